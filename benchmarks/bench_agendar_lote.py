@@ -0,0 +1,70 @@
+"""Benchmark: agendar_turno en un bucle contra agendar_turnos con el lote completo.
+
+Uso: python benchmarks/bench_agendar_lote.py [cantidad_filas]
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelomedico import Medico
+from modelopaciente import Paciente
+from modeloespecialidad import Especialidad
+from modeloexcepciones import TurnoOcupadoException, MedicoNoDisponibleException
+
+
+def crear_clinica(pacientes, medicos):
+    clinica = Clinica()
+    for i in range(pacientes):
+        clinica.agregar_paciente(Paciente(f"Paciente {i}", str(i), "01/01/1990"))
+    todos = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+    for i in range(medicos):
+        medico = Medico(f"Medico {i}", f"M{i}")
+        medico.agregar_especialidad(Especialidad("Clínica", todos, timedelta(minutes=15)))
+        clinica.agregar_medico(medico)
+    return clinica
+
+
+def generar_filas(cantidad, pacientes, medicos):
+    inicio = datetime(2025, 1, 6, 8, 0)
+    filas = []
+    for i in range(cantidad):
+        fecha = inicio + timedelta(minutes=15 * (i // medicos))
+        filas.append((str(i % pacientes), f"M{i % medicos}", "Clínica", fecha))
+    # Un 1 % de filas repetidas para ejercitar los rechazos
+    filas.extend(filas[::100])
+    return filas
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    pacientes, medicos = 10_000, 200
+    filas = generar_filas(cantidad, pacientes, medicos)
+    
+    clinica = crear_clinica(pacientes, medicos)
+    inicio = time.perf_counter()
+    for dni, matricula, especialidad, fecha in filas:
+        try:
+            clinica.agendar_turno(dni, matricula, especialidad, fecha)
+        except (TurnoOcupadoException, MedicoNoDisponibleException):
+            pass
+    t_bucle = time.perf_counter() - inicio
+    
+    clinica = crear_clinica(pacientes, medicos)
+    inicio = time.perf_counter()
+    resultados = clinica.agendar_turnos(filas)
+    t_lote = time.perf_counter() - inicio
+    rechazos = sum(1 for r in resultados if r is not None)
+    
+    print(f"Filas: {len(filas)} ({rechazos} rechazadas)")
+    print(f"  bucle agendar_turno : {t_bucle:7.3f} s  ({len(filas) / t_bucle:10.0f} filas/s)")
+    print(f"  agendar_turnos      : {t_lote:7.3f} s  ({len(filas) / t_lote:10.0f} filas/s)")
+    print(f"  mejora              : {t_bucle / t_lote:7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark: bitácora e instantánea binaria con un millón de eventos.
+
+Mide la reproducción completa de la bitácora contra la recuperación desde una
+instantánea (más la cola de bitácora, vacía en este caso) y la lectura de un solo turno.
+
+Uso: python benchmarks/bench_bitacora.py [cantidad_turnos]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelobitacora import Bitacora
+from modeloinstantanea import Instantanea
+from modelomedico import Medico
+from modelopaciente import Paciente
+from modeloespecialidad import Especialidad, DIAS_SEMANA
+
+
+def main():
+    cantidad_turnos = int(sys.argv[1]) if len(sys.argv) > 1 else 900_000
+    cantidad_pacientes = 50_000
+    cantidad_medicos = 500
+    
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "clinica.log")
+        clinica = Clinica(Bitacora(ruta, fsync_cada=1000))
+        
+        inicio = time.perf_counter()
+        for i in range(cantidad_pacientes):
+            clinica.agregar_paciente(Paciente(f"Paciente {i}", str(i), "01/01/1990"))
+        for i in range(cantidad_medicos):
+            medico = Medico(f"Medico {i}", f"M{i}")
+            medico.agregar_especialidad(Especialidad("Clínica", list(DIAS_SEMANA), timedelta(minutes=15)))
+            clinica.agregar_medico(medico)
+        base = datetime(2025, 1, 1, 8, 0)
+        for i in range(cantidad_turnos):
+            fecha = base + timedelta(minutes=15 * (i // cantidad_medicos))
+            clinica.agendar_turno(str(i % cantidad_pacientes), f"M{i % cantidad_medicos}", "Clínica", fecha)
+        for i in range(cantidad_pacientes):
+            clinica.emitir_receta(str(i), f"M{i % cantidad_medicos}", ["Paracetamol"])
+        clinica.cerrar()
+        t_escritura = time.perf_counter() - inicio
+        
+        eventos = cantidad_pacientes * 2 + cantidad_medicos + cantidad_turnos
+        tamanio = os.path.getsize(ruta) / 2 ** 20
+        print(f"Eventos: {eventos} ({tamanio:.1f} MiB)")
+        print(f"  operaciones con bitácora : {t_escritura:6.2f} s")
+        
+        inicio = time.perf_counter()
+        recuperada = Clinica.desde_bitacora(ruta)
+        t_reproduccion = time.perf_counter() - inicio
+        recuperada.cerrar()
+        print(f"  reproducción             : {t_reproduccion:6.2f} s ({eventos / t_reproduccion:,.0f} eventos/s)")
+        assert len(recuperada.obtener_turnos()) == cantidad_turnos
+        
+        ruta_instantanea = os.path.join(directorio, "clinica.snap")
+        inicio = time.perf_counter()
+        recuperada.guardar_instantanea(ruta_instantanea)
+        t_guardar = time.perf_counter() - inicio
+        tamanio = os.path.getsize(ruta_instantanea) / 2 ** 20
+        print(f"  guardar instantánea      : {t_guardar:6.2f} s ({tamanio:.1f} MiB)")
+        
+        inicio = time.perf_counter()
+        with Instantanea(ruta_instantanea) as instantanea:
+            instantanea.obtener_turno(instantanea.cantidad_turnos() - 1)
+        print(f"  abrir y leer un turno    : {(time.perf_counter() - inicio) * 1000:6.2f} ms")
+        
+        inicio = time.perf_counter()
+        desde_instantanea = Clinica.recuperar(ruta_instantanea, ruta)
+        t_recuperar = time.perf_counter() - inicio
+        desde_instantanea.cerrar()
+        print(f"  recuperar (inst. + cola) : {t_recuperar:6.2f} s")
+        assert len(desde_instantanea.obtener_turnos()) == cantidad_turnos
+
+
+if __name__ == "__main__":
+    main()
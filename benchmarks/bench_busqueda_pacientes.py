@@ -0,0 +1,73 @@
+"""Benchmark: búsqueda de pacientes por nombre, con prefijos y errores de tipeo.
+
+Registra pacientes con nombres y apellidos sintéticos (siempre iguales con la misma
+semilla) y mide buscar_pacientes con apellidos completos, comienzos de apellido,
+nombre y apellido juntos y apellidos mal escritos.
+
+Uso: python benchmarks/bench_busqueda_pacientes.py [cantidad_pacientes]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelopaciente import Paciente
+
+NOMBRES = ["Juan", "María", "José", "Ana", "Luis", "Lucía", "Carlos", "Sofía", "Jorge", "Valentina",
+           "Miguel", "Martina", "Diego", "Camila", "Pablo", "Florencia", "Andrés", "Julieta", "Tomás", "Paula"]
+SILABAS = ["gon", "za", "lez", "ro", "dri", "guez", "fer", "nan", "dez", "mar", "ti", "nez", "lo", "pez",
+           "gar", "cia", "sán", "chez", "pé", "rez", "gó", "mez", "ál", "va", "ri", "to", "be", "na", "ca", "sa"]
+CONSULTAS = [
+    ("apellido completo", "Gonzalez"),
+    ("comienzo de apellido", "mar"),
+    ("nombre y apellido", "ana gonza"),
+    ("apellido con un error", "Gonsalez"),
+    ("apellido con dos errores", "Lucia Rodriges"),
+    ("sin resultados", "Wxyzqk"),
+]
+
+
+def generar_apellidos(aleatorio, cantidad):
+    """Apellidos de dos o tres sílabas, sin repetir"""
+    apellidos = {"Gonzalez", "Fernandez", "Rodriguez"}
+    while len(apellidos) < cantidad:
+        apellido = "".join(aleatorio.choices(SILABAS, k=aleatorio.randint(2, 3)))
+        apellidos.add(apellido.capitalize())
+    return sorted(apellidos)
+
+
+def medir(funcion, repeticiones=20):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return (time.perf_counter() - inicio) / repeticiones, resultado
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    aleatorio = random.Random(1)
+    apellidos = generar_apellidos(aleatorio, 5_000)
+    pacientes = [Paciente(f"{aleatorio.choice(NOMBRES)} {aleatorio.choice(apellidos)} {aleatorio.choice(apellidos)}",
+                          str(10_000_000 + i), "01/01/1990") for i in range(cantidad)]
+    
+    clinica = Clinica()
+    inicio = time.perf_counter()
+    clinica.agregar_pacientes(pacientes)
+    # El índice de nombres se arma en la primera búsqueda: se mide junto con el alta
+    clinica.buscar_pacientes("a")
+    t_alta = time.perf_counter() - inicio
+    print(f"Pacientes: {cantidad} ({len(apellidos)} apellidos distintos)")
+    print(f"  alta con índice de nombres : {t_alta:6.2f} s")
+    
+    for descripcion, texto in CONSULTAS:
+        t_busqueda, resultado = medir(lambda: clinica.buscar_pacientes(texto, 20))
+        primero = resultado[0].obtener_nombre() if resultado else "-"
+        print(f"  {descripcion:<26} {texto!r:<22} {t_busqueda * 1000:8.2f} ms  ({len(resultado)}, {primero})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark: el menú interactivo alimentado por una tubería contra el modo por lotes.
+
+Registra la misma carga (pacientes y turnos) de las dos formas: respondiendo a las
+preguntas del menú desde un texto preparado y con CLI.ejecutar_lote. La salida se
+descarta en los dos casos.
+
+Uso: python benchmarks/bench_cli_lote.py [cantidad_pacientes]
+"""
+
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from cli import CLI
+
+INICIO = datetime(2025, 6, 16, 8, 0)
+
+
+def turnos(cantidad):
+    for i in range(cantidad):
+        fecha_hora = INICIO + timedelta(days=7 * (i // 20), minutes=30 * (i % 20))
+        yield str(i), fecha_hora.strftime("%d/%m/%Y"), fecha_hora.strftime("%H:%M")
+
+
+def respuestas_menu(cantidad):
+    """Lo que escribiría una persona en el menú, con un Enter después de cada acción"""
+    # Enter en las duraciones: la especialidad usa la predeterminada y cada turno, la de su especialidad
+    lineas = ["2", "Dra. Martínez", "MED001", "", "3", "MED001", "Pediatría", "lunes", "", ""]
+    for i in range(cantidad):
+        lineas += ["1", f"Paciente {i}", str(i), "01/01/1990", ""]
+    for dni, fecha, hora in turnos(cantidad):
+        lineas += ["4", dni, "MED001", "Pediatría", fecha, hora, "", ""]
+    return "\n".join(lineas + ["0"]) + "\n"
+
+
+def comandos_lote(cantidad):
+    lineas = ['agregar_medico "Dra. Martínez" MED001', "agregar_especialidad MED001 Pediatría lunes 30"]
+    lineas += [f'agregar_paciente "Paciente {i}" {i} 01/01/1990' for i in range(cantidad)]
+    lineas += [f"agendar_turno {dni} MED001 Pediatría {fecha} {hora}" for dni, fecha, hora in turnos(cantidad)]
+    return "\n".join(lineas) + "\n"
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    print(f"Pacientes y turnos: {cantidad} de cada uno")
+    
+    cli = CLI()
+    entrada_original = sys.stdin
+    sys.stdin = io.StringIO(respuestas_menu(cantidad))
+    try:
+        with open(os.devnull, "w") as nulo, redirect_stdout(nulo):
+            inicio = time.perf_counter()
+            cli.ejecutar()
+            t_menu = time.perf_counter() - inicio
+    finally:
+        sys.stdin = entrada_original
+    assert len(cli.clinica.obtener_turnos()) == cantidad
+    
+    cli = CLI()
+    with open(os.devnull, "w") as nulo:
+        inicio = time.perf_counter()
+        exitosos, fallidos = cli.ejecutar_lote(io.StringIO(comandos_lote(cantidad)), nulo)
+        t_lote = time.perf_counter() - inicio
+    assert fallidos == 0 and len(cli.clinica.obtener_turnos()) == cantidad
+    
+    comandos = 2 * cantidad + 2
+    print(f"  {'modo':<18} {'tiempo':>9} {'comandos/s':>11}")
+    print(f"  {'menú por tubería':<18} {t_menu * 1000:7.0f} ms {comandos / t_menu:11.0f}")
+    print(f"  {'lote':<18} {t_lote * 1000:7.0f} ms {comandos / t_lote:11.0f}")
+
+
+if __name__ == "__main__":
+    main()
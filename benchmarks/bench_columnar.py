@@ -0,0 +1,82 @@
+"""Benchmark: turnos en objetos (RepositorioMemoria) contra columnas de arreglos (RepositorioColumnar).
+
+Mide la memoria retenida por turno con tracemalloc y el tiempo de un recorrido
+completo de la tabla, de filtrar la agenda de un médico y de contar por rango de fechas.
+
+Uso: python benchmarks/bench_columnar.py [cantidad_turnos]
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelomedico import Medico
+from modelopaciente import Paciente
+from modeloespecialidad import Especialidad
+from modelorepositorio import RepositorioMemoria
+from modelorepositoriocolumnar import RepositorioColumnar
+
+PACIENTES = 10_000
+MEDICOS = 200
+INICIO = datetime(2025, 1, 6, 8, 0)
+
+
+def crear_clinica(repositorio):
+    clinica = Clinica(repositorio=repositorio)
+    for i in range(PACIENTES):
+        clinica.agregar_paciente(Paciente(f"Paciente {i}", str(i), "01/01/1990"))
+    todos = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+    for i in range(MEDICOS):
+        medico = Medico(f"Medico {i}", f"M{i}")
+        medico.agregar_especialidad(Especialidad("Clínica", todos, timedelta(minutes=15)))
+        clinica.agregar_medico(medico)
+    return clinica
+
+
+def filas(cantidad):
+    for i in range(cantidad):
+        yield str(i % PACIENTES), f"M{i % MEDICOS}", "Clínica", INICIO + timedelta(minutes=15 * (i // MEDICOS))
+
+
+def cronometrar(funcion, repeticiones=1):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return (time.perf_counter() - inicio) / repeticiones, resultado
+
+
+def medir(repositorio, cantidad):
+    clinica = crear_clinica(repositorio)
+    gc.collect()
+    tracemalloc.start()
+    antes, _ = tracemalloc.get_traced_memory()
+    clinica.agendar_turnos(filas(cantidad))
+    gc.collect()
+    despues, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    semana = (INICIO + timedelta(days=3), INICIO + timedelta(days=10))
+    t_recorrido, _ = cronometrar(lambda: sum(1 for t in clinica.obtener_turnos() if t.obtener_especialidad() == "Clínica"))
+    t_medico, _ = cronometrar(lambda: clinica.obtener_turnos_medico("M7", *semana), 100)
+    t_contar, total = cronometrar(lambda: clinica.contar_turnos(desde=semana[0], hasta=semana[1]), 100)
+    return (despues - antes) / cantidad, t_recorrido, t_medico, t_contar, total
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    print(f"Turnos: {cantidad}")
+    print(f"  {'almacén':<9} {'bytes/turno':>11} {'recorrido':>10} {'agenda médico':>14} {'contar semana':>14}")
+    for nombre, repositorio in (("objetos", RepositorioMemoria()), ("columnar", RepositorioColumnar())):
+        por_turno, t_recorrido, t_medico, t_contar, total = medir(repositorio, cantidad)
+        print(f"  {nombre:<9} {por_turno:11.0f} {t_recorrido * 1000:8.0f} ms {t_medico * 1e6:11.0f} µs "
+              f"{t_contar * 1e6:11.0f} µs  ({total} turnos)")
+
+
+if __name__ == "__main__":
+    main()
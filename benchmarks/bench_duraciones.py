@@ -0,0 +1,100 @@
+"""Benchmark: agendar turnos con duraciones variables a medida que se llena la agenda.
+
+Carga a un médico de 1.000 a 1.000.000 turnos de 15, 30 o 45 minutos (uno por
+hora) y mide Clinica.agendar_turno aceptando turnos en los huecos y rechazando
+turnos que pisan a otro, en horas al azar de toda la agenda. La detección de
+superposiciones es O(log n) en los tres repositorios: el rechazo cuesta lo mismo
+aunque la agenda crezca mil veces. En memoria (agenda en bloques) y en SQLite
+(índice B-tree) también el alta se mantiene plana; el repositorio columnar guarda
+la agenda del médico en arrays compactos y un alta en el medio mueve 8 bytes por
+turno posterior. SQLite se mide hasta 100.000 turnos para no tardar minutos en la carga.
+
+Uso: python benchmarks/bench_duraciones.py [cantidad_maxima]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelomedico import Medico
+from modelopaciente import Paciente
+from modeloespecialidad import Especialidad, DIAS_SEMANA
+from modelorepositorio import RepositorioMemoria
+from modelorepositoriocolumnar import RepositorioColumnar
+from modelorepositoriosqlite import RepositorioSQLite
+from modeloexcepciones import TurnoOcupadoException
+
+INICIO = datetime(2025, 1, 6)
+HORA = timedelta(hours=1)
+DURACIONES = [timedelta(minutes=m) for m in (15, 30, 45)]
+MEDICIONES = 1000
+
+
+def cargar(clinica, cantidad):
+    """Un turno por hora que empieza en punto y dura 15, 30 o 45 minutos"""
+    clinica.agregar_paciente(Paciente("Paciente Benchmark", "1", "01/01/1990"))
+    medico = Medico("Medico Benchmark", "M1")
+    medico.agregar_especialidad(Especialidad("Clínica", list(DIAS_SEMANA)))
+    clinica.agregar_medico(medico)
+    for desde in range(0, cantidad, 100000):
+        clinica.agendar_turnos([("1", "M1", "Clínica", INICIO + i * HORA, DURACIONES[i % 3])
+                                for i in range(desde, min(desde + 100000, cantidad))])
+
+
+def medir(clinica, cantidad):
+    """Microsegundos por turno aceptado (a los 45 minutos de una hora) y por turno rechazado (a los 10)"""
+    aleatorio = random.Random(42)
+    horas = aleatorio.sample(range(cantidad), MEDICIONES)
+    cuarto = timedelta(minutes=15)
+    
+    t = time.perf_counter()
+    for hora in horas:
+        clinica.agendar_turno("1", "M1", "Clínica", INICIO + hora * HORA + timedelta(minutes=45), cuarto)
+    aceptado = (time.perf_counter() - t) / MEDICIONES * 1e6
+    
+    t = time.perf_counter()
+    for hora in horas:
+        try:
+            clinica.agendar_turno("1", "M1", "Clínica", INICIO + hora * HORA + timedelta(minutes=10), cuarto)
+        except TurnoOcupadoException:
+            pass
+    rechazado = (time.perf_counter() - t) / MEDICIONES * 1e6
+    return aceptado, rechazado
+
+
+def main():
+    cantidad_maxima = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    cantidades = [c for c in (1000, 10000, 100000, 1000000) if c <= cantidad_maxima]
+    
+    with tempfile.TemporaryDirectory() as directorio:
+        repositorios = [
+            ("memoria", RepositorioMemoria, max(cantidades)),
+            ("columnar", RepositorioColumnar, max(cantidades)),
+            ("sqlite", lambda: RepositorioSQLite(os.path.join(directorio, f"bench{time.perf_counter_ns()}.db")),
+             100000),
+        ]
+        print(f"{'repositorio':12s} {'turnos':>9s} {'carga':>8s} {'aceptado':>10s} {'rechazado':>10s}")
+        for nombre, crear_repositorio, maximo in repositorios:
+            base = None
+            for cantidad in cantidades:
+                if cantidad > maximo:
+                    break
+                clinica = Clinica(repositorio=crear_repositorio())
+                t = time.perf_counter()
+                cargar(clinica, cantidad)
+                carga = time.perf_counter() - t
+                aceptado, rechazado = medir(clinica, cantidad)
+                clinica.cerrar()
+                base = base or aceptado
+                print(f"{nombre:12s} {cantidad:9d} {carga:7.1f}s {aceptado:8.1f}µs {rechazado:8.1f}µs"
+                      f"  (x{aceptado / base:.2f} respecto de {cantidades[0]} turnos)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""Benchmark: cómo escala la clínica con 10 mil, 100 mil o un millón de pacientes.
+
+Genera para cada tamaño una clínica sintética (siempre la misma con la misma semilla):
+un turno por paciente, la mitad de los pacientes con una receta y un médico cada 100
+pacientes. Sobre ella mide el tiempo por operación de agendar_turno,
+validar_turno_no_duplicado, emitir_receta, obtener_historia_clinica,
+HistoriaClinica.__str__ y de recorrer los listados, y con tracemalloc los bytes por
+paciente (con su turno y su receta). Muestra las curvas por tamaño.
+
+Con --guardar-base se guardan los resultados en un JSON; con --base se comparan contra
+uno guardado y el programa termina con código 1 si algún valor empeoró más que el
+umbral (por defecto 30%: las operaciones de menos de un microsegundo varían bastante
+entre corridas, conviene medir con la máquina sin otra carga).
+
+Uso: python benchmarks/bench_escala.py [--tamanos 10000 100000 1000000] [--guardar-base base.json]
+                                       [--base base.json] [--umbral 0.3]
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+
+INICIO = datetime(2025, 1, 6, 8, 0)
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+ESPECIALIDADES = ["Pediatría", "Cardiología", "Dermatología", "Traumatología"]
+MEDICAMENTOS = ["Paracetamol", "Ibuprofeno", "Amoxicilina", "Omeprazol", "Loratadina"]
+PACIENTES_POR_MEDICO = 100
+TURNOS_POR_DIA = 20
+# Operaciones medidas por caso: suficientes para un promedio estable sin depender del tamaño
+OPERACIONES = 20_000
+# Tandas por caso (se toma la mejor): las que agregan datos no se pueden repetir sobre los
+# mismos horarios, las consultas sí y con más tandas el resultado varía menos
+REPETICIONES = 3
+REPETICIONES_CONSULTAS = 15
+
+
+def horario(indice: int) -> datetime:
+    """Fecha del turno número `indice` de la agenda de un médico"""
+    return INICIO + timedelta(days=indice // TURNOS_POR_DIA, minutes=30 * (indice % TURNOS_POR_DIA))
+
+
+def generar_clinica(pacientes: int, semilla: int = 1) -> Clinica:
+    """Arma una clínica sintética con `pacientes` pacientes, sus turnos y sus recetas"""
+    aleatorio = random.Random(semilla)
+    medicos = max(10, pacientes // PACIENTES_POR_MEDICO)
+    clinica = Clinica()
+    clinica.agregar_pacientes([Paciente(f"Paciente {i}", str(10_000_000 + i), "01/01/1990")
+                               for i in range(pacientes)])
+    for m in range(medicos):
+        medico = Medico(f"Médico {m}", f"MED{m:05d}")
+        medico.agregar_especialidad(Especialidad(ESPECIALIDADES[m % len(ESPECIALIDADES)], DIAS))
+        clinica.agregar_medico(medico)
+    
+    lote = [(str(10_000_000 + aleatorio.randrange(pacientes)), f"MED{i % medicos:05d}",
+             ESPECIALIDADES[i % medicos % len(ESPECIALIDADES)], horario(i // medicos))
+            for i in range(pacientes)]
+    assert not any(clinica.agendar_turnos(lote))
+    for i in range(0, pacientes, 2):
+        clinica.emitir_receta(str(10_000_000 + i), f"MED{i % medicos:05d}",
+                              aleatorio.sample(MEDICAMENTOS, 2))
+    return clinica
+
+
+def bytes_por_paciente(pacientes: int) -> float:
+    """Memoria retenida por la clínica generada, dividida por la cantidad de pacientes"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        clinica = generar_clinica(pacientes)
+        gc.collect()
+        retenidos, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del clinica
+    return retenidos / pacientes
+
+
+def medir(funcion, tandas) -> float:
+    """Mejor tiempo por llamada en µs de `funcion` sobre los argumentos de cada tanda"""
+    mejor = float("inf")
+    for argumentos in tandas:
+        inicio = time.perf_counter()
+        for argumento in argumentos:
+            funcion(*argumento)
+        mejor = min(mejor, (time.perf_counter() - inicio) / len(argumentos))
+    return mejor * 1e6
+
+
+def recorrer(listado):
+    """Recorre un listado completo sin hacer nada con sus elementos"""
+    for _ in listado():
+        pass
+
+
+def repetir(argumentos, veces: int = REPETICIONES_CONSULTAS) -> list:
+    """Las mismas llamadas para cada repetición"""
+    return [argumentos] * veces
+
+
+def medir_tamano(pacientes: int) -> dict:
+    """Tiempos por operación (µs) y memoria (bytes por paciente) para un tamaño"""
+    clinica = generar_clinica(pacientes)
+    aleatorio = random.Random(2)
+    medicos = len(clinica.obtener_medicos())
+    cantidad = min(OPERACIONES, pacientes)
+    dnis = [(str(10_000_000 + aleatorio.randrange(pacientes)),) for _ in range(cantidad)]
+    # Horarios libres, después del último turno generado de cada médico; cada repetición
+    # de agendar_turno usa una tanda distinta porque los anteriores ya quedan ocupados
+    primer_libre = pacientes // medicos + 1
+    tandas = [[(dni, f"MED{i % medicos:05d}", ESPECIALIDADES[i % medicos % len(ESPECIALIDADES)],
+                horario(primer_libre + (tanda * cantidad + i) // medicos))
+               for i, (dni,) in enumerate(dnis)]
+              for tanda in range(REPETICIONES)]
+    
+    resultados = {}
+    # Primero las consultas, para que las historias tengan lo generado en todos los tamaños
+    resultados["obtener_historia_clinica"] = medir(clinica.obtener_historia_clinica, repetir(dnis))
+    historias = [(clinica.obtener_historia_clinica(dni),) for (dni,) in dnis]
+    resultados["HistoriaClinica.__str__"] = medir(str, repetir(historias))
+    resultados["validar_turno_no_duplicado"] = medir(
+        clinica.validar_turno_no_duplicado,
+        repetir([(matricula, fecha_hora) for _, matricula, _, fecha_hora in tandas[0]]))
+    resultados["agendar_turno"] = medir(clinica.agendar_turno, tandas)
+    recetas = [(dni, matricula, MEDICAMENTOS[:2]) for dni, matricula, _, _ in tandas[0]]
+    resultados["emitir_receta"] = medir(clinica.emitir_receta, repetir(recetas, REPETICIONES))
+    
+    # Listados: tiempo por elemento al recorrerlos completos
+    for nombre, listado in (("obtener_pacientes", clinica.obtener_pacientes),
+                            ("obtener_medicos", clinica.obtener_medicos),
+                            ("obtener_turnos", clinica.obtener_turnos)):
+        elementos = len(listado())
+        resultados[f"{nombre} (por elemento)"] = medir(recorrer, repetir([(listado,)])) / elementos
+    
+    clinica.cerrar()
+    del clinica, historias
+    resultados["bytes por paciente"] = bytes_por_paciente(pacientes)
+    return resultados
+
+
+def comparar(curvas: dict, base: dict, umbral: float) -> list:
+    """Devuelve los valores que empeoraron más que el umbral respecto de la base"""
+    regresiones = []
+    for caso, por_tamano in curvas.items():
+        for tamano, valor in por_tamano.items():
+            anterior = base.get(caso, {}).get(tamano)
+            if anterior and valor > anterior * (1 + umbral):
+                regresiones.append((caso, tamano, anterior, valor))
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Curvas de escala de la clínica")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[10_000, 100_000], metavar="N",
+                        help="cantidades de pacientes a medir")
+    parser.add_argument("--guardar-base", metavar="RUTA", help="guardar los resultados como base en un JSON")
+    parser.add_argument("--base", metavar="RUTA", help="comparar contra una base guardada")
+    parser.add_argument("--umbral", type=float, default=0.3,
+                        help="empeoramiento tolerado respecto de la base (0.3 = 30%%)")
+    argumentos = parser.parse_args()
+    if argumentos.umbral < 0:
+        parser.error("el umbral no puede ser negativo")
+    
+    curvas: dict = {}
+    for tamano in argumentos.tamanos:
+        print(f"Midiendo {tamano} pacientes...", flush=True)
+        for caso, valor in medir_tamano(tamano).items():
+            curvas.setdefault(caso, {})[str(tamano)] = valor
+    
+    tamanos = [str(tamano) for tamano in argumentos.tamanos]
+    print(f"\n  {'caso (µs por operación)':<36}" + "".join(f"{tamano:>12}" for tamano in tamanos)
+          + f"{'crecimiento':>13}")
+    for caso, por_tamano in curvas.items():
+        valores = [por_tamano[tamano] for tamano in tamanos]
+        print(f"  {caso:<36}" + "".join(f"{valor:12.3f}" for valor in valores)
+              + f"{valores[-1] / valores[0]:12.2f}x")
+    
+    if argumentos.guardar_base:
+        with open(argumentos.guardar_base, "w", encoding="utf-8") as archivo:
+            json.dump(curvas, archivo, ensure_ascii=False, indent=2)
+        print(f"\nBase guardada en {argumentos.guardar_base}")
+    
+    if argumentos.base:
+        with open(argumentos.base, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+        regresiones = comparar(curvas, base, argumentos.umbral)
+        if regresiones:
+            print(f"\nRegresiones (más de {argumentos.umbral:.0%} peor que la base):")
+            for caso, tamano, anterior, valor in regresiones:
+                print(f"  {caso} con {tamano}: {anterior:.3f} -> {valor:.3f} (+{valor / anterior - 1:.0%})")
+            sys.exit(1)
+        print(f"\nSin regresiones respecto de {argumentos.base} (umbral {argumentos.umbral:.0%})")
+
+
+if __name__ == "__main__":
+    main()
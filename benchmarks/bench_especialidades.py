@@ -0,0 +1,77 @@
+"""Benchmark: consulta de especialidad por día en médicos con muchas especialidades.
+
+Compara la tabla semanal de Medico contra el recorrido anterior (lista de
+especialidades con días en texto) y mide la validación completa de agendar_turno.
+
+Uso: python benchmarks/bench_especialidades.py [cantidad_especialidades]
+"""
+
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelomedico import Medico
+from modelopaciente import Paciente
+from modeloespecialidad import Especialidad, DIAS_SEMANA
+
+
+class EspecialidadLista:
+    """Réplica del modelo anterior: días como lista de textos"""
+    
+    def __init__(self, tipo, dias):
+        self.tipo = tipo
+        self.dias = [dia.lower() for dia in dias]
+    
+    def verificar_dia(self, dia):
+        return dia.lower() in self.dias
+
+
+def especialidad_para_dia_lista(especialidades, dia):
+    """Réplica del recorrido anterior de Medico.obtener_especialidad_para_dia"""
+    for especialidad in especialidades:
+        if especialidad.verificar_dia(dia):
+            return especialidad.tipo
+    return None
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    repeticiones = 200_000
+    
+    # Solo la última especialidad atiende el domingo: peor caso para el recorrido
+    medico = Medico("Benchmark", "BENCH")
+    legado = []
+    for i in range(cantidad - 1):
+        medico.agregar_especialidad(Especialidad(f"Esp{i}", ["lunes"]))
+        legado.append(EspecialidadLista(f"Esp{i}", ["lunes"]))
+    medico.agregar_especialidad(Especialidad("Guardia", ["domingo"], timedelta(minutes=15)))
+    legado.append(EspecialidadLista("Guardia", ["domingo"]))
+    
+    t_lista = timeit.timeit(lambda: especialidad_para_dia_lista(legado, "domingo"), number=repeticiones)
+    t_tabla = timeit.timeit(lambda: medico.obtener_especialidad_para_dia("domingo"), number=repeticiones)
+    
+    print(f"Especialidades por médico: {cantidad}")
+    print(f"  recorrido de lista : {t_lista / repeticiones * 1e9:9.1f} ns/consulta")
+    print(f"  tabla semanal      : {t_tabla / repeticiones * 1e9:9.1f} ns/consulta")
+    print(f"  mejora             : {t_lista / t_tabla:9.1f}x")
+    
+    # Agendar turnos los domingos, siempre en horarios distintos
+    clinica = Clinica()
+    clinica.agregar_paciente(Paciente("Paciente Benchmark", "1", "01/01/1990"))
+    clinica.agregar_medico(medico)
+    domingo = datetime(2025, 6, 15, 0, 0)
+    assert DIAS_SEMANA[domingo.weekday()] == "domingo"
+    turnos = 20_000
+    inicio = timeit.default_timer()
+    for i in range(turnos):
+        clinica.agendar_turno("1", "BENCH", "Guardia", domingo + timedelta(days=7 * (i // 96), minutes=15 * (i % 96)))
+    t_agendar = timeit.default_timer() - inicio
+    print(f"  agendar_turno      : {t_agendar / turnos * 1e6:9.2f} us/turno ({turnos} turnos)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark: importación masiva de pacientes desde CSV y JSONL.
+
+Genera un archivo temporal con pacientes (más algunos registros inválidos) y mide
+el tiempo de importarlo con Importador, en memoria y en una base SQLite.
+
+Uso: python benchmarks/bench_importacion.py [cantidad_pacientes]
+"""
+
+import csv
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modeloimportacion import Importador
+from modelorepositoriosqlite import RepositorioSQLite
+
+INVALIDOS = 100
+
+
+def registros(cantidad):
+    for i in range(cantidad):
+        yield {"nombre": f"Paciente {i}", "dni": str(10_000_000 + i),
+               "fecha_nacimiento": f"{i % 28 + 1:02d}/{i % 12 + 1:02d}/{1950 + i % 60}"}
+    for i in range(INVALIDOS):
+        yield {"nombre": f"Sin DNI {i}", "dni": "", "fecha_nacimiento": "01/01/1990"}
+
+
+def escribir(ruta, cantidad):
+    with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+        if ruta.endswith(".csv"):
+            escritor = csv.DictWriter(archivo, ["nombre", "dni", "fecha_nacimiento"])
+            escritor.writeheader()
+            escritor.writerows(registros(cantidad))
+        else:
+            for registro in registros(cantidad):
+                archivo.write(json.dumps(registro) + "\n")
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Pacientes: {cantidad} (+{INVALIDOS} inválidos)")
+    print(f"  {'archivo':<8} {'almacén':<8} {'tiempo':>8} {'registros/s':>12} {'rechazados':>11}")
+    with tempfile.TemporaryDirectory() as directorio:
+        for extension in ("csv", "jsonl"):
+            ruta = os.path.join(directorio, f"pacientes.{extension}")
+            escribir(ruta, cantidad)
+            for almacen in ("memoria", "sqlite"):
+                repositorio = RepositorioSQLite(os.path.join(directorio, f"{extension}.db")) if almacen == "sqlite" else None
+                clinica = Clinica(repositorio=repositorio)
+                inicio = time.perf_counter()
+                importados, rechazados = Importador(clinica, io.StringIO()).importar_pacientes(ruta)
+                segundos = time.perf_counter() - inicio
+                clinica.cerrar()
+                print(f"  {extension:<8} {almacen:<8} {segundos:6.1f} s {(importados + rechazados) / segundos:12.0f} "
+                      f"{rechazados:11}")
+
+
+if __name__ == "__main__":
+    main()
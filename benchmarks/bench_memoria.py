@@ -0,0 +1,123 @@
+"""Benchmark: bytes por entidad, medidos con tracemalloc.
+
+Compara las entidades actuales (con __slots__ y textos internados) con clases
+equivalentes en el formato anterior: atributos en un __dict__ por instancia, textos
+sin internar y medicamentos en una lista. Los datos de entrada se generan como si
+llegaran de la bitácora o de la red (un objeto str nuevo por campo) y no se conservan,
+así que solo cuenta lo que cada entidad retiene.
+
+Uso: python benchmarks/bench_memoria.py [cantidad]
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+from modeloturno import Turno
+from modeloreceta import Receta
+
+
+class PacienteAnterior:
+    def __init__(self, nombre, dni, fecha_nacimiento):
+        self.nombre = nombre
+        self.dni = dni
+        self.fecha_nacimiento = fecha_nacimiento
+
+
+class EspecialidadAnterior:
+    def __init__(self, tipo, mascara_dias):
+        self.tipo = tipo
+        self.mascara_dias = mascara_dias
+
+
+class MedicoAnterior:
+    def __init__(self, nombre, matricula, especialidad):
+        self.nombre = nombre
+        self.matricula = matricula
+        self.especialidades = [especialidad]
+        self.especialidad_por_dia = [especialidad.tipo] + [None] * 6
+
+
+class TurnoAnterior:
+    def __init__(self, paciente, medico, fecha_hora, especialidad):
+        self.paciente = paciente
+        self.medico = medico
+        self.fecha_hora = fecha_hora
+        self.especialidad = especialidad
+
+
+class RecetaAnterior:
+    def __init__(self, paciente, medico, medicamentos, fecha):
+        self.paciente = paciente
+        self.medico = medico
+        self.medicamentos = medicamentos
+        self.fecha = fecha
+
+
+def texto(valor):
+    """Devuelve una copia nueva del texto, como la que produce un decodificador"""
+    return "".join([valor[:1], valor[1:]])
+
+
+def medir(crear, cantidad):
+    """Bytes retenidos por entidad al crear `cantidad` entidades"""
+    gc.collect()
+    tracemalloc.start()
+    inicio, _ = tracemalloc.get_traced_memory()
+    entidades = [crear(i) for i in range(cantidad)]
+    fin, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entidades
+    return (fin - inicio) / cantidad
+
+
+def crear_medico(nombre, matricula, tipo):
+    medico = Medico(nombre, matricula)
+    medico.agregar_especialidad(Especialidad.desde_mascara(tipo, 31))
+    return medico
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    fecha = datetime(2025, 1, 6, 8, 0)
+    paciente, medico = Paciente("Ana", "1", "01/01/1990"), Medico("Dr. X", "M1")
+    paciente_ant = PacienteAnterior("Ana", "1", "01/01/1990")
+    medico_ant = MedicoAnterior("Dr. X", "M1", EspecialidadAnterior("Clínica", 1))
+    
+    casos = [
+        ("Paciente",
+         lambda i: PacienteAnterior(f"Paciente {i}", str(i), texto("01/01/1990")),
+         lambda i: Paciente(f"Paciente {i}", str(i), texto("01/01/1990"))),
+        ("Especialidad",
+         lambda i: EspecialidadAnterior(texto("Clínica"), 31),
+         lambda i: Especialidad.desde_mascara(texto("Clínica"), 31)),
+        ("Medico",
+         lambda i: MedicoAnterior(f"Medico {i}", f"M{i}", EspecialidadAnterior(texto("Clínica"), 31)),
+         lambda i: crear_medico(f"Medico {i}", f"M{i}", texto("Clínica"))),
+        ("Turno",
+         lambda i: TurnoAnterior(paciente_ant, medico_ant, fecha + timedelta(minutes=i), texto("Clínica")),
+         lambda i: Turno(paciente, medico, fecha + timedelta(minutes=i), texto("Clínica"))),
+        ("Receta",
+         lambda i: RecetaAnterior(paciente_ant, medico_ant, [texto("Paracetamol"), texto("Ibuprofeno")],
+                                  fecha + timedelta(minutes=i)),
+         lambda i: Receta(paciente, medico, [texto("Paracetamol"), texto("Ibuprofeno")],
+                          fecha + timedelta(minutes=i))),
+    ]
+    
+    print(f"Bytes por entidad ({cantidad} de cada una)")
+    print(f"  {'entidad':<13} {'antes':>8} {'después':>8} {'ahorro':>7}")
+    for nombre, anterior, actual in casos:
+        antes = medir(anterior, cantidad)
+        despues = medir(actual, cantidad)
+        print(f"  {nombre:<13} {antes:8.0f} {despues:8.0f} {1 - despues / antes:7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark: costo de las métricas sobre las operaciones de la clínica.
+
+Agenda turnos de a uno y consulta historias clínicas con una clínica sin métricas y
+con otra que las mide, y muestra el tiempo por operación de cada una.
+
+Uso: python benchmarks/bench_metricas.py [cantidad_turnos]
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelometricas import Metricas
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+
+INICIO = datetime(2025, 6, 16, 8, 0)
+PACIENTES = 1000
+
+
+def medir(clinica, cantidad):
+    clinica.agregar_pacientes([Paciente(f"Paciente {i}", str(i), "01/01/1990") for i in range(PACIENTES)])
+    medico = Medico("Dra. Martínez", "MED001")
+    medico.agregar_especialidad(Especialidad("Pediatría", ["lunes", "martes", "miércoles", "jueves",
+                                                           "viernes", "sábado", "domingo"]))
+    clinica.agregar_medico(medico)
+    
+    inicio = time.perf_counter()
+    for i in range(cantidad):
+        clinica.agendar_turno(str(i % PACIENTES), "MED001", "Pediatría",
+                              INICIO + timedelta(days=i // 20, minutes=30 * (i % 20)))
+    t_turnos = time.perf_counter() - inicio
+    
+    inicio = time.perf_counter()
+    for i in range(cantidad):
+        clinica.obtener_historia_clinica(str(i % PACIENTES))
+    t_historias = time.perf_counter() - inicio
+    return t_turnos / cantidad * 1e6, t_historias / cantidad * 1e6
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"Operaciones: {cantidad} de cada tipo")
+    
+    sin = medir(Clinica(), cantidad)
+    metricas = Metricas()
+    con = medir(Clinica(metricas=metricas), cantidad)
+    
+    print(f"  {'operación':<26} {'sin métricas':>13} {'con métricas':>13}")
+    for nombre, t_sin, t_con in zip(("agendar_turno", "obtener_historia_clinica"), sin, con):
+        print(f"  {nombre:<26} {t_sin:10.2f} µs {t_con:10.2f} µs")
+    p99 = metricas.obtener_operacion("agendar_turno").obtener_latencias().obtener_percentil(99)
+    print(f"p99 de agendar_turno medido: {p99 / 1000:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark: listar todo contra pedir una página.
+
+Compara el listado completo que hacía el menú (ordenar y formatear todos los turnos o
+pacientes) con una página de 20 filtrada por especialidad, rango de fechas o prefijo,
+en memoria y en SQLite.
+
+Uso: python benchmarks/bench_paginacion.py [cantidad_turnos]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelorepositorio import RepositorioMemoria
+from modelorepositoriosqlite import RepositorioSQLite
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+
+INICIO = datetime(2025, 6, 16, 8, 0)
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+ESPECIALIDADES = ["Pediatría", "Cardiología", "Dermatología", "Traumatología"]
+MEDICOS = 40
+
+
+def cargar(clinica, cantidad):
+    pacientes = cantidad // 10
+    clinica.agregar_pacientes([Paciente(f"Paciente {i}", str(10_000_000 + i), "01/01/1990")
+                               for i in range(pacientes)])
+    for m in range(MEDICOS):
+        medico = Medico(f"Médico {m}", f"MED{m:03d}")
+        medico.agregar_especialidad(Especialidad(ESPECIALIDADES[m % len(ESPECIALIDADES)], DIAS))
+        clinica.agregar_medico(medico)
+    por_medico = cantidad // MEDICOS
+    lote = ((str(10_000_000 + (i * 7919) % pacientes), f"MED{m:03d}", ESPECIALIDADES[m % len(ESPECIALIDADES)],
+             INICIO + timedelta(days=i // 20, minutes=30 * (i % 20)))
+            for m in range(MEDICOS) for i in range(por_medico))
+    clinica.agendar_turnos(lote)
+
+
+def medir(funcion, repeticiones=5):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def listado_completo(clinica):
+    turnos = sorted(clinica.obtener_turnos(), key=lambda turno: turno.obtener_fecha_hora())
+    return [f"{i}. {turno}" for i, turno in enumerate(turnos, 1)]
+
+
+def pagina(elementos):
+    return [f"{i}. {elemento}" for i, elemento in enumerate(elementos[0], 1)]
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"Turnos: {cantidad}, pacientes: {cantidad // 10}, médicos: {MEDICOS}")
+    desde = INICIO + timedelta(days=30)
+    
+    with tempfile.TemporaryDirectory() as directorio:
+        for nombre, repositorio in (("memoria", RepositorioMemoria()),
+                                    ("sqlite", RepositorioSQLite(os.path.join(directorio, "clinica.db")))):
+            clinica = Clinica(repositorio=repositorio)
+            cargar(clinica, cantidad)
+            # El índice de nombres se arma en la primera búsqueda: no se cuenta en la medición
+            clinica.paginar_pacientes(0, 1, "a")
+            casos = [
+                ("todos los turnos", lambda: listado_completo(clinica)),
+                ("página de turnos", lambda: pagina(clinica.paginar_turnos(100, 20))),
+                ("por especialidad", lambda: pagina(clinica.paginar_turnos(0, 20, especialidad="Cardiología",
+                                                                            desde=desde,
+                                                                            hasta=desde + timedelta(days=7)))),
+                ("pacientes por DNI", lambda: pagina(clinica.paginar_pacientes(0, 20, "1000123"))),
+                ("pacientes por nombre", lambda: pagina(clinica.paginar_pacientes(0, 20, "pacien"))),
+            ]
+            print(f"\n  {nombre}")
+            for descripcion, funcion in casos:
+                print(f"    {descripcion:<22} {medir(funcion) * 1000:9.2f} ms")
+            clinica.cerrar()
+
+
+if __name__ == "__main__":
+    main()
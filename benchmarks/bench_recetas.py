@@ -0,0 +1,110 @@
+"""Benchmark: recetas por medicamento recorriendo historias contra el índice invertido.
+
+Compara la forma anterior de responder "a quién se le recetó X este mes" (recorrer la
+historia clínica de cada paciente) y el ranking de medicamentos más recetados de un
+médico con las consultas de Clinica, que usan el índice por medicamento.
+
+Uso: python benchmarks/bench_recetas.py [cantidad_recetas]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelobitacora import Bitacora
+from modelomedico import Medico
+from modelopaciente import Paciente
+from modeloreceta import Receta
+
+INICIO = datetime(2025, 1, 1, 8, 0)
+MEDICAMENTOS = [f"Medicamento {i}" for i in range(300)]
+PACIENTES = 20_000
+MEDICOS = 200
+
+
+def escribir_bitacora(ruta, cantidad):
+    """Escribe una bitácora con recetas repartidas en un año (emitir_receta usaría la fecha actual)"""
+    aleatorio = random.Random(1)
+    bitacora = Bitacora(ruta, fsync_cada=0)
+    pacientes = [Paciente(f"Paciente {i}", str(i), "01/01/1990") for i in range(PACIENTES)]
+    medicos = [Medico(f"Médico {i}", f"M{i}") for i in range(MEDICOS)]
+    for paciente in pacientes:
+        bitacora.registrar_paciente(paciente)
+    for medico in medicos:
+        bitacora.registrar_medico(medico)
+    # Pocos medicamentos concentran la mayoría de las recetas
+    pesos = [1 / (i + 1) for i in range(len(MEDICAMENTOS))]
+    for i in range(cantidad):
+        fecha = INICIO + timedelta(minutes=525_600 * i // cantidad)
+        medicamentos = aleatorio.choices(MEDICAMENTOS, pesos, k=aleatorio.randint(1, 3))
+        bitacora.registrar_receta(Receta(pacientes[i % PACIENTES], medicos[i % MEDICOS], medicamentos, fecha))
+    bitacora.cerrar()
+
+
+def recorrer_historias(clinica, medicamento, desde, hasta):
+    """Pacientes con el medicamento en el período, recorriendo todas las historias"""
+    pacientes = []
+    for paciente in clinica.obtener_pacientes():
+        for receta in clinica.obtener_historia_clinica(paciente.obtener_dni()).obtener_recetas():
+            if desde <= receta.obtener_fecha() < hasta and medicamento in receta.obtener_medicamentos():
+                pacientes.append(paciente)
+                break
+    return pacientes
+
+
+def contar_recorriendo(clinica, matricula, desde, hasta):
+    """Ranking de un médico en el período, recorriendo todas las historias"""
+    cuentas = Counter()
+    for paciente in clinica.obtener_pacientes():
+        for receta in clinica.obtener_historia_clinica(paciente.obtener_dni()).obtener_recetas():
+            if receta.obtener_medico().obtener_matricula() == matricula and desde <= receta.obtener_fecha() < hasta:
+                cuentas.update(set(receta.obtener_medicamentos()))
+    return cuentas.most_common(10)
+
+
+def medir(funcion, repeticiones=5):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return (time.perf_counter() - inicio) / repeticiones, resultado
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "clinica.log")
+        escribir_bitacora(ruta, cantidad)
+        clinica = Clinica.desde_bitacora(ruta)
+        
+        desde, hasta = datetime(2025, 6, 1), datetime(2025, 7, 1)
+        medicamento = MEDICAMENTOS[5]
+        print(f"Recetas: {cantidad}, pacientes: {PACIENTES}, médicos: {MEDICOS}")
+        
+        t_recorrido, esperados = medir(lambda: recorrer_historias(clinica, medicamento, desde, hasta), 1)
+        t_indice, pacientes = medir(lambda: clinica.obtener_pacientes_por_medicamento(medicamento, desde, hasta))
+        assert {p.obtener_dni() for p in pacientes} == {p.obtener_dni() for p in esperados}
+        print(f"  pacientes con {medicamento} en junio ({len(pacientes)})")
+        print(f"    recorriendo historias : {t_recorrido * 1000:9.2f} ms")
+        print(f"    índice                : {t_indice * 1000:9.2f} ms  ({t_recorrido / t_indice:,.0f}x)")
+        
+        t_recorrido, esperado = medir(lambda: contar_recorriendo(clinica, "M7", desde, hasta), 1)
+        t_indice, ranking = medir(lambda: clinica.medicamentos_mas_recetados(10, "M7", desde, hasta))
+        assert [cuenta for _, cuenta in ranking] == [cuenta for _, cuenta in esperado]
+        print("  10 más recetados por M7 en junio")
+        print(f"    recorriendo historias : {t_recorrido * 1000:9.2f} ms")
+        print(f"    índice                : {t_indice * 1000:9.2f} ms  ({t_recorrido / t_indice:,.0f}x)")
+        
+        t_indice, _ = medir(lambda: clinica.medicamentos_mas_recetados(10, desde=desde, hasta=hasta))
+        print(f"  10 más recetados de la clínica en junio (índice): {t_indice * 1000:.2f} ms")
+        clinica.cerrar()
+
+
+if __name__ == "__main__":
+    main()
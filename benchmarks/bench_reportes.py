@@ -0,0 +1,89 @@
+"""Benchmark: reportes de ocupación con numpy contra un recorrido de los turnos en Python.
+
+Carga los turnos en un RepositorioColumnar y mide por separado la exportación a
+arreglos (una vez por reporte) y cada reporte. Como referencia, arma el mapa de
+calor recorriendo Clinica.obtener_turnos() turno por turno.
+
+Uso: python benchmarks/bench_reportes.py [cantidad_turnos]
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelomedico import Medico
+from modelopaciente import Paciente
+from modeloespecialidad import Especialidad
+from modelorepositoriocolumnar import RepositorioColumnar
+from modeloreportes import ReporteOcupacion, np
+
+PACIENTES = 10_000
+MEDICOS = 500
+INICIO = datetime(2025, 1, 6, 8, 0)
+DIAS = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+
+
+def crear_clinica(cantidad):
+    clinica = Clinica(repositorio=RepositorioColumnar())
+    for i in range(PACIENTES):
+        clinica.agregar_paciente(Paciente(f"Paciente {i}", str(i), "01/01/1990"))
+    for i in range(MEDICOS):
+        medico = Medico(f"Medico {i}", f"M{i}")
+        medico.agregar_especialidad(Especialidad(f"Especialidad {i % 20}", DIAS))
+        clinica.agregar_medico(medico)
+    # 20 turnos por día y médico, de 8 a 18, todos los días
+    clinica.agendar_turnos(
+        (str(i % PACIENTES), f"M{i % MEDICOS}", f"Especialidad {i % MEDICOS % 20}",
+         INICIO + timedelta(days=i // MEDICOS // 20, minutes=30 * (i // MEDICOS % 20)))
+        for i in range(cantidad))
+    return clinica
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return time.perf_counter() - inicio, resultado
+
+
+def mapa_en_python(clinica):
+    mapa = [[0] * 24 for _ in range(7)]
+    for turno in clinica.obtener_turnos():
+        fecha_hora = turno.obtener_fecha_hora()
+        mapa[fecha_hora.weekday()][fecha_hora.hour] += 1
+    return mapa
+
+
+def main():
+    if np is None:
+        print("Este benchmark requiere numpy")
+        return
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    print(f"Cargando {cantidad} turnos...")
+    clinica = crear_clinica(cantidad)
+    desde, hasta = INICIO.date(), INICIO.date() + timedelta(days=cantidad // MEDICOS // 20 + 1)
+    
+    t_exportar, reporte = cronometrar(lambda: ReporteOcupacion(clinica))
+    tiempos = [
+        ("exportar a arreglos", t_exportar),
+        ("turnos por médico", cronometrar(reporte.turnos_por_medico)[0]),
+        ("turnos por especialidad", cronometrar(reporte.turnos_por_especialidad)[0]),
+        ("mapa de calor", cronometrar(reporte.mapa_calor)[0]),
+        ("matriz de utilización", cronometrar(lambda: reporte.matriz_utilizacion(desde, hasta))[0]),
+        ("días sin capacidad", cronometrar(lambda: reporte.dias_sin_capacidad(desde, hasta))[0]),
+    ]
+    print(f"  {'reporte':<25} {'tiempo':>9}")
+    for nombre, segundos in tiempos:
+        print(f"  {nombre:<25} {segundos * 1000:7.0f} ms")
+    print(f"  {'total':<25} {sum(s for _, s in tiempos) * 1000:7.0f} ms")
+    
+    t_python, mapa = cronometrar(lambda: mapa_en_python(clinica))
+    iguales = np.array_equal(np.array(mapa), reporte.mapa_calor())
+    print(f"Mapa de calor recorriendo los turnos en Python: {t_python * 1000:.0f} ms (iguales: {iguales})")
+
+
+if __name__ == "__main__":
+    main()
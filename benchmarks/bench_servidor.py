@@ -0,0 +1,129 @@
+"""Prueba de carga del servidor JSON sobre TCP: solicitudes por segundo y latencia p99.
+
+Sin --puerto levanta `modelo/servidor.py` en un proceso aparte con una clínica vacía.
+Cada conexión mantiene hasta `--ventana` solicitudes en vuelo (pipelining); la mezcla es
+mitad turnos nuevos y mitad consultas de historia clínica.
+
+Uso: python benchmarks/bench_servidor.py [--solicitudes N] [--conexiones C] [--ventana V] [--puerto P]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import deque
+from datetime import datetime, timedelta
+
+SERVIDOR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo', 'servidor.py')
+MEDICOS = 50
+PACIENTES = 1000
+
+
+def codificar(identificador, operacion, **parametros):
+    return (json.dumps({"id": identificador, "operacion": operacion, "parametros": parametros}) + "\n").encode()
+
+
+async def preparar(puerto):
+    """Registra pacientes y médicos que atienden todos los días"""
+    lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+    todos = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+    lineas = [codificar(i, "agregar_paciente", nombre=f"Paciente {i}", dni=f"P{i}", fecha_nacimiento="01/01/1990")
+              for i in range(PACIENTES)]
+    lineas += [codificar(i, "agregar_medico", nombre=f"Medico {i}", matricula=f"M{i}",
+                         especialidades=[{"tipo": "Clínica", "dias": todos, "duracion": 15}]) for i in range(MEDICOS)]
+    escritor.write(b"".join(lineas))
+    await escritor.drain()
+    for _ in lineas:
+        await lector.readline()
+    escritor.close()
+
+
+def generar_solicitudes(conexion, cantidad):
+    """Solicitudes de una conexión: cada turno usa un horario propio de esa conexión"""
+    inicio = datetime(2030, 1, 7, 0, 0) + timedelta(days=400 * conexion)
+    for i in range(cantidad):
+        if i % 2 == 0:
+            fecha = inicio + timedelta(minutes=15 * (i // (2 * MEDICOS)))
+            yield codificar(i, "agendar_turno", dni=f"P{i % PACIENTES}", matricula=f"M{(i // 2) % MEDICOS}",
+                            especialidad="Clínica", fecha_hora=fecha.isoformat())
+        else:
+            yield codificar(i, "obtener_historia_clinica", dni=f"P{i % PACIENTES}")
+
+
+async def conexion_de_carga(puerto, numero, cantidad, ventana, latencias, errores):
+    """Envía `cantidad` solicitudes con hasta `ventana` en vuelo y mide la latencia de cada una"""
+    lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+    en_vuelo = asyncio.Semaphore(ventana)
+    enviadas = deque()
+    
+    async def enviar():
+        for linea in generar_solicitudes(numero, cantidad):
+            await en_vuelo.acquire()
+            enviadas.append(time.perf_counter())
+            escritor.write(linea)
+            await escritor.drain()
+    
+    async def recibir():
+        for _ in range(cantidad):
+            respuesta = await lector.readline()
+            latencias.append(time.perf_counter() - enviadas.popleft())
+            en_vuelo.release()
+            if b'"ok":false' in respuesta:
+                errores.append(respuesta)
+    
+    await asyncio.gather(enviar(), recibir())
+    escritor.close()
+
+
+async def cargar(puerto, solicitudes, conexiones, ventana):
+    await preparar(puerto)
+    latencias, errores = [], []
+    por_conexion = solicitudes // conexiones
+    inicio = time.perf_counter()
+    await asyncio.gather(*(conexion_de_carga(puerto, i, por_conexion, ventana, latencias, errores)
+                           for i in range(conexiones)))
+    return time.perf_counter() - inicio, latencias, errores
+
+
+def iniciar_servidor():
+    """Levanta el servidor en un puerto libre y devuelve (proceso, puerto)"""
+    proceso = subprocess.Popen([sys.executable, SERVIDOR, "--puerto", "0"], stdout=subprocess.PIPE, text=True)
+    linea = proceso.stdout.readline()
+    return proceso, int(linea.rsplit(":", 1)[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--solicitudes", type=int, default=100_000)
+    parser.add_argument("--conexiones", type=int, default=8)
+    parser.add_argument("--ventana", type=int, default=32)
+    parser.add_argument("--puerto", type=int, help="usar un servidor ya iniciado en este puerto")
+    argumentos = parser.parse_args()
+    
+    proceso = None
+    puerto = argumentos.puerto
+    if puerto is None:
+        proceso, puerto = iniciar_servidor()
+    try:
+        duracion, latencias, errores = asyncio.run(
+            cargar(puerto, argumentos.solicitudes, argumentos.conexiones, argumentos.ventana))
+    finally:
+        if proceso is not None:
+            proceso.terminate()
+            proceso.wait()
+    
+    latencias.sort()
+    p50 = latencias[len(latencias) // 2]
+    p99 = latencias[min(len(latencias) - 1, int(len(latencias) * 0.99))]
+    print(f"Solicitudes: {len(latencias)} en {argumentos.conexiones} conexiones "
+          f"(ventana {argumentos.ventana}, {len(errores)} con error)")
+    print(f"  rendimiento : {len(latencias) / duracion:10,.0f} solicitudes/s")
+    print(f"  latencia p50: {p50 * 1000:10.2f} ms")
+    print(f"  latencia p99: {p99 * 1000:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark: búsqueda de turnos libres por especialidad con la agenda casi llena.
+
+Carga 500 médicos y un semestre de turnos (todos los horarios ocupados salvo
+algunos al final) y mide Clinica.buscar_turnos_disponibles.
+
+Uso: python benchmarks/bench_turnos_disponibles.py [cantidad_medicos]
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelomedico import Medico
+from modelopaciente import Paciente
+from modeloespecialidad import Especialidad, DIAS_SEMANA
+
+ESPECIALIDADES = ["Cardiología", "Pediatría", "Neurología", "Dermatología", "Traumatología",
+                  "Clínica", "Oftalmología", "Ginecología", "Urología", "Psiquiatría"]
+
+
+def main():
+    cantidad_medicos = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    duracion = timedelta(minutes=30)
+    inicio = datetime(2025, 3, 3)
+    dias = 182
+    aleatorio = random.Random(42)
+    
+    clinica = Clinica()
+    clinica.agregar_paciente(Paciente("Paciente Benchmark", "1", "01/01/1990"))
+    for i in range(cantidad_medicos):
+        medico = Medico(f"Medico {i}", f"M{i}")
+        dias_medico = aleatorio.sample(DIAS_SEMANA[:5], 3)
+        medico.agregar_especialidad(Especialidad(ESPECIALIDADES[i % len(ESPECIALIDADES)], dias_medico))
+        clinica.agregar_medico(medico)
+    
+    # Semestre completo: cada médico tiene ocupados todos sus horarios de 8 a 18
+    lote = []
+    for medico in clinica.obtener_medicos():
+        matricula = medico.obtener_matricula()
+        for d in range(dias):
+            fecha = inicio + timedelta(days=d)
+            especialidad = medico.obtener_especialidad_para_fecha(fecha)
+            if especialidad is None:
+                continue
+            for h in range(20):
+                lote.append(("1", matricula, especialidad, fecha + timedelta(hours=8) + h * duracion))
+    t = time.perf_counter()
+    clinica.agendar_turnos(lote)
+    print(f"Médicos: {cantidad_medicos}, turnos cargados: {len(lote)} en {time.perf_counter() - t:.1f} s")
+    
+    for desde, descripcion in ((inicio + timedelta(days=30), "agenda llena hasta fin del semestre"),
+                               (inicio + timedelta(days=dias), "primer día libre")):
+        repeticiones = 20
+        t = time.perf_counter()
+        for _ in range(repeticiones):
+            libres = clinica.buscar_turnos_disponibles("Cardiología", desde, duracion, cantidad=5)
+        transcurrido = (time.perf_counter() - t) / repeticiones
+        print(f"  {descripcion:38s}: {transcurrido * 1000:8.2f} ms -> {libres[0][0]:%d/%m/%Y %H:%M}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Benchmark: listados con vistas de solo lectura contra copias completas de las listas.
+
+Simula una pantalla de listado que pide todos los turnos, muestra el total y la primera
+página. Las copias reproducen el comportamiento anterior (`lista.copy()` en cada acceso).
+
+Uso: python benchmarks/bench_vistas.py [cantidad_turnos] [consultas]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelomedico import Medico
+from modelopaciente import Paciente
+from modeloespecialidad import Especialidad
+
+
+def crear_clinica(cantidad_turnos):
+    clinica = Clinica()
+    for i in range(1000):
+        clinica.agregar_paciente(Paciente(f"Paciente {i}", str(i), "01/01/1990"))
+    todos = ["lunes", "martes", "miércoles", "jueves", "viernes", "sábado", "domingo"]
+    for i in range(100):
+        medico = Medico(f"Medico {i}", f"M{i}")
+        medico.agregar_especialidad(Especialidad("Clínica", todos, timedelta(minutes=15)))
+        clinica.agregar_medico(medico)
+    inicio = datetime(2025, 1, 6, 8, 0)
+    clinica.agendar_turnos([(str(i % 1000), f"M{i % 100}", "Clínica", inicio + timedelta(minutes=15 * (i // 100)))
+                            for i in range(cantidad_turnos)])
+    return clinica
+
+
+def pantalla(obtener, consultas):
+    """Pide el listado `consultas` veces y mide tiempo y pico de memoria"""
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    for _ in range(consultas):
+        turnos = obtener()
+        total = len(turnos)
+        pagina = [str(turno) for turno in turnos[:20]]
+    duracion = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duracion, pico, total, pagina
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    consultas = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    clinica = crear_clinica(cantidad)
+    
+    t_vista, m_vista, total, pagina_vista = pantalla(clinica.obtener_turnos, consultas)
+    t_copia, m_copia, _, pagina_copia = pantalla(lambda: list(clinica.obtener_turnos()), consultas)
+    assert pagina_vista == pagina_copia
+    
+    print(f"Turnos: {total}, consultas: {consultas}")
+    print(f"  copias : {t_copia:7.3f} s  pico {m_copia / 1024:10.1f} KiB")
+    print(f"  vistas : {t_vista:7.3f} s  pico {m_vista / 1024:10.1f} KiB")
+    print(f"  mejora : {t_copia / t_vista:7.1f}x en tiempo, {m_copia / max(m_vista, 1):.0f}x en memoria")
+
+
+if __name__ == "__main__":
+    main()
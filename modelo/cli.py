@@ -1,12 +1,21 @@
 
 
-from datetime import datetime
+import argparse
+import re
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, List, Optional, Sequence, TextIO, Tuple
+from modelorepositoriosqlite import RepositorioSQLite
+from modeloimportacion import Importador
+from modelometricas import Metricas
 from modeloclinica import (
-    Clinica, Paciente, Medico, Especialidad,
+    Clinica, Paciente, Medico, Especialidad, DURACION_PREDETERMINADA,
     PacienteNoEncontradoException,
     MedicoNoEncontradoException,
     MedicoNoDisponibleException,
     TurnoOcupadoException,
+    TurnoNoEncontradoException,
     RecetaInvalidaException,
     EspecialidadNoValidaException,
     PacienteDuplicadoException,
@@ -17,8 +26,12 @@ from modeloclinica import (
 class CLI:
     """Interfaz de consola para el sistema de gestión de la clínica"""
     
-    def __init__(self):
-        self.clinica = Clinica()
+    def __init__(self, clinica: Optional[Clinica] = None, tamano_pagina: int = 20):
+        if tamano_pagina < 1:
+            raise ValueError("El tamaño de página debe ser positivo")
+        self.clinica = clinica if clinica is not None else Clinica()
+        # Cantidad de registros por página en los listados
+        self.tamano_pagina = tamano_pagina
     
     def mostrar_menu(self):
         """Muestra el menú principal"""
@@ -34,6 +47,12 @@ class CLI:
         print("7) Ver todos los turnos")
         print("8) Ver todos los pacientes")
         print("9) Ver todos los médicos")
+        print("10) Ver métricas")
+        print("11) Cancelar turno")
+        print("12) Reprogramar turno")
+        print("13) Buscar recetas por medicamento")
+        print("14) Ver medicamentos más recetados")
+        print("15) Buscar paciente por nombre")
         print("0) Salir")
         print("="*50)
     
@@ -64,16 +83,30 @@ class CLI:
                     self.ver_pacientes()
                 elif opcion == "9":
                     self.ver_medicos()
+                elif opcion == "10":
+                    self.ver_metricas()
+                elif opcion == "11":
+                    self.cancelar_turno()
+                elif opcion == "12":
+                    self.reprogramar_turno()
+                elif opcion == "13":
+                    self.buscar_recetas_por_medicamento()
+                elif opcion == "14":
+                    self.ver_medicamentos_mas_recetados()
+                elif opcion == "15":
+                    self.buscar_pacientes()
                 elif opcion == "0":
                     print("¡Gracias!")
+                    self.clinica.cerrar()
                     break
                 else:
                     print("Opción inválida. Por favor, seleccione una opción del menú.")
                 
                 input("\nPresione Enter para continuar...")
-                
+            
             except KeyboardInterrupt:
                 print("\n\n¡Hasta luego!")
+                self.clinica.cerrar()
                 break
             except Exception as e:
                 print(f"Error inesperado: {e}")
@@ -94,7 +127,7 @@ class CLI:
             paciente = Paciente(nombre, dni, fecha_nacimiento)
             self.clinica.agregar_paciente(paciente)
             print(f"Paciente {nombre} registrado exitosamente.")
-            
+        
         except PacienteDuplicadoException as e:
             print(f" {e}")
         except ValueError as e:
@@ -116,7 +149,7 @@ class CLI:
             medico = Medico(nombre, matricula)
             self.clinica.agregar_medico(medico)
             print(f"Médico Dr. {nombre} registrado exitosamente.")
-            
+        
         except MedicoDuplicadoException as e:
             print(f" {e}")
         except ValueError as e:
@@ -134,8 +167,8 @@ class CLI:
                 print(" La matrícula es obligatoria.")
                 return
             
-          
-            medico = self.clinica.obtener_medico_por_matricula(matricula)
+            
+            self.clinica.validar_existencia_medico(matricula)
             
             tipo_especialidad = input("Tipo de especialidad: ").strip()
             if not tipo_especialidad:
@@ -151,12 +184,13 @@ class CLI:
                 return
             
             dias = [dia.strip() for dia in dias_input.split(",")]
+            duracion = _leer_duracion(input("Duración de los turnos en minutos (vacío = 30): ").strip())
             
-            especialidad = Especialidad(tipo_especialidad, dias)
-            medico.agregar_especialidad(especialidad)
+            especialidad = Especialidad(tipo_especialidad, dias, DURACION_PREDETERMINADA if duracion is None else duracion)
+            self.clinica.agregar_especialidad(matricula, especialidad)
             
             print(f"Especialidad {tipo_especialidad} agregada exitosamente al Dr. {matricula}.")
-            
+        
         except MedicoNoEncontradoException as e:
             print(f" {e}")
         except ValueError as e:
@@ -191,16 +225,85 @@ class CLI:
                 print(" Formato de fecha u hora inválido. Use dd/mm/aaaa para fecha y HH:MM para hora.")
                 return
             
-            self.clinica.agendar_turno(dni, matricula, especialidad, fecha_hora)
-            print(f" Turno agendado exitosamente para el {fecha_str} a las {hora_str}.")
+            try:
+                duracion = _leer_duracion(input("Duración en minutos (vacío = la de la especialidad): ").strip())
+            except ValueError as e:
+                print(f" {e}")
+                return
             
+            try:
+                self.clinica.agendar_turno(dni, matricula, especialidad, fecha_hora, duracion)
+            except TurnoOcupadoException as e:
+                print(f" {e}")
+                self.__ofrecer_lista_espera(dni, matricula, especialidad, fecha_hora)
+                return
+            print(f" Turno agendado exitosamente para el {fecha_str} a las {hora_str}.")
+        
         except (PacienteNoEncontradoException, MedicoNoEncontradoException, 
                 MedicoNoDisponibleException, TurnoOcupadoException, 
                 EspecialidadNoValidaException) as e:
             print(f" {e}")
+        except ValueError as e:
+            print(f" Error en los datos: {e}")
+        except Exception as e:
+            print(f" Error inesperado: {e}")
+    
+    def __ofrecer_lista_espera(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime):
+        """Ofrece anotar al paciente en la lista de espera del médico cuando el horario está ocupado"""
+        if input("¿Anotar al paciente en la lista de espera? (s/n): ").strip().lower() != "s":
+            return
+        try:
+            hasta = self.__leer_fecha_opcional("Esperar hasta el día (dd/mm/aaaa, vacío = el mismo día): ")
+            desde = fecha_hora.date()
+            solicitud = self.clinica.agregar_a_lista_espera(dni, especialidad, desde,
+                                                            hasta.date() if hasta else desde, matricula)
+        except ValueError as e:
+            print(f" {e}")
+            return
+        turno = solicitud.obtener_turno()
+        if turno is not None:
+            print(f" Había un horario libre. Turno agendado: {turno}")
+        else:
+            print(f" Paciente en lista de espera ({len(self.clinica.obtener_lista_espera())} esperando).")
+    
+    def cancelar_turno(self):
+        """Cancela un turno identificado por médico, fecha y hora"""
+        print("\n--- CANCELAR TURNO ---")
+        try:
+            matricula = input("Matrícula del médico: ").strip()
+            fecha_hora = self.__leer_fecha_hora("Fecha del turno (dd/mm/aaaa): ", "Hora del turno (HH:MM): ")
+            turno = self.clinica.cancelar_turno(matricula, fecha_hora)
+            print(f" Turno cancelado: {turno}")
+        
+        except (MedicoNoEncontradoException, TurnoNoEncontradoException) as e:
+            print(f" {e}")
+        except ValueError as e:
+            print(f" {e}")
         except Exception as e:
             print(f" Error inesperado: {e}")
     
+    def reprogramar_turno(self):
+        """Mueve un turno a otro horario del mismo médico"""
+        print("\n--- REPROGRAMAR TURNO ---")
+        try:
+            matricula = input("Matrícula del médico: ").strip()
+            fecha_hora = self.__leer_fecha_hora("Fecha actual del turno (dd/mm/aaaa): ", "Hora actual (HH:MM): ")
+            nueva_fecha_hora = self.__leer_fecha_hora("Nueva fecha (dd/mm/aaaa): ", "Nueva hora (HH:MM): ")
+            turno = self.clinica.reprogramar_turno(matricula, fecha_hora, nueva_fecha_hora)
+            print(f" Turno reprogramado: {turno}")
+        
+        except (MedicoNoEncontradoException, TurnoNoEncontradoException, MedicoNoDisponibleException,
+                TurnoOcupadoException, EspecialidadNoValidaException) as e:
+            print(f" {e}")
+        except ValueError as e:
+            print(f" {e}")
+        except Exception as e:
+            print(f" Error inesperado: {e}")
+    
+    def __leer_fecha_hora(self, pregunta_fecha: str, pregunta_hora: str) -> datetime:
+        """Pide una fecha dd/mm/aaaa y una hora HH:MM"""
+        return _leer_fecha_hora(input(pregunta_fecha).strip(), input(pregunta_hora).strip())
+    
     def emitir_receta(self):
         """Emite una nueva receta"""
         print("\n--- EMITIR RECETA ---")
@@ -228,13 +331,57 @@ class CLI:
             
             self.clinica.emitir_receta(dni, matricula, medicamentos)
             print("Receta emitida exitosamente.")
-            
+        
         except (PacienteNoEncontradoException, MedicoNoEncontradoException, 
                 RecetaInvalidaException) as e:
             print(f" {e}")
         except Exception as e:
             print(f" Error inesperado: {e}")
     
+    def buscar_recetas_por_medicamento(self):
+        """Muestra las recetas que incluyen un medicamento, con un período opcional"""
+        print("\n--- RECETAS POR MEDICAMENTO ---")
+        try:
+            medicamento = input("Medicamento: ").strip()
+            if not medicamento:
+                print(" El medicamento es obligatorio.")
+                return
+            desde, hasta = self.__leer_periodo()
+            
+            recetas = self.clinica.buscar_recetas_por_medicamento(medicamento, desde, hasta)
+            if not recetas:
+                print(f"No hay recetas con {medicamento}.")
+                return
+            print(f"\nRecetas con {medicamento} ({len(recetas)}):")
+            for numero, receta in enumerate(recetas, 1):
+                print(f"  {numero}. {receta}")
+        
+        except ValueError:
+            print(" Formato de fecha inválido. Use dd/mm/aaaa.")
+        except Exception as e:
+            print(f" Error inesperado: {e}")
+    
+    def ver_medicamentos_mas_recetados(self):
+        """Muestra el ranking de medicamentos más recetados, de un médico o de todos, con un período opcional"""
+        print("\n--- MEDICAMENTOS MÁS RECETADOS ---")
+        try:
+            matricula = input("Matrícula del médico (Enter para todos): ").strip() or None
+            desde, hasta = self.__leer_periodo()
+            
+            ranking = self.clinica.medicamentos_mas_recetados(10, matricula, desde, hasta)
+            if not ranking:
+                print("No hay recetas en el período.")
+                return
+            for numero, (medicamento, recetas) in enumerate(ranking, 1):
+                print(f"  {numero}. {medicamento}: {recetas} {'receta' if recetas == 1 else 'recetas'}")
+        
+        except MedicoNoEncontradoException as e:
+            print(f" {e}")
+        except ValueError:
+            print(" Formato de fecha inválido. Use dd/mm/aaaa.")
+        except Exception as e:
+            print(f" Error inesperado: {e}")
+    
     def ver_historia_clinica(self):
         """Muestra la historia clínica de un paciente"""
         print("\n--- HISTORIA CLÍNICA ---")
@@ -246,69 +393,369 @@ class CLI:
                 return
             
             historia = self.clinica.obtener_historia_clinica(dni)
-            print("\n" + str(historia))
-            
+            # Se escribe línea por línea, sin armar el texto completo de la historia
+            print()
+            historia.escribir(sys.stdout)
+        
         except PacienteNoEncontradoException as e:
             print(f"{e}")
         except Exception as e:
             print(f" Error inesperado: {e}")
     
     def ver_turnos(self):
-        """Muestra todos los turnos agendados"""
+        """Muestra los turnos agendados por páginas, con filtros opcionales"""
         print("\n--- TODOS LOS TURNOS ---")
         try:
-            turnos = self.clinica.obtener_turnos()
-            
-            if not turnos:
-                print("No hay turnos agendados.")
-                return
-            
-            print(f"Total de turnos: {len(turnos)}\n")
-            for i, turno in enumerate(turnos, 1):
-                print(f"{i}. {turno}")
-                
+            print("Filtros (Enter para omitir):")
+            matricula = input("Matrícula del médico: ").strip() or None
+            especialidad = input("Especialidad: ").strip() or None
+            desde = self.__leer_fecha_opcional("Desde (dd/mm/aaaa): ")
+            hasta = self.__leer_fecha_opcional("Hasta (dd/mm/aaaa, inclusive): ")
+            if hasta is not None:
+                hasta += timedelta(days=1)
+            
+            filtrado = any(filtro is not None for filtro in (matricula, especialidad, desde, hasta))
+            self.__paginar(
+                lambda inicio, cantidad: self.clinica.paginar_turnos(inicio, cantidad, matricula,
+                                                                     especialidad, desde, hasta),
+                "turnos", "Ningún turno cumple los filtros." if filtrado else "No hay turnos agendados.")
+        
+        except MedicoNoEncontradoException as e:
+            print(f" {e}")
+        except ValueError:
+            print(" Formato de fecha inválido. Use dd/mm/aaaa.")
         except Exception as e:
             print(f" Error inesperado: {e}")
     
     def ver_pacientes(self):
-        """Muestra todos los pacientes registrados"""
+        """Muestra los pacientes registrados por páginas, con filtro opcional por nombre o DNI"""
         print("\n--- TODOS LOS PACIENTES ---")
         try:
-            pacientes = self.clinica.obtener_pacientes()
+            prefijo = input("Comienzo del nombre o del DNI (Enter para todos): ").strip() or None
+            self.__paginar(
+                lambda inicio, cantidad: self.clinica.paginar_pacientes(inicio, cantidad, prefijo),
+                "pacientes", "Ningún paciente coincide." if prefijo else "No hay pacientes registrados.")
+        except Exception as e:
+            print(f" Error inesperado: {e}")
+    
+    def buscar_pacientes(self):
+        """Busca pacientes por nombre o apellido, aunque estén incompletos o mal escritos"""
+        print("\n--- BUSCAR PACIENTE ---")
+        try:
+            texto = input("Nombre o apellido (puede estar incompleto): ").strip()
+            if not texto:
+                print(" Debe escribir algo para buscar.")
+                return
             
+            pacientes = self.clinica.buscar_pacientes(texto, self.tamano_pagina)
             if not pacientes:
-                print("No hay pacientes registrados.")
+                print("Ningún paciente coincide.")
                 return
-            
-            print(f"Total de pacientes: {len(pacientes)}\n")
-            for i, paciente in enumerate(pacientes, 1):
-                print(f"{i}. {paciente}")
-                
+            for numero, paciente in enumerate(pacientes, 1):
+                print(f"  {numero}. {paciente}")
         except Exception as e:
             print(f" Error inesperado: {e}")
     
     def ver_medicos(self):
-        """Muestra todos los médicos registrados"""
+        """Muestra los médicos registrados por páginas"""
         print("\n--- TODOS LOS MÉDICOS ---")
         try:
-            medicos = self.clinica.obtener_medicos()
+            self.__paginar(self.clinica.paginar_medicos, "médicos", "No hay médicos registrados.")
+        except Exception as e:
+            print(f" Error inesperado: {e}")
+    
+    def ver_metricas(self):
+        """Muestra llamadas, rechazos y latencias de cada operación de la clínica"""
+        print("\n--- MÉTRICAS ---")
+        self.__escribir_metricas(sys.stdout)
+    
+    def __escribir_metricas(self, salida: TextIO):
+        """Escribe una tabla con las métricas de cada operación llamada"""
+        metricas = self.clinica.obtener_metricas()
+        if metricas is None:
+            salida.write("Las métricas están desactivadas (inicie con --metricas).\n")
+            return
+        resumen = metricas.resumen()
+        if not resumen:
+            salida.write("Todavía no se llamó a ninguna operación.\n")
+            return
+        
+        salida.write(f"{'operación':<26}{'llamadas':>9}{'rechazos':>9}"
+                     f"{'media µs':>11}{'p50':>9}{'p90':>9}{'p99':>9}{'máx':>11}\n")
+        for nombre, datos in resumen.items():
+            latencia = datos["latencia_us"]
+            salida.write(f"{nombre:<26}{datos['llamadas']:>9}{sum(datos['rechazos'].values()):>9}"
+                         f"{latencia['media']:>11.1f}{latencia['p50']:>9.0f}{latencia['p90']:>9.0f}"
+                         f"{latencia['p99']:>9.0f}{latencia['max']:>11.0f}\n")
+            for excepcion, cantidad in datos["rechazos"].items():
+                salida.write(f"  {excepcion}: {cantidad}\n")
+    
+    def __leer_periodo(self) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """Pide un período opcional de fechas; el último día se incluye"""
+        desde = self.__leer_fecha_opcional("Desde (dd/mm/aaaa, Enter para omitir): ")
+        hasta = self.__leer_fecha_opcional("Hasta (dd/mm/aaaa, inclusive, Enter para omitir): ")
+        if hasta is not None:
+            hasta += timedelta(days=1)
+        return desde, hasta
+    
+    def __leer_fecha_opcional(self, pregunta: str) -> Optional[datetime]:
+        """Pide una fecha dd/mm/aaaa; devuelve None si se deja vacía"""
+        texto = input(pregunta).strip()
+        return datetime.strptime(texto, "%d/%m/%Y") if texto else None
+    
+    def __paginar(self, obtener_pagina: Callable[[int, int], Tuple[List, int]], nombre: str, vacio: str):
+        """Muestra un listado de a una página; solo se piden y se formatean los elementos visibles"""
+        tamano = self.tamano_pagina
+        pagina = 0
+        while True:
+            elementos, total = obtener_pagina(pagina * tamano, tamano)
+            if not total:
+                print(vacio)
+                return
             
-            if not medicos:
-                print("No hay médicos registrados.")
+            paginas = -(-total // tamano)
+            if paginas == 1:
+                print(f"Total de {nombre}: {total}\n")
+            else:
+                print(f"Total de {nombre}: {total} (página {pagina + 1} de {paginas})\n")
+            for i, elemento in enumerate(elementos, pagina * tamano + 1):
+                print(f"{i}. {elemento}")
+            if paginas == 1:
                 return
             
-            print(f"Total de médicos: {len(medicos)}\n")
-            for i, medico in enumerate(medicos, 1):
-                print(f"{i}. {medico}")
-                
-        except Exception as e:
-            print(f" Error inesperado: {e}")
+            opcion = input("\n[s] siguiente, [a] anterior, número de página, Enter para volver: ").strip().lower()
+            if not opcion:
+                return
+            if opcion == "s" and pagina + 1 < paginas:
+                pagina += 1
+            elif opcion == "a" and pagina > 0:
+                pagina -= 1
+            elif opcion.isdigit() and 1 <= int(opcion) <= paginas:
+                pagina = int(opcion) - 1
+    
+    def __escribir_listado(self, salida: TextIO, elementos: Sequence, nombre: str, vacio: str):
+        """Escribe un listado numerado precedido por su total"""
+        if not elementos:
+            salida.write(vacio + "\n")
+            return
+        salida.write(f"Total de {nombre}: {len(elementos)}\n\n")
+        for i, elemento in enumerate(elementos, 1):
+            salida.write(f"{i}. {elemento}\n")
+    
+    def ejecutar_lote(self, entrada: Iterable[str], salida: TextIO = sys.stdout) -> Tuple[int, int]:
+        """Ejecuta comandos de a uno por línea, sin menú ni pausas, y termina con un resumen.
+        
+        Cada línea es el nombre de una acción seguido de sus datos separados por
+        espacios; los datos con espacios van entre comillas y las listas
+        (días, medicamentos) separadas por comas. La duración en minutos de
+        agregar_especialidad y agendar_turno se puede omitir. Las líneas vacías y las que empiezan
+        con # se ignoran. Un comando que falla no detiene el lote. Devuelve (exitosos, fallidos).
+        """
+        # Comando -> (acción, datos que recibe); los datos entre corchetes son opcionales
+        comandos = {
+            "agregar_paciente": (self.__lote_agregar_paciente, ("NOMBRE", "DNI", "FECHA_NACIMIENTO")),
+            "agregar_medico": (self.__lote_agregar_medico, ("NOMBRE", "MATRICULA")),
+            "agregar_especialidad": (self.__lote_agregar_especialidad, ("MATRICULA", "ESPECIALIDAD", "DIAS", "[MINUTOS]")),
+            "agendar_turno": (self.__lote_agendar_turno,
+                              ("DNI", "MATRICULA", "ESPECIALIDAD", "dd/mm/aaaa", "HH:MM", "[MINUTOS]")),
+            "cancelar_turno": (self.__lote_cancelar_turno, ("MATRICULA", "dd/mm/aaaa", "HH:MM")),
+            "reprogramar_turno": (self.__lote_reprogramar_turno,
+                                  ("MATRICULA", "dd/mm/aaaa", "HH:MM", "NUEVA_dd/mm/aaaa", "NUEVA_HH:MM")),
+            "emitir_receta": (self.__lote_emitir_receta, ("DNI", "MATRICULA", "MEDICAMENTOS")),
+            "ver_historia_clinica": (self.__lote_ver_historia_clinica, ("DNI",)),
+            "ver_turnos": (self.__lote_ver_turnos, ()),
+            "ver_pacientes": (self.__lote_ver_pacientes, ()),
+            "ver_medicos": (self.__lote_ver_medicos, ()),
+            "ver_metricas": (self.__escribir_metricas, ()),
+        }
+        exitosos = fallidos = 0
+        inicio = time.perf_counter()
+        for numero, linea in enumerate(entrada, 1):
+            linea = linea.strip()
+            if not linea or linea.startswith("#"):
+                continue
+            try:
+                nombre, *datos = _partir_linea(linea)
+                if nombre not in comandos:
+                    raise ValueError(f"Comando desconocido: {nombre}")
+                accion, parametros = comandos[nombre]
+                opcionales = sum(parametro.startswith("[") for parametro in parametros)
+                if not len(parametros) - opcionales <= len(datos) <= len(parametros):
+                    raise ValueError(f"Uso: {nombre} {' '.join(parametros)}".rstrip())
+                accion(salida, *datos)
+                exitosos += 1
+            except Exception as e:
+                salida.write(f"Línea {numero}: {e}\n")
+                fallidos += 1
+        
+        segundos = time.perf_counter() - inicio
+        salida.write(f"Resumen: {exitosos} exitosos, {fallidos} fallidos en {segundos:.3f} s\n")
+        salida.flush()
+        return exitosos, fallidos
+    
+    def __lote_agregar_paciente(self, salida: TextIO, nombre: str, dni: str, fecha_nacimiento: str):
+        self.clinica.agregar_paciente(Paciente(nombre, dni, fecha_nacimiento))
+    
+    def __lote_agregar_medico(self, salida: TextIO, nombre: str, matricula: str):
+        self.clinica.agregar_medico(Medico(nombre, matricula))
+    
+    def __lote_agregar_especialidad(self, salida: TextIO, matricula: str, especialidad: str, dias: str,
+                                    minutos: str = ""):
+        duracion = _leer_duracion(minutos)
+        self.clinica.agregar_especialidad(matricula, Especialidad(
+            especialidad, _separar(dias), DURACION_PREDETERMINADA if duracion is None else duracion))
+    
+    def __lote_agendar_turno(self, salida: TextIO, dni: str, matricula: str, especialidad: str,
+                             fecha: str, hora: str, minutos: str = ""):
+        self.clinica.agendar_turno(dni, matricula, especialidad, _leer_fecha_hora(fecha, hora), _leer_duracion(minutos))
+    
+    def __lote_cancelar_turno(self, salida: TextIO, matricula: str, fecha: str, hora: str):
+        self.clinica.cancelar_turno(matricula, _leer_fecha_hora(fecha, hora))
+    
+    def __lote_reprogramar_turno(self, salida: TextIO, matricula: str, fecha: str, hora: str,
+                                 nueva_fecha: str, nueva_hora: str):
+        self.clinica.reprogramar_turno(matricula, _leer_fecha_hora(fecha, hora), _leer_fecha_hora(nueva_fecha, nueva_hora))
+    
+    def __lote_emitir_receta(self, salida: TextIO, dni: str, matricula: str, medicamentos: str):
+        self.clinica.emitir_receta(dni, matricula, _separar(medicamentos))
+    
+    def __lote_ver_historia_clinica(self, salida: TextIO, dni: str):
+        self.clinica.obtener_historia_clinica(dni).escribir(salida)
+    
+    def __lote_ver_turnos(self, salida: TextIO):
+        self.__escribir_listado(salida, self.clinica.obtener_turnos(), "turnos", "No hay turnos agendados.")
+    
+    def __lote_ver_pacientes(self, salida: TextIO):
+        self.__escribir_listado(salida, self.clinica.obtener_pacientes(), "pacientes", "No hay pacientes registrados.")
+    
+    def __lote_ver_medicos(self, salida: TextIO):
+        self.__escribir_listado(salida, self.clinica.obtener_medicos(), "médicos", "No hay médicos registrados.")
+
+
+# Palabra entre comillas dobles (puede tener espacios) o sin comillas
+_PALABRA = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def _partir_linea(linea: str) -> List[str]:
+    """Separa una línea del modo por lotes en palabras; las comillas dobles agrupan espacios"""
+    if '"' not in linea:
+        return linea.split()
+    if linea.count('"') % 2:
+        raise ValueError("Comillas sin cerrar")
+    return [m.group(1) if m.group(2) is None else m.group(2) for m in _PALABRA.finditer(linea)]
+
+
+def _leer_fecha_hora(fecha: str, hora: str) -> datetime:
+    """Convierte una fecha dd/mm/aaaa y una hora HH:MM; más rápido que strptime para miles de líneas"""
+    try:
+        dia, mes, anio = fecha.split("/")
+        horas, minutos = hora.split(":")
+        return datetime(int(anio), int(mes), int(dia), int(horas), int(minutos))
+    except ValueError:
+        raise ValueError("Formato de fecha u hora inválido. Use dd/mm/aaaa para fecha y HH:MM para hora.") from None
+
+
+def _leer_duracion(minutos: str) -> Optional[timedelta]:
+    """Convierte una duración en minutos; vacía devuelve None y cero o negativa es un error"""
+    if not minutos:
+        return None
+    try:
+        cantidad = int(minutos)
+    except ValueError:
+        raise ValueError("La duración debe ser una cantidad entera de minutos.") from None
+    if cantidad <= 0:
+        raise ValueError("La duración debe ser de al menos un minuto.")
+    return timedelta(minutes=cantidad)
+
+
+def _separar(lista: str) -> List[str]:
+    """Separa una lista de valores separados por comas, descartando los vacíos"""
+    return [valor.strip() for valor in lista.split(",") if valor.strip()]
+
+
+def importar(clinica: Clinica, archivos, ruta_rechazos: str):
+    """Importa los archivos (tipo, ruta) en orden, mostrando el avance y la velocidad"""
+    def mostrar_progreso(procesados: int, rechazados: int, segundos: float):
+        velocidad = procesados / segundos if segundos > 0 else 0
+        print(f"\r  {procesados} registros, {rechazados} rechazados ({velocidad:.0f} registros/s)", end="")
+    
+    with open(ruta_rechazos, "w", encoding="utf-8") as rechazos:
+        importador = Importador(clinica, rechazos, progreso=mostrar_progreso)
+        metodos = {"pacientes": importador.importar_pacientes, "medicos": importador.importar_medicos,
+                   "turnos": importador.importar_turnos}
+        total_rechazados = 0
+        for tipo, ruta in archivos:
+            print(f"Importando {tipo} desde {ruta}")
+            importados, rechazados = metodos[tipo](ruta)
+            total_rechazados += rechazados
+            print(f"\n  {importados} importados, {rechazados} rechazados")
+    if total_rechazados:
+        print(f"Los registros rechazados están en {ruta_rechazos}")
 
 
 def main():
     """Función principal para ejecutar la aplicación"""
-    cli = CLI()
-    cli.ejecutar()
+    parser = argparse.ArgumentParser(description="Sistema de gestión de la clínica")
+    parser.add_argument("--bitacora", metavar="RUTA",
+                        help="archivo de bitácora: se reproduce al iniciar y registra cada operación")
+    parser.add_argument("--instantanea", metavar="RUTA",
+                        help="instantánea binaria: se carga al iniciar (más la bitácora posterior) y se guarda al salir")
+    parser.add_argument("--fsync-cada", type=int, default=100, metavar="N",
+                        help="confirmar la bitácora en disco cada N eventos (0 = nunca forzar)")
+    parser.add_argument("--base", metavar="RUTA",
+                        help="guardar los datos en una base SQLite (ya persistente: no admite bitácora ni instantánea)")
+    parser.add_argument("--importar", nargs=2, action="append", metavar=("TIPO", "RUTA"),
+                        help="importar pacientes, medicos o turnos desde un CSV o JSONL y salir (se puede repetir)")
+    parser.add_argument("--rechazos", default="rechazos.jsonl", metavar="RUTA",
+                        help="archivo donde se anotan los registros que no se pudieron importar")
+    parser.add_argument("--pagina", type=int, default=20, metavar="N",
+                        help="cantidad de registros por página en los listados")
+    parser.add_argument("--metricas", action="store_true",
+                        help="medir llamadas, rechazos y latencias de cada operación (opción 10 del menú)")
+    parser.add_argument("--metricas-json", metavar="RUTA",
+                        help="al salir, guardar las métricas en RUTA como JSON (activa --metricas)")
+    parser.add_argument("--lote", metavar="RUTA",
+                        help="ejecutar los comandos del archivo (o de la entrada estándar con -), uno por línea, y salir")
+    argumentos = parser.parse_args()
+    for tipo, _ in argumentos.importar or ():
+        if tipo not in ("pacientes", "medicos", "turnos"):
+            parser.error(f"tipo de importación inválido: {tipo} (use pacientes, medicos o turnos)")
+    if argumentos.base and (argumentos.bitacora or argumentos.instantanea):
+        parser.error("--base no se puede combinar con --bitacora ni con --instantanea")
+    
+    metricas = Metricas() if argumentos.metricas or argumentos.metricas_json else None
+    if argumentos.base:
+        clinica = Clinica(repositorio=RepositorioSQLite(argumentos.base), metricas=metricas)
+    elif argumentos.instantanea:
+        clinica = Clinica.recuperar(argumentos.instantanea, argumentos.bitacora, fsync_cada=argumentos.fsync_cada,
+                                    metricas=metricas)
+    elif argumentos.bitacora:
+        clinica = Clinica.desde_bitacora(argumentos.bitacora, fsync_cada=argumentos.fsync_cada, metricas=metricas)
+    else:
+        clinica = Clinica(metricas=metricas)
+    cli = CLI(clinica, argumentos.pagina)
+    fallidos = 0
+    if argumentos.importar:
+        importar(cli.clinica, argumentos.importar, argumentos.rechazos)
+    if argumentos.lote:
+        # Salida con un búfer grande: se escribe en bloques y no línea por línea
+        with open(sys.stdout.fileno(), "w", encoding="utf-8", buffering=1 << 16, closefd=False) as salida:
+            if argumentos.lote == "-":
+                _, fallidos = cli.ejecutar_lote(sys.stdin, salida)
+            else:
+                with open(argumentos.lote, encoding="utf-8") as entrada:
+                    _, fallidos = cli.ejecutar_lote(entrada, salida)
+    if argumentos.importar or argumentos.lote:
+        cli.clinica.cerrar()
+    else:
+        cli.ejecutar()
+    if argumentos.instantanea:
+        cli.clinica.guardar_instantanea(argumentos.instantanea)
+    if argumentos.metricas_json:
+        with open(argumentos.metricas_json, "w", encoding="utf-8") as archivo:
+            metricas.escribir_json(archivo)
+    if fallidos:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
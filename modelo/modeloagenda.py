@@ -0,0 +1,216 @@
+
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import List, Optional, Tuple
+from modeloturno import Turno
+
+
+# Turnos por bloque de la agenda: al superar el máximo el bloque se parte en dos
+_TAMANO_BLOQUE = 1024
+
+
+def _agregar_bloques(fechas: List[datetime], turnos: List[Turno], fechas_bloques: List[List[datetime]],
+                     turnos_bloques: List[List[Turno]], primeras: List[datetime]):
+    """Agrega turnos ordenados como uno o más bloques; si no entran en uno, a medio llenar"""
+    # Bloques a medio llenar: dejan lugar para insertar sin partirlos enseguida
+    paso = len(fechas) if len(fechas) <= _TAMANO_BLOQUE else _TAMANO_BLOQUE // 2
+    for i in range(0, len(fechas), paso):
+        fechas_bloques.append(fechas[i:i + paso])
+        turnos_bloques.append(turnos[i:i + paso])
+        primeras.append(fechas[i])
+
+
+class AgendaMedico:
+    """Calendario de un médico con sus turnos ordenados por fecha y hora.
+    
+    Los turnos se guardan en bloques ordenados de hasta _TAMANO_BLOQUE turnos, ubicados
+    por la primera fecha de cada bloque: insertar o quitar solo mueve los turnos de un
+    bloque, así que agendar cuesta lo mismo con mil turnos que con un millón.
+    
+    Clinica no deja agendar turnos que se superpongan, así que los turnos también quedan
+    ordenados por su fin: para saber si un intervalo choca con alguno alcanza con mirar
+    el último que empieza antes de que termine el intervalo.
+    """
+    
+    def __init__(self):
+        # Bloques paralelos: las fechas permiten buscar con bisect sin crear claves
+        self.__fechas: List[List[datetime]] = []
+        self.__turnos: List[List[Turno]] = []
+        # Primera fecha de cada bloque
+        self.__primeras: List[datetime] = []
+        self.__cantidad = 0
+    
+    def agregar_turno(self, turno: Turno):
+        """Inserta un turno manteniendo el orden cronológico"""
+        fecha_hora = turno.obtener_fecha_hora()
+        self.__cantidad += 1
+        if not self.__fechas:
+            self.__fechas.append([fecha_hora])
+            self.__turnos.append([turno])
+            self.__primeras.append(fecha_hora)
+            return
+        
+        bloque = max(bisect_right(self.__primeras, fecha_hora) - 1, 0)
+        fechas = self.__fechas[bloque]
+        turnos = self.__turnos[bloque]
+        posicion = bisect_right(fechas, fecha_hora)
+        fechas.insert(posicion, fecha_hora)
+        turnos.insert(posicion, turno)
+        if posicion == 0:
+            self.__primeras[bloque] = fecha_hora
+        
+        if len(fechas) > _TAMANO_BLOQUE:
+            mitad = len(fechas) // 2
+            self.__fechas.insert(bloque + 1, fechas[mitad:])
+            self.__turnos.insert(bloque + 1, turnos[mitad:])
+            self.__primeras.insert(bloque + 1, fechas[mitad])
+            del fechas[mitad:], turnos[mitad:]
+    
+    def agregar_turnos(self, turnos: List[Turno]):
+        """Inserta varios turnos a la vez, mezclándolos solo con los bloques donde caen"""
+        # Pocos turnos: conviene insertar de a uno en lugar de mezclar
+        if len(turnos) < 32:
+            for turno in turnos:
+                self.agregar_turno(turno)
+            return
+        nuevos = sorted(turnos, key=Turno.obtener_fecha_hora)
+        nuevas_fechas = [turno.obtener_fecha_hora() for turno in nuevos]
+        self.__cantidad += len(nuevos)
+        if not self.__fechas:
+            _agregar_bloques(nuevas_fechas, nuevos, self.__fechas, self.__turnos, self.__primeras)
+            return
+        
+        # Cada turno nuevo va al bloque que elegiría agregar_turno; los bloques que no
+        # reciben ninguno se conservan sin copiarlos
+        fechas_bloques: List[List[datetime]] = []
+        turnos_bloques: List[List[Turno]] = []
+        primeras: List[datetime] = []
+        inicio = 0
+        ultimo = len(self.__fechas) - 1
+        for bloque, (fechas, turnos_bloque) in enumerate(zip(self.__fechas, self.__turnos)):
+            fin = len(nuevos) if bloque == ultimo else bisect_left(nuevas_fechas, self.__primeras[bloque + 1], inicio)
+            if fin == inicio:
+                fechas_bloques.append(fechas)
+                turnos_bloques.append(turnos_bloque)
+                primeras.append(self.__primeras[bloque])
+                continue
+            # Dos tramos ordenados: sorted los mezcla en tiempo lineal y deja primero los existentes
+            todas_fechas = fechas + nuevas_fechas[inicio:fin]
+            todos_turnos = turnos_bloque + nuevos[inicio:fin]
+            orden = sorted(range(len(todas_fechas)), key=todas_fechas.__getitem__)
+            _agregar_bloques([todas_fechas[i] for i in orden], [todos_turnos[i] for i in orden],
+                             fechas_bloques, turnos_bloques, primeras)
+            inicio = fin
+        self.__fechas, self.__turnos, self.__primeras = fechas_bloques, turnos_bloques, primeras
+    
+    def quitar_turno(self, fecha_hora: datetime) -> Optional[Turno]:
+        """Quita el turno de esa fecha y hora (búsqueda binaria); devuelve el turno o None si no había"""
+        bloque, posicion = self.__posicion(fecha_hora)
+        if bloque == len(self.__fechas) or self.__fechas[bloque][posicion] != fecha_hora:
+            return None
+        
+        fechas = self.__fechas[bloque]
+        del fechas[posicion]
+        turno = self.__turnos[bloque].pop(posicion)
+        self.__cantidad -= 1
+        if not fechas:
+            del self.__fechas[bloque], self.__turnos[bloque], self.__primeras[bloque]
+        elif posicion == 0:
+            self.__primeras[bloque] = fechas[0]
+        return turno
+    
+    def __posicion(self, fecha_hora: datetime) -> Tuple[int, int]:
+        """(bloque, posición) del primer turno con fecha >= fecha_hora; (cantidad de bloques, 0) si no hay"""
+        bloque = bisect_left(self.__primeras, fecha_hora) - 1
+        if bloque < 0:
+            return 0, 0
+        posicion = bisect_left(self.__fechas[bloque], fecha_hora)
+        if posicion == len(self.__fechas[bloque]):
+            return bloque + 1, 0
+        return bloque, posicion
+    
+    def __anterior(self, bloque: int, posicion: int) -> Optional[Tuple[int, int]]:
+        """(bloque, posición) del turno anterior a una posición, o None si es la primera"""
+        if posicion:
+            return bloque, posicion - 1
+        if bloque:
+            return bloque - 1, len(self.__fechas[bloque - 1]) - 1
+        return None
+    
+    def __entre(self, bloques: list, inicio: Tuple[int, int], fin: Tuple[int, int],
+                limite: Optional[int] = None) -> list:
+        """Elementos de los bloques desde la posición inicio hasta fin (exclusive), como mucho `limite`"""
+        if inicio >= fin:
+            return []
+        (bloque, posicion), (ultimo, posicion_fin) = inicio, fin
+        if bloque == ultimo:
+            resultado = bloques[bloque][posicion:posicion_fin]
+        else:
+            resultado = bloques[bloque][posicion:]
+            for intermedio in range(bloque + 1, ultimo):
+                if limite is not None and len(resultado) >= limite:
+                    break
+                resultado.extend(bloques[intermedio])
+            if ultimo < len(bloques):
+                resultado.extend(bloques[ultimo][:posicion_fin])
+        if limite is not None:
+            del resultado[limite:]
+        return resultado
+    
+    def hay_superposicion(self, inicio: datetime, fin: datetime, excluir: Optional[datetime] = None) -> bool:
+        """Indica en O(log n) si algún turno se superpone con [inicio, fin), sin contar el que empieza en `excluir`"""
+        # Se agenda en cada alta: busca el último turno que empieza antes de `fin` sin pasar por __posicion
+        bloque = bisect_left(self.__primeras, fin) - 1
+        if bloque < 0:
+            return False
+        fechas = self.__fechas[bloque]
+        # El bloque empieza antes de `fin`, así que tiene al menos un turno anterior
+        posicion = bisect_left(fechas, fin) - 1
+        if fechas[posicion] == excluir:
+            if posicion:
+                posicion -= 1
+            elif bloque:
+                bloque -= 1
+                posicion = len(self.__fechas[bloque]) - 1
+            else:
+                return False
+        return self.__turnos[bloque][posicion].obtener_fin() > inicio
+    
+    def obtener_intervalos_entre(self, desde: datetime, hasta: datetime) -> List[Tuple[datetime, datetime]]:
+        """Devuelve (inicio, fin) de los turnos que se superponen con [desde, hasta), en orden cronológico"""
+        inicio = self.__posicion(desde)
+        # Solo el turno anterior puede seguir en curso al llegar a `desde`
+        anterior = self.__anterior(*inicio)
+        if anterior is not None and self.__turnos[anterior[0]][anterior[1]].obtener_fin() > desde:
+            inicio = anterior
+        return [(turno.obtener_fecha_hora(), turno.obtener_fin())
+                for turno in self.__entre(self.__turnos, inicio, self.__posicion(hasta))]
+    
+    def __rango(self, desde: Optional[datetime], hasta: Optional[datetime]) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """Posiciones de inicio y fin de los turnos con fecha en [desde, hasta)"""
+        inicio = (0, 0) if desde is None else self.__posicion(desde)
+        fin = (len(self.__fechas), 0) if hasta is None else self.__posicion(hasta)
+        return inicio, fin
+    
+    def obtener_turnos_entre(self, desde: Optional[datetime] = None, hasta: Optional[datetime] = None,
+                             limite: Optional[int] = None) -> List[Turno]:
+        """Devuelve los turnos con fecha en [desde, hasta) en orden cronológico (los primeros `limite`, si se indica)"""
+        return self.__entre(self.__turnos, *self.__rango(desde, hasta), limite)
+    
+    def contar_entre(self, desde: Optional[datetime] = None, hasta: Optional[datetime] = None) -> int:
+        """Cuenta los turnos con fecha en [desde, hasta) sin copiarlos"""
+        if desde is None and hasta is None:
+            return self.__cantidad
+        (bloque, posicion), (ultimo, posicion_fin) = self.__rango(desde, hasta)
+        if (bloque, posicion) >= (ultimo, posicion_fin):
+            return 0
+        # Se suman los tamaños de los bloques, no los turnos
+        return sum(map(len, self.__fechas[bloque:ultimo])) - posicion + posicion_fin
+    
+    def obtener_fechas_entre(self, desde: datetime, hasta: datetime) -> List[datetime]:
+        """Devuelve las fechas de los turnos en [desde, hasta) en orden cronológico"""
+        return self.__entre(self.__fechas, *self.__rango(desde, hasta))
+    
+    def __len__(self) -> int:
+        return self.__cantidad
\ No newline at end of file
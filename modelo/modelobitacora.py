@@ -0,0 +1,195 @@
+
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Iterator, List
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad, DURACION_PREDETERMINADA, MINUTO
+from modeloturno import Turno
+from modeloreceta import Receta
+
+
+# Tipos de evento: primer elemento de cada línea de la bitácora
+EVENTO_PACIENTE = "P"
+EVENTO_MEDICO = "M"
+EVENTO_ESPECIALIDAD = "E"
+EVENTO_TURNO = "T"
+EVENTO_RECETA = "R"
+EVENTO_CANCELACION = "C"
+# Reprogramación: cambio de horario de un turno
+EVENTO_REPROGRAMACION = "H"
+
+# Las especialidades y los turnos llevan al final su duración en minutos solo si no es
+# DURACION_PREDETERMINADA: las bitácoras anteriores a las duraciones se leen igual
+
+# Codificador y decodificador reutilizables: evitan reconstruirlos en cada evento
+_codificar = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+_decodificar = json.JSONDecoder().raw_decode
+
+
+def _duracion(duracion) -> List[int]:
+    """Minutos a agregar al final de un evento: ninguno para la duración predeterminada"""
+    return [] if duracion == DURACION_PREDETERMINADA else [duracion // MINUTO]
+
+
+def _descartar_linea_incompleta(ruta: str):
+    """Recorta la bitácora hasta su último salto de línea.
+    
+    Una escritura interrumpida deja una línea sin terminar al final; si se anexara
+    detrás de ella, el primer evento nuevo quedaría pegado y la línea sería ilegible.
+    """
+    if not os.path.exists(ruta):
+        return
+    with open(ruta, "r+b") as archivo:
+        fin = archivo.seek(0, os.SEEK_END)
+        posicion = fin
+        while posicion > 0:
+            inicio = max(0, posicion - (1 << 16))
+            archivo.seek(inicio)
+            bloque = archivo.read(posicion - inicio)
+            salto = bloque.rfind(b"\n")
+            if salto >= 0:
+                posicion = inicio + salto + 1
+                break
+            posicion = inicio
+        if posicion != fin:
+            archivo.truncate(posicion)
+
+
+class Bitacora:
+    """Registro de solo anexado con cada operación que modifica una Clinica.
+    
+    Cada evento es una línea JSON con una lista compacta. Las escrituras pasan por
+    un búfer y se confirman en disco (fsync) en grupo: cada `fsync_cada` eventos o a
+    lo sumo `fsync_intervalo` segundos después del primer evento sin confirmar, aunque
+    no lleguen más escrituras (un temporizador en segundo plano hace el fsync).
+    Con `fsync_cada=1` cada evento es durable al volver; con `fsync_cada=0` nunca se
+    fuerza el fsync y la durabilidad queda en manos del sistema operativo.
+    Se puede compartir entre hilos: cada evento se escribe completo bajo un candado.
+    """
+    
+    def __init__(self, ruta: str, fsync_cada: int = 100, fsync_intervalo: float = 1.0):
+        if fsync_cada < 0 or fsync_intervalo < 0:
+            raise ValueError("La política de fsync no puede ser negativa")
+        
+        self.__ruta = ruta
+        _descartar_linea_incompleta(ruta)
+        self.__archivo = open(ruta, "a", encoding="utf-8", buffering=1 << 16)
+        self.__fsync_cada = fsync_cada
+        self.__fsync_intervalo = fsync_intervalo
+        self.__pendientes = 0
+        self.__temporizador = None
+        self.__bloqueo = threading.Lock()
+    
+    def obtener_ruta(self) -> str:
+        """Devuelve la ruta del archivo de la bitácora"""
+        return self.__ruta
+    
+    def registrar_paciente(self, paciente: Paciente):
+        """Registra el alta de un paciente"""
+        self.__escribir([EVENTO_PACIENTE, paciente.obtener_nombre(), paciente.obtener_dni(),
+                         paciente.obtener_fecha_nacimiento()])
+    
+    def registrar_medico(self, medico: Medico):
+        """Registra el alta de un médico junto con las especialidades que ya tenga"""
+        especialidades = [[esp.obtener_especialidad(), esp.obtener_mascara_dias(), *_duracion(esp.obtener_duracion())]
+                          for esp in medico.obtener_especialidades()]
+        self.__escribir([EVENTO_MEDICO, medico.obtener_nombre(), medico.obtener_matricula(), especialidades])
+    
+    def registrar_especialidad(self, matricula: str, especialidad: Especialidad):
+        """Registra una especialidad agregada a un médico"""
+        self.__escribir([EVENTO_ESPECIALIDAD, matricula, especialidad.obtener_especialidad(),
+                         especialidad.obtener_mascara_dias(), *_duracion(especialidad.obtener_duracion())])
+    
+    def registrar_turno(self, turno: Turno):
+        """Registra un turno agendado"""
+        self.__escribir([EVENTO_TURNO, turno.obtener_paciente().obtener_dni(),
+                         turno.obtener_medico().obtener_matricula(), turno.obtener_especialidad(),
+                         turno.obtener_fecha_hora().isoformat(), *_duracion(turno.obtener_duracion())])
+    
+    def registrar_cancelacion(self, matricula: str, fecha_hora: datetime):
+        """Registra la cancelación del turno de un médico en una fecha y hora"""
+        self.__escribir([EVENTO_CANCELACION, matricula, fecha_hora.isoformat()])
+    
+    def registrar_reprogramacion(self, matricula: str, fecha_hora: datetime, nueva_fecha_hora: datetime):
+        """Registra el cambio de horario de un turno"""
+        self.__escribir([EVENTO_REPROGRAMACION, matricula, fecha_hora.isoformat(), nueva_fecha_hora.isoformat()])
+    
+    def registrar_receta(self, receta: Receta):
+        """Registra una receta emitida, con su fecha de emisión"""
+        self.__escribir([EVENTO_RECETA, receta.obtener_paciente().obtener_dni(),
+                         receta.obtener_medico().obtener_matricula(), receta.obtener_medicamentos(),
+                         receta.obtener_fecha().isoformat()])
+    
+    def __escribir(self, evento: List):
+        """Agrega un evento al búfer y aplica la política de confirmación en grupo"""
+        linea = _codificar(evento) + "\n"
+        with self.__bloqueo:
+            self.__archivo.write(linea)
+            self.__pendientes += 1
+            if not self.__fsync_cada:
+                return
+            if self.__pendientes >= self.__fsync_cada or not self.__fsync_intervalo:
+                self.__sincronizar()
+            elif self.__temporizador is None:
+                # El primer evento sin confirmar arma el temporizador; los siguientes lo comparten
+                self.__temporizador = threading.Timer(self.__fsync_intervalo, self.__vencer)
+                self.__temporizador.daemon = True
+                self.__temporizador.start()
+    
+    def __vencer(self):
+        """Confirma lo pendiente cuando vence el intervalo, haya o no escrituras nuevas"""
+        with self.__bloqueo:
+            self.__temporizador = None
+            if self.__pendientes:
+                self.__sincronizar()
+    
+    def sincronizar(self):
+        """Vacía el búfer y confirma en disco los eventos pendientes"""
+        with self.__bloqueo:
+            self.__sincronizar()
+    
+    def __sincronizar(self):
+        """Confirma en disco los eventos pendientes; se llama con el candado tomado"""
+        if self.__archivo.closed:
+            return
+        self.__archivo.flush()
+        os.fsync(self.__archivo.fileno())
+        self.__pendientes = 0
+    
+    def cerrar(self):
+        """Confirma los eventos pendientes y cierra el archivo"""
+        with self.__bloqueo:
+            if self.__temporizador is not None:
+                self.__temporizador.cancel()
+                self.__temporizador = None
+            self.__sincronizar()
+            self.__archivo.close()
+    
+    @staticmethod
+    def leer_eventos(ruta: str, desde: int = 0) -> Iterator[List]:
+        """Recorre los eventos de una bitácora en el orden en que se escribieron.
+        
+        `desde` es la posición en bytes desde la que se empieza a leer (por ejemplo, la
+        registrada en una instantánea). Una última línea incompleta (escritura
+        interrumpida) se ignora, y se descarta al volver a abrir la bitácora para
+        escribir; cualquier otra línea ilegible lanza ValueError.
+        """
+        if not os.path.exists(ruta):
+            return
+        with open(ruta, "rb", buffering=1 << 20) as archivo:
+            archivo.seek(desde)
+            for numero, linea in enumerate(archivo, 1):
+                if not linea.endswith(b"\n"):
+                    return
+                try:
+                    linea = linea.decode("utf-8")
+                    evento, fin = _decodificar(linea)
+                except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                    raise ValueError(f"Bitácora corrupta en la línea {numero}: {e}")
+                if fin != len(linea) - 1:
+                    raise ValueError(f"Bitácora corrupta en la línea {numero}: datos de más")
+                yield evento
\ No newline at end of file
@@ -1,18 +1,48 @@
 
 
-from datetime import datetime
-from typing import List, Dict
+import gc
+import heapq
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from contextlib import ExitStack, nullcontext
+from itertools import islice
+from datetime import date, datetime, timedelta, time
+from typing import List, Dict, Tuple, Optional, Iterable, Iterator, Sequence
 from modelopaciente import Paciente
 from modelomedico import Medico
 from modeloturno import Turno
 from modeloreceta import Receta
 from modelohistoriaclinica import HistoriaClinica
-from modeloespecialidad import Especialidad
+from modeloespecialidad import (
+    Especialidad,
+    DIAS_SEMANA,
+    DURACION_PREDETERMINADA,
+    duracion_en_minutos,
+    validar_duracion
+)
+from modelorepositorio import RepositorioClinica, RepositorioMemoria
+from modelobitacora import (
+    Bitacora,
+    EVENTO_PACIENTE,
+    EVENTO_MEDICO,
+    EVENTO_ESPECIALIDAD,
+    EVENTO_TURNO,
+    EVENTO_RECETA,
+    EVENTO_CANCELACION,
+    EVENTO_REPROGRAMACION
+)
+from modeloinstantanea import Instantanea, escribir_instantanea
+from modelometricas import Metricas, OPERACIONES_MEDIDAS, OPERACIONES_LOTE
+from modelolistaespera import ListaEspera, SolicitudEspera
+from modeloindicenombres import IndiceNombres
 from modeloexcepciones import (
     PacienteNoEncontradoException,
     MedicoNoEncontradoException,
     MedicoNoDisponibleException,
     TurnoOcupadoException,
+    TurnoNoEncontradoException,
     RecetaInvalidaException,
     EspecialidadNoValidaException,
     PacienteDuplicadoException,
@@ -20,67 +50,439 @@ from modeloexcepciones import (
 )
 
 
+# Franja horaria por defecto en la que se ofrecen turnos libres
+HORA_INICIO_ATENCION = time(8, 0)
+HORA_FIN_ATENCION = time(18, 0)
+
+# Contexto que no bloquea nada: reemplaza a los candados fuera del modo concurrente
+_SIN_BLOQUEO = nullcontext()
+# Instante mínimo: un horario sin duración se toma como [fecha_hora, fecha_hora + _INSTANTE)
+_INSTANTE = timedelta(microseconds=1)
+
+
+def _fin_turno(fecha_hora: datetime, duracion: timedelta) -> datetime:
+    """Fin de un turno; uno que terminaría después de datetime.max es un error de datos, no un desborde"""
+    try:
+        return fecha_hora + duracion
+    except OverflowError:
+        raise ValueError("El turno terminaría después de la última fecha representable") from None
+
+
+def _horarios_libres(horarios: Iterable[datetime], duracion: timedelta,
+                     intervalos: List[Tuple[datetime, datetime]]) -> Iterator[datetime]:
+    """Recorre los horarios cuyo intervalo [horario, horario + duración) no pisa ningún turno.
+    
+    Horarios e intervalos van en orden cronológico y los intervalos no se superponen,
+    así que ambos se recorren una sola vez.
+    """
+    i = 0
+    for horario in horarios:
+        while i < len(intervalos) and intervalos[i][1] <= horario:
+            i += 1
+        if i == len(intervalos) or intervalos[i][0] >= horario + duracion:
+            yield horario
+
+
 class Clinica:
     """Clase principal que representa el sistema de gestión de la clínica"""
     
-    def __init__(self):
-        self.__pacientes: Dict[str, Paciente] = {}
-        self.__medicos: Dict[str, Medico] = {}
-        self.__turnos: List[Turno] = []
-        self.__historias_clinicas: Dict[str, HistoriaClinica] = {}
+    def __init__(self, bitacora: Optional[Bitacora] = None, repositorio: Optional[RepositorioClinica] = None,
+                 concurrente: bool = False, metricas: Optional[Metricas] = None):
+        # Almacenamiento de pacientes, médicos, turnos y recetas (en memoria por defecto)
+        self.__repositorio = repositorio if repositorio is not None else RepositorioMemoria()
+        # Especialidad (en minúsculas) -> por cada día de la semana, médicos que la atienden
+        self.__medicos_por_especialidad: Dict[str, List[List[Medico]]] = {}
+        for medico in self.__repositorio.listar_medicos():
+            self.__indexar_dias_medico(medico, [None] * len(DIAS_SEMANA))
+        # Bitácora opcional donde se anexa cada operación que modifica la clínica
+        self.__bitacora = bitacora
+        # Modo concurrente: un candado por matrícula para los turnos y otros para las altas
+        self.__concurrente = concurrente
+        self.__bloqueos_medicos: Dict[str, threading.Lock] = {}
+        self.__bloqueo_pacientes = threading.Lock() if concurrente else _SIN_BLOQUEO
+        self.__bloqueo_alta_medicos = threading.Lock() if concurrente else _SIN_BLOQUEO
+        # Pacientes esperando que se libere un horario (solo en memoria)
+        self.__lista_espera = ListaEspera()
+        # Palabras de los nombres de pacientes, para buscarlos por apellido aunque esté mal escrito.
+        # Se arma en la primera búsqueda: abrir la clínica no recorre los pacientes del repositorio
+        self.__indice_nombres: Optional[IndiceNombres] = None
+        # Métricas opcionales: solo entonces se envuelven las operaciones de esta instancia
+        self.__metricas = metricas
+        if metricas is not None:
+            for nombre in OPERACIONES_MEDIDAS:
+                setattr(self, nombre, metricas.envolver(nombre, getattr(self, nombre)))
+            for nombre in OPERACIONES_LOTE:
+                setattr(self, nombre, metricas.envolver(nombre, getattr(self, nombre), lote=True))
+    
+    @classmethod
+    def desde_bitacora(cls, ruta: str, fsync_cada: int = 100, fsync_intervalo: float = 1.0,
+                       concurrente: bool = False, metricas: Optional[Metricas] = None) -> 'Clinica':
+        """Reconstruye una clínica reproduciendo su bitácora y sigue registrando en ella.
+        
+        Los eventos ya fueron validados al escribirse, así que se aplican directamente
+        sin las validaciones de cada operación.
+        """
+        clinica = cls(concurrente=concurrente, metricas=metricas)
+        clinica.reproducir_bitacora(ruta)
+        clinica.__bitacora = Bitacora(ruta, fsync_cada, fsync_intervalo)
+        return clinica
+    
+    @classmethod
+    def recuperar(cls, ruta_instantanea: str, ruta_bitacora: Optional[str] = None,
+                  fsync_cada: int = 100, fsync_intervalo: float = 1.0, concurrente: bool = False,
+                  metricas: Optional[Metricas] = None) -> 'Clinica':
+        """Reconstruye una clínica desde su última instantánea más el resto de la bitácora.
+        
+        Si la instantánea no existe se reproduce la bitácora completa. Con bitácora, la
+        clínica recuperada sigue registrando en ella.
+        
+        El arranque es O(n): cargar_instantanea construye todas las entidades, porque los
+        índices de la clínica (agendas por médico, conflictos, recetas por medicamento)
+        viven en el repositorio en memoria. Frente a reproducir la bitácora se ahorra
+        decodificar el JSON y aplicar cada evento: con un millón de eventos, 1,8 s contra
+        2,7 s (benchmarks/bench_bitacora.py).
+        """
+        clinica = cls(concurrente=concurrente, metricas=metricas)
+        posicion = 0
+        if os.path.exists(ruta_instantanea):
+            with Instantanea(ruta_instantanea) as instantanea:
+                clinica.cargar_instantanea(instantanea)
+                posicion = instantanea.obtener_posicion_bitacora()
+        if ruta_bitacora:
+            clinica.reproducir_bitacora(ruta_bitacora, desde=posicion)
+            clinica.__bitacora = Bitacora(ruta_bitacora, fsync_cada, fsync_intervalo)
+        return clinica
+    
+    def guardar_instantanea(self, ruta: str):
+        """Escribe una instantánea binaria con pacientes, médicos, especialidades, turnos y recetas"""
+        posicion = 0
+        if self.__bitacora is not None:
+            self.__bitacora.sincronizar()
+            posicion = os.path.getsize(self.__bitacora.obtener_ruta())
+        repositorio = self.__repositorio
+        escribir_instantanea(ruta, repositorio.listar_pacientes(), repositorio.listar_medicos(),
+                             repositorio.listar_turnos(), repositorio.listar_recetas(), posicion)
+    
+    def cargar_instantanea(self, instantanea: Instantanea):
+        """Incorpora todo el contenido de una instantánea sin repetir las validaciones.
+        
+        Construye todas las entidades, así que tarda en proporción al tamaño de la instantánea.
+        """
+        gc_activo = gc.isenabled()
+        gc.disable()
+        try:
+            repositorio = self.__repositorio
+            pacientes = [instantanea.obtener_paciente(i) for i in range(instantanea.cantidad_pacientes())]
+            repositorio.agregar_pacientes(pacientes)
+            self.__indexar_nombres(pacientes)
+            for i in range(instantanea.cantidad_medicos()):
+                self.__aplicar_medico(instantanea.obtener_medico(i))
+            repositorio.agregar_turnos([Turno(paciente, medico, fecha_hora, especialidad, duracion)
+                                        for paciente, medico, fecha_hora, especialidad, duracion
+                                        in instantanea.iterar_turnos()])
+            recetas = [instantanea.obtener_receta(i) for i in range(instantanea.cantidad_recetas())]
+            repositorio.agregar_recetas(recetas)
+        finally:
+            if gc_activo:
+                gc.enable()
+    
+    def reproducir_bitacora(self, ruta: str, desde: int = 0):
+        """Aplica sobre la clínica los eventos de una bitácora, sin volver a registrarlos"""
+        gc_activo = gc.isenabled()
+        gc.disable()
+        try:
+            self.__aplicar_eventos(Bitacora.leer_eventos(ruta, desde))
+        finally:
+            if gc_activo:
+                gc.enable()
+    
+    def __aplicar_eventos(self, eventos):
+        """Aplica eventos de bitácora; pacientes, turnos y recetas se guardan juntos al final"""
+        repositorio = self.__repositorio
+        medicos: Dict[str, Medico] = {medico.obtener_matricula(): medico for medico in repositorio.listar_medicos()}
+        # Pacientes ya usados por algún evento: evita consultar el repositorio en cada turno
+        pacientes: Dict[str, Paciente] = {}
+        nuevos_pacientes: List[Paciente] = []
+        turnos: List[Turno] = []
+        recetas: List[Receta] = []
+        leer_fecha = datetime.fromisoformat
+        
+        def obtener_paciente(dni: str) -> Paciente:
+            paciente = pacientes.get(dni)
+            if paciente is None:
+                paciente = repositorio.obtener_paciente(dni)
+                if paciente is None:
+                    raise ValueError(f"La bitácora usa un paciente inexistente: {dni}")
+                pacientes[dni] = paciente
+            return paciente
+        
+        for evento in eventos:
+            tipo = evento[0]
+            if tipo == EVENTO_TURNO:
+                _, dni, matricula, especialidad, fecha_hora, *duracion = evento
+                turnos.append(Turno(obtener_paciente(dni), medicos[matricula], leer_fecha(fecha_hora), especialidad,
+                                    duracion_en_minutos(duracion[0]) if duracion else DURACION_PREDETERMINADA))
+            elif tipo == EVENTO_RECETA:
+                _, dni, matricula, medicamentos, fecha = evento
+                recetas.append(Receta(obtener_paciente(dni), medicos[matricula], medicamentos, leer_fecha(fecha)))
+            elif tipo == EVENTO_PACIENTE:
+                _, nombre, dni, fecha_nacimiento = evento
+                paciente = Paciente(nombre, dni, fecha_nacimiento)
+                pacientes[dni] = paciente
+                nuevos_pacientes.append(paciente)
+            elif tipo == EVENTO_MEDICO:
+                _, nombre, matricula, especialidades = evento
+                medico = Medico(nombre, matricula)
+                for tipo_especialidad, mascara, *duracion in especialidades:
+                    medico.agregar_especialidad(Especialidad.desde_mascara(
+                        tipo_especialidad, mascara, duracion_en_minutos(duracion[0]) if duracion else DURACION_PREDETERMINADA))
+                self.__aplicar_medico(medico)
+                medicos[matricula] = medico
+            elif tipo == EVENTO_ESPECIALIDAD:
+                _, matricula, tipo_especialidad, mascara, *duracion = evento
+                self.__aplicar_especialidad(medicos[matricula], Especialidad.desde_mascara(
+                    tipo_especialidad, mascara, duracion_en_minutos(duracion[0]) if duracion else DURACION_PREDETERMINADA))
+            elif tipo in (EVENTO_CANCELACION, EVENTO_REPROGRAMACION):
+                # Los cambios se aplican sobre el repositorio: primero se guarda lo acumulado
+                repositorio.agregar_pacientes(nuevos_pacientes)
+                self.__indexar_nombres(nuevos_pacientes)
+                repositorio.agregar_turnos(turnos)
+                nuevos_pacientes.clear()
+                turnos.clear()
+                matricula, fecha_hora = evento[1], leer_fecha(evento[2])
+                if tipo == EVENTO_CANCELACION:
+                    repositorio.cancelar_turno(matricula, fecha_hora)
+                else:
+                    anterior = repositorio.obtener_turno(matricula, fecha_hora)
+                    repositorio.mover_turno(anterior, Turno(anterior.obtener_paciente(), medicos[matricula],
+                                                            leer_fecha(evento[3]), anterior.obtener_especialidad(),
+                                                            anterior.obtener_duracion()))
+            else:
+                raise ValueError(f"Evento de bitácora desconocido: {tipo}")
+        
+        repositorio.agregar_pacientes(nuevos_pacientes)
+        self.__indexar_nombres(nuevos_pacientes)
+        repositorio.agregar_turnos(turnos)
+        repositorio.agregar_recetas(recetas)
+    
+    def obtener_metricas(self) -> Optional[Metricas]:
+        """Devuelve las métricas de la clínica, o None si no se están midiendo"""
+        return self.__metricas
+    
+    def cerrar(self):
+        """Confirma en disco y cierra la bitácora, si la clínica tiene una, y libera el repositorio"""
+        if self.__bitacora is not None:
+            self.__bitacora.cerrar()
+        self.__repositorio.cerrar()
     
     def agregar_paciente(self, paciente: Paciente):
         """Registra un paciente y crea su historia clínica"""
         dni = paciente.obtener_dni()
-        if dni in self.__pacientes:
-            raise PacienteDuplicadoException(f"Ya existe un paciente con DNI {dni}")
+        with self.__bloqueo_pacientes:
+            if self.__repositorio.obtener_paciente(dni) is not None:
+                raise PacienteDuplicadoException(f"Ya existe un paciente con DNI {dni}")
+            
+            # Se registra en la bitácora antes de que otro hilo pueda darle un turno
+            if self.__bitacora is not None:
+                self.__bitacora.registrar_paciente(paciente)
+            self.__repositorio.agregar_paciente(paciente)
+            self.__indexar_nombres((paciente,))
+    
+    def agregar_pacientes(self, pacientes: Iterable[Paciente]) -> List[Optional[Exception]]:
+        """Registra un lote de pacientes.
         
-        self.__pacientes[dni] = paciente
-        self.__historias_clinicas[dni] = HistoriaClinica(paciente)
+        Rechaza los DNI ya registrados o repetidos dentro del lote y guarda los demás de
+        una sola vez. Devuelve, para cada paciente y en el mismo orden, None si se
+        registró o la excepción que lo impidió.
+        """
+        obtener_paciente = self.__repositorio.obtener_paciente
+        dnis_lote = set()
+        validados: List[Paciente] = []
+        resultados: List[Optional[Exception]] = []
+        with self.__bloqueo_pacientes:
+            for paciente in pacientes:
+                dni = paciente.obtener_dni()
+                if dni in dnis_lote or obtener_paciente(dni) is not None:
+                    resultados.append(PacienteDuplicadoException(f"Ya existe un paciente con DNI {dni}"))
+                    continue
+                dnis_lote.add(dni)
+                validados.append(paciente)
+                resultados.append(None)
+            
+            if self.__bitacora is not None:
+                for paciente in validados:
+                    self.__bitacora.registrar_paciente(paciente)
+            self.__repositorio.agregar_pacientes(validados)
+            self.__indexar_nombres(validados)
+        return resultados
+    
+    def __indexar_nombres(self, pacientes: Iterable[Paciente]):
+        """Agrega pacientes recién guardados al índice de nombres, si ya se armó"""
+        if self.__indice_nombres is not None:
+            self.__indice_nombres.agregar_pacientes(pacientes)
+    
+    def __nombres(self) -> IndiceNombres:
+        """Devuelve el índice de nombres, armándolo con los pacientes del repositorio la primera vez.
+        
+        Se arma con el candado de altas de pacientes: ningún alta concurrente queda afuera
+        ni se indexa dos veces.
+        """
+        indice = self.__indice_nombres
+        if indice is None:
+            with self.__bloqueo_pacientes:
+                indice = self.__indice_nombres
+                if indice is None:
+                    indice = IndiceNombres()
+                    indice.agregar_pacientes(self.__repositorio.listar_pacientes())
+                    self.__indice_nombres = indice
+        return indice
     
     def agregar_medico(self, medico: Medico):
         """Registra un médico"""
         matricula = medico.obtener_matricula()
-        if matricula in self.__medicos:
-            raise MedicoDuplicadoException(f"Ya existe un médico con matrícula {matricula}")
+        with self.__bloqueo_alta_medicos:
+            if self.__repositorio.obtener_medico(matricula) is not None:
+                raise MedicoDuplicadoException(f"Ya existe un médico con matrícula {matricula}")
+            
+            if self.__bitacora is not None:
+                self.__bitacora.registrar_medico(medico)
+            self.__aplicar_medico(medico)
+    
+    def __aplicar_medico(self, medico: Medico):
+        """Incorpora un médico a los registros e índices de la clínica"""
+        self.__repositorio.agregar_medico(medico)
+        self.__indexar_dias_medico(medico, [None] * len(DIAS_SEMANA))
+    
+    def agregar_especialidad(self, matricula: str, especialidad: Especialidad):
+        """Agrega una especialidad a un médico registrado y actualiza el índice por especialidad"""
+        medico = self.obtener_medico_por_matricula(matricula)
+        with self.__bloqueo_medico(matricula):
+            dias_nuevos = self.__aplicar_especialidad(medico, especialidad)
+            if self.__bitacora is not None:
+                self.__bitacora.registrar_especialidad(matricula, especialidad)
+        
+        # Los días nuevos pueden atender a quienes esperan esa especialidad
+        if dias_nuevos:
+            for dia in self.__lista_espera.obtener_dias(especialidad.obtener_especialidad(), matricula):
+                if dia.weekday() in dias_nuevos:
+                    self.__llenar_dia(medico, especialidad.obtener_especialidad(), dia)
+    
+    def __aplicar_especialidad(self, medico: Medico, especialidad: Especialidad) -> List[int]:
+        """Agrega la especialidad al médico y actualiza el índice; devuelve los días (0 = lunes) que empezó a atender"""
+        dias_previos = [medico.obtener_especialidad_para_dia(dia) for dia in DIAS_SEMANA]
+        medico.agregar_especialidad(especialidad)
+        self.__repositorio.agregar_especialidad(medico, especialidad)
+        self.__indexar_dias_medico(medico, dias_previos)
+        return [indice for indice, dia in enumerate(DIAS_SEMANA)
+                if dias_previos[indice] is None and medico.obtener_especialidad_para_dia(dia) is not None]
+    
+    def __indexar_dias_medico(self, medico: Medico, dias_previos: List[Optional[str]]):
+        """Agrega al índice por especialidad los días que el médico empezó a atender"""
+        for indice, dia in enumerate(DIAS_SEMANA):
+            especialidad = medico.obtener_especialidad_para_dia(dia)
+            if especialidad is not None and dias_previos[indice] is None:
+                por_dia = self.__medicos_por_especialidad.setdefault(
+                    especialidad.lower(), [[] for _ in DIAS_SEMANA])
+                por_dia[indice].append(medico)
+    
+    def __bloqueo_medico(self, matricula: str):
+        """Devuelve el candado que protege los turnos de un médico (uno nulo fuera del modo concurrente)"""
+        if not self.__concurrente:
+            return _SIN_BLOQUEO
+        bloqueo = self.__bloqueos_medicos.get(matricula)
+        if bloqueo is None:
+            # setdefault es atómico: si dos hilos llegan a la vez, ambos usan el mismo candado
+            bloqueo = self.__bloqueos_medicos.setdefault(matricula, threading.Lock())
+        return bloqueo
+    
+    def obtener_pacientes(self) -> Sequence[Paciente]:
+        """Devuelve todos los pacientes registrados (vista de solo lectura con el repositorio en memoria)"""
+        return self.__repositorio.listar_pacientes()
+    
+    def obtener_medicos(self) -> Sequence[Medico]:
+        """Devuelve todos los médicos registrados (vista de solo lectura con el repositorio en memoria)"""
+        return self.__repositorio.listar_medicos()
+    
+    def paginar_pacientes(self, inicio: int = 0, cantidad: int = 20,
+                          prefijo: Optional[str] = None) -> Tuple[List[Paciente], int]:
+        """Devuelve una página de pacientes y el total que cumple el filtro.
+        
+        Sin prefijo, en orden de alta; con un prefijo numérico, los pacientes cuyo DNI
+        empieza así (en orden de DNI, con los índices del repositorio); con otro texto,
+        aquellos cuyo nombre tiene, para cada palabra del texto, una que empieza así sin
+        distinguir tildes ni mayúsculas (en orden de alta, con el índice de buscar_pacientes).
+        """
+        self.__validar_pagina(inicio, cantidad)
+        prefijo = prefijo.strip() if prefijo else None
+        if not prefijo or prefijo.isdigit():
+            return self.__repositorio.paginar_pacientes(prefijo, inicio, cantidad)
+        dnis, total = self.__nombres().paginar(prefijo, inicio, cantidad)
+        obtener_paciente = self.__repositorio.obtener_paciente
+        return [obtener_paciente(dni) for dni in dnis], total
+    
+    def buscar_pacientes(self, texto: str, limite: int = 20) -> List[Paciente]:
+        """Busca pacientes por palabras de su nombre, sin distinguir tildes ni mayúsculas.
         
-        self.__medicos[matricula] = medico
+        Cada palabra del texto puede ser el comienzo de cualquier palabra del nombre y, desde
+        cuatro letras, tener un error (dos desde siete letras). Devuelve hasta `limite`
+        pacientes: primero los que coinciden sin errores y después los de menos errores,
+        con los empates en orden de alta.
+        """
+        if limite < 1:
+            raise ValueError("El límite debe ser al menos 1")
+        obtener_paciente = self.__repositorio.obtener_paciente
+        return [obtener_paciente(dni) for dni in self.__nombres().buscar(texto, limite)]
     
-    def obtener_pacientes(self) -> List[Paciente]:
-        """Devuelve todos los pacientes registrados"""
-        return list(self.__pacientes.values())
+    def paginar_medicos(self, inicio: int = 0, cantidad: int = 20) -> Tuple[List[Medico], int]:
+        """Devuelve una página de médicos, en orden de alta, y el total de médicos"""
+        self.__validar_pagina(inicio, cantidad)
+        medicos = self.__repositorio.listar_medicos()
+        return list(medicos[inicio:inicio + cantidad]), len(medicos)
     
-    def obtener_medicos(self) -> List[Medico]:
-        """Devuelve todos los médicos registrados"""
-        return list(self.__medicos.values())
+    def __validar_pagina(self, inicio: int, cantidad: int):
+        """Verifica que la página pedida tenga sentido"""
+        if inicio < 0 or cantidad < 1:
+            raise ValueError("La página debe empezar en una posición no negativa y tener al menos un elemento")
     
     def obtener_medico_por_matricula(self, matricula: str) -> Medico:
         """Devuelve un médico por su matrícula"""
-        if matricula not in self.__medicos:
+        medico = self.__repositorio.obtener_medico(matricula)
+        if medico is None:
             raise MedicoNoEncontradoException(f"No existe médico con matrícula {matricula}")
-        return self.__medicos[matricula]
+        return medico
     
     def validar_existencia_paciente(self, dni: str):
         """Verifica si un paciente está registrado"""
-        if dni not in self.__pacientes:
+        if self.__repositorio.obtener_paciente(dni) is None:
             raise PacienteNoEncontradoException(f"No existe paciente con DNI {dni}")
     
     def validar_existencia_medico(self, matricula: str):
         """Verifica si un médico está registrado"""
-        if matricula not in self.__medicos:
+        if self.__repositorio.obtener_medico(matricula) is None:
             raise MedicoNoEncontradoException(f"No existe médico con matrícula {matricula}")
     
-    def validar_turno_no_duplicado(self, matricula: str, fecha_hora: datetime):
-        """Verifica que no haya un turno duplicado"""
-        for turno in self.__turnos:
-            if (turno.obtener_medico().obtener_matricula() == matricula and 
-                turno.obtener_fecha_hora() == fecha_hora):
-                raise TurnoOcupadoException(f"Ya existe un turno para el médico {matricula} en esa fecha y hora")
+    def validar_turno_no_duplicado(self, matricula: str, fecha_hora: datetime,
+                                   duracion: Optional[timedelta] = None, excluir: Optional[datetime] = None):
+        """Verifica que el horario [fecha_hora, fecha_hora + duración) no pise otro turno del médico.
+        
+        Sin duración solo se mira el instante fecha_hora. El turno que empieza en `excluir`
+        no cuenta (el que se está reprogramando). Lanza ValueError si el turno terminaría
+        después de datetime.max.
+        """
+        fin = _fin_turno(fecha_hora, duracion if duracion is not None else _INSTANTE)
+        if self.__repositorio.existe_superposicion(matricula, fecha_hora, fin, excluir):
+            raise TurnoOcupadoException(
+                f"El médico {matricula} ya tiene un turno que se superpone con ese horario")
+    
+    def __duracion_turno(self, medico: Medico, especialidad: str, duracion: Optional[timedelta]) -> timedelta:
+        """Duración de un turno nuevo: la indicada o, si no, la de la especialidad del médico"""
+        if duracion is not None:
+            return validar_duracion(duracion)
+        return medico.obtener_duracion_especialidad(especialidad) or DURACION_PREDETERMINADA
     
     def obtener_dia_semana_en_espanol(self, fecha_hora: datetime) -> str:
         """Traduce un objeto datetime al día de la semana en español"""
-        dias = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
-        return dias[fecha_hora.weekday()]
+        return DIAS_SEMANA[fecha_hora.weekday()]
     
     def obtener_especialidad_disponible(self, medico: Medico, dia_semana: str) -> str:
         """Obtiene la especialidad disponible para un médico en un día"""
@@ -92,6 +494,11 @@ class Clinica:
     def validar_especialidad_en_dia(self, medico: Medico, especialidad_solicitada: str, dia_semana: str):
         """Verifica que el médico atienda esa especialidad ese día"""
         especialidad_disponible = medico.obtener_especialidad_para_dia(dia_semana)
+        self.__validar_especialidad_disponible(especialidad_disponible, especialidad_solicitada, dia_semana)
+    
+    def __validar_especialidad_disponible(self, especialidad_disponible: Optional[str],
+                                          especialidad_solicitada: str, dia_semana: str):
+        """Compara la especialidad que el médico atiende ese día con la solicitada"""
         if not especialidad_disponible:
             raise MedicoNoDisponibleException(f"El médico no atiende el día {dia_semana}")
         
@@ -101,33 +508,353 @@ class Clinica:
                 f"Ese día atiende: {especialidad_disponible}"
             )
     
-    def agendar_turno(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime):
-        """Agenda un turno si se cumplen todas las condiciones"""
+    def agendar_turno(self, dni: str, matricula: str, especialidad: str, fecha_hora: datetime,
+                      duracion: Optional[timedelta] = None):
+        """Agenda un turno si se cumplen todas las condiciones.
+        
+        Sin duración, el turno dura lo que indica la especialidad del médico. No puede
+        superponerse con ningún otro turno del médico.
+        """
         # Validar existencia de paciente y médico
         self.validar_existencia_paciente(dni)
         self.validar_existencia_medico(matricula)
         
         # Obtener objetos
-        paciente = self.__pacientes[dni]
-        medico = self.__medicos[matricula]
+        paciente = self.__repositorio.obtener_paciente(dni)
+        medico = self.__repositorio.obtener_medico(matricula)
+        duracion = self.__duracion_turno(medico, especialidad, duracion)
+        
+        # La verificación del horario y el alta del turno no pueden intercalarse con otro hilo
+        with self.__bloqueo_medico(matricula):
+            # Validar que no se superponga con otro turno
+            self.validar_turno_no_duplicado(matricula, fecha_hora, duracion)
+            
+            # Validar día y especialidad con una sola consulta a la tabla semanal del médico
+            self.__validar_especialidad_disponible(
+                medico.obtener_especialidad_para_fecha(fecha_hora), especialidad,
+                self.obtener_dia_semana_en_espanol(fecha_hora))
+            
+            # Crear y registrar turno (el repositorio también lo agrega a la historia clínica)
+            turno = Turno(paciente, medico, fecha_hora, especialidad, duracion)
+            self.__repositorio.agregar_turno(turno)
+            if self.__bitacora is not None:
+                self.__bitacora.registrar_turno(turno)
+    
+    def agendar_turnos(self, lote: Iterable[Tuple]) -> List[Optional[Exception]]:
+        """Agenda un lote de turnos (dni, matrícula, especialidad, fecha_hora[, duración]).
         
-        # Validar que no haya turno duplicado
-        self.validar_turno_no_duplicado(matricula, fecha_hora)
+        Valida todas las filas, incluidas las superposiciones dentro del mismo lote,
+        y registra las válidas de una sola vez. Devuelve, para cada fila y en el mismo
+        orden, None si el turno se agendó o la excepción que lo impidió.
+        """
+        # El recolector de ciclos no aporta nada mientras se crean miles de turnos
+        gc_activo = gc.isenabled()
+        gc.disable()
+        try:
+            if not self.__concurrente:
+                return self.__agendar_turnos(lote)
+            
+            # Se toman los candados de todos los médicos del lote, siempre en el mismo orden
+            lote = list(lote)
+            with ExitStack() as pila:
+                for matricula in sorted(self.__matriculas_del_lote(lote)):
+                    pila.enter_context(self.__bloqueo_medico(matricula))
+                return self.__agendar_turnos(lote)
+        finally:
+            if gc_activo:
+                gc.enable()
+    
+    def __matriculas_del_lote(self, lote: List[Tuple]) -> set:
+        """Matrículas (de texto) de las filas bien formadas de un lote"""
+        matriculas = set()
+        for fila in lote:
+            try:
+                _, matricula, _, _, *_ = fila
+            except (TypeError, ValueError):
+                continue
+            if isinstance(matricula, str):
+                matriculas.add(matricula)
+        return matriculas
+    
+    def __agendar_turnos(self, lote: Iterable[Tuple]) -> List[Optional[Exception]]:
+        """Valida y registra el lote de agendar_turnos"""
+        repositorio = self.__repositorio
+        obtener_paciente = repositorio.obtener_paciente
+        obtener_medico = repositorio.obtener_medico
+        existe_superposicion = repositorio.existe_superposicion
+        # Matrícula -> inicios y fines de los turnos aceptados del lote, ordenados (no se superponen)
+        ocupados_lote: Dict[str, Tuple[List[datetime], List[datetime]]] = {}
+        validados: List[Turno] = []
+        resultados: List[Optional[Exception]] = []
         
-        # Validar día y especialidad
-        dia_semana = self.obtener_dia_semana_en_espanol(fecha_hora)
-        self.validar_especialidad_en_dia(medico, especialidad, dia_semana)
+        for fila in lote:
+            try:
+                dni, matricula, especialidad, fecha_hora, *resto = fila
+                if len(resto) > 1:
+                    raise ValueError("Cada turno del lote lleva dni, matrícula, especialidad, fecha_hora y duración")
+                paciente = obtener_paciente(dni)
+                if paciente is None:
+                    self.validar_existencia_paciente(dni)
+                medico = obtener_medico(matricula)
+                if medico is None:
+                    self.validar_existencia_medico(matricula)
+                
+                duracion = self.__duracion_turno(medico, especialidad, resto[0] if resto else None)
+                fin = _fin_turno(fecha_hora, duracion)
+                if existe_superposicion(matricula, fecha_hora, fin):
+                    self.validar_turno_no_duplicado(matricula, fecha_hora, duracion)
+                # Como en la agenda: solo puede pisarlo el último turno del lote que empieza antes del fin
+                inicios, fines = ocupados_lote.get(matricula, ((), ()))
+                posicion = bisect_left(inicios, fin)
+                if posicion and fines[posicion - 1] > fecha_hora:
+                    raise TurnoOcupadoException(
+                        f"El lote tiene turnos superpuestos para el médico {matricula}")
+                
+                especialidad_disponible = medico.obtener_especialidad_para_fecha(fecha_hora)
+                if especialidad_disponible != especialidad:
+                    self.__validar_especialidad_disponible(
+                        especialidad_disponible, especialidad,
+                        self.obtener_dia_semana_en_espanol(fecha_hora))
+                
+                turno = Turno(paciente, medico, fecha_hora, especialidad, duracion)
+            except (PacienteNoEncontradoException, MedicoNoEncontradoException,
+                    MedicoNoDisponibleException, TurnoOcupadoException,
+                    EspecialidadNoValidaException, ValueError, TypeError, AttributeError) as e:
+                resultados.append(e)
+                continue
+            
+            inicios, fines = ocupados_lote.setdefault(matricula, ([], []))
+            inicios.insert(posicion, fecha_hora)
+            fines.insert(posicion, fin)
+            validados.append(turno)
+            resultados.append(None)
         
-        # Crear y registrar turno
-        turno = Turno(paciente, medico, fecha_hora, especialidad)
-        self.__turnos.append(turno)
+        repositorio.agregar_turnos(validados)
+        if self.__bitacora is not None:
+            for turno in validados:
+                self.__bitacora.registrar_turno(turno)
+        return resultados
+    
+    def cancelar_turno(self, matricula: str, fecha_hora: datetime) -> Turno:
+        """Cancela el turno de un médico en una fecha y hora y devuelve el turno cancelado.
         
-        # Agregar a historia clínica
-        self.__historias_clinicas[dni].agregar_turno(turno)
+        El turno se identifica por matrícula y fecha y hora, la misma clave con la que el
+        repositorio detecta horarios ocupados, así que se encuentra sin recorrer los turnos.
+        Sale también de la historia clínica del paciente y el horario queda libre en el momento:
+        si alguien lo espera, se le agenda.
+        """
+        self.validar_existencia_medico(matricula)
+        with self.__bloqueo_medico(matricula):
+            turno = self.__repositorio.cancelar_turno(matricula, fecha_hora)
+            if turno is None:
+                raise TurnoNoEncontradoException(f"No existe un turno del médico {matricula} en esa fecha y hora")
+            if self.__bitacora is not None:
+                self.__bitacora.registrar_cancelacion(matricula, fecha_hora)
+        self.__ofrecer_horario(turno.obtener_medico(), turno.obtener_especialidad(), fecha_hora)
+        return turno
+    
+    def reprogramar_turno(self, matricula: str, fecha_hora: datetime, nueva_fecha_hora: datetime) -> Turno:
+        """Mueve un turno a otro horario del mismo médico y devuelve el turno reprogramado.
+        
+        El nuevo horario se valida como al agendar (sin pisar otros turnos con su duración
+        y con la misma especialidad ese día); puede superponerse con el horario anterior
+        del propio turno. El turno conserva su lugar en los listados y en la historia clínica, y el
+        horario anterior queda libre en el momento (y se ofrece a la lista de espera).
+        """
+        medico = self.obtener_medico_por_matricula(matricula)
+        with self.__bloqueo_medico(matricula):
+            turno = self.__repositorio.obtener_turno(matricula, fecha_hora)
+            if turno is None:
+                raise TurnoNoEncontradoException(f"No existe un turno del médico {matricula} en esa fecha y hora")
+            if nueva_fecha_hora == fecha_hora:
+                return turno
+            
+            duracion = turno.obtener_duracion()
+            self.validar_turno_no_duplicado(matricula, nueva_fecha_hora, duracion, excluir=fecha_hora)
+            especialidad = turno.obtener_especialidad()
+            self.__validar_especialidad_disponible(
+                medico.obtener_especialidad_para_fecha(nueva_fecha_hora), especialidad,
+                self.obtener_dia_semana_en_espanol(nueva_fecha_hora))
+            
+            nuevo = Turno(turno.obtener_paciente(), medico, nueva_fecha_hora, especialidad, duracion)
+            self.__repositorio.mover_turno(turno, nuevo)
+            if self.__bitacora is not None:
+                self.__bitacora.registrar_reprogramacion(matricula, fecha_hora, nueva_fecha_hora)
+        self.__ofrecer_horario(medico, especialidad, fecha_hora)
+        return nuevo
+    
+    def agregar_a_lista_espera(self, dni: str, especialidad: str, desde: date, hasta: date,
+                               matricula: Optional[str] = None, prioridad: int = 0) -> SolicitudEspera:
+        """Anota a un paciente en la lista de espera de una especialidad entre dos días (inclusive).
+        
+        Con matrícula solo le sirve ese médico; sin ella, cualquiera que atienda la
+        especialidad. Se atiende primero la menor prioridad y, a igual prioridad, el que
+        llegó antes. Si ya hay un horario libre en el rango se le agenda enseguida; si no,
+        cuando se cancele o reprograme un turno que le sirva o un médico sume días de esa
+        especialidad. La solicitud devuelta da el turno asignado con obtener_turno().
+        """
+        self.validar_existencia_paciente(dni)
+        if matricula is not None:
+            self.validar_existencia_medico(matricula)
+        solicitud = SolicitudEspera(dni, especialidad, desde, hasta, matricula, prioridad)
+        self.__lista_espera.agregar(solicitud)
+        
+        por_dia = self.__medicos_por_especialidad.get(especialidad.lower())
+        if por_dia is not None:
+            for dia in solicitud.dias():
+                for medico in por_dia[dia.weekday()]:
+                    if matricula is None or medico.obtener_matricula() == matricula:
+                        self.__llenar_dia(medico, especialidad, dia)
+                if solicitud.obtener_turno() is not None:
+                    break
+        return solicitud
+    
+    def obtener_lista_espera(self) -> ListaEspera:
+        """Devuelve la lista de espera (ver ListaEspera.obtener_pendientes y quitar)"""
+        return self.__lista_espera
+    
+    def __ofrecer_horario(self, medico: Medico, especialidad: str, fecha_hora: datetime) -> bool:
+        """Agenda un horario libre al mejor paciente que lo espera; devuelve False si no esperaba nadie"""
+        matricula = medico.obtener_matricula()
+        solicitud = self.__lista_espera.extraer(especialidad, matricula, fecha_hora.date())
+        if solicitud is None:
+            return False
+        try:
+            self.agendar_turno(solicitud.obtener_dni(), matricula, solicitud.obtener_especialidad(), fecha_hora)
+        except (TurnoOcupadoException, MedicoNoDisponibleException, EspecialidadNoValidaException):
+            # Otro hilo tomó el horario: la solicitud vuelve a esperar con su lugar
+            self.__lista_espera.devolver(solicitud)
+            return True
+        solicitud.asignar_turno(self.__repositorio.obtener_turno(matricula, fecha_hora))
+        return True
     
-    def obtener_turnos(self) -> List[Turno]:
-        """Devuelve todos los turnos agendados"""
-        return self.__turnos.copy()
+    def __llenar_dia(self, medico: Medico, especialidad: str, dia: date):
+        """Ofrece a la lista de espera los horarios libres de un médico en un día, hasta que no espere nadie.
+        
+        Los horarios se cuentan desde el inicio de la atención con la duración de turno
+        de la especialidad.
+        """
+        duracion = medico.obtener_duracion_especialidad(especialidad) or DURACION_PREDETERMINADA
+        inicio = datetime.combine(dia, HORA_INICIO_ATENCION)
+        fin = datetime.combine(dia, HORA_FIN_ATENCION)
+        intervalos = self.__repositorio.obtener_intervalos_turnos_medico(medico.obtener_matricula(), inicio, fin)
+        horarios = (inicio + i * duracion for i in range((fin - inicio) // duracion))
+        for horario in _horarios_libres(horarios, duracion, intervalos):
+            if not self.__ofrecer_horario(medico, especialidad, horario):
+                return
+    
+    def obtener_turnos(self) -> Sequence[Turno]:
+        """Devuelve todos los turnos agendados (vista de solo lectura con el repositorio en memoria)"""
+        return self.__repositorio.listar_turnos()
+    
+    def obtener_turnos_medico(self, matricula: str, desde: Optional[datetime] = None,
+                              hasta: Optional[datetime] = None) -> List[Turno]:
+        """Devuelve los turnos de un médico entre desde (inclusive) y hasta (exclusive), ordenados por fecha"""
+        self.validar_existencia_medico(matricula)
+        return self.__repositorio.obtener_turnos_medico(matricula, desde, hasta)
+    
+    def paginar_turnos(self, inicio: int = 0, cantidad: int = 20, matricula: Optional[str] = None,
+                       especialidad: Optional[str] = None, desde: Optional[datetime] = None,
+                       hasta: Optional[datetime] = None) -> Tuple[List[Turno], int]:
+        """Devuelve una página de turnos ordenados por fecha y el total que cumple los filtros.
+        
+        Filtra por médico, por especialidad y por fecha en [desde, hasta). Solo consulta
+        las agendas de los médicos que atienden la especialidad y de cada una toma los
+        primeros turnos del rango que hacen falta para la página; no recorre ni copia
+        todos los turnos.
+        """
+        self.__validar_pagina(inicio, cantidad)
+        if matricula is not None:
+            medicos = [self.obtener_medico_por_matricula(matricula)]
+        elif especialidad is not None:
+            por_dia = self.__medicos_por_especialidad.get(especialidad.lower(), [])
+            # Un médico aparece una vez por cada día que atiende la especialidad
+            medicos = list(dict.fromkeys(medico for medicos_dia in por_dia for medico in medicos_dia))
+        else:
+            medicos = self.__repositorio.listar_medicos()
+        
+        necesarios = inicio + cantidad
+        buscada = especialidad.lower() if especialidad is not None else None
+        obtener_turnos_medico = self.__repositorio.obtener_turnos_medico
+        por_medico: List[List[Turno]] = []
+        total = 0
+        for medico in medicos:
+            matricula_medico = medico.obtener_matricula()
+            atiende = {esp.obtener_especialidad().lower() for esp in medico.obtener_especialidades()}
+            if buscada is None or atiende == {buscada}:
+                # Todos sus turnos cumplen el filtro: se cuentan y se toman solo los necesarios
+                total += self.__repositorio.contar_turnos(matricula_medico, desde, hasta)
+                por_medico.append(obtener_turnos_medico(matricula_medico, desde, hasta, necesarios))
+            elif buscada in atiende:
+                # Atiende otras especialidades otros días: se filtran sus turnos del rango
+                turnos_medico = [turno for turno in obtener_turnos_medico(matricula_medico, desde, hasta)
+                                 if turno.obtener_especialidad().lower() == buscada]
+                total += len(turnos_medico)
+                por_medico.append(turnos_medico)
+        
+        pagina = islice(heapq.merge(*por_medico, key=Turno.obtener_fecha_hora), inicio, necesarios)
+        return list(pagina), total
+    
+    def contar_turnos(self, matricula: Optional[str] = None, desde: Optional[datetime] = None,
+                      hasta: Optional[datetime] = None) -> int:
+        """Cuenta los turnos entre desde (inclusive) y hasta (exclusive), de un médico o de todos"""
+        if matricula is not None:
+            self.validar_existencia_medico(matricula)
+        return self.__repositorio.contar_turnos(matricula, desde, hasta)
+    
+    def exportar_turnos(self) -> Tuple[array, array, array, List[str]]:
+        """Devuelve los turnos en columnas (ver RepositorioClinica.exportar_turnos)"""
+        return self.__repositorio.exportar_turnos()
+    
+    def buscar_turnos_disponibles(self, especialidad: str, desde: datetime, duracion: timedelta,
+                                  cantidad: int = 1, hora_inicio: time = HORA_INICIO_ATENCION,
+                                  hora_fin: time = HORA_FIN_ATENCION,
+                                  dias_maximos: int = 365) -> List[Tuple[datetime, Medico]]:
+        """Busca los primeros turnos libres de una especialidad a partir de una fecha.
+        
+        Los turnos se ofrecen cada `duracion` desde `hora_inicio` hasta `hora_fin` y solo
+        con los médicos que atienden esa especialidad ese día de la semana. Un horario
+        está libre si [horario, horario + duracion) no pisa ningún turno del médico. Devuelve hasta
+        `cantidad` pares (fecha_hora, médico) ordenados por fecha, buscando como máximo
+        `dias_maximos` días hacia adelante.
+        """
+        if duracion <= timedelta(0) or cantidad < 1:
+            raise ValueError("La duración y la cantidad deben ser positivas")
+        
+        por_dia = self.__medicos_por_especialidad.get(especialidad.lower())
+        if por_dia is None:
+            raise EspecialidadNoValidaException(f"Ningún médico atiende {especialidad}")
+        
+        resultados: List[Tuple[datetime, Medico]] = []
+        dia = desde.date()
+        for _ in range(dias_maximos):
+            medicos = por_dia[dia.weekday()]
+            if medicos:
+                inicio_dia = datetime.combine(dia, hora_inicio)
+                fin_dia = datetime.combine(dia, hora_fin)
+                cantidad_horarios = (fin_dia - inicio_dia) // duracion
+                primero = 0
+                if desde > inicio_dia:
+                    primero = -((inicio_dia - desde) // duracion)
+                horarios = [inicio_dia + i * duracion for i in range(primero, cantidad_horarios)]
+                
+                if horarios:
+                    faltan = cantidad - len(resultados)
+                    libres_del_dia: List[Tuple[datetime, int]] = []
+                    for orden, medico in enumerate(medicos):
+                        intervalos = self.__repositorio.obtener_intervalos_turnos_medico(
+                            medico.obtener_matricula(), horarios[0], horarios[-1] + duracion)
+                        libres = islice(_horarios_libres(horarios, duracion, intervalos), faltan)
+                        libres_del_dia.extend((horario, orden) for horario in libres)
+                    
+                    libres_del_dia.sort()
+                    for horario, orden in libres_del_dia[:faltan]:
+                        resultados.append((horario, medicos[orden]))
+                    if len(resultados) >= cantidad:
+                        break
+            dia += timedelta(days=1)
+        
+        return resultados
     
     def emitir_receta(self, dni: str, matricula: str, medicamentos: List[str]):
         """Emite una receta para un paciente"""
@@ -139,16 +866,49 @@ class Clinica:
             raise RecetaInvalidaException("La receta debe incluir al menos un medicamento")
         
         # Obtener objetos
-        paciente = self.__pacientes[dni]
-        medico = self.__medicos[matricula]
+        paciente = self.__repositorio.obtener_paciente(dni)
+        medico = self.__repositorio.obtener_medico(matricula)
         
         # Crear receta
         receta = Receta(paciente, medico, medicamentos)
         
         # Agregar a historia clínica
-        self.__historias_clinicas[dni].agregar_receta(receta)
+        self.__repositorio.agregar_receta(receta)
+        if self.__bitacora is not None:
+            self.__bitacora.registrar_receta(receta)
+    
+    def buscar_recetas_por_medicamento(self, medicamento: str, desde: Optional[datetime] = None,
+                                       hasta: Optional[datetime] = None) -> List[Receta]:
+        """Devuelve las recetas que incluyen el medicamento, emitidas en [desde, hasta), por fecha de emisión.
+        
+        El nombre se compara sin distinguir mayúsculas ni espacios de más. Cada repositorio
+        responde con su propio índice por medicamento (SQLite, con una tabla indexada).
+        """
+        return self.__repositorio.buscar_recetas_por_medicamento(medicamento, desde, hasta)
+    
+    def obtener_pacientes_por_medicamento(self, medicamento: str, desde: Optional[datetime] = None,
+                                          hasta: Optional[datetime] = None) -> List[Paciente]:
+        """Devuelve, sin repetir, los pacientes a los que se les recetó el medicamento en [desde, hasta)"""
+        pacientes: Dict[str, Paciente] = {}
+        for receta in self.__repositorio.buscar_recetas_por_medicamento(medicamento, desde, hasta):
+            paciente = receta.obtener_paciente()
+            pacientes.setdefault(paciente.obtener_dni(), paciente)
+        return list(pacientes.values())
+    
+    def medicamentos_mas_recetados(self, cantidad: int = 10, matricula: Optional[str] = None,
+                                   desde: Optional[datetime] = None,
+                                   hasta: Optional[datetime] = None) -> List[Tuple[str, int]]:
+        """Devuelve los `cantidad` medicamentos más recetados en [desde, hasta), del médico indicado o de todos.
+        
+        Cada par es (medicamento, cantidad de recetas), de mayor a menor.
+        """
+        if cantidad < 1:
+            raise ValueError("La cantidad debe ser al menos 1")
+        if matricula is not None:
+            self.validar_existencia_medico(matricula)
+        return self.__repositorio.medicamentos_mas_recetados(cantidad, matricula, desde, hasta)
     
     def obtener_historia_clinica(self, dni: str) -> HistoriaClinica:
         """Devuelve la historia clínica completa de un paciente"""
         self.validar_existencia_paciente(dni)
-        return self.__historias_clinicas[dni]
\ No newline at end of file
+        return self.__repositorio.obtener_historia_clinica(dni)
\ No newline at end of file
@@ -1,34 +1,101 @@
 
 
-from typing import List
+import sys
+from datetime import timedelta
+from functools import lru_cache
+from typing import List, Optional
 
 
+# Días de la semana en el orden de datetime.weekday() (0 = lunes)
+DIAS_SEMANA = ('lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo')
+
+# Nombre normalizado -> índice del día, con y sin tilde; se resuelve una sola vez
+_INDICE_POR_DIA = {dia: indice for indice, dia in enumerate(DIAS_SEMANA)}
+_INDICE_POR_DIA.update({'miercoles': 2, 'sabado': 5})
+
+
+# Duración de los turnos de una especialidad si no se indica otra
+DURACION_PREDETERMINADA = timedelta(minutes=30)
+# Duración máxima de un turno: acota cuánto antes de un horario puede empezar otro que lo pise
+DURACION_MAXIMA = timedelta(hours=24)
+MINUTO = timedelta(minutes=1)
+
+
+@lru_cache(maxsize=None)
+def duracion_en_minutos(minutos: int) -> timedelta:
+    """Devuelve la duración de esa cantidad de minutos; los turnos con la misma duración comparten el objeto"""
+    return DURACION_PREDETERMINADA if minutos == DURACION_PREDETERMINADA // MINUTO else timedelta(minutes=minutos)
+
+
+def validar_duracion(duracion: timedelta) -> timedelta:
+    """Verifica que una duración sea de minutos enteros, positiva y no mayor a DURACION_MAXIMA"""
+    if not isinstance(duracion, timedelta) or duracion % MINUTO or not MINUTO <= duracion <= DURACION_MAXIMA:
+        raise ValueError(f"La duración debe ser de 1 a {DURACION_MAXIMA // MINUTO} minutos enteros")
+    return duracion_en_minutos(duracion // MINUTO)
+
+
+def obtener_indice_dia(dia: str) -> Optional[int]:
+    """Devuelve el índice (0 = lunes) de un día en español, o None si no es válido"""
+    indice = _INDICE_POR_DIA.get(dia)
+    if indice is None:
+        indice = _INDICE_POR_DIA.get(dia.strip().lower())
+    return indice
+
 
 class Especialidad:
     """Representa una especialidad médica con sus días de atención"""
     
-    def __init__(self, tipo: str, dias: List[str]):
+    __slots__ = ("__tipo", "__mascara_dias", "__duracion")
+    
+    def __init__(self, tipo: str, dias: List[str], duracion: timedelta = DURACION_PREDETERMINADA):
         if not tipo or not dias:
             raise ValueError("Tipo y días son obligatorios")
         
-        # Validar que los días sean válidos
-        dias_validos = ['lunes', 'martes', 'miércoles', 'jueves', 'viernes', 'sábado', 'domingo']
+        # Los días se guardan como máscara de 7 bits (bit 0 = lunes)
+        mascara = 0
         for dia in dias:
-            if dia.lower() not in dias_validos:
+            indice = obtener_indice_dia(dia)
+            if indice is None:
                 raise ValueError(f"Día inválido: {dia}")
+            mascara |= 1 << indice
         
-        self.__tipo = tipo
-        self.__dias = [dia.lower() for dia in dias]  # Normalizar a minúsculas
+        # Nombre compartido con los turnos de la especialidad (ver Turno)
+        self.__tipo = sys.intern(tipo) if type(tipo) is str else tipo
+        self.__mascara_dias = mascara
+        # Duración por defecto de sus turnos
+        self.__duracion = validar_duracion(duracion)
+    
+    @classmethod
+    def desde_mascara(cls, tipo: str, mascara_dias: int,
+                      duracion: timedelta = DURACION_PREDETERMINADA) -> 'Especialidad':
+        """Crea una especialidad a partir de una máscara de días (bit 0 = lunes)"""
+        dias = [dia for indice, dia in enumerate(DIAS_SEMANA) if mascara_dias >> indice & 1]
+        return cls(tipo, dias, duracion)
     
     def obtener_especialidad(self) -> str:
         """Devuelve el nombre de la especialidad"""
         return self.__tipo
     
+    def obtener_mascara_dias(self) -> int:
+        """Devuelve la máscara de bits de los días de atención (bit 0 = lunes)"""
+        return self.__mascara_dias
+    
+    def obtener_duracion(self) -> timedelta:
+        """Devuelve la duración por defecto de los turnos de la especialidad"""
+        return self.__duracion
+    
+    def obtener_dias(self) -> List[str]:
+        """Devuelve los días de atención en minúsculas, en orden de la semana"""
+        return [dia for indice, dia in enumerate(DIAS_SEMANA) if self.__mascara_dias >> indice & 1]
+    
     def verificar_dia(self, dia: str) -> bool:
         """Verifica si la especialidad está disponible en el día proporcionado"""
-        return dia.lower() in self.__dias
+        indice = obtener_indice_dia(dia)
+        return indice is not None and bool(self.__mascara_dias >> indice & 1)
     
     def __str__(self) -> str:
         """Representación legible de la especialidad"""
-        dias_str = ", ".join(self.__dias)
+        dias_str = ", ".join(self.obtener_dias())
+        if self.__duracion != DURACION_PREDETERMINADA:
+            return f"{self.__tipo} (Días: {dias_str}; turnos de {self.__duracion // MINUTO} min)"
         return f"{self.__tipo} (Días: {dias_str})"
\ No newline at end of file
@@ -20,6 +20,11 @@ class TurnoOcupadoException(Exception):
     pass
 
 
+class TurnoNoEncontradoException(Exception):
+    """Excepción cuando no existe el turno indicado"""
+    pass
+
+
 class RecetaInvalidaException(Exception):
     """Excepción cuando la receta es inválida"""
     pass
@@ -1,59 +1,138 @@
 
 
-from typing import List
+from bisect import insort
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, TextIO
 from modelopaciente import Paciente
 from modeloturno import Turno
 from modeloreceta import Receta
+from modelovista import Vista
 
 
 class HistoriaClinica:
-    """Almacena la información médica de un paciente"""
+    """Almacena la información médica de un paciente.
+    
+    Igual que en RepositorioMemoria, un turno cancelado deja un hueco en la lista de
+    turnos que las vistas saltean, y la lista se compacta cuando los huecos son más de
+    la mitad: quitar o reemplazar un turno no recorre la historia.
+    """
     
     def __init__(self, paciente: Paciente):
         if not paciente:
             raise ValueError("El paciente es obligatorio")
         
         self.__paciente = paciente
-        self.__turnos = []
+        self.__turnos: List[Turno] = []
+        # Turno -> posición en __turnos, para quitarlo o reemplazarlo sin buscarlo
+        self.__posiciones: Dict[Turno, int] = {}
+        # Posiciones de __turnos quitadas, ordenadas: huecos que las vistas saltean
+        self.__quitados: List[int] = []
         self.__recetas = []
     
+    def obtener_paciente(self) -> Paciente:
+        """Devuelve el paciente de la historia clínica"""
+        return self.__paciente
+    
     def agregar_turno(self, turno: Turno):
         """Agrega un nuevo turno a la historia clínica"""
         if not turno:
             raise ValueError("El turno es obligatorio")
+        self.__posiciones[turno] = len(self.__turnos)
         self.__turnos.append(turno)
     
+    def quitar_turno(self, turno: Turno):
+        """Quita un turno cancelado de la historia clínica"""
+        insort(self.__quitados, self.__posicion(turno))
+        # Compactar cuando los huecos son la mitad cuesta O(1) amortizado por turno quitado
+        if 2 * len(self.__quitados) > len(self.__turnos):
+            self.__compactar()
+    
+    def reemplazar_turno(self, anterior: Turno, nuevo: Turno):
+        """Reemplaza un turno reprogramado por el nuevo, en el mismo lugar de la historia"""
+        posicion = self.__posicion(anterior)
+        self.__turnos[posicion] = nuevo
+        self.__posiciones[nuevo] = posicion
+    
+    def __posicion(self, turno: Turno) -> int:
+        """Saca un turno del índice de posiciones y devuelve la que ocupaba"""
+        posicion = self.__posiciones.pop(turno, None)
+        if posicion is None:
+            raise ValueError("El turno no está en la historia clínica")
+        return posicion
+    
+    def __compactar(self):
+        """Arma la lista de turnos sin los huecos y recalcula las posiciones.
+        
+        Son listas nuevas: las vistas ya entregadas siguen mostrando las anteriores.
+        """
+        self.__turnos = list(Vista(self.__turnos, huecos=self.__quitados))
+        self.__posiciones = {turno: posicion for posicion, turno in enumerate(self.__turnos)}
+        self.__quitados = []
+    
     def agregar_receta(self, receta: Receta):
         """Agrega una receta médica a la historia clínica"""
         if not receta:
             raise ValueError("La receta es obligatoria")
         self.__recetas.append(receta)
     
-    def obtener_turnos(self) -> List[Turno]:
-        """Devuelve una copia de la lista de turnos del paciente"""
-        return self.__turnos.copy()
+    def obtener_turnos(self) -> Sequence[Turno]:
+        """Devuelve una vista de solo lectura de los turnos del paciente"""
+        return Vista(self.__turnos, huecos=self.__quitados)
     
-    def obtener_recetas(self) -> List[Receta]:
-        """Devuelve una copia de la lista de recetas del paciente"""
-        return self.__recetas.copy()
+    def obtener_recetas(self) -> Sequence[Receta]:
+        """Devuelve una vista de solo lectura de las recetas del paciente"""
+        return Vista(self.__recetas)
     
-    def __str__(self) -> str:
-        """Representación textual de la historia clínica"""
-        resultado = f"Historia Clínica de {self.__paciente}\n"
-        resultado += "=" * 50 + "\n"
+    def iterar_lineas(self, inicio_turnos: int = 0, limite_turnos: Optional[int] = None,
+                      inicio_recetas: int = 0, limite_recetas: Optional[int] = None,
+                      desde: Optional[datetime] = None, hasta: Optional[datetime] = None) -> Iterator[str]:
+        """Genera la historia clínica línea por línea, sin armar el texto completo.
         
-        resultado += f"TURNOS ({len(self.__turnos)}):\n"
-        if self.__turnos:
-            for i, turno in enumerate(self.__turnos, 1):
-                resultado += f"  {i}. {turno}\n"
-        else:
-            resultado += "  No hay turnos registrados.\n"
+        Turnos y recetas se paginan por separado: se saltean los primeros `inicio_*` y se
+        muestran como máximo `limite_*` (None = todos). Con `desde`/`hasta` solo se incluyen
+        los turnos y recetas con fecha en [desde, hasta); los totales y la numeración se
+        refieren a los elementos de ese rango.
+        """
+        yield f"Historia Clínica de {self.__paciente}"
+        yield "=" * 50
+        yield from self.__lineas_seccion("TURNOS", "No hay turnos registrados.", self.obtener_turnos(),
+                                         Turno.obtener_fecha_hora, inicio_turnos, limite_turnos, desde, hasta)
+        yield ""
+        yield from self.__lineas_seccion("RECETAS", "No hay recetas registradas.", self.__recetas,
+                                         Receta.obtener_fecha, inicio_recetas, limite_recetas, desde, hasta)
+    
+    def __lineas_seccion(self, titulo: str, sin_elementos: str, elementos: Sequence, obtener_fecha: Callable,
+                         inicio: int, limite: Optional[int], desde: Optional[datetime],
+                         hasta: Optional[datetime]) -> Iterator[str]:
+        """Genera el título y una página de los elementos de una sección de la historia"""
+        if inicio < 0 or (limite is not None and limite < 0):
+            raise ValueError("El inicio y el límite no pueden ser negativos")
         
-        resultado += f"\nRECETAS ({len(self.__recetas)}):\n"
-        if self.__recetas:
-            for i, receta in enumerate(self.__recetas, 1):
-                resultado += f"  {i}. {receta}\n"
+        if desde is None and hasta is None:
+            total = len(elementos)
+            fin = total if limite is None else min(total, inicio + limite)
+            pagina = (elementos[i] for i in range(inicio, fin))
         else:
-            resultado += "  No hay recetas registradas.\n"
+            def en_rango(elemento) -> bool:
+                fecha = obtener_fecha(elemento)
+                return (desde is None or fecha >= desde) and (hasta is None or fecha < hasta)
+            total = sum(1 for elemento in elementos if en_rango(elemento))
+            fin = None if limite is None else inicio + limite
+            pagina = islice(filter(en_rango, elementos), inicio, fin)
         
-        return resultado
\ No newline at end of file
+        yield f"{titulo} ({total}):"
+        if not total:
+            yield f"  {sin_elementos}"
+        for numero, elemento in enumerate(pagina, inicio + 1):
+            yield f"  {numero}. {elemento}"
+    
+    def escribir(self, destino: TextIO, **paginacion):
+        """Escribe la historia clínica en un archivo (o cualquier objeto con write), con la paginación de iterar_lineas"""
+        for linea in self.iterar_lineas(**paginacion):
+            destino.write(linea)
+            destino.write("\n")
+    
+    def __str__(self) -> str:
+        """Representación textual de la historia clínica"""
+        return "".join(linea + "\n" for linea in self.iterar_lineas())
\ No newline at end of file
@@ -0,0 +1,191 @@
+
+
+import csv
+import gc
+import json
+import os
+import time
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, TextIO, Tuple
+from modeloclinica import Clinica
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+from modeloexcepciones import MedicoNoEncontradoException, MedicoDuplicadoException
+
+
+FORMATOS = ("csv", "jsonl")
+
+# Función que recibe (registros procesados, rechazados, segundos transcurridos)
+Progreso = Callable[[int, int, float], None]
+
+
+def _registros_csv(archivo: TextIO) -> Iterator[Tuple[int, object]]:
+    """Recorre un CSV con encabezado y devuelve (número de línea, registro)"""
+    lector = csv.DictReader(archivo)
+    for registro in lector:
+        yield lector.line_num, registro
+
+
+def _registros_jsonl(archivo: TextIO) -> Iterator[Tuple[int, object]]:
+    """Recorre un archivo con un objeto JSON por línea; las líneas ilegibles se devuelven como texto"""
+    for numero, linea in enumerate(archivo, 1):
+        if not linea.strip():
+            continue
+        try:
+            yield numero, json.loads(linea)
+        except ValueError:
+            yield numero, linea.rstrip("\n")
+
+
+def _campo(registro: Dict, nombre: str) -> str:
+    """Devuelve un campo obligatorio como texto sin espacios en los extremos"""
+    valor = registro.get(nombre)
+    valor = "" if valor is None else str(valor).strip()
+    if not valor:
+        raise ValueError(f"Falta el campo {nombre}")
+    return valor
+
+
+def _leer_paciente(registro: Dict) -> Paciente:
+    """Registro con nombre, dni y fecha_nacimiento"""
+    return Paciente(_campo(registro, "nombre"), _campo(registro, "dni"), _campo(registro, "fecha_nacimiento"))
+
+
+def _leer_medico(registro: Dict) -> Tuple[Medico, Optional[Especialidad]]:
+    """Registro con nombre y matricula, y opcionalmente especialidad y dias"""
+    medico = Medico(_campo(registro, "nombre"), _campo(registro, "matricula"))
+    if not registro.get("especialidad"):
+        return medico, None
+    dias = registro.get("dias") or ""
+    if isinstance(dias, str):
+        dias = dias.split(",")
+    return medico, Especialidad(_campo(registro, "especialidad"), [str(dia).strip() for dia in dias])
+
+
+def _leer_turno(registro: Dict) -> Tuple[str, str, str, datetime]:
+    """Registro con dni, matricula, especialidad y fecha_hora en formato ISO (aaaa-mm-ddTHH:MM)"""
+    dni, matricula, especialidad = _campo(registro, "dni"), _campo(registro, "matricula"), _campo(registro, "especialidad")
+    fecha_hora = datetime.fromisoformat(_campo(registro, "fecha_hora"))
+    # Los turnos van en minutos exactos: así la fila se rechaza sola en cualquier repositorio
+    if fecha_hora.second or fecha_hora.microsecond:
+        raise ValueError("La fecha_hora debe ser en minutos exactos (aaaa-mm-ddTHH:MM)")
+    return dni, matricula, especialidad, fecha_hora
+
+
+class Importador:
+    """Importa pacientes, médicos y turnos desde archivos CSV o JSONL a una clínica.
+    
+    Lee los archivos de a `tamano_lote` registros, así que la memoria no depende del
+    tamaño del archivo, y registra cada lote con las operaciones en lote de la clínica.
+    Los registros inválidos no detienen la importación: se anotan en `rechazos` (un
+    objeto JSON por línea con archivo, línea, error y registro) y se cuentan.
+    """
+    
+    def __init__(self, clinica: Clinica, rechazos: Optional[TextIO] = None, tamano_lote: int = 10_000,
+                 progreso: Optional[Progreso] = None):
+        if tamano_lote < 1:
+            raise ValueError("El tamaño del lote debe ser positivo")
+        self.__clinica = clinica
+        self.__rechazos = rechazos
+        self.__tamano_lote = tamano_lote
+        self.__progreso = progreso
+    
+    def importar_pacientes(self, ruta: str, formato: Optional[str] = None) -> Tuple[int, int]:
+        """Importa pacientes; devuelve (importados, rechazados)"""
+        return self.__importar(ruta, formato, _leer_paciente, self.__clinica.agregar_pacientes)
+    
+    def importar_medicos(self, ruta: str, formato: Optional[str] = None) -> Tuple[int, int]:
+        """Importa médicos con sus especialidades; devuelve (importados, rechazados).
+        
+        Cada registro es un médico con a lo sumo una especialidad; un registro con la
+        matrícula de un médico ya registrado le agrega esa especialidad.
+        """
+        return self.__importar(ruta, formato, _leer_medico, self.__registrar_medicos)
+    
+    def importar_turnos(self, ruta: str, formato: Optional[str] = None) -> Tuple[int, int]:
+        """Importa turnos con las mismas validaciones que agendar_turnos; devuelve (importados, rechazados)"""
+        return self.__importar(ruta, formato, _leer_turno, self.__clinica.agendar_turnos)
+    
+    def __registrar_medicos(self, filas: List[Tuple[Medico, Optional[Especialidad]]]) -> List[Optional[Exception]]:
+        """Registra los médicos nuevos y agrega las especialidades de cada fila"""
+        resultados: List[Optional[Exception]] = []
+        for medico, especialidad in filas:
+            matricula = medico.obtener_matricula()
+            try:
+                if especialidad is None or not self.__existe_medico(matricula):
+                    self.__clinica.agregar_medico(medico)
+                if especialidad is not None:
+                    self.__clinica.agregar_especialidad(matricula, especialidad)
+            except (MedicoDuplicadoException, ValueError) as e:
+                resultados.append(e)
+                continue
+            resultados.append(None)
+        return resultados
+    
+    def __existe_medico(self, matricula: str) -> bool:
+        """Indica si la clínica ya tiene un médico con esa matrícula"""
+        try:
+            self.__clinica.validar_existencia_medico(matricula)
+        except MedicoNoEncontradoException:
+            return False
+        return True
+    
+    def __importar(self, ruta: str, formato: Optional[str], convertir: Callable,
+                   registrar: Callable[[List], List[Optional[Exception]]]) -> Tuple[int, int]:
+        """Lee el archivo por lotes, convierte cada registro y registra los válidos de cada lote"""
+        if formato is None:
+            formato = os.path.splitext(ruta)[1].lstrip(".").lower()
+        if formato not in FORMATOS:
+            raise ValueError(f"Formato de importación desconocido: {formato} (use csv o jsonl)")
+        
+        # Como en agendar_turnos: el recolector de ciclos no aporta nada mientras se crean miles de objetos
+        gc_activo = gc.isenabled()
+        gc.disable()
+        try:
+            return self.__importar_archivo(ruta, formato, convertir, registrar)
+        finally:
+            if gc_activo:
+                gc.enable()
+    
+    def __importar_archivo(self, ruta: str, formato: str, convertir: Callable,
+                           registrar: Callable[[List], List[Optional[Exception]]]) -> Tuple[int, int]:
+        """Recorre el archivo de a un lote por vez"""
+        inicio = time.perf_counter()
+        importados = rechazados = 0
+        with open(ruta, newline="", encoding="utf-8") as archivo:
+            registros = _registros_csv(archivo) if formato == "csv" else _registros_jsonl(archivo)
+            while True:
+                lote = list(islice(registros, self.__tamano_lote))
+                if not lote:
+                    break
+                
+                validos, origen = [], []
+                for linea, registro in lote:
+                    try:
+                        if not isinstance(registro, dict):
+                            raise ValueError("El registro no es un objeto JSON")
+                        validos.append(convertir(registro))
+                    except (ValueError, TypeError) as e:
+                        self.__rechazar(ruta, linea, registro, e)
+                        rechazados += 1
+                        continue
+                    origen.append((linea, registro))
+                
+                for (linea, registro), error in zip(origen, registrar(validos)):
+                    if error is None:
+                        importados += 1
+                    else:
+                        self.__rechazar(ruta, linea, registro, error)
+                        rechazados += 1
+                
+                if self.__progreso is not None:
+                    self.__progreso(importados + rechazados, rechazados, time.perf_counter() - inicio)
+        return importados, rechazados
+    
+    def __rechazar(self, ruta: str, linea: int, registro: object, error: Exception):
+        """Anota un registro rechazado en el archivo de rechazos"""
+        if self.__rechazos is not None:
+            self.__rechazos.write(json.dumps({"archivo": ruta, "linea": linea, "error": str(error),
+                                              "registro": registro}, ensure_ascii=False) + "\n")
\ No newline at end of file
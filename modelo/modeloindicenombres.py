@@ -0,0 +1,272 @@
+
+
+import heapq
+import re
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+from modelopaciente import Paciente
+
+
+# Mayor carácter posible: toda palabra que empieza con el prefijo es menor que prefijo + _ULTIMO
+_ULTIMO = "\U0010ffff"
+# Palabras de la consulta más cortas no se buscan con errores: casi cualquier palabra estaría cerca
+_MINIMO_DIFUSO = 4
+# Desde este largo se toleran dos errores en lugar de uno
+_LARGO_DOS_ERRORES = 7
+# Solo letras (con las tildes sueltas que pueden seguirlas): los números se buscan por DNI
+_PALABRA = re.compile(r"(?:[^\W\d_]|[\u0300-\u036f])+")
+
+
+@lru_cache(maxsize=65536)
+def _sin_tildes(palabra: str) -> str:
+    """Quita las tildes de una palabra; nombres y apellidos se repiten, así que casi siempre está en caché"""
+    if palabra.isascii():
+        return palabra
+    descompuesta = unicodedata.normalize("NFKD", palabra)
+    return "".join(c for c in descompuesta if not unicodedata.combining(c))
+
+
+def normalizar_palabras(texto: str) -> List[str]:
+    """Separa un texto en palabras de letras sin tildes ni mayúsculas ("Pérez-Núñez 2" -> ["perez", "nunez"])"""
+    return [_sin_tildes(palabra) for palabra in _PALABRA.findall(texto.casefold())]
+
+
+def _trigramas(palabra: str) -> List[str]:
+    """Trigramas de la palabra con relleno solo al comienzo: un prefijo comparte todos los suyos"""
+    relleno = "  " + palabra
+    return [relleno[i:i + 3] for i in range(len(palabra))]
+
+
+def _distancia_a_prefijo(consulta: str, palabra: str, maximo: int) -> int:
+    """Menor distancia de edición entre la consulta y algún prefijo de la palabra (maximo + 1 si la supera).
+    
+    Solo se calcula la franja de la tabla a `maximo` de la diagonal: fuera de ella la
+    distancia ya supera el máximo.
+    """
+    palabra = palabra[:len(consulta) + maximo]
+    fuera = maximo + 1
+    anterior = [j if j <= maximo else fuera for j in range(len(palabra) + 1)]
+    for i, letra in enumerate(consulta, 1):
+        actual = [fuera] * (len(palabra) + 1)
+        if i <= maximo:
+            actual[0] = i
+        mejor = actual[0]
+        for j in range(max(1, i - maximo), min(len(palabra), i + maximo) + 1):
+            valor = anterior[j - 1] if letra == palabra[j - 1] else anterior[j - 1] + 1
+            if anterior[j] + 1 < valor:
+                valor = anterior[j] + 1
+            if actual[j - 1] + 1 < valor:
+                valor = actual[j - 1] + 1
+            actual[j] = valor
+            if valor < mejor:
+                mejor = valor
+        if mejor > maximo:
+            return fuera
+        anterior = actual
+    return min(min(anterior), fuera)
+
+
+class IndiceNombres:
+    """Índice de palabras de los nombres de pacientes para buscar por prefijo y con errores.
+    
+    Cada palabra distinta (sin tildes ni mayúsculas) tiene un número y la lista ordenada
+    de los pacientes que la usan. Las palabras se mantienen ordenadas para encontrar con
+    bisect las que empiezan con un prefijo, y cada trigrama apunta a las palabras que lo
+    contienen para encontrar las parecidas sin compararlas a todas. Como los apellidos se
+    repiten, hay muchas menos palabras que pacientes. De cada paciente solo se guarda el
+    DNI: el índice no retiene los objetos Paciente, que Clinica pide al repositorio.
+    """
+    
+    __slots__ = ("__dnis", "__ids_paciente", "__inicios", "__numeros", "__palabras", "__posteos",
+                 "__trigramas", "__ordenadas", "__ordenadas_numeros", "__nuevas", "__bloqueo")
+    
+    def __init__(self):
+        # DNI de cada paciente, por número de alta
+        self.__dnis: List[str] = []
+        # Números de palabra de cada paciente, seguidos; los del paciente i van de __inicios[i] a __inicios[i + 1]
+        self.__ids_paciente = array("I")
+        self.__inicios = array("I", [0])
+        # Palabra -> número, número -> palabra y número -> pacientes que la usan (en orden de alta)
+        self.__numeros: Dict[str, int] = {}
+        self.__palabras: List[str] = []
+        self.__posteos: List[array] = []
+        # Trigrama -> números de las palabras que lo contienen
+        self.__trigramas: Dict[str, List[int]] = {}
+        # Palabras ordenadas (listas paralelas) y palabras nuevas que todavía no se ubicaron
+        self.__ordenadas: List[str] = []
+        self.__ordenadas_numeros: List[int] = []
+        self.__nuevas: List[int] = []
+        self.__bloqueo = threading.Lock()
+    
+    def agregar_paciente(self, paciente: Paciente):
+        """Indexa las palabras del nombre de un paciente"""
+        with self.__bloqueo:
+            self.__agregar(paciente)
+    
+    def agregar_pacientes(self, pacientes: Iterable[Paciente]):
+        """Indexa varios pacientes a la vez"""
+        with self.__bloqueo:
+            for paciente in pacientes:
+                self.__agregar(paciente)
+    
+    def __agregar(self, paciente: Paciente):
+        """Indexa un paciente con el siguiente número de alta"""
+        indice = len(self.__dnis)
+        self.__dnis.append(paciente.obtener_dni())
+        for palabra in dict.fromkeys(normalizar_palabras(paciente.obtener_nombre())):
+            numero = self.__numeros.get(palabra)
+            if numero is None:
+                numero = self.__numeros[palabra] = len(self.__palabras)
+                self.__palabras.append(palabra)
+                self.__posteos.append(array("I"))
+                for trigrama in set(_trigramas(palabra)):
+                    self.__trigramas.setdefault(trigrama, []).append(numero)
+                self.__nuevas.append(numero)
+            self.__posteos[numero].append(indice)
+            self.__ids_paciente.append(numero)
+        self.__inicios.append(len(self.__ids_paciente))
+    
+    def buscar(self, texto: str, limite: int) -> List[str]:
+        """Devuelve el DNI de hasta `limite` pacientes cuyo nombre tiene, para cada palabra del texto, una palabra parecida.
+        
+        Primero los que coinciden por prefijo en todas las palabras, después los que
+        necesitan menos correcciones; los empates, en orden de alta.
+        """
+        consulta = normalizar_palabras(texto)
+        if not consulta:
+            return []
+        with self.__bloqueo:
+            self.__ordenar_nuevas()
+            exactas = [self.__con_prefijo(palabra) for palabra in consulta]
+            # La palabra con menos pacientes guía la búsqueda; las demás solo filtran
+            guia = min(range(len(consulta)), key=lambda i: self.__cantidad(exactas[i]))
+            encontrados = self.__por_prefijo(exactas, guia, limite)
+            if len(encontrados) == limite:
+                return [self.__dnis[i] for i in encontrados]
+            
+            costos = [self.__parecidas(palabra, exactas[i]) for i, palabra in enumerate(consulta)]
+            if all(len(costos[i]) == len(exactas[i]) for i in range(len(consulta))):
+                # Ninguna palabra tiene parecidas: lo encontrado por prefijo ya es todo
+                return [self.__dnis[i] for i in encontrados]
+            if len(consulta) == 1:
+                return [self.__dnis[i] for i in self.__por_niveles(costos[0], limite)]
+            guia = min(range(len(consulta)), key=lambda i: self.__cantidad(costos[i]))
+            candidatos = set()
+            for numero in costos[guia]:
+                candidatos.update(self.__posteos[numero])
+            puntajes = []
+            for indice in candidatos:
+                total = self.__costo(indice, costos)
+                if total is not None:
+                    puntajes.append((total, indice))
+            return [self.__dnis[i] for _, i in heapq.nsmallest(limite, puntajes)]
+    
+    def paginar(self, texto: str, inicio: int, cantidad: int) -> Tuple[List[str], int]:
+        """Devuelve el DNI de `cantidad` pacientes desde la posición `inicio` y el total que coincide.
+        
+        Coinciden los pacientes cuyo nombre tiene, para cada palabra del texto, una que
+        empieza así (sin errores de tipeo), en orden de alta.
+        """
+        consulta = normalizar_palabras(texto)
+        if not consulta:
+            return [], 0
+        with self.__bloqueo:
+            self.__ordenar_nuevas()
+            exactas = [self.__con_prefijo(palabra) for palabra in consulta]
+            if len(exactas) == 1 and len(exactas[0]) == 1:
+                # Una sola palabra del índice empieza así: sus pacientes ya son la respuesta, en orden de alta
+                posteo = self.__posteos[next(iter(exactas[0]))]
+                return [self.__dnis[i] for i in posteo[inicio:inicio + cantidad]], len(posteo)
+            guia = min(range(len(consulta)), key=lambda i: self.__cantidad(exactas[i]))
+            encontrados = self.__por_prefijo(exactas, guia, None)
+            return [self.__dnis[i] for i in encontrados[inicio:inicio + cantidad]], len(encontrados)
+    
+    def __ordenar_nuevas(self):
+        """Ubica las palabras agregadas desde la última búsqueda en la lista ordenada"""
+        nuevas = self.__nuevas
+        if not nuevas:
+            return
+        if len(nuevas) < 32:
+            for numero in nuevas:
+                palabra = self.__palabras[numero]
+                posicion = bisect_right(self.__ordenadas, palabra)
+                self.__ordenadas.insert(posicion, palabra)
+                self.__ordenadas_numeros.insert(posicion, numero)
+        else:
+            self.__ordenadas_numeros = sorted(range(len(self.__palabras)), key=self.__palabras.__getitem__)
+            self.__ordenadas = [self.__palabras[numero] for numero in self.__ordenadas_numeros]
+        self.__nuevas = []
+    
+    def __con_prefijo(self, prefijo: str) -> Dict[int, int]:
+        """Números de las palabras que empiezan con el prefijo, con costo 0"""
+        primera = bisect_left(self.__ordenadas, prefijo)
+        ultima = bisect_right(self.__ordenadas, prefijo + _ULTIMO)
+        return dict.fromkeys(self.__ordenadas_numeros[primera:ultima], 0)
+    
+    def __parecidas(self, consulta: str, exactas: Dict[int, int]) -> Dict[int, int]:
+        """Agrega a las palabras con el prefijo las que tienen un prefijo a pocas correcciones, con su costo"""
+        if len(consulta) < _MINIMO_DIFUSO:
+            return exactas
+        maximo = 1 if len(consulta) < _LARGO_DOS_ERRORES else 2
+        trigramas = _trigramas(consulta)
+        # Cada corrección cambia como mucho tres trigramas de la consulta
+        minimo = len(trigramas) - 3 * maximo
+        comunes = Counter()
+        for trigrama in set(trigramas):
+            comunes.update(self.__trigramas.get(trigrama, ()))
+        costos = dict(exactas)
+        for numero, cantidad in comunes.items():
+            if cantidad >= minimo and numero not in costos:
+                distancia = _distancia_a_prefijo(consulta, self.__palabras[numero], maximo)
+                if distancia <= maximo:
+                    costos[numero] = distancia
+        return costos
+    
+    def __cantidad(self, numeros: Dict[int, int]) -> int:
+        """Cuántas apariciones en pacientes suman esas palabras"""
+        return sum(len(self.__posteos[numero]) for numero in numeros)
+    
+    def __por_prefijo(self, exactas: List[Dict[int, int]], guia: int, limite: Optional[int]) -> List[int]:
+        """Los primeros `limite` pacientes (None = todos), en orden de alta, que coinciden por prefijo en todas las palabras"""
+        encontrados: List[int] = []
+        anterior = -1
+        # Los posteos ya están en orden de alta: se mezclan sin ordenar a todos los candidatos
+        for indice in heapq.merge(*(self.__posteos[numero] for numero in exactas[guia])):
+            if indice == anterior:
+                continue
+            anterior = indice
+            if self.__costo(indice, exactas) is not None:
+                encontrados.append(indice)
+                if len(encontrados) == limite:
+                    break
+        return encontrados
+    
+    def __por_niveles(self, costos: Dict[int, int], limite: int) -> List[int]:
+        """Con una sola palabra: los pacientes de las palabras de menor costo primero, sin puntuar a todos"""
+        encontrados: List[int] = []
+        vistos = set()
+        for nivel in sorted(set(costos.values())):
+            posteos = [self.__posteos[numero] for numero, costo in costos.items() if costo == nivel]
+            for indice in heapq.merge(*posteos):
+                if indice not in vistos:
+                    vistos.add(indice)
+                    encontrados.append(indice)
+                    if len(encontrados) == limite:
+                        return encontrados
+        return encontrados
+    
+    def __costo(self, indice: int, costos: List[Dict[int, int]]) -> Optional[int]:
+        """Suma, por cada palabra de la consulta, la menor corrección entre las palabras del paciente; None si alguna no aparece"""
+        palabras = self.__ids_paciente[self.__inicios[indice]:self.__inicios[indice + 1]]
+        total = 0
+        for costo in costos:
+            mejor = min((costo[numero] for numero in palabras if numero in costo), default=None)
+            if mejor is None:
+                return None
+            total += mejor
+        return total
\ No newline at end of file
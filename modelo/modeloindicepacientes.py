@@ -0,0 +1,56 @@
+
+
+import threading
+from bisect import bisect_left, bisect_right
+from typing import List, Tuple
+from modelopaciente import Paciente
+
+
+# Mayor carácter posible: todo texto que empieza con el prefijo es menor que prefijo + _ULTIMO
+_ULTIMO = "\U0010ffff"
+
+
+class IndicePacientes:
+    """Índice de pacientes ordenado por DNI para buscar por prefijo.
+    
+    Los nombres no se indexan acá: paginar por nombre usa el IndiceNombres de Clinica,
+    que es el mismo para todos los repositorios.
+    
+    Se arma recién en la primera búsqueda a partir de la lista de pacientes en orden de
+    alta (que solo crece) y se pone al día en cada búsqueda: los pocos pacientes nuevos
+    se insertan en su lugar y, si son muchos, se vuelve a ordenar todo una sola vez.
+    """
+    
+    __slots__ = ("__pacientes", "__indexados", "__dnis", "__por_dni", "__bloqueo")
+    
+    def __init__(self, pacientes: List[Paciente]):
+        self.__pacientes = pacientes
+        self.__indexados = 0
+        # Listas paralelas: claves ordenadas y el paciente de cada una
+        self.__dnis: List[str] = []
+        self.__por_dni: List[Paciente] = []
+        self.__bloqueo = threading.Lock()
+    
+    def buscar(self, prefijo: str, inicio: int, cantidad: int) -> Tuple[List[Paciente], int]:
+        """Devuelve `cantidad` pacientes cuyo DNI empieza con el prefijo, desde la posición `inicio` en orden de DNI, y el total"""
+        with self.__bloqueo:
+            self.__actualizar()
+            primero = bisect_left(self.__dnis, prefijo)
+            ultimo = bisect_right(self.__dnis, prefijo + _ULTIMO)
+            return self.__por_dni[primero + inicio:min(ultimo, primero + inicio + cantidad)], ultimo - primero
+    
+    def __actualizar(self):
+        """Incorpora los pacientes agregados a la lista desde la última búsqueda"""
+        nuevos = self.__pacientes[self.__indexados:]
+        if not nuevos:
+            return
+        if len(nuevos) < 32:
+            for paciente in nuevos:
+                posicion = bisect_right(self.__dnis, paciente.obtener_dni())
+                self.__dnis.insert(posicion, paciente.obtener_dni())
+                self.__por_dni.insert(posicion, paciente)
+        else:
+            todos = self.__pacientes[:self.__indexados + len(nuevos)]
+            self.__por_dni = sorted(todos, key=Paciente.obtener_dni)
+            self.__dnis = [paciente.obtener_dni() for paciente in self.__por_dni]
+        self.__indexados += len(nuevos)
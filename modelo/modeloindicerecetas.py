@@ -0,0 +1,114 @@
+
+
+import heapq
+import threading
+from bisect import bisect_left, insort
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+from modeloreceta import Receta
+
+
+@lru_cache(maxsize=4096)
+def normalizar_medicamento(nombre: str) -> str:
+    """Clave de un medicamento: sin mayúsculas y con los espacios colapsados"""
+    return " ".join(nombre.split()).casefold()
+
+
+def medicamentos_distintos(medicamentos: Iterable[str]) -> Dict[str, str]:
+    """Medicamento normalizado -> nombre con que aparece primero en la receta, sin espacios en los extremos"""
+    # Recorridos al revés, queda la primera escritura
+    return {normalizar_medicamento(m): m.strip() for m in reversed(list(medicamentos))}
+
+
+def _contar(fechas: List[datetime], desde: Optional[datetime], hasta: Optional[datetime]) -> int:
+    """Cuenta con búsqueda binaria las fechas (ordenadas) en [desde, hasta)"""
+    inicio = 0 if desde is None else bisect_left(fechas, desde)
+    fin = len(fechas) if hasta is None else bisect_left(fechas, hasta)
+    return max(fin - inicio, 0)
+
+
+class IndiceRecetas:
+    """Índice invertido de recetas por medicamento.
+    
+    Por cada medicamento (normalizado con normalizar_medicamento) guarda sus recetas
+    ordenadas por fecha de emisión, y por cada médico las fechas en que recetó cada
+    medicamento. Las consultas por período son búsquedas binarias sobre esas fechas y
+    el ranking de más recetados solo recorre los medicamentos, nunca las recetas.
+    Un medicamento repetido en la misma receta se cuenta una vez.
+    """
+    
+    __slots__ = ("__fechas", "__recetas", "__nombres", "__por_medico", "__bloqueo")
+    
+    def __init__(self):
+        # Listas paralelas por medicamento: fechas ordenadas y la receta de cada una
+        self.__fechas: Dict[str, List[datetime]] = {}
+        self.__recetas: Dict[str, List[Receta]] = {}
+        # Medicamento normalizado -> nombre con el que se recetó por primera vez
+        self.__nombres: Dict[str, str] = {}
+        # Matrícula -> medicamento -> fechas ordenadas en que ese médico lo recetó
+        self.__por_medico: Dict[str, Dict[str, List[datetime]]] = {}
+        self.__bloqueo = threading.Lock()
+    
+    def agregar_receta(self, receta: Receta):
+        """Indexa una receta bajo cada uno de sus medicamentos"""
+        with self.__bloqueo:
+            self.__agregar(receta)
+    
+    def agregar_recetas(self, recetas: Iterable[Receta]):
+        """Indexa varias recetas a la vez"""
+        with self.__bloqueo:
+            for receta in recetas:
+                self.__agregar(receta)
+    
+    def __agregar(self, receta: Receta):
+        """Indexa una receta; casi siempre llega la más nueva, así que se agrega al final"""
+        fecha = receta.obtener_fecha()
+        por_medico = self.__por_medico.setdefault(receta.obtener_medico().obtener_matricula(), {})
+        # Una entrada por medicamento distinto
+        for clave, nombre in medicamentos_distintos(receta.obtener_medicamentos()).items():
+            fechas = self.__fechas.get(clave)
+            if fechas is None:
+                fechas = self.__fechas[clave] = []
+                self.__recetas[clave] = []
+                self.__nombres[clave] = nombre
+            recetas = self.__recetas[clave]
+            if not fechas or fechas[-1] <= fecha:
+                fechas.append(fecha)
+                recetas.append(receta)
+            else:
+                posicion = bisect_left(fechas, fecha)
+                fechas.insert(posicion, fecha)
+                recetas.insert(posicion, receta)
+            
+            fechas_medico = por_medico.setdefault(clave, [])
+            if not fechas_medico or fechas_medico[-1] <= fecha:
+                fechas_medico.append(fecha)
+            else:
+                insort(fechas_medico, fecha)
+    
+    def buscar(self, medicamento: str, desde: Optional[datetime] = None,
+               hasta: Optional[datetime] = None) -> List[Receta]:
+        """Devuelve las recetas del medicamento emitidas en [desde, hasta), por fecha de emisión"""
+        clave = normalizar_medicamento(medicamento)
+        with self.__bloqueo:
+            fechas = self.__fechas.get(clave)
+            if fechas is None:
+                return []
+            inicio = 0 if desde is None else bisect_left(fechas, desde)
+            fin = len(fechas) if hasta is None else bisect_left(fechas, hasta)
+            return self.__recetas[clave][inicio:fin]
+    
+    def mas_recetados(self, cantidad: int, matricula: Optional[str] = None, desde: Optional[datetime] = None,
+                      hasta: Optional[datetime] = None) -> List[Tuple[str, int]]:
+        """Los `cantidad` medicamentos con más recetas en [desde, hasta), del médico indicado o de todos.
+        
+        Devuelve pares (nombre, recetas) de mayor a menor; los empates, por nombre.
+        """
+        with self.__bloqueo:
+            fechas = self.__fechas if matricula is None else self.__por_medico.get(matricula, {})
+            cuentas = ((self.__nombres[clave], _contar(fechas_medicamento, desde, hasta))
+                       for clave, fechas_medicamento in fechas.items())
+            mejores = heapq.nsmallest(cantidad, (par for par in cuentas if par[1]),
+                                      key=lambda par: (-par[1], par[0]))
+        return mejores
\ No newline at end of file
@@ -0,0 +1,290 @@
+
+
+import mmap
+import os
+import struct
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad, DURACION_PREDETERMINADA, MINUTO, duracion_en_minutos
+from modeloturno import Turno
+from modeloreceta import Receta
+
+
+# Formato binario (little-endian):
+#   cabecera | desplazamientos de cadenas | bytes UTF-8 de cadenas | pacientes | médicos
+#   | especialidades | turnos | recetas | medicamentos de recetas
+# Todas las cadenas se guardan una sola vez y los registros las referencian por índice.
+MAGIA = b"CLIN"
+# Versión 2: especialidades y turnos llevan su duración en minutos (la 1 se sigue leyendo)
+VERSION = 2
+
+_CABECERA = struct.Struct("<4sHHQIIIIIIQ")
+_DESPLAZAMIENTO = struct.Struct("<Q")
+_PACIENTE = struct.Struct("<III")       # nombre, dni, fecha de nacimiento
+_MEDICO = struct.Struct("<II")          # nombre, matrícula
+_ESPECIALIDAD = struct.Struct("<IIBH")  # índice de médico, tipo, máscara de días, duración
+_TURNO = struct.Struct("<IIIqH")        # índice de paciente, índice de médico, especialidad, fecha, duración
+_RECETA = struct.Struct("<IIqII")       # índice de paciente, índice de médico, fecha, primer medicamento, cantidad
+_MEDICAMENTO = struct.Struct("<I")
+# Registros de la versión 1, sin duraciones
+_ESPECIALIDAD_V1 = struct.Struct("<IIB")
+_TURNO_V1 = struct.Struct("<IIIq")
+
+# Las fechas se guardan como microsegundos desde esta época
+_EPOCA = datetime(1970, 1, 1)
+_MICROSEGUNDO = timedelta(microseconds=1)
+
+
+def _a_entero(fecha: datetime) -> int:
+    return (fecha - _EPOCA) // _MICROSEGUNDO
+
+
+def _a_fecha(valor: int) -> datetime:
+    return _EPOCA + timedelta(microseconds=valor)
+
+
+def escribir_instantanea(ruta: str, pacientes: Iterable[Paciente], medicos: Iterable[Medico],
+                         turnos: Iterable[Turno], recetas: Iterable[Receta], posicion_bitacora: int = 0):
+    """Escribe una instantánea binaria de forma atómica (archivo temporal y reemplazo).
+    
+    `posicion_bitacora` es el tamaño en bytes de la bitácora al momento de la
+    instantánea: al recuperar, solo se reproduce lo escrito después de esa posición.
+    """
+    cadenas: Dict[str, int] = {}
+    
+    def cadena(texto: str) -> int:
+        indice = cadenas.get(texto)
+        if indice is None:
+            indice = cadenas[texto] = len(cadenas)
+        return indice
+    
+    indice_paciente: Dict[str, int] = {}
+    bloque_pacientes = bytearray()
+    for paciente in pacientes:
+        indice_paciente[paciente.obtener_dni()] = len(indice_paciente)
+        bloque_pacientes += _PACIENTE.pack(cadena(paciente.obtener_nombre()), cadena(paciente.obtener_dni()),
+                                           cadena(paciente.obtener_fecha_nacimiento()))
+    
+    indice_medico: Dict[str, int] = {}
+    bloque_medicos = bytearray()
+    bloque_especialidades = bytearray()
+    cantidad_especialidades = 0
+    for medico in medicos:
+        posicion = indice_medico[medico.obtener_matricula()] = len(indice_medico)
+        bloque_medicos += _MEDICO.pack(cadena(medico.obtener_nombre()), cadena(medico.obtener_matricula()))
+        for especialidad in medico.obtener_especialidades():
+            bloque_especialidades += _ESPECIALIDAD.pack(posicion, cadena(especialidad.obtener_especialidad()),
+                                                        especialidad.obtener_mascara_dias(),
+                                                        especialidad.obtener_duracion() // MINUTO)
+            cantidad_especialidades += 1
+    
+    bloque_turnos = bytearray()
+    cantidad_turnos = 0
+    for turno in turnos:
+        bloque_turnos += _TURNO.pack(indice_paciente[turno.obtener_paciente().obtener_dni()],
+                                     indice_medico[turno.obtener_medico().obtener_matricula()],
+                                     cadena(turno.obtener_especialidad()),
+                                     _a_entero(turno.obtener_fecha_hora()),
+                                     turno.obtener_duracion() // MINUTO)
+        cantidad_turnos += 1
+    
+    bloque_recetas = bytearray()
+    bloque_medicamentos = bytearray()
+    cantidad_recetas = 0
+    cantidad_medicamentos = 0
+    for receta in recetas:
+        medicamentos = receta.obtener_medicamentos()
+        bloque_recetas += _RECETA.pack(indice_paciente[receta.obtener_paciente().obtener_dni()],
+                                       indice_medico[receta.obtener_medico().obtener_matricula()],
+                                       _a_entero(receta.obtener_fecha()), cantidad_medicamentos, len(medicamentos))
+        for medicamento in medicamentos:
+            bloque_medicamentos += _MEDICAMENTO.pack(cadena(medicamento))
+        cantidad_recetas += 1
+        cantidad_medicamentos += len(medicamentos)
+    
+    bytes_cadenas = [texto.encode("utf-8") for texto in cadenas]
+    desplazamientos = bytearray()
+    posicion = 0
+    for codificada in bytes_cadenas:
+        desplazamientos += _DESPLAZAMIENTO.pack(posicion)
+        posicion += len(codificada)
+    desplazamientos += _DESPLAZAMIENTO.pack(posicion)
+    
+    cabecera = _CABECERA.pack(MAGIA, VERSION, 0, posicion, len(cadenas), len(indice_paciente),
+                              len(indice_medico), cantidad_especialidades, cantidad_turnos,
+                              cantidad_recetas, posicion_bitacora)
+    
+    temporal = ruta + ".tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(cabecera)
+        archivo.write(desplazamientos)
+        for codificada in bytes_cadenas:
+            archivo.write(codificada)
+        for bloque in (bloque_pacientes, bloque_medicos, bloque_especialidades,
+                       bloque_turnos, bloque_recetas, bloque_medicamentos):
+            archivo.write(bloque)
+        archivo.flush()
+        os.fsync(archivo.fileno())
+    os.replace(temporal, ruta)
+
+
+class Instantanea:
+    """Lector de una instantánea binaria mapeada en memoria, registro por registro.
+    
+    Abrirla solo lee la cabecera y cada registro se decodifica al pedirlo (pacientes y
+    médicos quedan guardados para los siguientes accesos). Sirve para consultar unos
+    pocos registros; Clinica.recuperar los pide todos, así que recuperar no es perezoso.
+    """
+    
+    def __init__(self, ruta: str):
+        self.__archivo = open(ruta, "rb")
+        try:
+            self.__datos = mmap.mmap(self.__archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.__archivo.close()
+            raise ValueError(f"Instantánea vacía: {ruta}")
+        
+        if len(self.__datos) < _CABECERA.size:
+            self.cerrar()
+            raise ValueError(f"Instantánea inválida: {ruta}")
+        (magia, version, _, tamanio_cadenas, cantidad_cadenas, cantidad_pacientes, cantidad_medicos,
+         cantidad_especialidades, cantidad_turnos, cantidad_recetas,
+         self.__posicion_bitacora) = _CABECERA.unpack_from(self.__datos, 0)
+        if magia != MAGIA or version not in (1, VERSION):
+            self.cerrar()
+            raise ValueError(f"Instantánea inválida: {ruta}")
+        self.__formato_especialidad = _ESPECIALIDAD if version == VERSION else _ESPECIALIDAD_V1
+        self.__formato_turno = _TURNO if version == VERSION else _TURNO_V1
+        
+        self.__cantidad_pacientes = cantidad_pacientes
+        self.__cantidad_medicos = cantidad_medicos
+        self.__cantidad_especialidades = cantidad_especialidades
+        self.__cantidad_turnos = cantidad_turnos
+        self.__cantidad_recetas = cantidad_recetas
+        
+        # Posición de cada sección dentro del archivo
+        self.__inicio_desplazamientos = _CABECERA.size
+        self.__inicio_cadenas = self.__inicio_desplazamientos + (cantidad_cadenas + 1) * _DESPLAZAMIENTO.size
+        self.__inicio_pacientes = self.__inicio_cadenas + tamanio_cadenas
+        self.__inicio_medicos = self.__inicio_pacientes + cantidad_pacientes * _PACIENTE.size
+        self.__inicio_especialidades = self.__inicio_medicos + cantidad_medicos * _MEDICO.size
+        self.__inicio_turnos = (self.__inicio_especialidades
+                                + cantidad_especialidades * self.__formato_especialidad.size)
+        self.__inicio_recetas = self.__inicio_turnos + cantidad_turnos * self.__formato_turno.size
+        self.__inicio_medicamentos = self.__inicio_recetas + cantidad_recetas * _RECETA.size
+        
+        self.__cadenas: List[Optional[str]] = [None] * cantidad_cadenas
+        self.__pacientes: List[Optional[Paciente]] = [None] * cantidad_pacientes
+        self.__medicos: Optional[List[Medico]] = None
+    
+    def obtener_posicion_bitacora(self) -> int:
+        """Devuelve el tamaño que tenía la bitácora cuando se tomó la instantánea"""
+        return self.__posicion_bitacora
+    
+    def cantidad_pacientes(self) -> int:
+        """Devuelve la cantidad de pacientes guardados"""
+        return self.__cantidad_pacientes
+    
+    def cantidad_medicos(self) -> int:
+        """Devuelve la cantidad de médicos guardados"""
+        return self.__cantidad_medicos
+    
+    def cantidad_turnos(self) -> int:
+        """Devuelve la cantidad de turnos guardados"""
+        return self.__cantidad_turnos
+    
+    def cantidad_recetas(self) -> int:
+        """Devuelve la cantidad de recetas guardadas"""
+        return self.__cantidad_recetas
+    
+    def __cadena(self, indice: int) -> str:
+        """Decodifica (una sola vez) la cadena con ese índice"""
+        texto = self.__cadenas[indice]
+        if texto is None:
+            inicio, fin = struct.unpack_from(
+                "<QQ", self.__datos, self.__inicio_desplazamientos + indice * _DESPLAZAMIENTO.size)
+            base = self.__inicio_cadenas
+            texto = self.__cadenas[indice] = str(self.__datos[base + inicio:base + fin], "utf-8")
+        return texto
+    
+    def obtener_paciente(self, indice: int) -> Paciente:
+        """Devuelve el paciente en la posición indicada"""
+        paciente = self.__pacientes[indice]
+        if paciente is None:
+            nombre, dni, fecha_nacimiento = _PACIENTE.unpack_from(
+                self.__datos, self.__inicio_pacientes + indice * _PACIENTE.size)
+            paciente = self.__pacientes[indice] = Paciente(
+                self.__cadena(nombre), self.__cadena(dni), self.__cadena(fecha_nacimiento))
+        return paciente
+    
+    def obtener_medico(self, indice: int) -> Medico:
+        """Devuelve el médico en la posición indicada, con sus especialidades"""
+        if self.__medicos is None:
+            # Los médicos son pocos y sus especialidades están en una sección aparte:
+            # se construyen todos juntos la primera vez
+            medicos = []
+            for i in range(self.__cantidad_medicos):
+                nombre, matricula = _MEDICO.unpack_from(self.__datos, self.__inicio_medicos + i * _MEDICO.size)
+                medicos.append(Medico(self.__cadena(nombre), self.__cadena(matricula)))
+            formato = self.__formato_especialidad
+            for i in range(self.__cantidad_especialidades):
+                medico, tipo, mascara, *duracion = formato.unpack_from(
+                    self.__datos, self.__inicio_especialidades + i * formato.size)
+                medicos[medico].agregar_especialidad(Especialidad.desde_mascara(
+                    self.__cadena(tipo), mascara, duracion_en_minutos(duracion[0]) if duracion else DURACION_PREDETERMINADA))
+            self.__medicos = medicos
+        return self.__medicos[indice]
+    
+    def obtener_turno(self, indice: int) -> Turno:
+        """Construye el turno en la posición indicada"""
+        formato = self.__formato_turno
+        paciente, medico, especialidad, fecha, *duracion = formato.unpack_from(
+            self.__datos, self.__inicio_turnos + indice * formato.size)
+        return Turno(self.obtener_paciente(paciente), self.obtener_medico(medico), _a_fecha(fecha),
+                     self.__cadena(especialidad), duracion_en_minutos(duracion[0]) if duracion else DURACION_PREDETERMINADA)
+    
+    def iterar_turnos(self) -> Iterator[Tuple[Paciente, Medico, datetime, str, timedelta]]:
+        """Recorre todos los turnos como (paciente, médico, fecha_hora, especialidad, duración).
+        
+        Pensado para cargas completas: decodifica la sección de una pasada y comparte
+        los objetos datetime de turnos que caen en la misma fecha y hora.
+        """
+        fechas: Dict[int, datetime] = {}
+        obtener_paciente = self.obtener_paciente
+        obtener_medico = self.obtener_medico
+        cadena = self.__cadena
+        inicio = self.__inicio_turnos
+        formato = self.__formato_turno
+        seccion = memoryview(self.__datos)[inicio:inicio + self.__cantidad_turnos * formato.size]
+        try:
+            for paciente, medico, especialidad, valor, *duracion in formato.iter_unpack(seccion):
+                fecha = fechas.get(valor)
+                if fecha is None:
+                    fecha = fechas[valor] = _a_fecha(valor)
+                yield (obtener_paciente(paciente), obtener_medico(medico), fecha, cadena(especialidad),
+                       duracion_en_minutos(duracion[0]) if duracion else DURACION_PREDETERMINADA)
+        finally:
+            seccion.release()
+    
+    def obtener_receta(self, indice: int) -> Receta:
+        """Construye la receta en la posición indicada"""
+        paciente, medico, fecha, primero, cantidad = _RECETA.unpack_from(
+            self.__datos, self.__inicio_recetas + indice * _RECETA.size)
+        inicio = self.__inicio_medicamentos + primero * _MEDICAMENTO.size
+        medicamentos = [self.__cadena(m) for m, in _MEDICAMENTO.iter_unpack(
+            self.__datos[inicio:inicio + cantidad * _MEDICAMENTO.size])]
+        return Receta(self.obtener_paciente(paciente), self.obtener_medico(medico), medicamentos, _a_fecha(fecha))
+    
+    def cerrar(self):
+        """Libera el mapeo en memoria y el archivo"""
+        if not self.__datos.closed:
+            self.__datos.close()
+        self.__archivo.close()
+    
+    def __enter__(self) -> 'Instantanea':
+        return self
+    
+    def __exit__(self, *_):
+        self.cerrar()
\ No newline at end of file
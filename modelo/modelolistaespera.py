@@ -0,0 +1,191 @@
+
+
+import heapq
+import threading
+from datetime import date, timedelta
+from itertools import count
+from typing import Dict, List, Optional, Set, Tuple
+from modeloturno import Turno
+
+
+# Orden de llegada de las solicitudes: desempata las de igual prioridad
+_LLEGADAS = count()
+
+
+class SolicitudEspera:
+    """Pedido de un paciente para un turno de una especialidad dentro de un rango de días"""
+    
+    __slots__ = ("__dni", "__especialidad", "__matricula", "__desde", "__hasta", "__prioridad",
+                 "__llegada", "__turno")
+    
+    def __init__(self, dni: str, especialidad: str, desde: date, hasta: date,
+                 matricula: Optional[str] = None, prioridad: int = 0):
+        if not dni or not especialidad or not desde or not hasta:
+            raise ValueError("DNI, especialidad y rango de días son obligatorios")
+        if hasta < desde:
+            raise ValueError("El rango de días termina antes de empezar")
+        
+        self.__dni = dni
+        self.__especialidad = especialidad
+        # None: sirve cualquier médico que atienda la especialidad
+        self.__matricula = matricula
+        self.__desde = desde
+        self.__hasta = hasta
+        # Menor número, más urgente
+        self.__prioridad = prioridad
+        self.__llegada = next(_LLEGADAS)
+        self.__turno: Optional[Turno] = None
+    
+    def obtener_dni(self) -> str:
+        """Devuelve el DNI del paciente"""
+        return self.__dni
+    
+    def obtener_especialidad(self) -> str:
+        """Devuelve la especialidad pedida"""
+        return self.__especialidad
+    
+    def obtener_matricula(self) -> Optional[str]:
+        """Devuelve la matrícula del médico pedido, o None si sirve cualquiera"""
+        return self.__matricula
+    
+    def obtener_desde(self) -> date:
+        """Devuelve el primer día aceptado"""
+        return self.__desde
+    
+    def obtener_hasta(self) -> date:
+        """Devuelve el último día aceptado (inclusive)"""
+        return self.__hasta
+    
+    def obtener_prioridad(self) -> int:
+        """Devuelve la prioridad (menor número, más urgente)"""
+        return self.__prioridad
+    
+    def obtener_turno(self) -> Optional[Turno]:
+        """Devuelve el turno asignado, o None mientras espera"""
+        return self.__turno
+    
+    def asignar_turno(self, turno: Turno):
+        """Registra el turno que se le asignó al paciente"""
+        self.__turno = turno
+    
+    def obtener_clave(self) -> Tuple[int, int]:
+        """Devuelve la clave de orden en la lista: prioridad y, a igual prioridad, orden de llegada"""
+        return self.__prioridad, self.__llegada
+    
+    def dias(self) -> List[date]:
+        """Devuelve los días aceptados en orden"""
+        return [self.__desde + timedelta(days=i) for i in range((self.__hasta - self.__desde).days + 1)]
+    
+    def __str__(self) -> str:
+        medico = self.__matricula if self.__matricula is not None else "cualquier médico"
+        return (f"Espera: {self.__dni} - {self.__especialidad} con {medico} entre el "
+                f"{self.__desde.strftime('%d/%m/%Y')} y el {self.__hasta.strftime('%d/%m/%Y')} "
+                f"(prioridad {self.__prioridad})")
+
+
+class ListaEspera:
+    """Pacientes esperando un turno, ordenados por prioridad y orden de llegada.
+    
+    Cada solicitud se anota en un montículo por (especialidad, médico, día) de su rango,
+    con el médico en None si le sirve cualquiera. Para un horario libre solo se miran
+    los dos montículos de ese médico y ese día, así que el mejor paciente se encuentra
+    en O(log n) sin recorrer la lista. Las solicitudes atendidas o quitadas no se borran
+    de los demás montículos: se descartan cuando llegan a la cima.
+    """
+    
+    def __init__(self):
+        # (especialidad en minúsculas, matrícula o None, día) -> montículo de (clave, anotación, solicitud);
+        # el número de anotación desempata si una solicitud devuelta queda dos veces en un montículo
+        self.__monticulos: Dict[Tuple[str, Optional[str], date], list] = {}
+        # (especialidad en minúsculas, matrícula o None) -> días con montículo
+        self.__dias: Dict[Tuple[str, Optional[str]], Set[date]] = {}
+        self.__pendientes: Set[SolicitudEspera] = set()
+        self.__anotaciones = count()
+        self.__bloqueo = threading.Lock()
+    
+    def agregar(self, solicitud: SolicitudEspera):
+        """Anota una solicitud en los montículos de cada día de su rango"""
+        with self.__bloqueo:
+            self.__pendientes.add(solicitud)
+            self.__anotar(solicitud)
+    
+    def devolver(self, solicitud: SolicitudEspera):
+        """Vuelve a poner en espera una solicitud extraída que no se pudo agendar, sin perder su lugar"""
+        with self.__bloqueo:
+            if solicitud.obtener_turno() is None and solicitud not in self.__pendientes:
+                self.__pendientes.add(solicitud)
+                self.__anotar(solicitud)
+    
+    def __anotar(self, solicitud: SolicitudEspera):
+        clave = solicitud.obtener_clave()
+        especialidad = solicitud.obtener_especialidad().lower()
+        matricula = solicitud.obtener_matricula()
+        dias = self.__dias.setdefault((especialidad, matricula), set())
+        for dia in solicitud.dias():
+            heapq.heappush(self.__monticulos.setdefault((especialidad, matricula, dia), []),
+                           (clave, next(self.__anotaciones), solicitud))
+            dias.add(dia)
+    
+    def quitar(self, solicitud: SolicitudEspera) -> bool:
+        """Saca una solicitud de la espera; devuelve False si ya no estaba esperando"""
+        with self.__bloqueo:
+            if solicitud not in self.__pendientes:
+                return False
+            self.__pendientes.remove(solicitud)
+            return True
+    
+    def extraer(self, especialidad: str, matricula: str, dia: date) -> Optional[SolicitudEspera]:
+        """Saca de la espera la mejor solicitud para un horario de ese médico ese día, o None si no hay.
+        
+        Compite la cima de los pedidos para ese médico con la de los pedidos para
+        cualquier médico de la especialidad.
+        """
+        especialidad = especialidad.lower()
+        with self.__bloqueo:
+            mejor = None
+            for clave in ((especialidad, matricula, dia), (especialidad, None, dia)):
+                cima = self.__cima(clave)
+                if cima is not None and (mejor is None or cima[0] < mejor[0][0]):
+                    mejor = (cima, clave)
+            if mejor is None:
+                return None
+            
+            (_, _, solicitud), clave = mejor
+            heapq.heappop(self.__monticulos[clave])
+            self.__pendientes.remove(solicitud)
+            self.__cima(clave)
+            return solicitud
+    
+    def __cima(self, clave: Tuple[str, Optional[str], date]) -> Optional[Tuple[Tuple[int, int], int, SolicitudEspera]]:
+        """Devuelve la primera solicitud pendiente de un montículo, descartando las que ya no esperan"""
+        monticulo = self.__monticulos.get(clave)
+        if monticulo is None:
+            return None
+        while monticulo and monticulo[0][2] not in self.__pendientes:
+            heapq.heappop(monticulo)
+        if monticulo:
+            return monticulo[0]
+        
+        del self.__monticulos[clave]
+        especialidad, matricula, dia = clave
+        dias = self.__dias[(especialidad, matricula)]
+        dias.discard(dia)
+        if not dias:
+            del self.__dias[(especialidad, matricula)]
+        return None
+    
+    def obtener_dias(self, especialidad: str, matricula: str) -> List[date]:
+        """Devuelve en orden los días con pedidos de la especialidad para ese médico o para cualquiera"""
+        especialidad = especialidad.lower()
+        with self.__bloqueo:
+            dias = set(self.__dias.get((especialidad, matricula), ()))
+            dias.update(self.__dias.get((especialidad, None), ()))
+        return sorted(dias)
+    
+    def obtener_pendientes(self) -> List[SolicitudEspera]:
+        """Devuelve las solicitudes que siguen esperando, en el orden en que se atenderían"""
+        with self.__bloqueo:
+            return sorted(self.__pendientes, key=SolicitudEspera.obtener_clave)
+    
+    def __len__(self) -> int:
+        return len(self.__pendientes)
\ No newline at end of file
@@ -1,12 +1,15 @@
 
 
+from datetime import datetime, timedelta
 from typing import List, Optional
-from modeloespecialidad import Especialidad
+from modeloespecialidad import Especialidad, obtener_indice_dia
 
 
 class Medico:
     """Representa a un médico del sistema"""
     
+    __slots__ = ("__nombre", "__matricula", "__especialidades", "__especialidad_por_dia")
+    
     def __init__(self, nombre: str, matricula: str):
         if not nombre or not matricula:
             raise ValueError("Nombre y matrícula son obligatorios")
@@ -14,6 +17,8 @@ class Medico:
         self.__nombre = nombre
         self.__matricula = matricula
         self.__especialidades = []
+        # Tabla día de la semana (0 = lunes) -> especialidad que atiende ese día
+        self.__especialidad_por_dia: List[Optional[str]] = [None] * 7
     
     def agregar_especialidad(self, especialidad: Especialidad):
         """Agrega una especialidad a la lista del médico"""
@@ -23,17 +28,49 @@ class Medico:
                 raise ValueError(f"La especialidad {especialidad.obtener_especialidad()} ya existe para este médico")
         
         self.__especialidades.append(especialidad)
+        
+        # Cada día lo ocupa la primera especialidad agregada que lo atiende
+        tipo = especialidad.obtener_especialidad()
+        mascara = especialidad.obtener_mascara_dias()
+        for indice in range(7):
+            if mascara >> indice & 1 and self.__especialidad_por_dia[indice] is None:
+                self.__especialidad_por_dia[indice] = tipo
     
     def obtener_matricula(self) -> str:
         """Devuelve la matrícula del médico"""
         return self.__matricula
     
+    def obtener_nombre(self) -> str:
+        """Devuelve el nombre del médico"""
+        return self.__nombre
+    
+    def obtener_especialidades(self) -> List[Especialidad]:
+        """Devuelve una copia de la lista de especialidades del médico"""
+        return self.__especialidades.copy()
+    
+    def obtener_duracion_especialidad(self, especialidad: str) -> Optional[timedelta]:
+        """Devuelve la duración de los turnos de una especialidad del médico, o None si no la atiende"""
+        # La duración vive en la Especialidad: un médico atiende pocas, así que recorrerlas
+        # cuesta menos que guardar un diccionario más por médico
+        for esp in self.__especialidades:
+            if esp.obtener_especialidad() == especialidad:
+                return esp.obtener_duracion()
+        nombre = especialidad.lower()
+        for esp in self.__especialidades:
+            if esp.obtener_especialidad().lower() == nombre:
+                return esp.obtener_duracion()
+        return None
+    
     def obtener_especialidad_para_dia(self, dia: str) -> Optional[str]:
         """Devuelve el nombre de la especialidad disponible en el día especificado"""
-        for especialidad in self.__especialidades:
-            if especialidad.verificar_dia(dia):
-                return especialidad.obtener_especialidad()
-        return None
+        indice = obtener_indice_dia(dia)
+        if indice is None:
+            return None
+        return self.__especialidad_por_dia[indice]
+    
+    def obtener_especialidad_para_fecha(self, fecha_hora: datetime) -> Optional[str]:
+        """Devuelve el nombre de la especialidad disponible el día de la semana de la fecha"""
+        return self.__especialidad_por_dia[fecha_hora.weekday()]
     
     def __str__(self) -> str:
         """Representación legible del médico"""
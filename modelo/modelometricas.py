@@ -0,0 +1,202 @@
+
+
+import json
+import threading
+import time
+from functools import wraps
+from typing import Callable, Dict, List, Optional, TextIO
+
+
+# Operaciones de Clinica que se miden cuando las métricas están activadas
+OPERACIONES_MEDIDAS = (
+    "agregar_paciente",
+    "agregar_medico",
+    "agregar_especialidad",
+    "agendar_turno",
+    "cancelar_turno",
+    "reprogramar_turno",
+    "agregar_a_lista_espera",
+    "emitir_receta",
+    "obtener_historia_clinica",
+    "obtener_turnos_medico",
+    "contar_turnos",
+    "buscar_turnos_disponibles",
+    "paginar_pacientes",
+    "buscar_pacientes",
+    "paginar_medicos",
+    "paginar_turnos",
+    "buscar_recetas_por_medicamento",
+    "medicamentos_mas_recetados"
+)
+# Operaciones en lote: devuelven una lista con la excepción (o None) de cada elemento
+OPERACIONES_LOTE = ("agregar_pacientes", "agendar_turnos")
+
+# Los intervalos del histograma se duplican: el primero llega a 2**_PRIMER_BIT ns (~1 µs)
+_PRIMER_BIT = 10
+_CANTIDAD_INTERVALOS = 28
+
+
+class HistogramaLatencia:
+    """Histograma de duraciones en nanosegundos con intervalos que se duplican.
+    
+    El intervalo de cada medición sale de la cantidad de bits de la duración, sin
+    comparaciones ni búsquedas; el último intervalo junta todo lo que supera ~2 minutos.
+    """
+    
+    __slots__ = ("__cantidades", "__cantidad", "__total", "__maximo")
+    
+    def __init__(self):
+        self.__cantidades = [0] * _CANTIDAD_INTERVALOS
+        self.__cantidad = 0
+        self.__total = 0
+        self.__maximo = 0
+    
+    def registrar(self, nanosegundos: int):
+        """Suma una medición a su intervalo"""
+        intervalo = nanosegundos.bit_length() - _PRIMER_BIT
+        if intervalo < 0:
+            intervalo = 0
+        elif intervalo >= _CANTIDAD_INTERVALOS:
+            intervalo = _CANTIDAD_INTERVALOS - 1
+        self.__cantidades[intervalo] += 1
+        self.__cantidad += 1
+        self.__total += nanosegundos
+        if nanosegundos > self.__maximo:
+            self.__maximo = nanosegundos
+    
+    def obtener_cantidad(self) -> int:
+        """Devuelve la cantidad de mediciones"""
+        return self.__cantidad
+    
+    def obtener_media(self) -> float:
+        """Devuelve la duración media en nanosegundos (0 sin mediciones)"""
+        return self.__total / self.__cantidad if self.__cantidad else 0.0
+    
+    def obtener_maximo(self) -> int:
+        """Devuelve la mayor duración medida en nanosegundos"""
+        return self.__maximo
+    
+    def obtener_percentil(self, percentil: float) -> int:
+        """Devuelve una cota superior del percentil (0 a 100): el límite de su intervalo"""
+        if not 0 <= percentil <= 100:
+            raise ValueError("El percentil debe estar entre 0 y 100")
+        buscado = percentil / 100 * self.__cantidad
+        acumulado = 0
+        for intervalo, cantidad in enumerate(self.__cantidades):
+            acumulado += cantidad
+            if cantidad and acumulado >= buscado:
+                return min(self.limite(intervalo), self.__maximo)
+        return 0
+    
+    def obtener_intervalos(self) -> List[List[int]]:
+        """Devuelve los pares [límite superior en ns, cantidad] de los intervalos con mediciones"""
+        return [[self.limite(intervalo), cantidad]
+                for intervalo, cantidad in enumerate(self.__cantidades) if cantidad]
+    
+    @staticmethod
+    def limite(intervalo: int) -> int:
+        """Devuelve el límite superior (exclusive) en nanosegundos de un intervalo"""
+        return 1 << (intervalo + _PRIMER_BIT)
+
+
+class EstadisticasOperacion:
+    """Llamadas, rechazos por tipo de excepción y latencias de una operación"""
+    
+    __slots__ = ("__llamadas", "__rechazos", "__latencias", "__bloqueo")
+    
+    def __init__(self):
+        self.__llamadas = 0
+        self.__rechazos: Dict[str, int] = {}
+        self.__latencias = HistogramaLatencia()
+        self.__bloqueo = threading.Lock()
+    
+    def registrar(self, nanosegundos: int, rechazos: Optional[List[str]] = None):
+        """Registra una llamada con su duración y las excepciones que la rechazaron"""
+        with self.__bloqueo:
+            self.__llamadas += 1
+            self.__latencias.registrar(nanosegundos)
+            if rechazos:
+                for excepcion in rechazos:
+                    self.__rechazos[excepcion] = self.__rechazos.get(excepcion, 0) + 1
+    
+    def obtener_llamadas(self) -> int:
+        """Devuelve la cantidad de llamadas"""
+        return self.__llamadas
+    
+    def obtener_rechazos(self) -> Dict[str, int]:
+        """Devuelve cuántas veces se lanzó cada tipo de excepción"""
+        with self.__bloqueo:
+            return dict(self.__rechazos)
+    
+    def obtener_latencias(self) -> HistogramaLatencia:
+        """Devuelve el histograma de duraciones"""
+        return self.__latencias
+    
+    def resumen(self) -> dict:
+        """Devuelve las estadísticas como un diccionario listo para JSON (duraciones en µs)"""
+        with self.__bloqueo:
+            latencias = self.__latencias
+            return {
+                "llamadas": self.__llamadas,
+                "rechazos": dict(self.__rechazos),
+                "latencia_us": {
+                    "media": round(latencias.obtener_media() / 1000, 3),
+                    "p50": latencias.obtener_percentil(50) / 1000,
+                    "p90": latencias.obtener_percentil(90) / 1000,
+                    "p99": latencias.obtener_percentil(99) / 1000,
+                    "max": latencias.obtener_maximo() / 1000,
+                    "histograma": [[limite / 1000, cantidad] for limite, cantidad in latencias.obtener_intervalos()]
+                }
+            }
+
+
+class Metricas:
+    """Métricas por operación de una Clinica: llamadas, rechazos y latencias.
+    
+    Clinica(metricas=Metricas()) reemplaza, solo en esa instancia, cada operación
+    medida por una envoltura que toma el tiempo y anota la excepción que la rechazó.
+    Sin métricas no se envuelve nada y las operaciones no cambian.
+    """
+    
+    def __init__(self):
+        self.__operaciones: Dict[str, EstadisticasOperacion] = {}
+    
+    def envolver(self, nombre: str, operacion: Callable, lote: bool = False) -> Callable:
+        """Devuelve la operación medida con el nombre dado.
+        
+        En una operación en lote se cuentan como rechazos las excepciones que devuelve
+        para sus elementos.
+        """
+        estadisticas = self.__operaciones.setdefault(nombre, EstadisticasOperacion())
+        registrar = estadisticas.registrar
+        reloj = time.perf_counter_ns
+        
+        @wraps(operacion)
+        def medida(*args, **kwargs):
+            inicio = reloj()
+            try:
+                resultado = operacion(*args, **kwargs)
+            except Exception as e:
+                registrar(reloj() - inicio, [type(e).__name__])
+                raise
+            if lote:
+                registrar(reloj() - inicio, [type(error).__name__ for error in resultado if error is not None])
+            else:
+                registrar(reloj() - inicio)
+            return resultado
+        
+        return medida
+    
+    def obtener_operacion(self, nombre: str) -> EstadisticasOperacion:
+        """Devuelve las estadísticas de una operación medida"""
+        return self.__operaciones[nombre]
+    
+    def resumen(self) -> Dict[str, dict]:
+        """Devuelve las estadísticas de las operaciones que se llamaron al menos una vez"""
+        return {nombre: estadisticas.resumen() for nombre, estadisticas in self.__operaciones.items()
+                if estadisticas.obtener_llamadas()}
+    
+    def escribir_json(self, salida: TextIO):
+        """Escribe el resumen como JSON"""
+        json.dump(self.resumen(), salida, ensure_ascii=False, indent=2)
+        salida.write("\n")
\ No newline at end of file
@@ -1,20 +1,34 @@
 
 
+import sys
+
+
 class Paciente:
     """Representa a un paciente de la clínica"""
     
+    __slots__ = ("__nombre", "__dni", "__fecha_nacimiento")
+    
     def __init__(self, nombre: str, dni: str, fecha_nacimiento: str):
         if not nombre or not dni or not fecha_nacimiento:
             raise ValueError("Todos los campos son obligatorios")
         
         self.__nombre = nombre
         self.__dni = dni
-        self.__fecha_nacimiento = fecha_nacimiento
+        # Muchas fechas se repiten entre pacientes: se comparte una sola copia de cada una
+        self.__fecha_nacimiento = sys.intern(fecha_nacimiento) if type(fecha_nacimiento) is str else fecha_nacimiento
     
     def obtener_dni(self) -> str:
         """Devuelve el DNI del paciente"""
         return self.__dni
     
+    def obtener_nombre(self) -> str:
+        """Devuelve el nombre completo del paciente"""
+        return self.__nombre
+    
+    def obtener_fecha_nacimiento(self) -> str:
+        """Devuelve la fecha de nacimiento del paciente (dd/mm/aaaa)"""
+        return self.__fecha_nacimiento
+    
     def __str__(self) -> str:
         """Representación en texto del paciente"""
         return f"Paciente: {self.__nombre} (DNI: {self.__dni})"
\ No newline at end of file
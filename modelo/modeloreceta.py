@@ -1,7 +1,8 @@
 
 
+import sys
 from datetime import datetime
-from typing import List
+from typing import List, Optional
 from modelopaciente import Paciente
 from modelomedico import Medico
 
@@ -9,7 +10,10 @@ from modelomedico import Medico
 class Receta:
     """Representa una receta médica"""
     
-    def __init__(self, paciente: Paciente, medico: Medico, medicamentos: List[str]):
+    __slots__ = ("__paciente", "__medico", "__medicamentos", "__fecha")
+    
+    def __init__(self, paciente: Paciente, medico: Medico, medicamentos: List[str],
+                 fecha: Optional[datetime] = None):
         if not paciente or not medico or not medicamentos:
             raise ValueError("Todos los campos son obligatorios")
         
@@ -18,8 +22,26 @@ class Receta:
         
         self.__paciente = paciente
         self.__medico = medico
-        self.__medicamentos = medicamentos
-        self.__fecha = datetime.now()
+        # Tupla (sin espacio de reserva) con los nombres de medicamentos internados
+        self.__medicamentos = tuple(sys.intern(m) if type(m) is str else m for m in medicamentos)
+        # La fecha solo se indica al reconstruir recetas ya emitidas
+        self.__fecha = fecha if fecha is not None else datetime.now()
+    
+    def obtener_paciente(self) -> Paciente:
+        """Devuelve el paciente de la receta"""
+        return self.__paciente
+    
+    def obtener_medico(self) -> Medico:
+        """Devuelve el médico que emitió la receta"""
+        return self.__medico
+    
+    def obtener_medicamentos(self) -> List[str]:
+        """Devuelve una copia de la lista de medicamentos"""
+        return list(self.__medicamentos)
+    
+    def obtener_fecha(self) -> datetime:
+        """Devuelve la fecha de emisión de la receta"""
+        return self.__fecha
     
     def __str__(self) -> str:
         """Representación en cadena de la receta"""
@@ -0,0 +1,183 @@
+
+
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple
+from modeloclinica import Clinica, HORA_INICIO_ATENCION, HORA_FIN_ATENCION
+from modelorepositorio import EPOCA
+from modeloexcepciones import MedicoNoEncontradoException
+
+# numpy es opcional: solo lo necesitan los reportes
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+_MINUTOS_POR_DIA = 24 * 60
+# Día de la semana (0 = lunes) del día 0 de los arreglos
+_DIA_SEMANA_EPOCA = EPOCA.weekday()
+
+
+def _a_minuto(fecha: date) -> int:
+    """Minutos desde EPOCA hasta la fecha y hora (o el comienzo del día), redondeando hacia arriba"""
+    if not isinstance(fecha, datetime):
+        fecha = datetime.combine(fecha, time())
+    return -((EPOCA - fecha) // timedelta(minutes=1))
+
+
+def _a_dia(fecha: date) -> int:
+    """Días desde EPOCA hasta la fecha (se ignora la hora)"""
+    return fecha.toordinal() - EPOCA.toordinal()
+
+
+def _columna(arreglo, tipo) -> 'np.ndarray':
+    """Convierte un arreglo de la biblioteca estándar en un arreglo de numpy del tipo indicado"""
+    if not len(arreglo):
+        return np.zeros(0, dtype=tipo)
+    return np.frombuffer(arreglo, dtype=np.dtype(arreglo.typecode)).astype(tipo)
+
+
+class ReporteOcupacion:
+    """Reportes de ocupación de la clínica calculados en bloque con numpy.
+    
+    Al crearse exporta los turnos una sola vez (ver Clinica.exportar_turnos) a arreglos
+    de médico, especialidad, día, día de la semana y hora; cada reporte filtra y cuenta
+    sobre esos arreglos sin recorrer los turnos en Python. La capacidad de un médico en
+    cada día de la semana que atiende es la cantidad de horarios entre `hora_inicio` y
+    `hora_fin` con la duración de la especialidad de ese día (la primera agregada que lo
+    atiende, como al agendar), o con `duracion` para todas si se indica. Los turnos
+    agendados después de crear el reporte no se reflejan.
+    """
+    
+    def __init__(self, clinica: Clinica, duracion: Optional[timedelta] = None,
+                 hora_inicio: time = HORA_INICIO_ATENCION, hora_fin: time = HORA_FIN_ATENCION):
+        if np is None:
+            raise ImportError("Los reportes de ocupación requieren numpy")
+        if duracion is not None and duracion <= timedelta(0):
+            raise ValueError("La duración debe ser positiva")
+        
+        dia = EPOCA.date()
+        franja = datetime.combine(dia, hora_fin) - datetime.combine(dia, hora_inicio)
+        if duracion is not None and franja // duracion < 1:
+            raise ValueError("La franja horaria no admite ningún turno de esa duración")
+        
+        medicos = clinica.obtener_medicos()
+        self.__matriculas: List[str] = [medico.obtener_matricula() for medico in medicos]
+        self.__indice_medicos = {matricula: indice for indice, matricula in enumerate(self.__matriculas)}
+        # Médico x día de la semana: horarios que ofrece ese día (0 si no atiende)
+        self.__horarios = np.zeros((len(medicos), 7), dtype=np.int64)
+        for indice, medico in enumerate(medicos):
+            pendientes = 0b1111111
+            for especialidad in medico.obtener_especialidades():
+                dias = especialidad.obtener_mascara_dias() & pendientes
+                pendientes &= ~dias
+                horarios = franja // (duracion or especialidad.obtener_duracion())
+                for dia_semana in range(7):
+                    if dias >> dia_semana & 1:
+                        self.__horarios[indice, dia_semana] = horarios
+        self.__atiende = self.__horarios > 0
+        
+        col_medicos, col_minutos, col_especialidades, self.__especialidades = clinica.exportar_turnos()
+        self.__medico = _columna(col_medicos, np.intp)
+        self.__especialidad = _columna(col_especialidades, np.intp)
+        self.__minutos = _columna(col_minutos, np.int64)
+        self.__dia = self.__minutos // _MINUTOS_POR_DIA
+        self.__dia_semana = ((self.__dia + _DIA_SEMANA_EPOCA) % 7).astype(np.intp)
+        self.__hora = ((self.__minutos - self.__dia * _MINUTOS_POR_DIA) // 60).astype(np.intp)
+    
+    def obtener_matriculas(self) -> List[str]:
+        """Devuelve las matrículas en el orden de las filas de los reportes por médico"""
+        return self.__matriculas.copy()
+    
+    def obtener_horarios_por_dia(self) -> 'np.ndarray':
+        """Matriz de médicos (filas) x día de la semana (0 = lunes) con cuántos turnos puede dar cada uno ese día"""
+        return self.__horarios.copy()
+    
+    def __seleccion(self, desde: Optional[date] = None, hasta: Optional[date] = None,
+                    matricula: Optional[str] = None, especialidad: Optional[str] = None):
+        """Máscara de los turnos en [desde, hasta) del médico y la especialidad indicados"""
+        if desde is None and hasta is None and matricula is None and especialidad is None:
+            return slice(None)
+        mascara = np.ones(len(self.__minutos), dtype=bool)
+        if desde is not None:
+            mascara &= self.__minutos >= _a_minuto(desde)
+        if hasta is not None:
+            mascara &= self.__minutos < _a_minuto(hasta)
+        if matricula is not None:
+            indice = self.__indice_medicos.get(matricula)
+            if indice is None:
+                raise MedicoNoEncontradoException(f"No existe médico con matrícula {matricula}")
+            mascara &= self.__medico == indice
+        if especialidad is not None:
+            if especialidad not in self.__especialidades:
+                # Ningún turno de esa especialidad
+                return np.zeros(len(self.__minutos), dtype=bool)
+            mascara &= self.__especialidad == self.__especialidades.index(especialidad)
+        return mascara
+    
+    def turnos_por_medico(self, desde: Optional[date] = None, hasta: Optional[date] = None) -> Dict[str, int]:
+        """Cantidad de turnos de cada médico en [desde, hasta)"""
+        cuentas = np.bincount(self.__medico[self.__seleccion(desde, hasta)], minlength=len(self.__matriculas))
+        return dict(zip(self.__matriculas, cuentas.tolist()))
+    
+    def turnos_por_especialidad(self, desde: Optional[date] = None,
+                                hasta: Optional[date] = None) -> Dict[str, int]:
+        """Cantidad de turnos de cada especialidad en [desde, hasta)"""
+        cuentas = np.bincount(self.__especialidad[self.__seleccion(desde, hasta)],
+                              minlength=len(self.__especialidades))
+        return dict(zip(self.__especialidades, cuentas.tolist()))
+    
+    def mapa_calor(self, desde: Optional[date] = None, hasta: Optional[date] = None,
+                   matricula: Optional[str] = None, especialidad: Optional[str] = None) -> 'np.ndarray':
+        """Matriz de 7 x 24 con la cantidad de turnos por día de la semana (fila 0 = lunes) y hora"""
+        seleccion = self.__seleccion(desde, hasta, matricula, especialidad)
+        celdas = self.__dia_semana[seleccion] * 24 + self.__hora[seleccion]
+        return np.bincount(celdas, minlength=7 * 24).reshape(7, 24)
+    
+    def __ocupacion_semanal(self, desde: date, hasta: date) -> Tuple['np.ndarray', 'np.ndarray']:
+        """Turnos ocupados y capacidad por médico (filas) y día de la semana (columnas) entre dos días"""
+        inicio, fin = _a_dia(desde), max(_a_dia(desde), _a_dia(hasta))
+        seleccion = (self.__dia >= inicio) & (self.__dia < fin)
+        celdas = self.__medico[seleccion] * 7 + self.__dia_semana[seleccion]
+        ocupados = np.bincount(celdas, minlength=len(self.__matriculas) * 7).reshape(-1, 7)
+        # Cuántas veces cae cada día de la semana en el período
+        veces = np.bincount((np.arange(inicio, fin) + _DIA_SEMANA_EPOCA) % 7, minlength=7)
+        capacidad = self.__horarios * veces
+        return ocupados, capacidad
+    
+    def matriz_utilizacion(self, desde: date, hasta: date) -> 'np.ndarray':
+        """Fracción de horarios ocupados por médico (filas) y día de la semana (columnas, 0 = lunes).
+        
+        Cuenta los días desde `desde` (inclusive) hasta `hasta` (exclusive). Vale NaN donde
+        el médico no atiende ese día de la semana o el día no cae en el período.
+        """
+        ocupados, capacidad = self.__ocupacion_semanal(desde, hasta)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(capacidad > 0, ocupados / capacidad, np.nan)
+    
+    def utilizacion_por_medico(self, desde: date, hasta: date) -> Dict[str, float]:
+        """Fracción de horarios ocupados de cada médico entre dos días (NaN si no atiende en el período)"""
+        ocupados, capacidad = self.__ocupacion_semanal(desde, hasta)
+        total = capacidad.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            utilizacion = np.where(total > 0, ocupados.sum(axis=1) / total, np.nan)
+        return dict(zip(self.__matriculas, utilizacion.tolist()))
+    
+    def dias_sin_capacidad(self, desde: date, hasta: date) -> List[Tuple[str, date]]:
+        """Días que atiende cada médico en que ya no le quedan horarios libres.
+        
+        Devuelve pares (matrícula, día) entre `desde` (inclusive) y `hasta` (exclusive),
+        ordenados por médico y luego por día.
+        """
+        inicio, fin = _a_dia(desde), max(_a_dia(desde), _a_dia(hasta))
+        cantidad_dias = fin - inicio
+        seleccion = (self.__dia >= inicio) & (self.__dia < fin)
+        celdas = self.__medico[seleccion] * cantidad_dias + (self.__dia[seleccion] - inicio)
+        ocupados = np.bincount(celdas, minlength=len(self.__matriculas) * cantidad_dias)
+        ocupados = ocupados.reshape(len(self.__matriculas), cantidad_dias)
+        dias_semana = (np.arange(inicio, fin) + _DIA_SEMANA_EPOCA) % 7
+        atiende = self.__atiende[:, dias_semana]
+        medicos, dias = np.nonzero(atiende & (ocupados >= self.__horarios[:, dias_semana]))
+        dia_cero = EPOCA.date()
+        return [(self.__matriculas[medico], dia_cero + timedelta(days=inicio + dia))
+                for medico, dia in zip(medicos.tolist(), dias.tolist())]
\ No newline at end of file
@@ -0,0 +1,387 @@
+
+
+import threading
+from array import array
+from bisect import insort
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad, DURACION_MAXIMA
+from modeloturno import Turno
+from modeloreceta import Receta
+from modelohistoriaclinica import HistoriaClinica
+from modeloagenda import AgendaMedico
+from modelovista import Vista
+from modeloindicepacientes import IndicePacientes
+from modeloindicerecetas import IndiceRecetas
+
+
+# Origen de los minutos con los que se exportan las fechas de los turnos
+EPOCA = datetime(1970, 1, 1)
+
+
+class RepositorioClinica:
+    """Interfaz de almacenamiento de la clínica.
+    
+    Clinica valida cada operación y después delega en el repositorio, que solo guarda
+    y consulta datos: no lanza excepciones de negocio.
+    """
+    
+    def obtener_paciente(self, dni: str) -> Optional[Paciente]:
+        """Devuelve el paciente con ese DNI, o None si no existe"""
+        raise NotImplementedError
+    
+    def agregar_paciente(self, paciente: Paciente):
+        """Guarda un paciente nuevo junto con su historia clínica vacía"""
+        raise NotImplementedError
+    
+    def agregar_pacientes(self, pacientes: List[Paciente]):
+        """Guarda varios pacientes nuevos de una vez"""
+        for paciente in pacientes:
+            self.agregar_paciente(paciente)
+    
+    def listar_pacientes(self) -> Sequence[Paciente]:
+        """Devuelve todos los pacientes en orden de alta"""
+        raise NotImplementedError
+    
+    def paginar_pacientes(self, prefijo: Optional[str], inicio: int, cantidad: int) -> Tuple[List[Paciente], int]:
+        """Devuelve `cantidad` pacientes desde la posición `inicio` y el total que coincide con el prefijo.
+        
+        Sin prefijo, en orden de alta; con un prefijo (numérico), los DNI que empiezan
+        así, en orden de DNI. Los prefijos de nombre los resuelve Clinica con su índice
+        de nombres, igual para todos los repositorios.
+        """
+        pacientes = self.listar_pacientes()
+        if not prefijo:
+            return list(pacientes[inicio:inicio + cantidad]), len(pacientes)
+        coincidencias = sorted((p for p in pacientes if p.obtener_dni().startswith(prefijo)), key=Paciente.obtener_dni)
+        return coincidencias[inicio:inicio + cantidad], len(coincidencias)
+    
+    def obtener_medico(self, matricula: str) -> Optional[Medico]:
+        """Devuelve el médico con esa matrícula, o None si no existe"""
+        raise NotImplementedError
+    
+    def agregar_medico(self, medico: Medico):
+        """Guarda un médico nuevo con las especialidades que ya tenga"""
+        raise NotImplementedError
+    
+    def agregar_especialidad(self, medico: Medico, especialidad: Especialidad):
+        """Guarda una especialidad que ya se agregó al médico"""
+        raise NotImplementedError
+    
+    def listar_medicos(self) -> Sequence[Medico]:
+        """Devuelve todos los médicos en orden de alta"""
+        raise NotImplementedError
+    
+    def existe_turno(self, matricula: str, fecha_hora: datetime) -> bool:
+        """Indica si el médico ya tiene un turno en esa fecha y hora"""
+        raise NotImplementedError
+    
+    def existe_superposicion(self, matricula: str, inicio: datetime, fin: datetime,
+                             excluir: Optional[datetime] = None) -> bool:
+        """Indica si algún turno del médico se superpone con [inicio, fin), sin contar el que empieza en `excluir`.
+        
+        Un repositorio que no puede guardar un turno en `inicio` lanza ValueError: así el
+        horario se rechaza al validarlo y no al agregar los turnos.
+        """
+        return any(turno_inicio != excluir
+                   for turno_inicio, _ in self.obtener_intervalos_turnos_medico(matricula, inicio, fin))
+    
+    def obtener_intervalos_turnos_medico(self, matricula: str, desde: datetime,
+                                         hasta: datetime) -> List[Tuple[datetime, datetime]]:
+        """Devuelve (inicio, fin) de los turnos del médico que se superponen con [desde, hasta), en orden"""
+        # Un turno que pise `desde` empezó como mucho DURACION_MAXIMA antes
+        return [(turno.obtener_fecha_hora(), turno.obtener_fin())
+                for turno in self.obtener_turnos_medico(matricula, desde - DURACION_MAXIMA, hasta)
+                if turno.obtener_fin() > desde]
+    
+    def agregar_turno(self, turno: Turno):
+        """Guarda un turno ya validado y lo agrega a la historia clínica del paciente"""
+        self.agregar_turnos([turno])
+    
+    def agregar_turnos(self, turnos: List[Turno]):
+        """Guarda varios turnos ya validados de una vez"""
+        raise NotImplementedError
+    
+    def listar_turnos(self) -> Sequence[Turno]:
+        """Devuelve todos los turnos en orden de alta"""
+        raise NotImplementedError
+    
+    def obtener_turno(self, matricula: str, fecha_hora: datetime) -> Optional[Turno]:
+        """Devuelve el turno del médico en esa fecha y hora, o None si no existe"""
+        turnos = self.obtener_turnos_medico(matricula, fecha_hora, fecha_hora + timedelta(microseconds=1), 1)
+        return turnos[0] if turnos else None
+    
+    def cancelar_turno(self, matricula: str, fecha_hora: datetime) -> Optional[Turno]:
+        """Quita el turno del médico en esa fecha y hora, también de la historia del paciente.
+        
+        El horario queda libre en el momento. Devuelve el turno quitado, o None si no existía.
+        """
+        raise NotImplementedError
+    
+    def mover_turno(self, anterior: Turno, nuevo: Turno):
+        """Reemplaza un turno por otro del mismo paciente y médico en otro horario.
+        
+        El turno conserva su lugar en listar_turnos y en la historia clínica; el horario
+        anterior queda libre en el momento.
+        """
+        raise NotImplementedError
+    
+    def obtener_turnos_medico(self, matricula: str, desde: Optional[datetime] = None,
+                              hasta: Optional[datetime] = None, limite: Optional[int] = None) -> List[Turno]:
+        """Devuelve los turnos del médico en [desde, hasta), ordenados por fecha (como mucho `limite`)"""
+        raise NotImplementedError
+    
+    def obtener_fechas_turnos_medico(self, matricula: str, desde: datetime, hasta: datetime) -> List[datetime]:
+        """Devuelve las fechas de los turnos del médico en [desde, hasta), ordenadas"""
+        raise NotImplementedError
+    
+    def contar_turnos(self, matricula: Optional[str] = None, desde: Optional[datetime] = None,
+                      hasta: Optional[datetime] = None) -> int:
+        """Cuenta los turnos en [desde, hasta), de un médico o de todos"""
+        if matricula is not None:
+            return len(self.obtener_turnos_medico(matricula, desde, hasta))
+        return sum(1 for turno in self.listar_turnos()
+                   if (desde is None or turno.obtener_fecha_hora() >= desde)
+                   and (hasta is None or turno.obtener_fecha_hora() < hasta))
+    
+    def exportar_turnos(self) -> Tuple[array, array, array, List[str]]:
+        """Devuelve los turnos en columnas para analizarlos en bloque.
+        
+        Son tres arreglos paralelos con una posición por turno: índice del médico (según
+        el orden de listar_medicos), minutos desde EPOCA e identificador de especialidad,
+        más la lista de especialidades indexada por ese identificador.
+        """
+        indice_medicos = {medico.obtener_matricula(): indice
+                          for indice, medico in enumerate(self.listar_medicos())}
+        indice_especialidades: Dict[str, int] = {}
+        medicos, minutos, especialidades = array("I"), array("i"), array("H")
+        minuto = timedelta(minutes=1)
+        for turno in self.listar_turnos():
+            especialidad = turno.obtener_especialidad()
+            medicos.append(indice_medicos[turno.obtener_medico().obtener_matricula()])
+            minutos.append((turno.obtener_fecha_hora() - EPOCA) // minuto)
+            especialidades.append(indice_especialidades.setdefault(especialidad, len(indice_especialidades)))
+        return medicos, minutos, especialidades, list(indice_especialidades)
+    
+    def agregar_receta(self, receta: Receta):
+        """Guarda una receta y la agrega a la historia clínica del paciente"""
+        self.agregar_recetas([receta])
+    
+    def agregar_recetas(self, recetas: List[Receta]):
+        """Guarda varias recetas de una vez"""
+        raise NotImplementedError
+    
+    def listar_recetas(self) -> Iterable[Receta]:
+        """Recorre todas las recetas"""
+        raise NotImplementedError
+    
+    def buscar_recetas_por_medicamento(self, medicamento: str, desde: Optional[datetime] = None,
+                                       hasta: Optional[datetime] = None) -> List[Receta]:
+        """Devuelve las recetas con el medicamento (normalizado) emitidas en [desde, hasta), por fecha de emisión"""
+        raise NotImplementedError
+    
+    def medicamentos_mas_recetados(self, cantidad: int, matricula: Optional[str] = None,
+                                   desde: Optional[datetime] = None,
+                                   hasta: Optional[datetime] = None) -> List[Tuple[str, int]]:
+        """Los `cantidad` medicamentos con más recetas en [desde, hasta), del médico indicado o de todos.
+        
+        Devuelve pares (nombre, recetas) de mayor a menor; los empates, por nombre.
+        """
+        raise NotImplementedError
+    
+    def obtener_historia_clinica(self, dni: str) -> HistoriaClinica:
+        """Devuelve la historia clínica de un paciente registrado"""
+        raise NotImplementedError
+    
+    def cerrar(self):
+        """Libera los recursos del repositorio"""
+
+
+class RepositorioMemoria(RepositorioClinica):
+    """Repositorio en memoria: diccionarios, listas e índices dentro del proceso.
+    
+    Los listados se devuelven como vistas de solo lectura sobre las listas internas.
+    Un turno cancelado deja un hueco en la lista de turnos que las vistas saltean; la
+    lista se compacta recién cuando los huecos son más de la mitad, así que cancelar y
+    listar no cuestan O(n) cada vez.
+    """
+    
+    def __init__(self):
+        self.__pacientes: Dict[str, Paciente] = {}
+        self.__medicos: Dict[str, Medico] = {}
+        # Listas en orden de alta: permiten devolver vistas indexables sin copiar
+        self.__lista_pacientes: List[Paciente] = []
+        self.__lista_medicos: List[Medico] = []
+        # Pacientes ordenados por DNI, para buscar por prefijo
+        self.__indice_pacientes = IndicePacientes(self.__lista_pacientes)
+        self.__turnos: List[Turno] = []
+        # Índice (matrícula, fecha_hora) -> posición en __turnos, para detectar conflictos
+        # y encontrar un turno en O(1)
+        self.__turnos_por_horario: Dict[Tuple[str, datetime], int] = {}
+        # Posiciones de __turnos canceladas, ordenadas: huecos que las vistas saltean
+        self.__cancelados: List[int] = []
+        # Agenda ordenada por fecha de cada médico, indexada por matrícula
+        self.__agendas: Dict[str, AgendaMedico] = {}
+        self.__historias_clinicas: Dict[str, HistoriaClinica] = {}
+        # Medicamento -> recetas, para buscar por medicamento y rankear sin recorrer historias
+        self.__indice_recetas = IndiceRecetas()
+        # Lista de turnos, índice por horario y huecos cambian juntos aunque varios hilos agenden a la vez
+        self.__bloqueo = threading.Lock()
+    
+    def obtener_paciente(self, dni: str) -> Optional[Paciente]:
+        return self.__pacientes.get(dni)
+    
+    def agregar_paciente(self, paciente: Paciente):
+        dni = paciente.obtener_dni()
+        self.__pacientes[dni] = paciente
+        self.__lista_pacientes.append(paciente)
+        self.__historias_clinicas[dni] = HistoriaClinica(paciente)
+    
+    def listar_pacientes(self) -> Sequence[Paciente]:
+        return Vista(self.__lista_pacientes)
+    
+    def paginar_pacientes(self, prefijo: Optional[str], inicio: int, cantidad: int) -> Tuple[List[Paciente], int]:
+        if not prefijo:
+            return self.__lista_pacientes[inicio:inicio + cantidad], len(self.__lista_pacientes)
+        return self.__indice_pacientes.buscar(prefijo, inicio, cantidad)
+    
+    def obtener_medico(self, matricula: str) -> Optional[Medico]:
+        return self.__medicos.get(matricula)
+    
+    def agregar_medico(self, medico: Medico):
+        matricula = medico.obtener_matricula()
+        self.__medicos[matricula] = medico
+        self.__lista_medicos.append(medico)
+        self.__agendas[matricula] = AgendaMedico()
+    
+    def agregar_especialidad(self, medico: Medico, especialidad: Especialidad):
+        # El médico en memoria ya es el objeto guardado
+        pass
+    
+    def listar_medicos(self) -> Sequence[Medico]:
+        return Vista(self.__lista_medicos)
+    
+    def existe_turno(self, matricula: str, fecha_hora: datetime) -> bool:
+        return (matricula, fecha_hora) in self.__turnos_por_horario
+    
+    def existe_superposicion(self, matricula: str, inicio: datetime, fin: datetime,
+                             excluir: Optional[datetime] = None) -> bool:
+        return self.__agendas[matricula].hay_superposicion(inicio, fin, excluir)
+    
+    def obtener_intervalos_turnos_medico(self, matricula: str, desde: datetime,
+                                         hasta: datetime) -> List[Tuple[datetime, datetime]]:
+        return self.__agendas[matricula].obtener_intervalos_entre(desde, hasta)
+    
+    def agregar_turno(self, turno: Turno):
+        matricula = turno.obtener_medico().obtener_matricula()
+        with self.__bloqueo:
+            self.__turnos_por_horario[(matricula, turno.obtener_fecha_hora())] = len(self.__turnos)
+            self.__turnos.append(turno)
+        self.__agendas[matricula].agregar_turno(turno)
+        self.__historias_clinicas[turno.obtener_paciente().obtener_dni()].agregar_turno(turno)
+    
+    def agregar_turnos(self, turnos: List[Turno]):
+        # Cada agenda recibe de una sola vez todos los turnos nuevos del médico
+        por_medico: Dict[str, List[Turno]] = {}
+        historias = self.__historias_clinicas
+        with self.__bloqueo:
+            ocupados = self.__turnos_por_horario
+            for posicion, turno in enumerate(turnos, len(self.__turnos)):
+                matricula = turno.obtener_medico().obtener_matricula()
+                ocupados[(matricula, turno.obtener_fecha_hora())] = posicion
+                historias[turno.obtener_paciente().obtener_dni()].agregar_turno(turno)
+                turnos_medico = por_medico.get(matricula)
+                if turnos_medico is None:
+                    por_medico[matricula] = [turno]
+                else:
+                    turnos_medico.append(turno)
+            self.__turnos.extend(turnos)
+        
+        for matricula, turnos_medico in por_medico.items():
+            self.__agendas[matricula].agregar_turnos(turnos_medico)
+    
+    def listar_turnos(self) -> Sequence[Turno]:
+        with self.__bloqueo:
+            return Vista(self.__turnos, huecos=self.__cancelados)
+    
+    def __compactar(self):
+        """Arma la lista de turnos sin los huecos y recalcula las posiciones; se llama con el candado tomado.
+        
+        Son listas nuevas: las vistas ya entregadas siguen mostrando las anteriores.
+        """
+        self.__turnos = [turno for turno in Vista(self.__turnos, huecos=self.__cancelados)]
+        self.__turnos_por_horario = {(turno.obtener_medico().obtener_matricula(), turno.obtener_fecha_hora()): posicion
+                                     for posicion, turno in enumerate(self.__turnos)}
+        self.__cancelados = []
+    
+    def obtener_turno(self, matricula: str, fecha_hora: datetime) -> Optional[Turno]:
+        posicion = self.__turnos_por_horario.get((matricula, fecha_hora))
+        return None if posicion is None else self.__turnos[posicion]
+    
+    def cancelar_turno(self, matricula: str, fecha_hora: datetime) -> Optional[Turno]:
+        with self.__bloqueo:
+            posicion = self.__turnos_por_horario.pop((matricula, fecha_hora), None)
+            if posicion is None:
+                return None
+            turno = self.__turnos[posicion]
+            insort(self.__cancelados, posicion)
+            # Compactar cuando los huecos son la mitad cuesta O(1) amortizado por cancelación
+            if 2 * len(self.__cancelados) > len(self.__turnos):
+                self.__compactar()
+        self.__agendas[matricula].quitar_turno(fecha_hora)
+        self.__historias_clinicas[turno.obtener_paciente().obtener_dni()].quitar_turno(turno)
+        return turno
+    
+    def mover_turno(self, anterior: Turno, nuevo: Turno):
+        matricula = anterior.obtener_medico().obtener_matricula()
+        with self.__bloqueo:
+            posicion = self.__turnos_por_horario.pop((matricula, anterior.obtener_fecha_hora()))
+            self.__turnos[posicion] = nuevo
+            self.__turnos_por_horario[(matricula, nuevo.obtener_fecha_hora())] = posicion
+        agenda = self.__agendas[matricula]
+        agenda.quitar_turno(anterior.obtener_fecha_hora())
+        agenda.agregar_turno(nuevo)
+        self.__historias_clinicas[anterior.obtener_paciente().obtener_dni()].reemplazar_turno(anterior, nuevo)
+    
+    def obtener_turnos_medico(self, matricula: str, desde: Optional[datetime] = None,
+                              hasta: Optional[datetime] = None, limite: Optional[int] = None) -> List[Turno]:
+        return self.__agendas[matricula].obtener_turnos_entre(desde, hasta, limite)
+    
+    def obtener_fechas_turnos_medico(self, matricula: str, desde: datetime, hasta: datetime) -> List[datetime]:
+        return self.__agendas[matricula].obtener_fechas_entre(desde, hasta)
+    
+    def contar_turnos(self, matricula: Optional[str] = None, desde: Optional[datetime] = None,
+                      hasta: Optional[datetime] = None) -> int:
+        if matricula is not None:
+            return self.__agendas[matricula].contar_entre(desde, hasta)
+        if desde is None and hasta is None:
+            return len(self.__turnos_por_horario)
+        return sum(agenda.contar_entre(desde, hasta) for agenda in self.__agendas.values())
+    
+    def agregar_receta(self, receta: Receta):
+        self.__historias_clinicas[receta.obtener_paciente().obtener_dni()].agregar_receta(receta)
+        self.__indice_recetas.agregar_receta(receta)
+    
+    def agregar_recetas(self, recetas: List[Receta]):
+        historias = self.__historias_clinicas
+        for receta in recetas:
+            historias[receta.obtener_paciente().obtener_dni()].agregar_receta(receta)
+        self.__indice_recetas.agregar_recetas(recetas)
+    
+    def listar_recetas(self) -> Iterable[Receta]:
+        for historia in self.__historias_clinicas.values():
+            yield from historia.obtener_recetas()
+    
+    def buscar_recetas_por_medicamento(self, medicamento: str, desde: Optional[datetime] = None,
+                                       hasta: Optional[datetime] = None) -> List[Receta]:
+        return self.__indice_recetas.buscar(medicamento, desde, hasta)
+    
+    def medicamentos_mas_recetados(self, cantidad: int, matricula: Optional[str] = None,
+                                   desde: Optional[datetime] = None,
+                                   hasta: Optional[datetime] = None) -> List[Tuple[str, int]]:
+        return self.__indice_recetas.mas_recetados(cantidad, matricula, desde, hasta)
+    
+    def obtener_historia_clinica(self, dni: str) -> HistoriaClinica:
+        return self.__historias_clinicas[dni]
\ No newline at end of file
@@ -0,0 +1,376 @@
+
+
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from itertools import compress
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad, duracion_en_minutos
+from modeloturno import Turno
+from modeloreceta import Receta
+from modelohistoriaclinica import HistoriaClinica
+from modelorepositorio import RepositorioClinica, EPOCA
+from modelovista import Vista
+from modeloindicepacientes import IndicePacientes
+from modeloindicerecetas import IndiceRecetas
+
+
+_MINUTO = timedelta(minutes=1)
+
+
+def _cota(fecha_hora: Optional[datetime]) -> Optional[int]:
+    """Primer minuto entero no anterior a la fecha: sirve de cota para comparar entero contra entero"""
+    return None if fecha_hora is None else -((EPOCA - fecha_hora) // _MINUTO)
+
+
+def _a_minutos(fecha_hora: datetime) -> int:
+    """Minutos desde 1970; los turnos del almacén columnar no guardan segundos"""
+    if fecha_hora.second or fecha_hora.microsecond:
+        raise ValueError("El almacén columnar solo admite turnos en minutos exactos")
+    minutos = (fecha_hora - EPOCA) // _MINUTO
+    # La columna de minutos es de 32 bits: alcanza hasta el año 6053
+    if not -2 ** 31 <= minutos < 2 ** 31:
+        raise ValueError("El almacén columnar solo admite turnos entre los años 1 y 6053")
+    return minutos
+
+
+class _TurnosColumnares(Sequence):
+    """Secuencia de solo lectura que crea cada Turno recién cuando se lo pide"""
+    
+    __slots__ = ("__repositorio", "__filas")
+    
+    def __init__(self, repositorio: 'RepositorioColumnar', filas: Sequence):
+        self.__repositorio = repositorio
+        self.__filas = filas
+    
+    def __len__(self) -> int:
+        return len(self.__filas)
+    
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return _TurnosColumnares(self.__repositorio, self.__filas[indice])
+        return self.__repositorio.construir_turno(self.__filas[indice])
+    
+    def __iter__(self) -> Iterator[Turno]:
+        construir = self.__repositorio.construir_turno
+        return (construir(fila) for fila in self.__filas)
+
+
+class RepositorioColumnar(RepositorioClinica):
+    """Repositorio en memoria que guarda los turnos en columnas de arreglos tipados.
+    
+    Cada turno ocupa una fila en cinco arreglos paralelos: índice del paciente, índice
+    del médico, identificador de especialidad, minutos desde 1970 y duración en minutos.
+    No se guarda ningún objeto Turno: se crean al listar o consultar. Cada médico tiene
+    además sus minutos ordenados (con la fila de cada uno) para verificar superposiciones
+    y filtrar por fecha con búsqueda binaria, y cada paciente la lista de filas de sus turnos. Un turno cancelado
+    sale de los índices del médico y su fila se marca como cancelada; en las filas del
+    paciente queda como hueco hasta que los huecos son más de la mitad. Uno reprogramado
+    cambia de horario en su misma fila.
+    """
+    
+    def __init__(self):
+        self.__indice_pacientes: Dict[str, int] = {}
+        self.__pacientes: List[Paciente] = []
+        self.__indice_prefijos = IndicePacientes(self.__pacientes)
+        self.__indice_medicos: Dict[str, int] = {}
+        self.__medicos: List[Medico] = []
+        self.__indice_especialidades: Dict[str, int] = {}
+        self.__especialidades: List[str] = []
+        # Columnas de la tabla de turnos: una posición por turno, en orden de alta
+        self.__col_paciente = array("I")
+        self.__col_medico = array("I")
+        self.__col_especialidad = array("H")
+        self.__col_minutos = array("i")
+        self.__col_duracion = array("H")
+        # Por médico: minutos ordenados y la fila de cada uno, en paralelo
+        self.__minutos_medico: List[array] = []
+        self.__filas_medico: List[array] = []
+        # Por paciente: filas de sus turnos (se crea con el primer turno) y cuántas de ellas se cancelaron
+        self.__filas_paciente: Dict[int, array] = {}
+        self.__canceladas_paciente: Dict[int, int] = {}
+        # Filas de turnos cancelados: quedan en las columnas pero fuera de todos los índices
+        self.__filas_canceladas: Set[int] = set()
+        self.__recetas: Dict[str, List[Receta]] = {}
+        # Medicamento -> recetas, para buscar por medicamento y rankear sin recorrer historias
+        self.__indice_recetas = IndiceRecetas()
+        # Las columnas de una fila se escriben juntas aunque varios hilos agenden a la vez
+        self.__bloqueo = threading.Lock()
+    
+    def construir_turno(self, fila: int) -> Turno:
+        """Crea el Turno de una fila de la tabla"""
+        return Turno(self.__pacientes[self.__col_paciente[fila]], self.__medicos[self.__col_medico[fila]],
+                     EPOCA + timedelta(minutes=self.__col_minutos[fila]),
+                     self.__especialidades[self.__col_especialidad[fila]],
+                     duracion_en_minutos(self.__col_duracion[fila]))
+    
+    def obtener_paciente(self, dni: str) -> Optional[Paciente]:
+        indice = self.__indice_pacientes.get(dni)
+        return None if indice is None else self.__pacientes[indice]
+    
+    def agregar_paciente(self, paciente: Paciente):
+        self.__indice_pacientes[paciente.obtener_dni()] = len(self.__pacientes)
+        self.__pacientes.append(paciente)
+    
+    def listar_pacientes(self) -> Vista[Paciente]:
+        return Vista(self.__pacientes)
+    
+    def paginar_pacientes(self, prefijo: Optional[str], inicio: int, cantidad: int) -> Tuple[List[Paciente], int]:
+        if not prefijo:
+            return self.__pacientes[inicio:inicio + cantidad], len(self.__pacientes)
+        return self.__indice_prefijos.buscar(prefijo, inicio, cantidad)
+    
+    def obtener_medico(self, matricula: str) -> Optional[Medico]:
+        indice = self.__indice_medicos.get(matricula)
+        return None if indice is None else self.__medicos[indice]
+    
+    def agregar_medico(self, medico: Medico):
+        self.__indice_medicos[medico.obtener_matricula()] = len(self.__medicos)
+        self.__medicos.append(medico)
+        self.__minutos_medico.append(array("i"))
+        self.__filas_medico.append(array("I"))
+    
+    def agregar_especialidad(self, medico: Medico, especialidad: Especialidad):
+        # El médico en memoria ya es el objeto guardado
+        pass
+    
+    def listar_medicos(self) -> Vista[Medico]:
+        return Vista(self.__medicos)
+    
+    def existe_turno(self, matricula: str, fecha_hora: datetime) -> bool:
+        indice = self.__indice_medicos.get(matricula)
+        if indice is None:
+            return False
+        minutos = self.__minutos_medico[indice]
+        minuto = _a_minutos(fecha_hora)
+        posicion = bisect_left(minutos, minuto)
+        return posicion < len(minutos) and minutos[posicion] == minuto
+    
+    def existe_superposicion(self, matricula: str, inicio: datetime, fin: datetime,
+                             excluir: Optional[datetime] = None) -> bool:
+        # Un horario que no se puede guardar se rechaza al validar, antes de tocar las columnas
+        minuto = _a_minutos(inicio)
+        # Los turnos del médico no se superponen: basta con el último que empieza antes de `fin`
+        indice = self.__indice_medicos[matricula]
+        minutos = self.__minutos_medico[indice]
+        posicion = bisect_left(minutos, _cota(fin)) - 1
+        if posicion >= 0 and excluir is not None and EPOCA + timedelta(minutes=minutos[posicion]) == excluir:
+            posicion -= 1
+        if posicion < 0:
+            return False
+        fila = self.__filas_medico[indice][posicion]
+        return minutos[posicion] + self.__col_duracion[fila] > minuto
+    
+    def obtener_intervalos_turnos_medico(self, matricula: str, desde: datetime,
+                                         hasta: datetime) -> List[Tuple[datetime, datetime]]:
+        indice = self.__indice_medicos[matricula]
+        minutos, filas = self.__minutos_medico[indice], self.__filas_medico[indice]
+        duraciones = self.__col_duracion
+        rango = self.__rango_medico(indice, _cota(desde), _cota(hasta))
+        inicio = rango.start
+        # Solo el turno anterior puede seguir en curso al llegar a `desde`
+        if inicio and minutos[inicio - 1] + duraciones[filas[inicio - 1]] > (desde - EPOCA) // _MINUTO:
+            inicio -= 1
+        return [(EPOCA + timedelta(minutes=minutos[i]), EPOCA + timedelta(minutes=minutos[i] + duraciones[filas[i]]))
+                for i in range(inicio, rango.stop)]
+    
+    def agregar_turnos(self, turnos: List[Turno]):
+        with self.__bloqueo:
+            self.__agregar_turnos(turnos)
+    
+    def __agregar_turnos(self, turnos: List[Turno]):
+        """Agrega las filas de los turnos a las columnas y a los índices por médico y paciente"""
+        # Primero se convierten todas las filas: si alguna falla, las columnas quedan como estaban
+        valores = [(self.__indice_pacientes[turno.obtener_paciente().obtener_dni()],
+                    self.__indice_medicos[turno.obtener_medico().obtener_matricula()],
+                    _a_minutos(turno.obtener_fecha_hora()), turno.obtener_especialidad(),
+                    turno.obtener_duracion() // _MINUTO) for turno in turnos]
+        por_medico: Dict[int, List[int]] = {}
+        for paciente, medico, minuto, especialidad, duracion in valores:
+            fila = len(self.__col_minutos)
+            especialidad = self.__id_especialidad(especialidad)
+            self.__col_paciente.append(paciente)
+            self.__col_medico.append(medico)
+            self.__col_especialidad.append(especialidad)
+            self.__col_minutos.append(minuto)
+            self.__col_duracion.append(duracion)
+            por_medico.setdefault(medico, []).append(fila)
+            filas_paciente = self.__filas_paciente.get(paciente)
+            if filas_paciente is None:
+                filas_paciente = self.__filas_paciente[paciente] = array("I")
+            filas_paciente.append(fila)
+        
+        for medico, filas in por_medico.items():
+            self.__ordenar_en_medico(medico, filas)
+    
+    def __id_especialidad(self, especialidad: str) -> int:
+        """Devuelve el identificador de una especialidad, registrándola si es nueva"""
+        identificador = self.__indice_especialidades.get(especialidad)
+        if identificador is None:
+            identificador = self.__indice_especialidades[especialidad] = len(self.__especialidades)
+            self.__especialidades.append(especialidad)
+        return identificador
+    
+    def __ordenar_en_medico(self, medico: int, filas: List[int]):
+        """Agrega filas nuevas a los arreglos ordenados de un médico"""
+        minutos, filas_medico = self.__minutos_medico[medico], self.__filas_medico[medico]
+        columna = self.__col_minutos
+        # Pocas filas: se insertan de a una; muchas: se reordena una sola vez
+        if len(filas) < 32:
+            for fila in filas:
+                posicion = bisect_right(minutos, columna[fila])
+                minutos.insert(posicion, columna[fila])
+                filas_medico.insert(posicion, fila)
+            return
+        todas = sorted([*filas_medico, *filas], key=columna.__getitem__)
+        self.__filas_medico[medico] = array("I", todas)
+        self.__minutos_medico[medico] = array("i", (columna[fila] for fila in todas))
+    
+    def listar_turnos(self) -> Sequence:
+        return _TurnosColumnares(self, self.__filas_vigentes())
+    
+    def __filas_vigentes(self) -> Sequence:
+        """Filas de la tabla que no fueron canceladas, en orden de alta"""
+        filas = range(len(self.__col_minutos))
+        canceladas = self.__filas_canceladas
+        if not canceladas:
+            return filas
+        return array("I", (fila for fila in filas if fila not in canceladas))
+    
+    def __buscar_en_medico(self, matricula: str, fecha_hora: datetime) -> Tuple[int, int]:
+        """Posición del turno en los arreglos ordenados del médico (-1 si no existe) e índice del médico"""
+        indice = self.__indice_medicos[matricula]
+        minutos = self.__minutos_medico[indice]
+        minuto = _a_minutos(fecha_hora)
+        posicion = bisect_left(minutos, minuto)
+        if posicion == len(minutos) or minutos[posicion] != minuto:
+            return -1, indice
+        return posicion, indice
+    
+    def obtener_turno(self, matricula: str, fecha_hora: datetime) -> Optional[Turno]:
+        if fecha_hora.second or fecha_hora.microsecond:
+            return None
+        posicion, indice = self.__buscar_en_medico(matricula, fecha_hora)
+        return None if posicion < 0 else self.construir_turno(self.__filas_medico[indice][posicion])
+    
+    def cancelar_turno(self, matricula: str, fecha_hora: datetime) -> Optional[Turno]:
+        if fecha_hora.second or fecha_hora.microsecond:
+            return None
+        with self.__bloqueo:
+            posicion, indice = self.__buscar_en_medico(matricula, fecha_hora)
+            if posicion < 0:
+                return None
+            fila = self.__filas_medico[indice].pop(posicion)
+            del self.__minutos_medico[indice][posicion]
+            self.__filas_canceladas.add(fila)
+            self.__quitar_de_paciente(self.__col_paciente[fila])
+            return self.construir_turno(fila)
+    
+    def __quitar_de_paciente(self, paciente: int):
+        """Cuenta una fila cancelada del paciente y compacta sus filas si los huecos son más de la mitad.
+        
+        Compactar recién entonces cuesta O(1) amortizado por cancelación; se llama con el candado tomado.
+        """
+        canceladas = self.__canceladas_paciente.get(paciente, 0) + 1
+        filas = self.__filas_paciente[paciente]
+        if 2 * canceladas <= len(filas):
+            self.__canceladas_paciente[paciente] = canceladas
+            return
+        descartadas = self.__filas_canceladas
+        self.__filas_paciente[paciente] = array("I", (fila for fila in filas if fila not in descartadas))
+        self.__canceladas_paciente.pop(paciente, None)
+    
+    def mover_turno(self, anterior: Turno, nuevo: Turno):
+        minuto = _a_minutos(nuevo.obtener_fecha_hora())
+        with self.__bloqueo:
+            especialidad = self.__id_especialidad(nuevo.obtener_especialidad())
+            posicion, indice = self.__buscar_en_medico(anterior.obtener_medico().obtener_matricula(),
+                                                       anterior.obtener_fecha_hora())
+            # La fila conserva su lugar en la tabla y en el paciente: solo cambia de horario
+            minutos, filas = self.__minutos_medico[indice], self.__filas_medico[indice]
+            fila = filas.pop(posicion)
+            del minutos[posicion]
+            self.__col_minutos[fila] = minuto
+            self.__col_especialidad[fila] = especialidad
+            self.__col_duracion[fila] = nuevo.obtener_duracion() // _MINUTO
+            posicion = bisect_right(minutos, minuto)
+            minutos.insert(posicion, minuto)
+            filas.insert(posicion, fila)
+    
+    def __rango_medico(self, indice: int, desde: Optional[int], hasta: Optional[int]) -> range:
+        """Posiciones, en los arreglos ordenados del médico, de los turnos con minuto en [desde, hasta)"""
+        minutos = self.__minutos_medico[indice]
+        inicio = 0 if desde is None else bisect_left(minutos, desde)
+        fin = len(minutos) if hasta is None else bisect_left(minutos, hasta)
+        return range(inicio, max(inicio, fin))
+    
+    def obtener_turnos_medico(self, matricula: str, desde: Optional[datetime] = None,
+                              hasta: Optional[datetime] = None, limite: Optional[int] = None) -> List[Turno]:
+        indice = self.__indice_medicos[matricula]
+        filas = self.__filas_medico[indice]
+        rango = self.__rango_medico(indice, _cota(desde), _cota(hasta))[:limite]
+        return [self.construir_turno(filas[i]) for i in rango]
+    
+    def obtener_fechas_turnos_medico(self, matricula: str, desde: datetime, hasta: datetime) -> List[datetime]:
+        indice = self.__indice_medicos[matricula]
+        minutos = self.__minutos_medico[indice]
+        return [EPOCA + timedelta(minutes=minutos[i]) for i in self.__rango_medico(indice, _cota(desde), _cota(hasta))]
+    
+    def contar_turnos(self, matricula: Optional[str] = None, desde: Optional[datetime] = None,
+                      hasta: Optional[datetime] = None) -> int:
+        desde, hasta = _cota(desde), _cota(hasta)
+        if matricula is not None:
+            return len(self.__rango_medico(self.__indice_medicos[matricula], desde, hasta))
+        if desde is None and hasta is None:
+            return len(self.__col_minutos) - len(self.__filas_canceladas)
+        total = 0
+        for minutos in self.__minutos_medico:
+            inicio = 0 if desde is None else bisect_left(minutos, desde)
+            fin = len(minutos) if hasta is None else bisect_left(minutos, hasta)
+            total += max(0, fin - inicio)
+        return total
+    
+    def exportar_turnos(self) -> Tuple[array, array, array, List[str]]:
+        # Las columnas ya tienen el formato de exportación: basta con copiarlas
+        with self.__bloqueo:
+            if not self.__filas_canceladas:
+                return (array("I", self.__col_medico), array("i", self.__col_minutos),
+                        array("H", self.__col_especialidad), list(self.__especialidades))
+            vigentes = bytes(fila not in self.__filas_canceladas for fila in range(len(self.__col_minutos)))
+            return (array("I", compress(self.__col_medico, vigentes)),
+                    array("i", compress(self.__col_minutos, vigentes)),
+                    array("H", compress(self.__col_especialidad, vigentes)), list(self.__especialidades))
+    
+    def agregar_recetas(self, recetas: List[Receta]):
+        for receta in recetas:
+            self.__recetas.setdefault(receta.obtener_paciente().obtener_dni(), []).append(receta)
+        self.__indice_recetas.agregar_recetas(recetas)
+    
+    def listar_recetas(self) -> Iterable[Receta]:
+        for recetas in self.__recetas.values():
+            yield from recetas
+    
+    def buscar_recetas_por_medicamento(self, medicamento: str, desde: Optional[datetime] = None,
+                                       hasta: Optional[datetime] = None) -> List[Receta]:
+        return self.__indice_recetas.buscar(medicamento, desde, hasta)
+    
+    def medicamentos_mas_recetados(self, cantidad: int, matricula: Optional[str] = None,
+                                   desde: Optional[datetime] = None,
+                                   hasta: Optional[datetime] = None) -> List[Tuple[str, int]]:
+        return self.__indice_recetas.mas_recetados(cantidad, matricula, desde, hasta)
+    
+    def obtener_historia_clinica(self, dni: str) -> HistoriaClinica:
+        # La historia se arma en el momento a partir de las filas del paciente
+        indice = self.__indice_pacientes[dni]
+        historia = HistoriaClinica(self.__pacientes[indice])
+        canceladas = self.__filas_canceladas
+        for fila in self.__filas_paciente.get(indice, ()):
+            if fila not in canceladas:
+                historia.agregar_turno(self.construir_turno(fila))
+        for receta in self.__recetas.get(dni, ()):
+            historia.agregar_receta(receta)
+        return historia
\ No newline at end of file
@@ -0,0 +1,373 @@
+
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad, DURACION_MAXIMA, MINUTO, duracion_en_minutos
+from modeloturno import Turno
+from modeloreceta import Receta
+from modelohistoriaclinica import HistoriaClinica
+from modelorepositorio import RepositorioClinica
+from modeloindicerecetas import medicamentos_distintos, normalizar_medicamento
+
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS pacientes (
+    dni TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL,
+    fecha_nacimiento TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS medicos (
+    matricula TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS especialidades (
+    matricula TEXT NOT NULL,
+    tipo TEXT NOT NULL,
+    mascara_dias INTEGER NOT NULL,
+    duracion INTEGER NOT NULL DEFAULT 30,
+    PRIMARY KEY (matricula, tipo)
+);
+DROP INDEX IF EXISTS idx_pacientes_nombre;
+CREATE INDEX IF NOT EXISTS idx_especialidades_tipo ON especialidades (tipo);
+CREATE TABLE IF NOT EXISTS turnos (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL,
+    matricula TEXT NOT NULL,
+    especialidad TEXT NOT NULL,
+    fecha_hora TEXT NOT NULL,
+    duracion INTEGER NOT NULL DEFAULT 30
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_turnos_medico_fecha ON turnos (matricula, fecha_hora);
+CREATE INDEX IF NOT EXISTS idx_turnos_dni ON turnos (dni);
+CREATE INDEX IF NOT EXISTS idx_turnos_especialidad ON turnos (especialidad);
+CREATE TABLE IF NOT EXISTS recetas (
+    id INTEGER PRIMARY KEY,
+    dni TEXT NOT NULL,
+    matricula TEXT NOT NULL,
+    fecha TEXT NOT NULL,
+    medicamentos TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_recetas_dni ON recetas (dni);
+CREATE TABLE IF NOT EXISTS medicamentos (
+    clave TEXT PRIMARY KEY,
+    nombre TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS recetas_medicamentos (
+    receta INTEGER NOT NULL,
+    clave TEXT NOT NULL,
+    matricula TEXT NOT NULL,
+    fecha TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_recetas_medicamentos_clave ON recetas_medicamentos (clave, fecha, receta);
+CREATE INDEX IF NOT EXISTS idx_recetas_medicamentos_medico ON recetas_medicamentos (matricula, clave, fecha);
+"""
+
+# Columnas agregadas después de la primera versión del esquema: (tabla, columna, definición)
+_COLUMNAS_NUEVAS = (
+    ("especialidades", "duracion", "INTEGER NOT NULL DEFAULT 30"),
+    ("turnos", "duracion", "INTEGER NOT NULL DEFAULT 30"),
+)
+
+# Consultas fijas: sqlite3 guarda cada sentencia preparada y la reutiliza
+_INSERTAR_PACIENTE = "INSERT INTO pacientes (dni, nombre, fecha_nacimiento) VALUES (?, ?, ?)"
+_OBTENER_PACIENTE = "SELECT nombre, dni, fecha_nacimiento FROM pacientes WHERE dni = ?"
+_LISTAR_PACIENTES = "SELECT nombre, dni, fecha_nacimiento FROM pacientes ORDER BY rowid"
+# Prefijo de DNI: rango [prefijo, prefijo + último carácter) sobre la clave primaria
+_FILTRO_DNI = " WHERE dni >= ? AND dni < ?"
+_INSERTAR_MEDICO = "INSERT INTO medicos (matricula, nombre) VALUES (?, ?)"
+_INSERTAR_ESPECIALIDAD = "INSERT INTO especialidades (matricula, tipo, mascara_dias, duracion) VALUES (?, ?, ?, ?)"
+_EXISTE_TURNO = "SELECT 1 FROM turnos WHERE matricula = ? AND fecha_hora = ?"
+# Los turnos de un médico no se superponen: alcanza con los dos últimos que empiezan antes del fin
+_ULTIMOS_ANTES = ("SELECT fecha_hora, duracion FROM turnos WHERE matricula = ? AND fecha_hora < ?"
+                  " ORDER BY fecha_hora DESC LIMIT 2")
+_INTERVALOS_MEDICO = ("SELECT fecha_hora, duracion FROM turnos WHERE matricula = ? AND fecha_hora >= ?"
+                      " AND fecha_hora < ? ORDER BY fecha_hora")
+_INSERTAR_TURNO = "INSERT INTO turnos (dni, matricula, especialidad, fecha_hora, duracion) VALUES (?, ?, ?, ?, ?)"
+_BORRAR_TURNO = "DELETE FROM turnos WHERE matricula = ? AND fecha_hora = ?"
+# El turno conserva su id: mantiene su lugar en los listados y en la historia clínica
+_MOVER_TURNO = ("UPDATE turnos SET fecha_hora = ?, especialidad = ?, duracion = ?"
+                " WHERE matricula = ? AND fecha_hora = ?")
+_COLUMNAS_TURNO = """SELECT p.nombre, p.dni, p.fecha_nacimiento, t.matricula, t.fecha_hora, t.especialidad,
+    t.duracion FROM turnos t JOIN pacientes p ON p.dni = t.dni"""
+_INSERTAR_RECETA = "INSERT INTO recetas (id, dni, matricula, fecha, medicamentos) VALUES (?, ?, ?, ?, ?)"
+# Una fila por medicamento distinto de cada receta; el nombre que queda es el de la primera receta
+_INSERTAR_MEDICAMENTO = "INSERT OR IGNORE INTO medicamentos (clave, nombre) VALUES (?, ?)"
+_INSERTAR_RECETA_MEDICAMENTO = "INSERT INTO recetas_medicamentos (receta, clave, matricula, fecha) VALUES (?, ?, ?, ?)"
+_RECETAS_POR_MEDICAMENTO = """SELECT p.nombre, p.dni, p.fecha_nacimiento, r.matricula, r.fecha, r.medicamentos
+    FROM recetas_medicamentos m JOIN recetas r ON r.id = m.receta JOIN pacientes p ON p.dni = r.dni
+    WHERE m.clave = ? AND m.fecha >= ? AND m.fecha < ? ORDER BY m.fecha, m.receta"""
+# Los índices de recetas_medicamentos cubren la consulta: se cuenta sin leer las recetas
+_MAS_RECETADOS = """SELECT n.nombre, c.recetas FROM (
+    SELECT clave, COUNT(*) AS recetas FROM recetas_medicamentos WHERE {filtro} fecha >= ? AND fecha < ? GROUP BY clave
+    ) c JOIN medicamentos n ON n.clave = c.clave ORDER BY c.recetas DESC, n.nombre LIMIT ?"""
+
+
+def _texto_fecha(fecha: datetime) -> str:
+    """Formato ISO de ancho fijo: el orden de los textos coincide con el de las fechas"""
+    return fecha.isoformat(timespec="microseconds")
+
+
+class RepositorioSQLite(RepositorioClinica):
+    """Repositorio sobre un archivo SQLite local.
+    
+    Los médicos (pocos) se mantienen en memoria; pacientes, turnos y recetas se leen
+    de la base en cada consulta usando sus índices. Las recetas por medicamento y el
+    ranking de más recetados se responden con la tabla recetas_medicamentos, sin
+    cargar las recetas en memoria. La conexión se comparte entre hilos
+    y cada acceso a ella se serializa con un candado.
+    """
+    
+    def __init__(self, ruta: str):
+        self.__conexion = sqlite3.connect(ruta, check_same_thread=False)
+        self.__bloqueo = threading.Lock()
+        self.__conexion.execute("PRAGMA journal_mode = WAL")
+        self.__conexion.execute("PRAGMA synchronous = NORMAL")
+        self.__conexion.executescript(_ESQUEMA)
+        self.__migrar()
+        self.__indexar_medicamentos()
+        self.__medicos: Dict[str, Medico] = self.__cargar_medicos()
+    
+    def __migrar(self):
+        """Agrega a una base creada con un esquema anterior las columnas que le faltan"""
+        for tabla, columna, definicion in _COLUMNAS_NUEVAS:
+            columnas = {fila[1] for fila in self.__conexion.execute(f"PRAGMA table_info({tabla})")}
+            if columna not in columnas:
+                with self.__conexion:
+                    self.__conexion.execute(f"ALTER TABLE {tabla} ADD COLUMN {columna} {definicion}")
+    
+    def __indexar_medicamentos(self):
+        """Llena las tablas de medicamentos de una base creada antes de que existieran"""
+        conexion = self.__conexion
+        if conexion.execute("SELECT 1 FROM recetas_medicamentos LIMIT 1").fetchone() is not None:
+            return
+        with conexion:
+            filas = conexion.execute("SELECT id, matricula, fecha, medicamentos FROM recetas ORDER BY id")
+            for id_receta, matricula, fecha, medicamentos in filas:
+                distintos = medicamentos_distintos(json.loads(medicamentos))
+                conexion.executemany(_INSERTAR_MEDICAMENTO, distintos.items())
+                conexion.executemany(_INSERTAR_RECETA_MEDICAMENTO,
+                                     [(id_receta, clave, matricula, fecha) for clave in distintos])
+    
+    def __consultar(self, consulta: str, parametros: tuple = ()) -> List[tuple]:
+        """Ejecuta una consulta y devuelve todas sus filas"""
+        with self.__bloqueo:
+            return self.__conexion.execute(consulta, parametros).fetchall()
+    
+    def __escribir(self, sentencia: str, filas: Iterable[tuple]):
+        """Ejecuta una sentencia para cada fila dentro de una única transacción"""
+        with self.__bloqueo, self.__conexion:
+            self.__conexion.executemany(sentencia, filas)
+    
+    def __cargar_medicos(self) -> Dict[str, Medico]:
+        """Carga todos los médicos con sus especialidades, en orden de alta"""
+        medicos: Dict[str, Medico] = {}
+        for matricula, nombre in self.__conexion.execute("SELECT matricula, nombre FROM medicos ORDER BY rowid"):
+            medicos[matricula] = Medico(nombre, matricula)
+        consulta = "SELECT matricula, tipo, mascara_dias, duracion FROM especialidades ORDER BY rowid"
+        for matricula, tipo, mascara, duracion in self.__conexion.execute(consulta):
+            medicos[matricula].agregar_especialidad(
+                Especialidad.desde_mascara(tipo, mascara, duracion_en_minutos(duracion)))
+        return medicos
+    
+    def obtener_paciente(self, dni: str) -> Optional[Paciente]:
+        filas = self.__consultar(_OBTENER_PACIENTE, (dni,))
+        return Paciente(*filas[0]) if filas else None
+    
+    def agregar_paciente(self, paciente: Paciente):
+        self.agregar_pacientes([paciente])
+    
+    def agregar_pacientes(self, pacientes: List[Paciente]):
+        self.__escribir(_INSERTAR_PACIENTE, [
+            (p.obtener_dni(), p.obtener_nombre(), p.obtener_fecha_nacimiento()) for p in pacientes])
+    
+    def listar_pacientes(self) -> List[Paciente]:
+        return [Paciente(*fila) for fila in self.__consultar(_LISTAR_PACIENTES)]
+    
+    def paginar_pacientes(self, prefijo: Optional[str], inicio: int, cantidad: int) -> Tuple[List[Paciente], int]:
+        if not prefijo:
+            filtro, orden, parametros = "", "rowid", ()
+        else:
+            filtro, orden, parametros = _FILTRO_DNI, "dni", (prefijo, prefijo + "\U0010ffff")
+        filas = self.__consultar(f"SELECT nombre, dni, fecha_nacimiento FROM pacientes{filtro} ORDER BY {orden}"
+                                 " LIMIT ? OFFSET ?", parametros + (cantidad, inicio))
+        total = self.__consultar("SELECT COUNT(*) FROM pacientes" + filtro, parametros)[0][0]
+        return [Paciente(*fila) for fila in filas], total
+    
+    def obtener_medico(self, matricula: str) -> Optional[Medico]:
+        return self.__medicos.get(matricula)
+    
+    def agregar_medico(self, medico: Medico):
+        matricula = medico.obtener_matricula()
+        with self.__bloqueo, self.__conexion:
+            self.__conexion.execute(_INSERTAR_MEDICO, (matricula, medico.obtener_nombre()))
+            self.__conexion.executemany(_INSERTAR_ESPECIALIDAD, (
+                (matricula, esp.obtener_especialidad(), esp.obtener_mascara_dias(), esp.obtener_duracion() // MINUTO)
+                for esp in medico.obtener_especialidades()))
+        self.__medicos[matricula] = medico
+    
+    def agregar_especialidad(self, medico: Medico, especialidad: Especialidad):
+        self.__escribir(_INSERTAR_ESPECIALIDAD, [(
+            medico.obtener_matricula(), especialidad.obtener_especialidad(), especialidad.obtener_mascara_dias(),
+            especialidad.obtener_duracion() // MINUTO)])
+    
+    def listar_medicos(self) -> List[Medico]:
+        return list(self.__medicos.values())
+    
+    def existe_turno(self, matricula: str, fecha_hora: datetime) -> bool:
+        return bool(self.__consultar(_EXISTE_TURNO, (matricula, _texto_fecha(fecha_hora))))
+    
+    def existe_superposicion(self, matricula: str, inicio: datetime, fin: datetime,
+                             excluir: Optional[datetime] = None) -> bool:
+        filas = self.__consultar(_ULTIMOS_ANTES, (matricula, _texto_fecha(fin)))
+        if filas and excluir is not None and filas[0][0] == _texto_fecha(excluir):
+            filas = filas[1:]
+        if not filas:
+            return False
+        fecha_hora, duracion = filas[0]
+        return datetime.fromisoformat(fecha_hora) + timedelta(minutes=duracion) > inicio
+    
+    def obtener_intervalos_turnos_medico(self, matricula: str, desde: datetime,
+                                         hasta: datetime) -> List[Tuple[datetime, datetime]]:
+        # Un turno que pise `desde` empezó como mucho DURACION_MAXIMA antes: el índice acota la búsqueda
+        filas = self.__consultar(_INTERVALOS_MEDICO, (matricula, _texto_fecha(desde - DURACION_MAXIMA), _texto_fecha(hasta)))
+        intervalos = []
+        for fecha_hora, duracion in filas:
+            inicio = datetime.fromisoformat(fecha_hora)
+            fin = inicio + timedelta(minutes=duracion)
+            if fin > desde:
+                intervalos.append((inicio, fin))
+        return intervalos
+    
+    def agregar_turnos(self, turnos: List[Turno]):
+        self.__escribir(_INSERTAR_TURNO, [
+            (t.obtener_paciente().obtener_dni(), t.obtener_medico().obtener_matricula(),
+             t.obtener_especialidad(), _texto_fecha(t.obtener_fecha_hora()), t.obtener_duracion() // MINUTO)
+            for t in turnos])
+    
+    def __construir_turnos(self, filas: Iterable) -> List[Turno]:
+        """Crea los turnos a partir de filas de _COLUMNAS_TURNO"""
+        medicos = self.__medicos
+        leer_fecha = datetime.fromisoformat
+        return [Turno(Paciente(nombre, dni, fecha_nacimiento), medicos[matricula], leer_fecha(fecha_hora), especialidad,
+                      duracion_en_minutos(duracion))
+                for nombre, dni, fecha_nacimiento, matricula, fecha_hora, especialidad, duracion in filas]
+    
+    def listar_turnos(self) -> List[Turno]:
+        return self.__construir_turnos(self.__consultar(_COLUMNAS_TURNO + " ORDER BY t.id"))
+    
+    def obtener_turno(self, matricula: str, fecha_hora: datetime) -> Optional[Turno]:
+        filas = self.__consultar(_COLUMNAS_TURNO + " WHERE t.matricula = ? AND t.fecha_hora = ?",
+                                 (matricula, _texto_fecha(fecha_hora)))
+        return self.__construir_turnos(filas)[0] if filas else None
+    
+    def cancelar_turno(self, matricula: str, fecha_hora: datetime) -> Optional[Turno]:
+        # La historia clínica se arma desde la tabla de turnos: basta con borrar la fila
+        turno = self.obtener_turno(matricula, fecha_hora)
+        if turno is not None:
+            self.__escribir(_BORRAR_TURNO, [(matricula, _texto_fecha(fecha_hora))])
+        return turno
+    
+    def mover_turno(self, anterior: Turno, nuevo: Turno):
+        self.__escribir(_MOVER_TURNO, [(_texto_fecha(nuevo.obtener_fecha_hora()), nuevo.obtener_especialidad(),
+                                        nuevo.obtener_duracion() // MINUTO,
+                                        anterior.obtener_medico().obtener_matricula(),
+                                        _texto_fecha(anterior.obtener_fecha_hora()))])
+    
+    def obtener_turnos_medico(self, matricula: str, desde: Optional[datetime] = None,
+                              hasta: Optional[datetime] = None, limite: Optional[int] = None) -> List[Turno]:
+        consulta = (_COLUMNAS_TURNO + " WHERE t.matricula = ? AND t.fecha_hora >= ? AND t.fecha_hora < ?"
+                    " ORDER BY t.fecha_hora LIMIT ?")
+        desde_texto = _texto_fecha(desde) if desde is not None else ""
+        hasta_texto = _texto_fecha(hasta) if hasta is not None else "￿"
+        # LIMIT -1: sin límite
+        parametros = (matricula, desde_texto, hasta_texto, -1 if limite is None else limite)
+        return self.__construir_turnos(self.__consultar(consulta, parametros))
+    
+    def obtener_fechas_turnos_medico(self, matricula: str, desde: datetime, hasta: datetime) -> List[datetime]:
+        consulta = "SELECT fecha_hora FROM turnos WHERE matricula = ? AND fecha_hora >= ? AND fecha_hora < ? ORDER BY fecha_hora"
+        filas = self.__consultar(consulta, (matricula, _texto_fecha(desde), _texto_fecha(hasta)))
+        return [datetime.fromisoformat(fecha) for fecha, in filas]
+    
+    def contar_turnos(self, matricula: Optional[str] = None, desde: Optional[datetime] = None,
+                      hasta: Optional[datetime] = None) -> int:
+        condiciones, parametros = [], []
+        if matricula is not None:
+            condiciones.append("matricula = ?")
+            parametros.append(matricula)
+        if desde is not None:
+            condiciones.append("fecha_hora >= ?")
+            parametros.append(_texto_fecha(desde))
+        if hasta is not None:
+            condiciones.append("fecha_hora < ?")
+            parametros.append(_texto_fecha(hasta))
+        consulta = "SELECT COUNT(*) FROM turnos"
+        if condiciones:
+            consulta += " WHERE " + " AND ".join(condiciones)
+        return self.__consultar(consulta, tuple(parametros))[0][0]
+    
+    def agregar_recetas(self, recetas: List[Receta]):
+        filas_recetas, nombres, filas_medicamentos = [], [], []
+        with self.__bloqueo, self.__conexion:
+            # Los ids se asignan acá para enlazar cada receta con sus medicamentos en la misma transacción
+            siguiente = self.__conexion.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM recetas").fetchone()[0]
+            for id_receta, r in enumerate(recetas, siguiente):
+                matricula, fecha = r.obtener_medico().obtener_matricula(), _texto_fecha(r.obtener_fecha())
+                filas_recetas.append((id_receta, r.obtener_paciente().obtener_dni(), matricula, fecha,
+                                      json.dumps(r.obtener_medicamentos(), ensure_ascii=False)))
+                distintos = medicamentos_distintos(r.obtener_medicamentos())
+                nombres.extend(distintos.items())
+                filas_medicamentos.extend((id_receta, clave, matricula, fecha) for clave in distintos)
+            self.__conexion.executemany(_INSERTAR_RECETA, filas_recetas)
+            self.__conexion.executemany(_INSERTAR_MEDICAMENTO, nombres)
+            self.__conexion.executemany(_INSERTAR_RECETA_MEDICAMENTO, filas_medicamentos)
+    
+    def __construir_recetas(self, filas: Iterable) -> Iterator[Receta]:
+        """Crea las recetas a partir de filas (nombre, dni, fecha_nacimiento, matrícula, fecha, medicamentos)"""
+        for nombre, dni, fecha_nacimiento, matricula, fecha, medicamentos in filas:
+            yield Receta(Paciente(nombre, dni, fecha_nacimiento), self.__medicos[matricula],
+                         json.loads(medicamentos), datetime.fromisoformat(fecha))
+    
+    def listar_recetas(self) -> Iterable[Receta]:
+        consulta = """SELECT p.nombre, p.dni, p.fecha_nacimiento, r.matricula, r.fecha, r.medicamentos
+            FROM recetas r JOIN pacientes p ON p.dni = r.dni ORDER BY r.id"""
+        return self.__construir_recetas(self.__consultar(consulta))
+    
+    def buscar_recetas_por_medicamento(self, medicamento: str, desde: Optional[datetime] = None,
+                                       hasta: Optional[datetime] = None) -> List[Receta]:
+        desde_texto = _texto_fecha(desde) if desde is not None else ""
+        hasta_texto = _texto_fecha(hasta) if hasta is not None else "￿"
+        filas = self.__consultar(_RECETAS_POR_MEDICAMENTO, (normalizar_medicamento(medicamento), desde_texto, hasta_texto))
+        return list(self.__construir_recetas(filas))
+    
+    def medicamentos_mas_recetados(self, cantidad: int, matricula: Optional[str] = None,
+                                   desde: Optional[datetime] = None,
+                                   hasta: Optional[datetime] = None) -> List[Tuple[str, int]]:
+        filtro, parametros = ("", ()) if matricula is None else ("matricula = ? AND", (matricula,))
+        desde_texto = _texto_fecha(desde) if desde is not None else ""
+        hasta_texto = _texto_fecha(hasta) if hasta is not None else "￿"
+        filas = self.__consultar(_MAS_RECETADOS.format(filtro=filtro), parametros + (desde_texto, hasta_texto, cantidad))
+        return [(nombre, recetas) for nombre, recetas in filas]
+    
+    def obtener_historia_clinica(self, dni: str) -> HistoriaClinica:
+        # La historia se arma en el momento con los índices por DNI
+        paciente = self.obtener_paciente(dni)
+        historia = HistoriaClinica(paciente)
+        medicos = self.__medicos
+        consulta = "SELECT matricula, fecha_hora, especialidad, duracion FROM turnos WHERE dni = ? ORDER BY id"
+        for matricula, fecha_hora, especialidad, duracion in self.__consultar(consulta, (dni,)):
+            historia.agregar_turno(Turno(paciente, medicos[matricula], datetime.fromisoformat(fecha_hora), especialidad,
+                                         duracion_en_minutos(duracion)))
+        consulta = "SELECT matricula, fecha, medicamentos FROM recetas WHERE dni = ? ORDER BY id"
+        for matricula, fecha, medicamentos in self.__consultar(consulta, (dni,)):
+            historia.agregar_receta(Receta(paciente, medicos[matricula], json.loads(medicamentos),
+                                           datetime.fromisoformat(fecha)))
+        return historia
+    
+    def cerrar(self):
+        with self.__bloqueo:
+            self.__conexion.close()
\ No newline at end of file
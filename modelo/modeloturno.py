@@ -1,21 +1,35 @@
 
 
-from datetime import datetime
+import sys
+from datetime import datetime, timedelta
 from modelopaciente import Paciente
 from modelomedico import Medico
+from modeloespecialidad import DURACION_PREDETERMINADA
 
 
 class Turno:
     """Representa un turno médico"""
     
-    def __init__(self, paciente: Paciente, medico: Medico, fecha_hora: datetime, especialidad: str):
+    __slots__ = ("__paciente", "__medico", "__fecha_hora", "__especialidad", "__duracion")
+    
+    def __init__(self, paciente: Paciente, medico: Medico, fecha_hora: datetime, especialidad: str,
+                 duracion: timedelta = DURACION_PREDETERMINADA):
         if not paciente or not medico or not fecha_hora or not especialidad:
             raise ValueError("Todos los campos son obligatorios")
+        if not duracion:
+            raise ValueError("La duración del turno debe ser positiva")
         
         self.__paciente = paciente
         self.__medico = medico
         self.__fecha_hora = fecha_hora
-        self.__especialidad = especialidad
+        # Internado: todos los turnos de una especialidad comparten el mismo texto
+        self.__especialidad = sys.intern(especialidad) if type(especialidad) is str else especialidad
+        # Clinica valida la duración; los turnos con la misma duración comparten el objeto
+        self.__duracion = duracion
+    
+    def obtener_paciente(self) -> Paciente:
+        """Devuelve el paciente del turno"""
+        return self.__paciente
     
     def obtener_medico(self) -> Medico:
         """Devuelve el médico asignado al turno"""
@@ -25,6 +39,18 @@ class Turno:
         """Devuelve la fecha y hora del turno"""
         return self.__fecha_hora
     
+    def obtener_especialidad(self) -> str:
+        """Devuelve la especialidad del turno"""
+        return self.__especialidad
+    
+    def obtener_duracion(self) -> timedelta:
+        """Devuelve la duración del turno"""
+        return self.__duracion
+    
+    def obtener_fin(self) -> datetime:
+        """Devuelve la fecha y hora en que termina el turno"""
+        return self.__fecha_hora + self.__duracion
+    
     def __str__(self) -> str:
         """Representación legible del turno"""
         fecha_str = self.__fecha_hora.strftime("%d/%m/%Y %H:%M")
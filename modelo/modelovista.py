@@ -0,0 +1,104 @@
+
+
+from collections.abc import Sequence
+from itertools import islice
+from typing import Generic, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Vista(Sequence, Generic[T]):
+    """Vista de solo lectura sobre una lista interna, sin copiarla.
+    
+    Tiene largo, se puede recorrer, indexar y cortar, pero no ofrece métodos para
+    modificarla. Refleja los elementos que se agreguen después a la lista original;
+    un corte devuelve otra vista que fija las posiciones al momento de cortar.
+    
+    `huecos` son posiciones de la lista, ordenadas, que la vista saltea: elementos
+    quitados sin mover los demás. La lista de huecos también se comparte, así que la
+    vista refleja los que se agreguen después.
+    """
+    
+    __slots__ = ("__datos", "__rango", "__huecos")
+    
+    def __init__(self, datos: List[T], rango: Optional[Sequence] = None, huecos: Optional[List[int]] = None):
+        self.__datos = datos
+        self.__rango = rango
+        self.__huecos = huecos
+    
+    def __len__(self) -> int:
+        """Cantidad de elementos visibles"""
+        if self.__rango is None:
+            return len(self.__datos) - len(self.__huecos) if self.__huecos else len(self.__datos)
+        return len(self.__rango)
+    
+    def __posicion(self, indice: int) -> int:
+        """Posición en la lista del elemento visible número `indice`, salteando los huecos (búsqueda binaria)"""
+        largo = len(self)
+        if indice < 0:
+            indice += largo
+        if not 0 <= indice < largo:
+            raise IndexError("índice de la vista fuera de rango")
+        # Antes del hueco j hay huecos[j] - j elementos visibles: se cuentan los huecos que quedan antes
+        huecos = self.__huecos
+        bajo, alto = 0, len(huecos)
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            if huecos[medio] - medio <= indice:
+                bajo = medio + 1
+            else:
+                alto = medio
+        return indice + bajo
+    
+    def __getitem__(self, indice):
+        """Devuelve un elemento, o una vista si se pide un corte"""
+        if isinstance(indice, slice):
+            if self.__rango is None and self.__huecos:
+                return Vista(self.__datos, [self.__posicion(i) for i in range(len(self))[indice]])
+            rango = range(len(self.__datos)) if self.__rango is None else self.__rango
+            return Vista(self.__datos, rango[indice])
+        if self.__rango is None:
+            if self.__huecos:
+                return self.__datos[self.__posicion(indice)]
+            return self.__datos[indice]
+        return self.__datos[self.__rango[indice]]
+    
+    def __iter__(self) -> Iterator[T]:
+        """Recorre los elementos en orden"""
+        if self.__rango is None:
+            if self.__huecos:
+                return self.__sin_huecos()
+            return iter(self.__datos)
+        datos = self.__datos
+        return (datos[i] for i in self.__rango)
+    
+    def __sin_huecos(self) -> Iterator[T]:
+        """Recorre la lista salteando las posiciones de los huecos"""
+        elementos = iter(self.__datos)
+        posicion = 0
+        for hueco in self.__huecos:
+            yield from islice(elementos, hueco - posicion)
+            next(elementos, None)
+            posicion = hueco + 1
+        yield from elementos
+    
+    def __reversed__(self) -> Iterator[T]:
+        """Recorre los elementos en orden inverso"""
+        if self.__rango is None:
+            if self.__huecos:
+                return (self[i] for i in reversed(range(len(self))))
+            return reversed(self.__datos)
+        datos = self.__datos
+        return (datos[i] for i in reversed(self.__rango))
+    
+    def __eq__(self, otro) -> bool:
+        """Compara elemento a elemento con otra vista, lista o tupla"""
+        if not isinstance(otro, (Vista, list, tuple)):
+            return NotImplemented
+        return len(self) == len(otro) and all(a == b for a, b in zip(self, otro))
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        """Representación de la vista con sus elementos"""
+        return f"Vista({list(self)!r})"
\ No newline at end of file
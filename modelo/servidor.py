@@ -0,0 +1,343 @@
+
+
+import argparse
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from modeloclinica import Clinica
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad, DURACION_PREDETERMINADA, MINUTO
+from modeloturno import Turno
+from modeloreceta import Receta
+from modelohistoriaclinica import HistoriaClinica
+from modelorepositoriosqlite import RepositorioSQLite
+from modeloexcepciones import (
+    PacienteNoEncontradoException,
+    MedicoNoEncontradoException,
+    MedicoNoDisponibleException,
+    TurnoOcupadoException,
+    TurnoNoEncontradoException,
+    RecetaInvalidaException,
+    EspecialidadNoValidaException,
+    PacienteDuplicadoException,
+    MedicoDuplicadoException
+)
+
+
+# Errores del dominio: se informan al cliente con el nombre de la excepción
+ERRORES_CLINICA = (
+    PacienteNoEncontradoException,
+    MedicoNoEncontradoException,
+    MedicoNoDisponibleException,
+    TurnoOcupadoException,
+    TurnoNoEncontradoException,
+    RecetaInvalidaException,
+    EspecialidadNoValidaException,
+    PacienteDuplicadoException,
+    MedicoDuplicadoException
+)
+
+# Bytes que se piden al socket por lectura y largo máximo de una solicitud (como el límite de StreamReader)
+_TAMANO_LECTURA = 1 << 16
+_LARGO_MAXIMO = 1 << 16
+
+_codificar = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _duracion(parametros: Dict[str, Any]) -> Optional[timedelta]:
+    """Lee el parámetro opcional duracion: un entero de minutos (no un booleano ni un decimal)"""
+    minutos = parametros.get("duracion")
+    if minutos is None:
+        return None
+    if type(minutos) is not int:
+        raise ValueError("La duración debe ser una cantidad entera de minutos")
+    # Un entero enorme desborda timedelta: se informa como solicitud inválida
+    try:
+        return timedelta(minutes=minutos)
+    except OverflowError:
+        raise ValueError("La duración está fuera de rango") from None
+
+
+def _especialidad(parametros: Dict[str, Any]) -> Especialidad:
+    """Arma una especialidad con su tipo, sus días y su duración de turno opcional"""
+    duracion = _duracion(parametros)
+    return Especialidad(parametros["tipo"], parametros["dias"],
+                        duracion if duracion is not None else DURACION_PREDETERMINADA)
+
+
+def _periodo(parametros: Dict[str, Any]) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Lee los parámetros opcionales desde y hasta (ISO)"""
+    desde = parametros.get("desde")
+    hasta = parametros.get("hasta")
+    return (datetime.fromisoformat(desde) if desde else None,
+            datetime.fromisoformat(hasta) if hasta else None)
+
+
+def paciente_a_dict(paciente: Paciente) -> Dict[str, Any]:
+    """Convierte un paciente a un diccionario serializable"""
+    return {"nombre": paciente.obtener_nombre(), "dni": paciente.obtener_dni(),
+            "fecha_nacimiento": paciente.obtener_fecha_nacimiento()}
+
+
+def medico_a_dict(medico: Medico) -> Dict[str, Any]:
+    """Convierte un médico, con sus especialidades, a un diccionario serializable"""
+    return {"nombre": medico.obtener_nombre(), "matricula": medico.obtener_matricula(),
+            "especialidades": [{"tipo": esp.obtener_especialidad(), "dias": esp.obtener_dias(),
+                                "duracion": esp.obtener_duracion() // MINUTO}
+                               for esp in medico.obtener_especialidades()]}
+
+
+def turno_a_dict(turno: Turno) -> Dict[str, Any]:
+    """Convierte un turno a un diccionario serializable"""
+    return {"dni": turno.obtener_paciente().obtener_dni(),
+            "matricula": turno.obtener_medico().obtener_matricula(),
+            "especialidad": turno.obtener_especialidad(),
+            "fecha_hora": turno.obtener_fecha_hora().isoformat(),
+            "duracion": turno.obtener_duracion() // MINUTO}
+
+
+def receta_a_dict(receta: Receta) -> Dict[str, Any]:
+    """Convierte una receta a un diccionario serializable"""
+    return {"dni": receta.obtener_paciente().obtener_dni(),
+            "matricula": receta.obtener_medico().obtener_matricula(),
+            "medicamentos": receta.obtener_medicamentos(),
+            "fecha": receta.obtener_fecha().isoformat()}
+
+
+def historia_a_dict(historia: HistoriaClinica) -> Dict[str, Any]:
+    """Convierte una historia clínica a un diccionario serializable"""
+    return {"paciente": paciente_a_dict(historia.obtener_paciente()),
+            "turnos": [turno_a_dict(turno) for turno in historia.obtener_turnos()],
+            "recetas": [receta_a_dict(receta) for receta in historia.obtener_recetas()]}
+
+
+class ServidorClinica:
+    """Servidor asyncio que expone las operaciones de una Clinica con JSON sobre TCP.
+    
+    Cada solicitud es una línea JSON `{"id": ..., "operacion": ..., "parametros": {...}}` y
+    cada respuesta una línea `{"id": ..., "ok": true, "resultado": ...}` o
+    `{"id": ..., "ok": false, "error": ..., "mensaje": ...}`. Un cliente puede enviar varias
+    solicitudes sin esperar las respuestas; se responden en el mismo orden.
+    
+    Las operaciones se ejecutan en un grupo de `hilos` hilos, fuera del bucle de eventos:
+    una escritura lenta en SQLite o un fsync de la bitácora no frena a los demás clientes.
+    Con un solo hilo las operaciones quedan serializadas; con más, la clínica debe
+    haberse creado con concurrente=True.
+    """
+    
+    def __init__(self, clinica: Clinica, hilos: int = 1):
+        if hilos < 1:
+            raise ValueError("El servidor necesita al menos un hilo")
+        self.__clinica = clinica
+        self.__hilos = hilos
+        self.__ejecutor: Optional[ThreadPoolExecutor] = None
+        self.__servidor: Optional[asyncio.AbstractServer] = None
+        self.__operaciones: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "agregar_paciente": self.__agregar_paciente,
+            "agregar_medico": self.__agregar_medico,
+            "agregar_especialidad": self.__agregar_especialidad,
+            "agendar_turno": self.__agendar_turno,
+            "cancelar_turno": self.__cancelar_turno,
+            "reprogramar_turno": self.__reprogramar_turno,
+            "emitir_receta": self.__emitir_receta,
+            "obtener_historia_clinica": self.__obtener_historia_clinica,
+            "obtener_pacientes": self.__obtener_pacientes,
+            "buscar_pacientes": self.__buscar_pacientes,
+            "obtener_medicos": self.__obtener_medicos,
+            "obtener_turnos": self.__obtener_turnos,
+            "obtener_turnos_medico": self.__obtener_turnos_medico,
+            "buscar_recetas_por_medicamento": self.__buscar_recetas_por_medicamento,
+            "medicamentos_mas_recetados": self.__medicamentos_mas_recetados,
+        }
+    
+    async def iniciar(self, host: str = "127.0.0.1", puerto: int = 0):
+        """Empieza a aceptar conexiones; con puerto 0 el sistema elige uno libre"""
+        self.__ejecutor = ThreadPoolExecutor(self.__hilos, thread_name_prefix="clinica")
+        self.__servidor = await asyncio.start_server(self.__atender, host, puerto)
+    
+    def obtener_puerto(self) -> int:
+        """Devuelve el puerto en el que escucha el servidor"""
+        return self.__servidor.sockets[0].getsockname()[1]
+    
+    async def servir(self):
+        """Atiende conexiones hasta que se cancele la tarea"""
+        async with self.__servidor:
+            await self.__servidor.serve_forever()
+    
+    async def cerrar(self):
+        """Deja de aceptar conexiones y espera las operaciones en curso"""
+        self.__servidor.close()
+        await self.__servidor.wait_closed()
+        await asyncio.get_running_loop().run_in_executor(None, self.__ejecutor.shutdown)
+    
+    async def __atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """Responde en orden cada línea que envía un cliente hasta que cierra la conexión"""
+        bucle = asyncio.get_running_loop()
+        pendiente = b""
+        try:
+            while True:
+                datos = await lector.read(_TAMANO_LECTURA)
+                if not datos:
+                    break
+                *lineas, pendiente = (pendiente + datos).split(b"\n")
+                if len(pendiente) > _LARGO_MAXIMO:
+                    break
+                if lineas:
+                    # Las líneas ya recibidas van juntas al hilo: un cliente que encadena solicitudes
+                    # paga un solo salto de hilo, y la siguiente tanda se lee con estas respondidas
+                    escritor.write(await bucle.run_in_executor(self.__ejecutor, self.__responder_todas, lineas))
+                    # drain solo espera si el cliente dejó de leer y el búfer de salida se llenó
+                    await escritor.drain()
+            if pendiente.strip():
+                escritor.write(await bucle.run_in_executor(self.__ejecutor, self.responder, pendiente))
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+    
+    def __responder_todas(self, lineas: List[bytes]) -> bytes:
+        """Procesa varias solicitudes en orden y devuelve sus respuestas juntas"""
+        return b"".join(map(self.responder, lineas))
+    
+    def responder(self, linea: bytes) -> bytes:
+        """Procesa una solicitud JSON y devuelve la línea de respuesta"""
+        identificador = None
+        try:
+            solicitud = json.loads(linea)
+            if not isinstance(solicitud, dict):
+                raise ValueError("La solicitud debe ser un objeto JSON")
+            identificador = solicitud.get("id")
+            operacion = self.__operaciones.get(solicitud.get("operacion"))
+            if operacion is None:
+                respuesta = {"id": identificador, "ok": False, "error": "OperacionDesconocida",
+                             "mensaje": f"Operación desconocida: {solicitud.get('operacion')}"}
+            else:
+                resultado = operacion(solicitud.get("parametros") or {})
+                respuesta = {"id": identificador, "ok": True, "resultado": resultado}
+        except ERRORES_CLINICA as e:
+            respuesta = {"id": identificador, "ok": False, "error": type(e).__name__, "mensaje": str(e)}
+        except KeyError as e:
+            respuesta = {"id": identificador, "ok": False, "error": "SolicitudInvalida",
+                         "mensaje": f"Falta el parámetro {e}"}
+        except (ValueError, TypeError, AttributeError, OverflowError) as e:
+            respuesta = {"id": identificador, "ok": False, "error": "SolicitudInvalida", "mensaje": str(e)}
+        return (_codificar(respuesta) + "\n").encode("utf-8")
+    
+    def __agregar_paciente(self, parametros: Dict[str, Any]):
+        """Operación agregar_paciente: nombre, dni, fecha_nacimiento"""
+        self.__clinica.agregar_paciente(
+            Paciente(parametros["nombre"], parametros["dni"], parametros["fecha_nacimiento"]))
+    
+    def __agregar_medico(self, parametros: Dict[str, Any]):
+        """Operación agregar_medico: nombre, matricula y especialidades opcionales [{tipo, dias, duracion}]"""
+        medico = Medico(parametros["nombre"], parametros["matricula"])
+        for especialidad in parametros.get("especialidades", []):
+            medico.agregar_especialidad(_especialidad(especialidad))
+        self.__clinica.agregar_medico(medico)
+    
+    def __agregar_especialidad(self, parametros: Dict[str, Any]):
+        """Operación agregar_especialidad: matricula, tipo, dias y duracion opcional (minutos)"""
+        self.__clinica.agregar_especialidad(parametros["matricula"], _especialidad(parametros))
+    
+    def __agendar_turno(self, parametros: Dict[str, Any]):
+        """Operación agendar_turno: dni, matricula, especialidad, fecha_hora (ISO) y duracion opcional (minutos)"""
+        self.__clinica.agendar_turno(parametros["dni"], parametros["matricula"], parametros["especialidad"],
+                                     datetime.fromisoformat(parametros["fecha_hora"]), _duracion(parametros))
+    
+    def __cancelar_turno(self, parametros: Dict[str, Any]) -> Dict[str, Any]:
+        """Operación cancelar_turno: matricula, fecha_hora (ISO); devuelve el turno cancelado"""
+        return turno_a_dict(self.__clinica.cancelar_turno(parametros["matricula"],
+                                                          datetime.fromisoformat(parametros["fecha_hora"])))
+    
+    def __reprogramar_turno(self, parametros: Dict[str, Any]) -> Dict[str, Any]:
+        """Operación reprogramar_turno: matricula, fecha_hora y nueva_fecha_hora (ISO); devuelve el turno nuevo"""
+        return turno_a_dict(self.__clinica.reprogramar_turno(parametros["matricula"],
+                                                             datetime.fromisoformat(parametros["fecha_hora"]),
+                                                             datetime.fromisoformat(parametros["nueva_fecha_hora"])))
+    
+    def __emitir_receta(self, parametros: Dict[str, Any]):
+        """Operación emitir_receta: dni, matricula, medicamentos"""
+        self.__clinica.emitir_receta(parametros["dni"], parametros["matricula"], parametros["medicamentos"])
+    
+    def __obtener_historia_clinica(self, parametros: Dict[str, Any]) -> Dict[str, Any]:
+        """Operación obtener_historia_clinica: dni"""
+        return historia_a_dict(self.__clinica.obtener_historia_clinica(parametros["dni"]))
+    
+    def __obtener_pacientes(self, parametros: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Operación obtener_pacientes"""
+        return [paciente_a_dict(paciente) for paciente in self.__clinica.obtener_pacientes()]
+    
+    def __buscar_pacientes(self, parametros: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Operación buscar_pacientes: texto y limite opcional (20 por defecto)"""
+        pacientes = self.__clinica.buscar_pacientes(parametros["texto"], parametros.get("limite", 20))
+        return [paciente_a_dict(paciente) for paciente in pacientes]
+    
+    def __obtener_medicos(self, parametros: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Operación obtener_medicos"""
+        return [medico_a_dict(medico) for medico in self.__clinica.obtener_medicos()]
+    
+    def __obtener_turnos(self, parametros: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Operación obtener_turnos"""
+        return [turno_a_dict(turno) for turno in self.__clinica.obtener_turnos()]
+    
+    def __obtener_turnos_medico(self, parametros: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Operación obtener_turnos_medico: matricula y, opcionales, desde y hasta (ISO)"""
+        turnos = self.__clinica.obtener_turnos_medico(parametros["matricula"], *_periodo(parametros))
+        return [turno_a_dict(turno) for turno in turnos]
+    
+    def __buscar_recetas_por_medicamento(self, parametros: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Operación buscar_recetas_por_medicamento: medicamento y, opcionales, desde y hasta (ISO)"""
+        recetas = self.__clinica.buscar_recetas_por_medicamento(parametros["medicamento"], *_periodo(parametros))
+        return [receta_a_dict(receta) for receta in recetas]
+    
+    def __medicamentos_mas_recetados(self, parametros: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Operación medicamentos_mas_recetados: cantidad, matricula, desde y hasta (ISO), todos opcionales"""
+        ranking = self.__clinica.medicamentos_mas_recetados(parametros.get("cantidad", 10), parametros.get("matricula"),
+                                                            *_periodo(parametros))
+        return [{"medicamento": medicamento, "recetas": recetas} for medicamento, recetas in ranking]
+
+
+async def _servir(clinica: Clinica, host: str, puerto: int, hilos: int):
+    """Inicia el servidor, informa el puerto y atiende hasta que se interrumpa"""
+    servidor = ServidorClinica(clinica, hilos)
+    await servidor.iniciar(host, puerto)
+    print(f"Escuchando en {host}:{servidor.obtener_puerto()}", flush=True)
+    await servidor.servir()
+
+
+def main():
+    """Función principal para ejecutar el servidor"""
+    parser = argparse.ArgumentParser(description="Servidor JSON sobre TCP de la clínica")
+    parser.add_argument("--host", default="127.0.0.1", help="dirección en la que escuchar")
+    parser.add_argument("--puerto", type=int, default=8765, help="puerto TCP (0 = elegir uno libre)")
+    parser.add_argument("--bitacora", metavar="RUTA",
+                        help="archivo de bitácora: se reproduce al iniciar y registra cada operación")
+    parser.add_argument("--base", metavar="RUTA", help="guardar los datos en una base SQLite")
+    parser.add_argument("--hilos", type=int, default=4, metavar="N",
+                        help="hilos que ejecutan las operaciones (la clínica se abre en modo concurrente)")
+    argumentos = parser.parse_args()
+    if argumentos.base and argumentos.bitacora:
+        parser.error("--base no se puede combinar con --bitacora")
+    if argumentos.hilos < 1:
+        parser.error("--hilos debe ser al menos 1")
+    
+    if argumentos.base:
+        clinica = Clinica(repositorio=RepositorioSQLite(argumentos.base), concurrente=True)
+    elif argumentos.bitacora:
+        clinica = Clinica.desde_bitacora(argumentos.bitacora, concurrente=True)
+    else:
+        clinica = Clinica(concurrente=True)
+    try:
+        asyncio.run(_servir(clinica, argumentos.host, argumentos.puerto, argumentos.hilos))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        clinica.cerrar()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,56 @@
+import unittest
+import sys
+import os
+import tempfile
+from typing import Dict
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modelorepositorio import RepositorioMemoria
+from modelorepositoriocolumnar import RepositorioColumnar
+from modelorepositoriosqlite import RepositorioSQLite
+
+
+class ConRepositorioMemoria:
+    """Crea el repositorio en memoria para los tests comunes"""
+    
+    def crear_repositorio(self):
+        return RepositorioMemoria()
+
+
+class ConRepositorioColumnar:
+    """Crea el repositorio con los turnos en columnas para los tests comunes"""
+    
+    def crear_repositorio(self):
+        return RepositorioColumnar()
+
+
+class ConRepositorioSQLite:
+    """Crea un repositorio SQLite en un directorio temporal que se borra al terminar el test"""
+    
+    def crear_repositorio(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directorio.cleanup)
+        return RepositorioSQLite(os.path.join(self.directorio.name, "clinica.db"))
+
+
+REPOSITORIOS = {
+    "Memoria": ConRepositorioMemoria,
+    "Columnar": ConRepositorioColumnar,
+    "SQLite": ConRepositorioSQLite,
+}
+
+
+def casos_por_repositorio(base: type, **propios: type) -> Dict[str, type]:
+    """Arma una clase de test por repositorio a partir de la clase con los tests comunes.
+    
+    De "PaginacionBase" salen TestPaginacionMemoria, TestPaginacionColumnar y
+    TestPaginacionSQLite; el módulo de tests las agrega con globals().update. `propios`
+    agrega a un repositorio (por su sufijo, como Memoria=...) una clase con tests solo suyos.
+    """
+    nombre = base.__name__.removesuffix("Base")
+    return {f"Test{nombre}{sufijo}": type(f"Test{nombre}{sufijo}",
+                                          (mixin, *filter(None, [propios.get(sufijo)]), base, unittest.TestCase),
+                                          {"__module__": base.__module__, "__doc__": f"{base.__doc__} ({sufijo})"})
+            for sufijo, mixin in REPOSITORIOS.items()}
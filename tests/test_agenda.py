@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import patch
+from datetime import datetime, timedelta
+import random
+import sys
+import os
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+import modeloagenda
+from modeloagenda import AgendaMedico
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloturno import Turno
+from modeloespecialidad import Especialidad
+
+
+class TestAgendaMedico(unittest.TestCase):
+    """Tests para la agenda en bloques de un médico"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.paciente = Paciente("Juan Pérez", "12345678", "15/03/1990")
+        self.medico = Medico("Dra. Martínez", "MED001")
+        self.medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.inicio = datetime(2025, 6, 16, 8, 0)
+        # Bloques chicos para que pocos turnos ya ocupen varios bloques
+        parche = patch.object(modeloagenda, "_TAMANO_BLOQUE", 4)
+        parche.start()
+        self.addCleanup(parche.stop)
+    
+    def turno(self, hora):
+        return Turno(self.paciente, self.medico, self.inicio + timedelta(hours=hora), "Pediatría")
+    
+    def test_coincide_con_una_lista_ordenada(self):
+        """Test: Altas, bajas y consultas dan lo mismo que una lista ordenada aunque los bloques se partan y vacíen"""
+        aleatorio = random.Random(7)
+        agenda = AgendaMedico()
+        horas = aleatorio.sample(range(200), 120)
+        agenda.agregar_turnos([self.turno(hora) for hora in horas[:40]])
+        for hora in horas[40:]:
+            agenda.agregar_turno(self.turno(hora))
+        for hora in horas[:60]:
+            self.assertIsNotNone(agenda.quitar_turno(self.inicio + timedelta(hours=hora)))
+        self.assertIsNone(agenda.quitar_turno(self.inicio + timedelta(hours=horas[0])))
+        
+        esperadas = sorted(self.inicio + timedelta(hours=hora) for hora in horas[60:])
+        self.assertEqual(len(agenda), 60)
+        self.assertEqual([t.obtener_fecha_hora() for t in agenda.obtener_turnos_entre()], esperadas)
+        for _ in range(200):
+            desde, hasta = sorted(self.inicio + timedelta(hours=aleatorio.uniform(-5, 205)) for _ in range(2))
+            rango = [fecha for fecha in esperadas if desde <= fecha < hasta]
+            self.assertEqual(agenda.obtener_fechas_entre(desde, hasta), rango)
+            self.assertEqual(agenda.contar_entre(desde, hasta), len(rango))
+            self.assertEqual([t.obtener_fecha_hora() for t in agenda.obtener_turnos_entre(desde, hasta, 3)], rango[:3])
+            pisados = [fecha for fecha in esperadas if fecha < hasta and fecha + timedelta(minutes=30) > desde]
+            self.assertEqual([inicio for inicio, _ in agenda.obtener_intervalos_entre(desde, hasta)], pisados)
+            self.assertEqual(agenda.hay_superposicion(desde, hasta), bool(pisados))
+    
+    def test_lotes_se_mezclan_con_los_bloques(self):
+        """Test: Varios lotes grandes sobre una agenda con turnos quedan ordenados y consultables"""
+        aleatorio = random.Random(11)
+        agenda = AgendaMedico()
+        horas = aleatorio.sample(range(1000), 400)
+        for inicio in range(0, 400, 100):
+            agenda.agregar_turnos([self.turno(hora) for hora in horas[inicio:inicio + 100]])
+        agenda.agregar_turno(self.turno(1500))
+        
+        esperadas = sorted(self.inicio + timedelta(hours=hora) for hora in horas + [1500])
+        self.assertEqual(len(agenda), 401)
+        self.assertEqual([t.obtener_fecha_hora() for t in agenda.obtener_turnos_entre()], esperadas)
+        self.assertEqual(agenda.contar_entre(esperadas[100], esperadas[300]), 200)
+        self.assertIsNotNone(agenda.quitar_turno(esperadas[0]))
+        self.assertEqual(agenda.obtener_fechas_entre(esperadas[0], esperadas[3]), esperadas[1:3])
+
+
+if __name__ == '__main__':
+    unittest.main()
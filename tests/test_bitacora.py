@@ -0,0 +1,160 @@
+
+
+import unittest
+from datetime import datetime
+import sys
+import os
+import tempfile
+import threading
+from unittest import mock
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelobitacora import Bitacora
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+from modeloexcepciones import TurnoOcupadoException, PacienteDuplicadoException
+
+
+class TestBitacora(unittest.TestCase):
+    """Tests para la bitácora de operaciones de la clínica"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.log")
+    
+    def tearDown(self):
+        self.directorio.cleanup()
+    
+    def poblar(self, clinica):
+        """Registra un conjunto de operaciones de ejemplo"""
+        clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        medico = Medico("Dra. Martínez", "MED001")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        clinica.agregar_medico(medico)
+        clinica.agregar_especialidad("MED001", Especialidad("Cardiología", ["martes"]))
+        clinica.agendar_turno("12345678", "MED001", "Pediatría", datetime(2025, 6, 16, 10, 0))
+        clinica.agendar_turnos([("12345678", "MED001", "Cardiología", datetime(2025, 6, 17, 9, 0))])
+        clinica.emitir_receta("12345678", "MED001", ["Paracetamol", "Ibuprofeno"])
+    
+    def test_reproducir_bitacora(self):
+        """Test: Una clínica reconstruida desde la bitácora tiene el mismo estado"""
+        original = Clinica(Bitacora(self.ruta, fsync_cada=1))
+        self.poblar(original)
+        original.cerrar()
+        
+        clinica = Clinica.desde_bitacora(self.ruta)
+        
+        self.assertEqual([str(p) for p in clinica.obtener_pacientes()],
+                         [str(p) for p in original.obtener_pacientes()])
+        self.assertEqual([str(m) for m in clinica.obtener_medicos()],
+                         [str(m) for m in original.obtener_medicos()])
+        self.assertEqual([str(t) for t in clinica.obtener_turnos()],
+                         [str(t) for t in original.obtener_turnos()])
+        self.assertEqual(str(clinica.obtener_historia_clinica("12345678")),
+                         str(original.obtener_historia_clinica("12345678")))
+        self.assertEqual(clinica.obtener_medico_por_matricula("MED001").obtener_especialidad_para_dia("martes"),
+                         "Cardiología")
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.agendar_turno("12345678", "MED001", "Pediatría", datetime(2025, 6, 16, 10, 0))
+        with self.assertRaises(PacienteDuplicadoException):
+            clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        clinica.cerrar()
+    
+    def test_la_clinica_reconstruida_sigue_registrando(self):
+        """Test: Las operaciones posteriores a la reproducción se anexan a la misma bitácora"""
+        original = Clinica(Bitacora(self.ruta))
+        self.poblar(original)
+        original.cerrar()
+        
+        clinica = Clinica.desde_bitacora(self.ruta)
+        clinica.agregar_paciente(Paciente("María García", "87654321", "22/07/1985"))
+        clinica.cerrar()
+        
+        eventos = list(Bitacora.leer_eventos(self.ruta))
+        self.assertEqual(len(eventos), 7)
+        self.assertEqual(len(Clinica.desde_bitacora(self.ruta).obtener_pacientes()), 2)
+    
+    def test_operaciones_rechazadas_no_se_registran(self):
+        """Test: Solo se registran las operaciones que se aplicaron"""
+        clinica = Clinica(Bitacora(self.ruta))
+        self.poblar(clinica)
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.agendar_turno("12345678", "MED001", "Pediatría", datetime(2025, 6, 16, 10, 0))
+        clinica.cerrar()
+        
+        self.assertEqual(len(list(Bitacora.leer_eventos(self.ruta))), 6)
+    
+    def test_ultima_linea_incompleta_se_ignora(self):
+        """Test: Una escritura interrumpida al final de la bitácora no impide reproducirla"""
+        clinica = Clinica(Bitacora(self.ruta))
+        self.poblar(clinica)
+        clinica.cerrar()
+        with open(self.ruta, "a", encoding="utf-8") as archivo:
+            archivo.write('["P","Ana')
+        
+        self.assertEqual(len(Clinica.desde_bitacora(self.ruta).obtener_turnos()), 2)
+    
+    def test_escribir_despues_de_una_linea_incompleta(self):
+        """Test: Al reabrir la bitácora se descarta la línea incompleta y lo nuevo se puede reproducir"""
+        clinica = Clinica(Bitacora(self.ruta))
+        self.poblar(clinica)
+        clinica.cerrar()
+        with open(self.ruta, "a", encoding="utf-8") as archivo:
+            archivo.write('["P","B","2","01/0')
+        
+        clinica = Clinica.desde_bitacora(self.ruta)
+        clinica.agregar_paciente(Paciente("María García", "87654321", "22/07/1985"))
+        clinica.cerrar()
+        
+        clinica = Clinica.desde_bitacora(self.ruta)
+        self.assertEqual([p.obtener_dni() for p in clinica.obtener_pacientes()], ["12345678", "87654321"])
+        self.assertEqual(len(list(Bitacora.leer_eventos(self.ruta))), 7)
+        clinica.cerrar()
+    
+    def test_linea_corrupta_en_el_medio(self):
+        """Test: Una línea ilegible en medio de la bitácora lanza ValueError"""
+        with open(self.ruta, "w", encoding="utf-8") as archivo:
+            archivo.write('["P","Ana","1","01/01/2000"]\nbasura\n["P","Luis","2","01/01/2000"]\n')
+        
+        with self.assertRaises(ValueError):
+            Clinica.desde_bitacora(self.ruta)
+    
+    def test_bitacora_inexistente_crea_clinica_vacia(self):
+        """Test: Reproducir una bitácora que todavía no existe da una clínica vacía"""
+        clinica = Clinica.desde_bitacora(self.ruta)
+        
+        self.assertEqual(len(clinica.obtener_pacientes()), 0)
+        clinica.cerrar()
+    
+    def test_politica_fsync_invalida(self):
+        """Test: La política de confirmación no admite valores negativos"""
+        with self.assertRaises(ValueError):
+            Bitacora(self.ruta, fsync_cada=-1)
+
+    
+    def test_fsync_por_intervalo_sin_escrituras_nuevas(self):
+        """Test: Lo pendiente se confirma al vencer el intervalo aunque no lleguen más eventos"""
+        confirmado = threading.Event()
+        fsync = os.fsync
+        
+        def espiar(descriptor):
+            fsync(descriptor)
+            confirmado.set()
+        
+        bitacora = Bitacora(self.ruta, fsync_cada=1000, fsync_intervalo=0.05)
+        with mock.patch("modelobitacora.os.fsync", espiar):
+            bitacora.registrar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+            self.assertFalse(confirmado.is_set())
+            self.assertTrue(confirmado.wait(5))
+        
+        self.assertEqual(len(list(Bitacora.leer_eventos(self.ruta))), 1)
+        bitacora.cerrar()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+import unittest
+import random
+import sys
+import os
+import tempfile
+from unittest import mock
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloindicenombres import IndiceNombres, normalizar_palabras, _distancia_a_prefijo
+from modeloclinica import Clinica
+from modelorepositoriosqlite import RepositorioSQLite
+from modelopaciente import Paciente
+
+
+NOMBRES = ["Juan Pérez", "Ana González", "María José Gonzalez Núñez", "Pedro Gómez", "Ana Perales",
+           "Lucía Fernández", "José Rodríguez"]
+
+
+class TestIndiceNombres(unittest.TestCase):
+    """Tests para el índice de nombres de pacientes"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.indice = IndiceNombres()
+        self.indice.agregar_pacientes(Paciente(nombre, str(1000 + i), "01/01/1990")
+                                      for i, nombre in enumerate(NOMBRES))
+        self.nombres = {str(1000 + i): nombre for i, nombre in enumerate(NOMBRES)}
+    
+    def buscar(self, texto, limite=20):
+        return [self.nombres.get(dni, dni) for dni in self.indice.buscar(texto, limite)]
+    
+    def test_normalizar_palabras(self):
+        """Test: Se quitan tildes y mayúsculas, se separa por signos y se ignoran los números"""
+        self.assertEqual(normalizar_palabras("María PÉREZ-Núñez 2"), ["maria", "perez", "nunez"])
+        # Tilde suelta (combinante) después de la letra
+        self.assertEqual(normalizar_palabras("José"), ["jose"])
+    
+    def test_distancia_a_prefijo(self):
+        """Test: La distancia acotada coincide con la tabla completa contra el mejor prefijo"""
+        def completa(consulta, palabra):
+            anterior = list(range(len(palabra) + 1))
+            for i, letra in enumerate(consulta, 1):
+                actual = [i]
+                for j, otra in enumerate(palabra, 1):
+                    actual.append(min(anterior[j] + 1, actual[j - 1] + 1, anterior[j - 1] + (letra != otra)))
+                anterior = actual
+            return min(anterior)
+        
+        aleatorio = random.Random(3)
+        for _ in range(2000):
+            consulta = "".join(aleatorio.choices("abc", k=aleatorio.randint(1, 7)))
+            palabra = "".join(aleatorio.choices("abc", k=aleatorio.randint(0, 9)))
+            maximo = aleatorio.randint(0, 2)
+            self.assertEqual(_distancia_a_prefijo(consulta, palabra, maximo),
+                             min(completa(consulta, palabra), maximo + 1))
+    
+    def test_prefijo_sin_tildes(self):
+        """Test: Cualquier palabra del nombre se encuentra por su comienzo, sin distinguir tildes"""
+        self.assertEqual(self.buscar("gonzalez"), ["Ana González", "María José Gonzalez Núñez"])
+        self.assertEqual(self.buscar("NUÑ"), ["María José Gonzalez Núñez"])
+        self.assertEqual(self.buscar("pe"), ["Juan Pérez", "Pedro Gómez", "Ana Perales"])
+        self.assertEqual(self.buscar("pe", limite=2), ["Juan Pérez", "Pedro Gómez"])
+    
+    def test_varias_palabras(self):
+        """Test: Cada palabra del texto debe coincidir con alguna palabra del nombre"""
+        self.assertEqual(self.buscar("ana gonz"), ["Ana González"])
+        self.assertEqual(self.buscar("jose"), ["María José Gonzalez Núñez", "José Rodríguez"])
+        self.assertEqual(self.buscar("jose rodri"), ["José Rodríguez"])
+    
+    def test_errores_de_tipeo(self):
+        """Test: Desde cuatro letras se tolera un error, desde siete dos, y las coincidencias exactas van primero"""
+        self.assertEqual(self.buscar("gomes"), ["Pedro Gómez"])
+        self.assertEqual(self.buscar("fernandes"), ["Lucía Fernández"])
+        self.assertEqual(self.buscar("Rodrigues"), ["José Rodríguez"])
+        self.assertEqual(self.buscar("maria gonsalez"), ["María José Gonzalez Núñez"])
+        # "pere" coincide exacto con Pérez y con un error con Perales ("pera")
+        self.assertEqual(self.buscar("pere"), ["Juan Pérez", "Ana Perales"])
+        # Con menos de cuatro letras no se buscan parecidas
+        self.assertEqual(self.buscar("gim"), [])
+        self.assertEqual(self.buscar("zzzzzz"), [])
+        self.assertEqual(self.buscar("  "), [])
+    
+    def test_altas_despues_de_buscar(self):
+        """Test: Las palabras nuevas se ubican al buscar, de a una o reordenando todas"""
+        self.buscar("ana")
+        self.indice.agregar_paciente(Paciente("Anabela Ruiz", "2000", "01/01/1990"))
+        self.nombres["2000"] = "Anabela Ruiz"
+        self.assertEqual(self.buscar("ana"), ["Ana González", "Ana Perales", "Anabela Ruiz"])
+        # Más de 32 palabras nuevas: se reordena la lista completa
+        self.indice.agregar_pacientes(Paciente(f"Zoe Apellido{chr(97 + i % 26)}{chr(97 + i // 26)}",
+                                               str(3000 + i), "01/01/1990") for i in range(40))
+        self.assertEqual(len(self.buscar("zoe", limite=100)), 40)
+        self.assertEqual(self.buscar("ruiz"), ["Anabela Ruiz"])
+
+
+class TestBusquedaPacientesClinica(unittest.TestCase):
+    """Tests de buscar_pacientes en la clínica y de cómo se mantiene su índice"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.bitacora = os.path.join(self.directorio.name, "clinica.log")
+    
+    def tearDown(self):
+        self.directorio.cleanup()
+    
+    def cargar(self, clinica):
+        clinica.agregar_paciente(Paciente(NOMBRES[0], "1000", "01/01/1990"))
+        resultados = clinica.agregar_pacientes([Paciente(nombre, str(1001 + i), "01/01/1990")
+                                                for i, nombre in enumerate(NOMBRES[1:])] +
+                                               [Paciente("Duplicado Pérez", "1000", "01/01/1990")])
+        self.assertIsNotNone(resultados[-1])
+    
+    def dnis(self, clinica, texto):
+        return [paciente.obtener_dni() for paciente in clinica.buscar_pacientes(texto)]
+    
+    def test_altas_individuales_y_en_lote(self):
+        """Test: agregar_paciente y agregar_pacientes indexan solo a los pacientes registrados"""
+        clinica = Clinica()
+        self.cargar(clinica)
+        
+        self.assertEqual(self.dnis(clinica, "perez"), ["1000"])
+        self.assertEqual(self.dnis(clinica, "gonzales"), ["1001", "1002"])
+        with self.assertRaises(ValueError):
+            clinica.buscar_pacientes("perez", 0)
+    
+    def test_bitacora_instantanea_y_sqlite(self):
+        """Test: El índice se reconstruye desde la bitácora, la instantánea y una base SQLite existente"""
+        clinica = Clinica.desde_bitacora(self.bitacora, fsync_cada=0)
+        self.cargar(clinica)
+        instantanea = os.path.join(self.directorio.name, "clinica.snap")
+        clinica.guardar_instantanea(instantanea)
+        clinica.cerrar()
+        
+        for recuperada in (Clinica.desde_bitacora(self.bitacora), Clinica.recuperar(instantanea)):
+            self.assertEqual(self.dnis(recuperada, "rodrigues"), ["1006"])
+            recuperada.cerrar()
+        
+        ruta = os.path.join(self.directorio.name, "clinica.db")
+        clinica = Clinica(repositorio=RepositorioSQLite(ruta))
+        self.cargar(clinica)
+        clinica.cerrar()
+        reabierta = Clinica(repositorio=RepositorioSQLite(ruta))
+        self.assertEqual(self.dnis(reabierta, "ana"), ["1001", "1004"])
+        reabierta.cerrar()
+    
+    def test_indice_se_arma_en_la_primera_busqueda(self):
+        """Test: Abrir una base SQLite no recorre los pacientes; la primera búsqueda arma el índice con todos"""
+        ruta = os.path.join(self.directorio.name, "clinica.db")
+        clinica = Clinica(repositorio=RepositorioSQLite(ruta))
+        self.cargar(clinica)
+        clinica.cerrar()
+        
+        repositorio = RepositorioSQLite(ruta)
+        with mock.patch.object(repositorio, "listar_pacientes", wraps=repositorio.listar_pacientes) as listar:
+            reabierta = Clinica(repositorio=repositorio)
+            listar.assert_not_called()
+            reabierta.agregar_paciente(Paciente("Ana Pérez", "2000", "01/01/1990"))
+            self.assertEqual(self.dnis(reabierta, "ana per"), ["1004", "2000"])
+            reabierta.agregar_paciente(Paciente("Ana Peralta", "2001", "01/01/1990"))
+            self.assertEqual(self.dnis(reabierta, "ana per"), ["1004", "2000", "2001"])
+            self.assertEqual(listar.call_count, 1)
+        reabierta.cerrar()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,214 @@
+import unittest
+from datetime import datetime, timedelta
+import sys
+import os
+import tempfile
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from tests.repositorios import casos_por_repositorio
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+from modeloexcepciones import (
+    TurnoNoEncontradoException,
+    TurnoOcupadoException,
+    MedicoNoDisponibleException,
+    MedicoNoEncontradoException,
+    EspecialidadNoValidaException
+)
+
+
+class CancelacionBase:
+    """Tests de cancelación y reprogramación, comunes a todos los repositorios"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.clinica = Clinica(repositorio=self.crear_repositorio())
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        self.clinica.agregar_paciente(Paciente("Ana López", "11223344", "25/12/1992"))
+        medico = Medico("Dra. Martínez", "MED001")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes", "miércoles"]))
+        medico.agregar_especialidad(Especialidad("Cardiología", ["martes"]))
+        self.clinica.agregar_medico(medico)
+        self.lunes = datetime(2025, 6, 16, 9, 0)
+        lote = [("12345678" if i % 2 else "11223344", "MED001", "Pediatría", self.lunes + timedelta(minutes=30 * i))
+                for i in range(6)]
+        self.assertTrue(all(r is None for r in self.clinica.agendar_turnos(lote)))
+    
+    def tearDown(self):
+        self.clinica.cerrar()
+    
+    def fechas(self, turnos):
+        return [turno.obtener_fecha_hora() for turno in turnos]
+    
+    def test_cancelar_libera_el_horario(self):
+        """Test: El turno cancelado sale de los listados, la agenda y la historia, y el horario se puede volver a usar"""
+        horario = self.lunes + timedelta(minutes=30)
+        turno = self.clinica.cancelar_turno("MED001", horario)
+        
+        self.assertEqual(turno.obtener_paciente().obtener_dni(), "12345678")
+        self.assertEqual(len(self.clinica.obtener_turnos()), 5)
+        self.assertNotIn(horario, self.fechas(self.clinica.obtener_turnos()))
+        self.assertNotIn(horario, self.fechas(self.clinica.obtener_turnos_medico("MED001")))
+        self.assertEqual(self.clinica.contar_turnos(), 5)
+        self.assertEqual(self.clinica.contar_turnos("MED001"), 5)
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(self.fechas(historia.obtener_turnos()),
+                         [self.lunes + timedelta(minutes=90), self.lunes + timedelta(minutes=150)])
+        medicos, _, _, _ = self.clinica.exportar_turnos()
+        self.assertEqual(len(medicos), 5)
+        
+        self.clinica.agendar_turno("11223344", "MED001", "Pediatría", horario)
+        self.assertEqual(self.fechas(self.clinica.obtener_turnos())[-1], horario)
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.cancelar_turno("MED001", horario + timedelta(minutes=1))
+    
+    def test_cancelar_varias_veces(self):
+        """Test: Varias cancelaciones seguidas, intercaladas con altas y listados, dejan los demás turnos en orden"""
+        self.clinica.cancelar_turno("MED001", self.lunes)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 5)
+        self.clinica.cancelar_turno("MED001", self.lunes + timedelta(minutes=60))
+        self.clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes)
+        self.clinica.cancelar_turno("MED001", self.lunes + timedelta(minutes=150))
+        
+        self.assertEqual(self.fechas(self.clinica.obtener_turnos()),
+                         [self.lunes + timedelta(minutes=m) for m in (30, 90, 120, 0)])
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes + timedelta(minutes=30))
+    
+    def test_reprogramar_conserva_el_lugar(self):
+        """Test: El turno reprogramado cambia de horario sin cambiar su lugar en los listados ni en la historia"""
+        miercoles = self.lunes + timedelta(days=2)
+        nuevo = self.clinica.reprogramar_turno("MED001", self.lunes + timedelta(minutes=30), miercoles)
+        
+        self.assertEqual(nuevo.obtener_fecha_hora(), miercoles)
+        self.assertEqual(nuevo.obtener_especialidad(), "Pediatría")
+        self.assertEqual(self.fechas(self.clinica.obtener_turnos())[1], miercoles)
+        self.assertEqual(self.fechas(self.clinica.obtener_turnos_medico("MED001"))[-1], miercoles)
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(self.fechas(historia.obtener_turnos())[0], miercoles)
+        self.assertEqual(self.clinica.contar_turnos(), 6)
+        
+        # El horario anterior quedó libre
+        self.clinica.agendar_turno("11223344", "MED001", "Pediatría", self.lunes + timedelta(minutes=30))
+    
+    def test_reprogramar_valida_el_nuevo_horario(self):
+        """Test: El nuevo horario debe estar libre y el médico debe atender esa especialidad ese día"""
+        original = self.lunes + timedelta(minutes=30)
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.reprogramar_turno("MED001", original, self.lunes)
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.reprogramar_turno("MED001", original, self.lunes + timedelta(days=3))
+        with self.assertRaises(EspecialidadNoValidaException):
+            # El martes atiende Cardiología, no Pediatría
+            self.clinica.reprogramar_turno("MED001", original, self.lunes + timedelta(days=1))
+        with self.assertRaises(TurnoNoEncontradoException):
+            self.clinica.reprogramar_turno("MED001", self.lunes + timedelta(days=7), self.lunes + timedelta(days=9))
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.cancelar_turno("MED999", original)
+        
+        self.assertIn(original, self.fechas(self.clinica.obtener_turnos()))
+    
+    def test_historia_tras_cancelar_la_mayoria(self):
+        """Test: Cancelar y reprogramar casi todos los turnos de un paciente deja su historia en orden"""
+        miercoles = self.lunes + timedelta(days=2)
+        self.clinica.cancelar_turno("MED001", self.lunes + timedelta(minutes=90))
+        self.clinica.reprogramar_turno("MED001", self.lunes + timedelta(minutes=150), miercoles)
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(self.fechas(historia.obtener_turnos()), [self.lunes + timedelta(minutes=30), miercoles])
+        
+        # La segunda cancelación deja más huecos que turnos: la historia se compacta
+        self.clinica.cancelar_turno("MED001", self.lunes + timedelta(minutes=30))
+        self.clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes + timedelta(minutes=90))
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(self.fechas(historia.obtener_turnos()), [miercoles, self.lunes + timedelta(minutes=90)])
+        self.clinica.cancelar_turno("MED001", miercoles)
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(self.fechas(historia.obtener_turnos()), [self.lunes + timedelta(minutes=90)])
+
+
+class VistasMemoria:
+    """Tests propios del repositorio en memoria: vistas entregadas antes de cancelar"""
+    
+    def test_vistas_anteriores(self):
+        """Test: Una vista entregada antes de cancelar no muestra huecos"""
+        vista = self.clinica.obtener_turnos()
+        self.clinica.cancelar_turno("MED001", self.lunes)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 5)
+        self.assertTrue(all(turno is not None for turno in vista))
+    
+    def test_compactar_al_cancelar_la_mayoria(self):
+        """Test: Al cancelar más de la mitad la lista se compacta y las posiciones siguen sirviendo para reprogramar"""
+        vista = self.clinica.obtener_turnos()
+        for minutos in (0, 30, 60, 120):
+            self.clinica.cancelar_turno("MED001", self.lunes + timedelta(minutes=minutos))
+        self.assertEqual(self.fechas(vista), [self.lunes + timedelta(minutes=m) for m in (90, 150)])
+        
+        miercoles = self.lunes + timedelta(days=2)
+        self.clinica.reprogramar_turno("MED001", self.lunes + timedelta(minutes=150), miercoles)
+        self.assertEqual(self.fechas(self.clinica.obtener_turnos()), [self.lunes + timedelta(minutes=90), miercoles])
+        self.assertEqual(self.clinica.contar_turnos(), 2)
+
+
+globals().update(casos_por_repositorio(CancelacionBase, Memoria=VistasMemoria))
+
+
+class TestCancelacionBitacora(unittest.TestCase):
+    """Tests de cancelación y reprogramación al reproducir la bitácora"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.bitacora = os.path.join(self.directorio.name, "clinica.log")
+        self.instantanea = os.path.join(self.directorio.name, "clinica.snap")
+        self.lunes = datetime(2025, 6, 16, 9, 0)
+    
+    def tearDown(self):
+        self.directorio.cleanup()
+    
+    def cargar(self, clinica):
+        clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        medico = Medico("Dra. Martínez", "MED001")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        clinica.agregar_medico(medico)
+        for i in range(4):
+            clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes + timedelta(hours=i))
+    
+    def resumen(self, clinica):
+        return ([t.obtener_fecha_hora() for t in clinica.obtener_turnos()],
+                [t.obtener_fecha_hora() for t in clinica.obtener_historia_clinica("12345678").obtener_turnos()])
+    
+    def test_reproducir(self):
+        """Test: Las cancelaciones y reprogramaciones se reproducen en orden con los turnos"""
+        clinica = Clinica.desde_bitacora(self.bitacora, fsync_cada=0)
+        self.cargar(clinica)
+        clinica.cancelar_turno("MED001", self.lunes + timedelta(hours=1))
+        clinica.reprogramar_turno("MED001", self.lunes, self.lunes + timedelta(weeks=1))
+        clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes)
+        esperado = self.resumen(clinica)
+        clinica.cerrar()
+        
+        recuperada = Clinica.desde_bitacora(self.bitacora)
+        self.assertEqual(self.resumen(recuperada), esperado)
+        recuperada.cerrar()
+    
+    def test_instantanea_y_resto_de_la_bitacora(self):
+        """Test: Una cancelación posterior a la instantánea se aplica sobre lo cargado de ella"""
+        clinica = Clinica.desde_bitacora(self.bitacora, fsync_cada=0)
+        self.cargar(clinica)
+        clinica.guardar_instantanea(self.instantanea)
+        clinica.cancelar_turno("MED001", self.lunes + timedelta(hours=2))
+        clinica.reprogramar_turno("MED001", self.lunes + timedelta(hours=3), self.lunes + timedelta(hours=5))
+        esperado = self.resumen(clinica)
+        clinica.cerrar()
+        
+        recuperada = Clinica.recuperar(self.instantanea, self.bitacora)
+        self.assertEqual(self.resumen(recuperada), esperado)
+        recuperada.cerrar()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,280 @@
+import unittest
+from unittest.mock import patch
+from contextlib import redirect_stdout
+import io
+from datetime import datetime, timedelta
+import sys
+import os
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from cli import CLI
+from modeloclinica import Clinica
+from modelometricas import Metricas
+from modelopaciente import Paciente
+from modelomedico import Medico
+
+
+class TestCLILote(unittest.TestCase):
+    """Tests para el modo por lotes de la consola"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.cli = CLI()
+        self.salida = io.StringIO()
+    
+    def ejecutar(self, *lineas):
+        return self.cli.ejecutar_lote(io.StringIO("\n".join(lineas) + "\n"), self.salida)
+    
+    def test_comandos_exitosos(self):
+        """Test: Cada línea ejecuta una acción del menú, sin menú ni pausas"""
+        resultado = self.ejecutar(
+            "# alta del día",
+            "",
+            'agregar_paciente "Juan Pérez" 12345678 15/03/1990',
+            'agregar_medico "Dra. Martínez" MED001',
+            'agregar_especialidad MED001 Pediatría "lunes, martes"',
+            "agendar_turno 12345678 MED001 Pediatría 16/06/2025 10:00",
+            'emitir_receta 12345678 MED001 "Paracetamol, Ibuprofeno"',
+            "ver_pacientes",
+            "ver_historia_clinica 12345678",
+        )
+        
+        self.assertEqual(resultado, (7, 0))
+        turno = self.cli.clinica.obtener_turnos()[0]
+        self.assertEqual(turno.obtener_fecha_hora(), datetime(2025, 6, 16, 10, 0))
+        texto = self.salida.getvalue()
+        self.assertIn("Total de pacientes: 1", texto)
+        self.assertIn("Paracetamol, Ibuprofeno", texto)
+        self.assertNotIn("Presione Enter", texto)
+        self.assertTrue(texto.splitlines()[-1].startswith("Resumen: 7 exitosos, 0 fallidos en "))
+    
+    def test_duracion_opcional(self):
+        """Test: agregar_especialidad y agendar_turno aceptan la duración en minutos como último dato"""
+        resultado = self.ejecutar(
+            'agregar_paciente "Juan Pérez" 12345678 15/03/1990',
+            'agregar_medico "Dra. Martínez" MED001',
+            "agregar_especialidad MED001 Pediatría lunes 20",
+            "agendar_turno 12345678 MED001 Pediatría 16/06/2025 10:00",
+            "agendar_turno 12345678 MED001 Pediatría 16/06/2025 11:00 45",
+            "agendar_turno 12345678 MED001 Pediatría 16/06/2025 12:00 0",
+            "agendar_turno 12345678 MED001 Pediatría 16/06/2025 13:00 45 extra",
+        )
+        
+        self.assertEqual(resultado, (5, 2))
+        duraciones = [turno.obtener_duracion() for turno in self.cli.clinica.obtener_turnos()]
+        self.assertEqual(duraciones, [timedelta(minutes=20), timedelta(minutes=45)])
+        self.assertIn("Línea 6: La duración debe ser de al menos un minuto.", self.salida.getvalue())
+        self.assertIn("Uso: agendar_turno DNI MATRICULA ESPECIALIDAD dd/mm/aaaa HH:MM [MINUTOS]", self.salida.getvalue())
+    
+    def test_fallos_no_detienen_el_lote(self):
+        """Test: Los comandos que fallan se informan con su línea y se cuentan en el resumen"""
+        resultado = self.ejecutar(
+            'agregar_paciente "Juan Pérez" 12345678 15/03/1990',
+            'agregar_paciente "Juan Pérez" 12345678 15/03/1990',
+            "agendar_turno 12345678 MED999 Pediatría 16/06/2025 10:00",
+            "agregar_medico solo",
+            "borrar_todo",
+            'agregar_paciente "sin cerrar',
+            "ver_turnos",
+        )
+        
+        self.assertEqual(resultado, (2, 5))
+        lineas = self.salida.getvalue().splitlines()
+        self.assertTrue(lineas[0].startswith("Línea 2: Ya existe un paciente"))
+        self.assertTrue(lineas[1].startswith("Línea 3: "))
+        self.assertEqual(lineas[2], "Línea 4: Uso: agregar_medico NOMBRE MATRICULA")
+        self.assertEqual(lineas[3], "Línea 5: Comando desconocido: borrar_todo")
+        self.assertTrue(lineas[4].startswith("Línea 6: "))
+        self.assertEqual(lineas[5], "No hay turnos agendados.")
+        self.assertTrue(lineas[6].startswith("Resumen: 2 exitosos, 5 fallidos"))
+    
+    def test_cancelar_y_reprogramar(self):
+        """Test: Los comandos de cancelación y reprogramación actúan sobre el turno del médico"""
+        resultado = self.ejecutar(
+            'agregar_paciente "Juan Pérez" 12345678 15/03/1990',
+            'agregar_medico "Dra. Martínez" MED001',
+            'agregar_especialidad MED001 Pediatría "lunes, martes"',
+            "agendar_turno 12345678 MED001 Pediatría 16/06/2025 10:00",
+            "agendar_turno 12345678 MED001 Pediatría 16/06/2025 11:00",
+            "cancelar_turno MED001 16/06/2025 10:00",
+            "reprogramar_turno MED001 16/06/2025 11:00 17/06/2025 09:30",
+            "cancelar_turno MED001 16/06/2025 10:00",
+        )
+        
+        self.assertEqual(resultado, (7, 1))
+        turnos = self.cli.clinica.obtener_turnos()
+        self.assertEqual([turno.obtener_fecha_hora() for turno in turnos], [datetime(2025, 6, 17, 9, 30)])
+        self.assertTrue(self.salida.getvalue().startswith("Línea 8: "))
+
+
+
+class TestCLIMetricas(unittest.TestCase):
+    """Tests para las métricas desde la consola"""
+    
+    def test_ver_metricas(self):
+        """Test: ver_metricas muestra las operaciones llamadas con sus rechazos"""
+        cli = CLI(Clinica(metricas=Metricas()))
+        salida = io.StringIO()
+        cli.ejecutar_lote(io.StringIO('agregar_paciente "Juan Pérez" 12345678 15/03/1990\n'
+                                      'agregar_paciente "Juan Pérez" 12345678 15/03/1990\n'
+                                      "ver_metricas\n"), salida)
+        
+        texto = salida.getvalue()
+        self.assertRegex(texto, r"agregar_paciente +2 +1 ")
+        self.assertIn("  PacienteDuplicadoException: 1", texto)
+    
+    def test_metricas_desactivadas(self):
+        """Test: Sin métricas se avisa cómo activarlas"""
+        salida = io.StringIO()
+        CLI().ejecutar_lote(io.StringIO("ver_metricas\n"), salida)
+        self.assertIn("Las métricas están desactivadas", salida.getvalue())
+
+
+class TestCLIListaEspera(unittest.TestCase):
+    """Tests para anotarse en la lista de espera desde el menú"""
+    
+    def test_horario_ocupado(self):
+        """Test: Con el horario ocupado se ofrece la lista de espera, que asigna un horario libre del rango"""
+        cli = CLI()
+        salida = io.StringIO()
+        with redirect_stdout(salida):
+            cli.ejecutar_lote(io.StringIO('agregar_paciente "Juan Pérez" 12345678 15/03/1990\n'
+                                          'agregar_paciente "Ana López" 11223344 25/12/1992\n'
+                                          'agregar_medico "Dra. Martínez" MED001\n'
+                                          "agregar_especialidad MED001 Pediatría lunes\n"
+                                          "agendar_turno 12345678 MED001 Pediatría 16/06/2025 10:00\n"), salida)
+            respuestas = ["11223344", "MED001", "Pediatría", "16/06/2025", "10:00", "", "s", ""]
+            with patch("builtins.input", side_effect=respuestas):
+                cli.agendar_turno()
+        
+        self.assertIn("Había un horario libre. Turno agendado:", salida.getvalue())
+        turno = cli.clinica.obtener_turnos_medico("MED001")[0]
+        self.assertEqual(turno.obtener_paciente().obtener_dni(), "11223344")
+        self.assertEqual(turno.obtener_fecha_hora(), datetime(2025, 6, 16, 8, 0))
+
+
+class TestCLIDuraciones(unittest.TestCase):
+    """Tests para las duraciones pedidas en el menú"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.cli = CLI()
+        self.cli.clinica.agregar_medico(Medico("Dra. Martínez", "MED001"))
+    
+    def agregar_especialidad(self, tipo, duracion):
+        salida = io.StringIO()
+        with patch("builtins.input", side_effect=["MED001", tipo, "lunes", duracion]), redirect_stdout(salida):
+            self.cli.agregar_especialidad()
+        return salida.getvalue()
+    
+    def test_vacia_usa_la_predeterminada(self):
+        """Test: Sin duración la especialidad usa la predeterminada; con una duración, esa"""
+        self.agregar_especialidad("Pediatría", "")
+        self.agregar_especialidad("Cardiología", "45")
+        
+        medico = self.cli.clinica.obtener_medico_por_matricula("MED001")
+        self.assertEqual(medico.obtener_duracion_especialidad("Pediatría"), timedelta(minutes=30))
+        self.assertEqual(medico.obtener_duracion_especialidad("Cardiología"), timedelta(minutes=45))
+    
+    def test_cero_o_negativa_se_rechaza(self):
+        """Test: Una duración de cero o menos minutos se rechaza en lugar de tomar la predeterminada"""
+        for duracion in ("0", "-15"):
+            self.assertIn("al menos un minuto", self.agregar_especialidad("Pediatría", duracion))
+        self.assertEqual(self.cli.clinica.obtener_medico_por_matricula("MED001").obtener_especialidades(), [])
+
+
+class TestCLIPaginacion(unittest.TestCase):
+    """Tests para los listados paginados del menú"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.cli = CLI(tamano_pagina=3)
+        for i in range(8):
+            self.cli.clinica.agregar_paciente(Paciente(f"Paciente {i}", str(1000 + i), "01/01/1990"))
+    
+    def listar(self, *respuestas):
+        salida = io.StringIO()
+        with patch("builtins.input", side_effect=list(respuestas)), redirect_stdout(salida):
+            self.cli.ver_pacientes()
+        return salida.getvalue()
+    
+    def test_navegar_paginas(self):
+        """Test: Se muestra una página por vez y se navega con siguiente, anterior y número"""
+        texto = self.listar("", "s", "3", "a", "")
+        
+        self.assertIn("Total de pacientes: 8 (página 1 de 3)", texto)
+        self.assertIn("Total de pacientes: 8 (página 3 de 3)", texto)
+        self.assertEqual(texto.count("(página 2 de 3)"), 2)
+        self.assertIn("7. Paciente: Paciente 6", texto)
+        self.assertEqual(texto.count("1. Paciente: Paciente 0"), 1)
+    
+    def test_filtro_por_prefijo(self):
+        """Test: El prefijo filtra por DNI y una sola página no pide navegación"""
+        texto = self.listar("1007")
+        
+        self.assertIn("Total de pacientes: 1\n", texto)
+        self.assertIn("1. Paciente: Paciente 7 (DNI: 1007)", texto)
+        self.assertIn("Ningún paciente coincide.", self.listar("xyz"))
+    
+    def test_buscar_por_nombre(self):
+        """Test: La búsqueda por nombre tolera errores y muestra como mucho una página"""
+        self.cli.clinica.agregar_paciente(Paciente("Lucía Fernández", "2000", "01/01/1990"))
+        salida = io.StringIO()
+        with patch("builtins.input", side_effect=["fernandes"]), redirect_stdout(salida):
+            self.cli.buscar_pacientes()
+        self.assertIn("1. Paciente: Lucía Fernández (DNI: 2000)", salida.getvalue())
+        
+        salida = io.StringIO()
+        with patch("builtins.input", side_effect=["paciente"]), redirect_stdout(salida):
+            self.cli.buscar_pacientes()
+        self.assertIn("3. Paciente: Paciente 2", salida.getvalue())
+        self.assertNotIn("4. ", salida.getvalue())
+    
+    def test_tamano_pagina_invalido(self):
+        """Test: El tamaño de página debe ser positivo"""
+        with self.assertRaises(ValueError):
+            CLI(tamano_pagina=0)
+
+
+class TestCLIRecetas(unittest.TestCase):
+    """Tests para las consultas de recetas por medicamento del menú"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.cli = CLI()
+        with redirect_stdout(io.StringIO()):
+            self.cli.ejecutar_lote(io.StringIO('agregar_paciente "Juan Pérez" 12345678 15/03/1990\n'
+                                               'agregar_paciente "Ana López" 11223344 25/12/1992\n'
+                                               'agregar_medico "Dra. Martínez" MED001\n'
+                                               'emitir_receta 12345678 MED001 "Ibuprofeno, Amoxicilina"\n'
+                                               "emitir_receta 11223344 MED001 ibuprofeno\n"), io.StringIO())
+    
+    def consultar(self, accion, *respuestas):
+        salida = io.StringIO()
+        with patch("builtins.input", side_effect=list(respuestas)), redirect_stdout(salida):
+            accion()
+        return salida.getvalue()
+    
+    def test_buscar_por_medicamento(self):
+        """Test: Se listan las recetas del medicamento sin distinguir mayúsculas"""
+        texto = self.consultar(self.cli.buscar_recetas_por_medicamento, "IBUPROFENO", "", "")
+        
+        self.assertIn("Recetas con IBUPROFENO (2):", texto)
+        self.assertIn("Juan Pérez", texto)
+        self.assertIn("Ana López", texto)
+        self.assertIn("No hay recetas con Paracetamol.",
+                      self.consultar(self.cli.buscar_recetas_por_medicamento, "Paracetamol", "", ""))
+    
+    def test_mas_recetados(self):
+        """Test: El ranking muestra los medicamentos de mayor a menor y rechaza médicos inexistentes"""
+        texto = self.consultar(self.cli.ver_medicamentos_mas_recetados, "MED001", "", "")
+        
+        self.assertIn("1. Ibuprofeno: 2 recetas", texto)
+        self.assertIn("2. Amoxicilina: 1 receta\n", texto)
+        self.assertIn("No existe médico", self.consultar(self.cli.ver_medicamentos_mas_recetados, "MED999", "", ""))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,199 @@
+
+
+import unittest
+from datetime import datetime, timedelta, time
+import sys
+import os
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+from modeloexcepciones import (
+    TurnoOcupadoException,
+    MedicoNoEncontradoException,
+    PacienteNoEncontradoException,
+    MedicoNoDisponibleException,
+    EspecialidadNoValidaException
+)
+
+
+class TestClinica(unittest.TestCase):
+    """Tests para la clase Clinica"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        self.clinica.agregar_paciente(Paciente("María García", "87654321", "22/07/1985"))
+        medico = Medico("Dra. Martínez", "MED001")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes", "miércoles"]))
+        self.clinica.agregar_medico(medico)
+        otro_medico = Medico("Dr. Gómez", "MED002")
+        otro_medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.clinica.agregar_medico(otro_medico)
+        self.lunes = datetime(2025, 6, 16, 10, 0)
+    
+    def test_turno_ocupado_mismo_medico_y_horario(self):
+        """Test: No se puede agendar dos turnos con el mismo médico en el mismo horario"""
+        self.clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes)
+        
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MED001", "Pediatría", self.lunes)
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+    
+    def test_mismo_horario_con_otro_medico(self):
+        """Test: El mismo horario está libre para otro médico"""
+        self.clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes)
+        self.clinica.agendar_turno("87654321", "MED002", "Pediatría", self.lunes)
+        
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+    
+    def test_validar_turno_no_duplicado(self):
+        """Test: La validación de duplicados usa los turnos ya registrados"""
+        self.clinica.validar_turno_no_duplicado("MED001", self.lunes)
+        self.clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes)
+        
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.validar_turno_no_duplicado("MED001", self.lunes)
+        self.clinica.validar_turno_no_duplicado("MED001", datetime(2025, 6, 16, 10, 30))
+    
+    def test_obtener_turnos_medico_ordenados_y_por_rango(self):
+        """Test: La agenda de un médico se devuelve ordenada y filtrada por rango"""
+        tarde = datetime(2025, 6, 16, 15, 0)
+        miercoles = datetime(2025, 6, 18, 9, 0)
+        self.clinica.agendar_turno("12345678", "MED001", "Pediatría", miercoles)
+        self.clinica.agendar_turno("87654321", "MED001", "Pediatría", tarde)
+        self.clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes)
+        self.clinica.agendar_turno("87654321", "MED002", "Pediatría", self.lunes)
+        
+        fechas = [t.obtener_fecha_hora() for t in self.clinica.obtener_turnos_medico("MED001")]
+        self.assertEqual(fechas, [self.lunes, tarde, miercoles])
+        
+        del_lunes = self.clinica.obtener_turnos_medico(
+            "MED001", datetime(2025, 6, 16), datetime(2025, 6, 17))
+        self.assertEqual([t.obtener_fecha_hora() for t in del_lunes], [self.lunes, tarde])
+        
+        desde_la_tarde = self.clinica.obtener_turnos_medico("MED001", desde=tarde)
+        self.assertEqual(len(desde_la_tarde), 2)
+    
+    def test_obtener_turnos_medico_inexistente(self):
+        """Test: Consultar la agenda de un médico no registrado lanza excepción"""
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.obtener_turnos_medico("MED999")
+    
+    def test_agendar_turnos_en_lote(self):
+        """Test: El lote agenda las filas válidas y reporta el error de cada fila inválida"""
+        martes = datetime(2025, 6, 17, 10, 0)
+        self.clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes)
+        lote = [
+            ("87654321", "MED001", "Pediatría", datetime(2025, 6, 16, 11, 0)),
+            ("87654321", "MED001", "Pediatría", self.lunes),
+            ("00000000", "MED001", "Pediatría", datetime(2025, 6, 16, 12, 0)),
+            ("12345678", "MED999", "Pediatría", self.lunes),
+            ("12345678", "MED001", "Pediatría", martes),
+            ("12345678", "MED001", "Cardiología", datetime(2025, 6, 16, 12, 0)),
+            ("12345678", "MED002", "pediatría", self.lunes),
+            ("87654321", "MED002", "Pediatría", self.lunes),
+            ("incompleta",),
+        ]
+        
+        resultados = self.clinica.agendar_turnos(lote)
+        
+        self.assertEqual(len(resultados), len(lote))
+        self.assertIsNone(resultados[0])
+        self.assertIsInstance(resultados[1], TurnoOcupadoException)
+        self.assertIsInstance(resultados[2], PacienteNoEncontradoException)
+        self.assertIsInstance(resultados[3], MedicoNoEncontradoException)
+        self.assertIsInstance(resultados[4], MedicoNoDisponibleException)
+        self.assertIsInstance(resultados[5], EspecialidadNoValidaException)
+        self.assertIsNone(resultados[6])
+        self.assertIsInstance(resultados[7], TurnoOcupadoException)
+        self.assertIsInstance(resultados[8], ValueError)
+        
+        self.assertEqual(len(self.clinica.obtener_turnos()), 3)
+        self.assertEqual(len(self.clinica.obtener_turnos_medico("MED001")), 2)
+        self.assertEqual(len(self.clinica.obtener_historia_clinica("87654321").obtener_turnos()), 1)
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("87654321", "MED002", "Pediatría", self.lunes)
+    
+    def test_agendar_turnos_lote_grande_mantiene_agenda_ordenada(self):
+        """Test: Un lote grande deja la agenda del médico en orden cronológico"""
+        self.clinica.agendar_turno("12345678", "MED001", "Pediatría", datetime(2025, 6, 16, 12, 0),
+                                   timedelta(minutes=15))
+        lote = [("87654321", "MED001", "Pediatría", datetime(2025, 6, 16, 21 - i // 4, 15 * (i % 4)),
+                 timedelta(minutes=15))
+                for i in range(40)]
+        
+        resultados = self.clinica.agendar_turnos(lote)
+        
+        self.assertEqual(sum(1 for r in resultados if r is not None), 1)
+        fechas = [t.obtener_fecha_hora() for t in self.clinica.obtener_turnos_medico("MED001")]
+        self.assertEqual(len(fechas), 40)
+        self.assertEqual(fechas, sorted(fechas))
+    
+    def test_buscar_turnos_disponibles(self):
+        """Test: La búsqueda devuelve los primeros horarios libres entre todos los médicos"""
+        ocho = datetime(2025, 6, 16, 8, 0)
+        self.clinica.agendar_turno("12345678", "MED001", "Pediatría", ocho)
+        self.clinica.agendar_turno("87654321", "MED002", "Pediatría", ocho)
+        self.clinica.agendar_turno("87654321", "MED002", "Pediatría", datetime(2025, 6, 16, 8, 30))
+        
+        libres = self.clinica.buscar_turnos_disponibles(
+            "pediatría", datetime(2025, 6, 16, 7, 0), timedelta(minutes=30), cantidad=3)
+        
+        self.assertEqual([(f, m.obtener_matricula()) for f, m in libres], [
+            (datetime(2025, 6, 16, 8, 30), "MED001"),
+            (datetime(2025, 6, 16, 9, 0), "MED001"),
+            (datetime(2025, 6, 16, 9, 0), "MED002"),
+        ])
+        for fecha, medico in libres:
+            self.clinica.agendar_turno("12345678", medico.obtener_matricula(), "Pediatría", fecha)
+    
+    def test_buscar_turnos_disponibles_salta_dias_sin_atencion(self):
+        """Test: La búsqueda continúa en el próximo día en que se atiende la especialidad"""
+        libres = self.clinica.buscar_turnos_disponibles(
+            "Pediatría", datetime(2025, 6, 16, 17, 45), timedelta(minutes=30), cantidad=1,
+            hora_inicio=time(9, 0), hora_fin=time(12, 0))
+        
+        self.assertEqual(len(libres), 1)
+        self.assertEqual(libres[0][0], datetime(2025, 6, 18, 9, 0))
+        self.assertEqual(libres[0][1].obtener_matricula(), "MED001")
+    
+    def test_buscar_turnos_disponibles_especialidad_inexistente(self):
+        """Test: Buscar una especialidad que nadie atiende lanza excepción"""
+        with self.assertRaises(EspecialidadNoValidaException):
+            self.clinica.buscar_turnos_disponibles("Cardiología", self.lunes, timedelta(minutes=30))
+        with self.assertRaises(ValueError):
+            self.clinica.buscar_turnos_disponibles("Pediatría", self.lunes, timedelta(0))
+    
+    def test_agregar_especialidad_actualiza_busqueda(self):
+        """Test: Una especialidad agregada desde la clínica queda disponible para la búsqueda"""
+        self.clinica.agregar_especialidad("MED002", Especialidad("Cardiología", ["martes"]))
+        
+        libres = self.clinica.buscar_turnos_disponibles("Cardiología", self.lunes, timedelta(hours=1))
+        
+        self.assertEqual(libres[0][0], datetime(2025, 6, 17, 8, 0))
+        self.assertEqual(libres[0][1].obtener_matricula(), "MED002")
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.agregar_especialidad("MED999", Especialidad("Cardiología", ["martes"]))
+        with self.assertRaises(ValueError):
+            self.clinica.agregar_especialidad("MED002", Especialidad("Cardiología", ["jueves"]))
+    
+    def test_contar_turnos(self):
+        """Test: Contar turnos por médico y por rango de fechas"""
+        self.clinica.agendar_turnos([("12345678", "MED001", "Pediatría", self.lunes),
+                                     ("87654321", "MED002", "Pediatría", self.lunes),
+                                     ("12345678", "MED001", "Pediatría", self.lunes + timedelta(days=2))])
+        
+        self.assertEqual(self.clinica.contar_turnos(), 3)
+        self.assertEqual(self.clinica.contar_turnos("MED001"), 2)
+        self.assertEqual(self.clinica.contar_turnos(desde=self.lunes + timedelta(hours=1)), 1)
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.contar_turnos("MED999")
+
+if __name__ == '__main__':
+    unittest.main()
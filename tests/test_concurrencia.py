@@ -0,0 +1,134 @@
+import unittest
+from datetime import datetime, timedelta
+import sys
+import os
+import threading
+import time
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelorepositorio import RepositorioMemoria
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+from modeloexcepciones import TurnoOcupadoException, PacienteDuplicadoException
+
+
+class RepositorioLento(RepositorioMemoria):
+    """Repositorio que cede el procesador después de cada verificación para agrandar las carreras"""
+    
+    def existe_turno(self, matricula, fecha_hora):
+        existe = super().existe_turno(matricula, fecha_hora)
+        time.sleep(0)
+        return existe
+    
+    def existe_superposicion(self, matricula, inicio, fin, excluir=None):
+        existe = super().existe_superposicion(matricula, inicio, fin, excluir)
+        time.sleep(0)
+        return existe
+    
+    def obtener_paciente(self, dni):
+        paciente = super().obtener_paciente(dni)
+        time.sleep(0)
+        return paciente
+
+
+class TestConcurrencia(unittest.TestCase):
+    """Tests de estrés para la clínica compartida entre hilos"""
+    
+    HILOS = 16
+    MEDICOS = 4
+    HORARIOS = 50
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.clinica = Clinica(repositorio=RepositorioLento(), concurrente=True)
+        for i in range(self.HILOS):
+            self.clinica.agregar_paciente(Paciente(f"Paciente {i}", f"DNI{i}", "01/01/1990"))
+        for i in range(self.MEDICOS):
+            medico = Medico(f"Médico {i}", f"MED{i}")
+            medico.agregar_especialidad(Especialidad("Clínica", ["lunes"], timedelta(minutes=10)))
+            self.clinica.agregar_medico(medico)
+        lunes = datetime(2025, 6, 16, 8, 0)
+        self.horarios = [lunes + timedelta(minutes=10 * i) for i in range(self.HORARIOS)]
+        # Cambios de hilo mucho más frecuentes para forzar intercalados
+        self.intervalo_original = sys.getswitchinterval()
+        sys.setswitchinterval(1e-5)
+    
+    def tearDown(self):
+        sys.setswitchinterval(self.intervalo_original)
+    
+    def ejecutar_en_hilos(self, objetivo):
+        """Lanza HILOS hilos que arrancan juntos y espera a que terminen"""
+        barrera = threading.Barrier(self.HILOS)
+        
+        def correr(numero):
+            barrera.wait()
+            objetivo(numero)
+        
+        hilos = [threading.Thread(target=correr, args=(i,)) for i in range(self.HILOS)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+    
+    def verificar_sin_turnos_dobles(self):
+        """Cada horario de cada médico quedó ocupado exactamente una vez"""
+        turnos = self.clinica.obtener_turnos()
+        claves = [(t.obtener_medico().obtener_matricula(), t.obtener_fecha_hora()) for t in turnos]
+        self.assertEqual(len(claves), len(set(claves)))
+        self.assertEqual(len(claves), self.MEDICOS * self.HORARIOS)
+        for i in range(self.MEDICOS):
+            self.assertEqual(len(self.clinica.obtener_turnos_medico(f"MED{i}")), self.HORARIOS)
+    
+    def test_agendar_turno_sin_turnos_dobles(self):
+        """Test: Muchos hilos compiten por los mismos horarios y cada uno se otorga una sola vez"""
+        ocupados = []
+        
+        def agendar(numero):
+            for fecha_hora in self.horarios:
+                for i in range(self.MEDICOS):
+                    try:
+                        self.clinica.agendar_turno(f"DNI{numero}", f"MED{i}", "Clínica", fecha_hora)
+                    except TurnoOcupadoException:
+                        ocupados.append(1)
+        
+        self.ejecutar_en_hilos(agendar)
+        
+        self.verificar_sin_turnos_dobles()
+        self.assertEqual(len(ocupados), (self.HILOS - 1) * self.MEDICOS * self.HORARIOS)
+    
+    def test_agendar_turnos_en_lote_sin_turnos_dobles(self):
+        """Test: Lotes concurrentes de distintos médicos no se pisan"""
+        resultados = []
+        
+        def agendar(numero):
+            lote = [(f"DNI{numero}", f"MED{(numero + j) % self.MEDICOS}", "Clínica", fecha_hora)
+                    for j in range(2) for fecha_hora in self.horarios]
+            resultados.extend(self.clinica.agendar_turnos(lote))
+        
+        self.ejecutar_en_hilos(agendar)
+        
+        self.verificar_sin_turnos_dobles()
+        self.assertEqual(sum(r is None for r in resultados), self.MEDICOS * self.HORARIOS)
+    
+    def test_alta_de_pacientes_sin_duplicados(self):
+        """Test: Un mismo paciente dado de alta desde varios hilos se registra una sola vez"""
+        duplicados = []
+        
+        def agregar(numero):
+            try:
+                self.clinica.agregar_paciente(Paciente("Nuevo", "99999999", "01/01/2000"))
+            except PacienteDuplicadoException:
+                duplicados.append(numero)
+        
+        self.ejecutar_en_hilos(agregar)
+        
+        self.assertEqual(len(duplicados), self.HILOS - 1)
+        self.assertEqual(len(self.clinica.obtener_pacientes()), self.HILOS + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,227 @@
+import unittest
+from datetime import datetime, timedelta
+import sqlite3
+import sys
+import os
+import tempfile
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from tests.repositorios import casos_por_repositorio
+from modelorepositoriosqlite import RepositorioSQLite
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad, DURACION_PREDETERMINADA
+from modeloexcepciones import TurnoOcupadoException
+
+
+MINUTOS_45 = timedelta(minutes=45)
+
+
+class DuracionesBase:
+    """Tests de turnos con duración y superposición, comunes a todos los repositorios"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.clinica = Clinica(repositorio=self.crear_repositorio())
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        medico = Medico("Dra. Martínez", "MED001")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        medico.agregar_especialidad(Especialidad("Cardiología", ["martes"], MINUTOS_45))
+        self.clinica.agregar_medico(medico)
+        self.lunes = datetime(2025, 6, 16, 10, 0)
+        self.martes = datetime(2025, 6, 17, 10, 0)
+    
+    def tearDown(self):
+        self.clinica.cerrar()
+    
+    def agendar(self, fecha_hora, especialidad="Pediatría", duracion=None):
+        self.clinica.agendar_turno("12345678", "MED001", especialidad, fecha_hora, duracion)
+    
+    def fechas(self):
+        return [turno.obtener_fecha_hora() for turno in self.clinica.obtener_turnos_medico("MED001")]
+    
+    def test_superposicion_con_la_duracion_predeterminada(self):
+        """Test: Un turno de 30 minutos bloquea los horarios que lo pisan, no los contiguos"""
+        self.agendar(self.lunes)
+        for minutos in (-15, 15, 29):
+            with self.assertRaises(TurnoOcupadoException):
+                self.agendar(self.lunes + timedelta(minutes=minutos))
+        
+        self.agendar(self.lunes - timedelta(minutes=30))
+        self.agendar(self.lunes + timedelta(minutes=30))
+        self.assertEqual(len(self.fechas()), 3)
+    
+    def test_duracion_de_la_especialidad(self):
+        """Test: Sin duración, el turno dura lo que indica la especialidad del médico"""
+        self.agendar(self.martes, "Cardiología")
+        
+        self.assertEqual(self.clinica.obtener_turnos_medico("MED001")[0].obtener_duracion(), MINUTOS_45)
+        with self.assertRaises(TurnoOcupadoException):
+            self.agendar(self.martes + timedelta(minutes=30), "Cardiología")
+        self.agendar(self.martes + MINUTOS_45, "Cardiología")
+    
+    def test_duracion_por_turno(self):
+        """Test: La duración indicada al agendar reemplaza a la de la especialidad y se valida"""
+        self.agendar(self.lunes, duracion=timedelta(minutes=90))
+        with self.assertRaises(TurnoOcupadoException):
+            self.agendar(self.lunes + timedelta(hours=1))
+        self.agendar(self.lunes + timedelta(minutes=90))
+        
+        for invalida in (timedelta(0), timedelta(seconds=90), timedelta(hours=25)):
+            with self.assertRaises(ValueError):
+                self.agendar(self.lunes + timedelta(hours=5), duracion=invalida)
+    
+    def test_turno_que_termina_despues_de_la_ultima_fecha(self):
+        """Test: Un turno que terminaría después de datetime.max se rechaza con ValueError, no con un desborde"""
+        ultimo = datetime(9999, 12, 31, 23, 50)
+        with self.assertRaises(ValueError):
+            self.agendar(ultimo)
+        resultados = self.clinica.agendar_turnos([("12345678", "MED001", "Pediatría", ultimo)])
+        self.assertIsInstance(resultados[0], ValueError)
+        self.agendar(self.lunes)
+        with self.assertRaises(ValueError):
+            self.clinica.reprogramar_turno("MED001", self.lunes, ultimo)
+        self.assertEqual(self.fechas(), [self.lunes])
+    
+    def test_superposicion_entre_dias(self):
+        """Test: Un turno que pasa la medianoche bloquea el comienzo del día siguiente"""
+        self.agendar(self.lunes.replace(hour=23, minute=30), duracion=timedelta(hours=1))
+        with self.assertRaises(TurnoOcupadoException):
+            self.agendar(self.martes.replace(hour=0, minute=15), "Cardiología")
+        self.agendar(self.martes.replace(hour=0, minute=30), "Cardiología")
+    
+    def test_reprogramar_puede_pisar_su_propio_horario(self):
+        """Test: El turno reprogramado solo choca con los demás y conserva su duración"""
+        self.agendar(self.lunes, duracion=MINUTOS_45)
+        self.agendar(self.lunes + timedelta(hours=1))
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.reprogramar_turno("MED001", self.lunes, self.lunes + timedelta(minutes=30))
+        
+        turno = self.clinica.reprogramar_turno("MED001", self.lunes, self.lunes + timedelta(minutes=15))
+        self.assertEqual(turno.obtener_duracion(), MINUTOS_45)
+        self.assertEqual(self.fechas(), [self.lunes + timedelta(minutes=15), self.lunes + timedelta(hours=1)])
+    
+    def test_lote_con_turnos_superpuestos(self):
+        """Test: El lote rechaza los turnos que pisan a otros del lote o de la agenda"""
+        self.agendar(self.lunes + timedelta(hours=2))
+        lote = [
+            ("12345678", "MED001", "Pediatría", self.lunes),
+            ("12345678", "MED001", "Pediatría", self.lunes + timedelta(minutes=20)),
+            ("12345678", "MED001", "Pediatría", self.lunes + timedelta(minutes=30), timedelta(minutes=15)),
+            ("12345678", "MED001", "Pediatría", self.lunes + timedelta(minutes=40)),
+            ("12345678", "MED001", "Pediatría", self.lunes + timedelta(minutes=45), timedelta(hours=2)),
+            ("12345678", "MED001", "Pediatría", self.lunes + timedelta(minutes=45), timedelta(seconds=1)),
+            ("12345678", "MED001", "Pediatría", self.lunes + timedelta(minutes=45), MINUTOS_45, "extra"),
+            ("12345678", "MED001", "Pediatría", self.lunes + timedelta(minutes=45), MINUTOS_45),
+        ]
+        
+        resultados = self.clinica.agendar_turnos(lote)
+        
+        self.assertEqual([type(r).__name__ for r in resultados], [
+            "NoneType", "TurnoOcupadoException", "NoneType", "TurnoOcupadoException",
+            "TurnoOcupadoException", "ValueError", "ValueError", "NoneType"])
+        self.assertEqual(len(self.fechas()), 4)
+    
+    def test_turnos_disponibles_respetan_las_duraciones(self):
+        """Test: Un horario no se ofrece si algún turno lo pisa aunque empiece antes"""
+        self.agendar(self.lunes.replace(hour=8), duracion=timedelta(minutes=90))
+        self.agendar(self.lunes.replace(hour=10, minute=15))
+        
+        libres = self.clinica.buscar_turnos_disponibles(
+            "Pediatría", self.lunes.replace(hour=7), timedelta(minutes=30), cantidad=3)
+        
+        self.assertEqual([fecha for fecha, _ in libres], [
+            self.lunes.replace(hour=9, minute=30), self.lunes.replace(hour=11), self.lunes.replace(hour=11, minute=30)])
+
+
+globals().update(casos_por_repositorio(DuracionesBase))
+
+
+class TestDuracionesPersistencia(unittest.TestCase):
+    """Tests de las duraciones en la bitácora, la instantánea y bases anteriores"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.bitacora = os.path.join(self.directorio.name, "clinica.log")
+        self.instantanea = os.path.join(self.directorio.name, "clinica.snap")
+        self.lunes = datetime(2025, 6, 16, 10, 0)
+    
+    def tearDown(self):
+        self.directorio.cleanup()
+    
+    def cargar(self, clinica):
+        clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        medico = Medico("Dra. Martínez", "MED001")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"], MINUTOS_45))
+        clinica.agregar_medico(medico)
+        clinica.agregar_especialidad("MED001", Especialidad("Cardiología", ["martes"], timedelta(minutes=20)))
+        clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes)
+        clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes + timedelta(hours=1),
+                              timedelta(minutes=90))
+        clinica.agendar_turno("12345678", "MED001", "Cardiología", self.lunes + timedelta(days=1))
+        clinica.reprogramar_turno("MED001", self.lunes, self.lunes + timedelta(hours=3))
+    
+    def resumen(self, clinica):
+        medico = clinica.obtener_medico_por_matricula("MED001")
+        return ([(t.obtener_fecha_hora(), t.obtener_duracion()) for t in clinica.obtener_turnos()],
+                [str(esp) for esp in medico.obtener_especialidades()])
+    
+    def test_bitacora(self):
+        """Test: Al reproducir la bitácora cada turno y especialidad recupera su duración"""
+        clinica = Clinica.desde_bitacora(self.bitacora, fsync_cada=0)
+        self.cargar(clinica)
+        esperado = self.resumen(clinica)
+        clinica.cerrar()
+        
+        recuperada = Clinica.desde_bitacora(self.bitacora)
+        self.assertEqual(self.resumen(recuperada), esperado)
+        self.assertIn("turnos de 45 min", esperado[1][0])
+        recuperada.cerrar()
+    
+    def test_instantanea(self):
+        """Test: La instantánea guarda las duraciones de turnos y especialidades"""
+        clinica = Clinica.desde_bitacora(self.bitacora, fsync_cada=0)
+        self.cargar(clinica)
+        clinica.guardar_instantanea(self.instantanea)
+        esperado = self.resumen(clinica)
+        clinica.cerrar()
+        
+        recuperada = Clinica.recuperar(self.instantanea, self.bitacora)
+        self.assertEqual(self.resumen(recuperada), esperado)
+        with self.assertRaises(TurnoOcupadoException):
+            recuperada.agendar_turno("12345678", "MED001", "Pediatría", self.lunes + timedelta(hours=2))
+        recuperada.cerrar()
+    
+    def test_base_sqlite_sin_duraciones(self):
+        """Test: Una base creada antes de las duraciones se migra y sus turnos duran lo predeterminado"""
+        ruta = os.path.join(self.directorio.name, "anterior.db")
+        conexion = sqlite3.connect(ruta)
+        conexion.executescript("""
+            CREATE TABLE especialidades (matricula TEXT NOT NULL, tipo TEXT NOT NULL,
+                mascara_dias INTEGER NOT NULL, PRIMARY KEY (matricula, tipo));
+            CREATE TABLE turnos (id INTEGER PRIMARY KEY, dni TEXT NOT NULL, matricula TEXT NOT NULL,
+                especialidad TEXT NOT NULL, fecha_hora TEXT NOT NULL);
+            INSERT INTO especialidades VALUES ('MED001', 'Pediatría', 1);
+            INSERT INTO turnos (dni, matricula, especialidad, fecha_hora)
+                VALUES ('12345678', 'MED001', 'Pediatría', '2025-06-16T10:00:00.000000');
+            CREATE TABLE medicos (matricula TEXT PRIMARY KEY, nombre TEXT NOT NULL);
+            CREATE TABLE pacientes (dni TEXT PRIMARY KEY, nombre TEXT NOT NULL, fecha_nacimiento TEXT NOT NULL);
+            INSERT INTO medicos VALUES ('MED001', 'Dra. Martínez');
+            INSERT INTO pacientes VALUES ('12345678', 'Juan Pérez', '15/03/1990');
+        """)
+        conexion.close()
+        
+        clinica = Clinica(repositorio=RepositorioSQLite(ruta))
+        self.assertEqual(clinica.obtener_turnos()[0].obtener_duracion(), DURACION_PREDETERMINADA)
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes + timedelta(minutes=15))
+        clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes + timedelta(minutes=30))
+        clinica.cerrar()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -67,6 +67,23 @@ class TestEspecialidad(unittest.TestCase):
         self.assertTrue(especialidad.verificar_dia("lunes"))
         self.assertTrue(especialidad.verificar_dia("miércoles"))
         self.assertTrue(especialidad.verificar_dia("viernes"))
+    
+    def test_dias_con_y_sin_tilde(self):
+        """Test: Los días con tilde se reconocen también escritos sin tilde"""
+        especialidad = Especialidad("Pediatría", ["Miercoles", "sábado"])
+        
+        self.assertTrue(especialidad.verificar_dia("miércoles"))
+        self.assertTrue(especialidad.verificar_dia("miercoles"))
+        self.assertTrue(especialidad.verificar_dia("SABADO"))
+        self.assertFalse(especialidad.verificar_dia("domingo"))
+        self.assertFalse(especialidad.verificar_dia("día_inventado"))
+    
+    def test_mascara_y_dias_en_orden_semanal(self):
+        """Test: Los días se guardan como máscara de bits y se listan en orden semanal"""
+        especialidad = Especialidad("Pediatría", ["viernes", "lunes", "lunes"])
+        
+        self.assertEqual(especialidad.obtener_mascara_dias(), 0b10001)
+        self.assertEqual(especialidad.obtener_dias(), ["lunes", "viernes"])
 
 
 if __name__ == '__main__':
@@ -1,6 +1,7 @@
 
 
 import unittest
+import io
 from datetime import datetime
 import sys
 import os
@@ -58,6 +59,24 @@ class TestHistoriaClinica(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.historia.agregar_turno(None)
     
+    def test_quitar_y_reemplazar_turnos(self):
+        """Test: Quitar y reemplazar turnos conserva el orden del resto, también al compactar"""
+        turnos = [Turno(self.paciente, self.medico, self.fecha_hora.replace(hour=h), "Pediatría") for h in range(8, 13)]
+        for turno in turnos:
+            self.historia.agregar_turno(turno)
+        nuevo = Turno(self.paciente, self.medico, self.fecha_hora.replace(hour=17), "Pediatría")
+        
+        self.historia.quitar_turno(turnos[1])
+        self.historia.reemplazar_turno(turnos[3], nuevo)
+        self.assertEqual(list(self.historia.obtener_turnos()), [turnos[0], turnos[2], nuevo, turnos[4]])
+        self.assertIn("TURNOS (4):", str(self.historia))
+        
+        self.historia.quitar_turno(turnos[0])
+        self.historia.quitar_turno(nuevo)
+        self.assertEqual(list(self.historia.obtener_turnos()), [turnos[2], turnos[4]])
+        with self.assertRaises(ValueError):
+            self.historia.quitar_turno(turnos[3])
+    
     def test_agregar_receta_exitosa(self):
         """Test: Agregar receta a la historia clínica"""
         medicamentos = ["Paracetamol", "Ibuprofeno"]
@@ -74,6 +93,33 @@ class TestHistoriaClinica(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.historia.agregar_receta(None)
     
+    def test_iterar_lineas_paginado(self):
+        """Test: Turnos y recetas se paginan por separado y por rango de fechas"""
+        for dia in range(1, 11):
+            fecha = datetime(2025, 7, dia, 9, 0)
+            self.historia.agregar_turno(Turno(self.paciente, self.medico, fecha, "Pediatría"))
+            self.historia.agregar_receta(Receta(self.paciente, self.medico, [f"Med {dia}"], fecha))
+        
+        lineas = list(self.historia.iterar_lineas(inicio_turnos=2, limite_turnos=3, limite_recetas=0,
+                                                  desde=datetime(2025, 7, 3), hasta=datetime(2025, 7, 9)))
+        
+        self.assertIn("TURNOS (6):", lineas)
+        self.assertIn("RECETAS (6):", lineas)
+        numerados = [linea for linea in lineas if linea.startswith("  ") and ". " in linea]
+        self.assertEqual(len(numerados), 3)
+        self.assertTrue(numerados[0].startswith("  3. "))
+        self.assertIn("05/07/2025", numerados[0])
+    
+    def test_escribir_igual_a_str(self):
+        """Test: escribir en un archivo produce el mismo texto que str"""
+        self.historia.agregar_turno(Turno(self.paciente, self.medico, self.fecha_hora, "Pediatría"))
+        destino = io.StringIO()
+        
+        self.historia.escribir(destino)
+        
+        self.assertEqual(destino.getvalue(), str(self.historia))
+        self.assertIn("No hay recetas registradas.", destino.getvalue())
+    
     def test_multiples_turnos_y_recetas(self):
         """Test: Agregar múltiples turnos y recetas"""
         # Agregar turnos
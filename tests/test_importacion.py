@@ -0,0 +1,129 @@
+import unittest
+import io
+import json
+from datetime import datetime
+import sys
+import os
+import tempfile
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modeloimportacion import Importador
+from modelorepositoriocolumnar import RepositorioColumnar
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+from modelopaciente import Paciente
+from modeloexcepciones import PacienteDuplicadoException
+
+
+class TestImportacion(unittest.TestCase):
+    """Tests para la importación masiva desde CSV y JSONL"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.clinica = Clinica()
+        self.rechazos = io.StringIO()
+        self.avances = []
+        self.importador = Importador(self.clinica, self.rechazos, tamano_lote=2,
+                                     progreso=lambda *avance: self.avances.append(avance))
+    
+    def tearDown(self):
+        self.directorio.cleanup()
+    
+    def escribir(self, nombre, contenido):
+        """Crea un archivo de entrada y devuelve su ruta"""
+        ruta = os.path.join(self.directorio.name, nombre)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        return ruta
+    
+    def leer_rechazos(self):
+        return [json.loads(linea) for linea in self.rechazos.getvalue().splitlines()]
+    
+    def test_agregar_pacientes_en_lote(self):
+        """Test: El alta en lote rechaza DNI registrados o repetidos en el lote"""
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        resultados = self.clinica.agregar_pacientes([
+            Paciente("Ana López", "11223344", "25/12/1992"),
+            Paciente("Juan Pérez", "12345678", "15/03/1990"),
+            Paciente("Ana Gómez", "11223344", "01/01/1980"),
+        ])
+        self.assertIsNone(resultados[0])
+        self.assertIsInstance(resultados[1], PacienteDuplicadoException)
+        self.assertIsInstance(resultados[2], PacienteDuplicadoException)
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 2)
+    
+    def test_importar_csv_con_rechazos(self):
+        """Test: Los registros inválidos o duplicados van a rechazos sin detener la importación"""
+        ruta = self.escribir("pacientes.csv",
+                             "nombre,dni,fecha_nacimiento\n"
+                             "Juan Pérez,12345678,15/03/1990\n"
+                             "Sin DNI,,01/01/1990\n"
+                             "Ana López,11223344,25/12/1992\n"
+                             "Juan Otro,12345678,01/01/1980\n"
+                             "Luis Díaz,22334455,02/02/2000\n")
+        
+        self.assertEqual(self.importador.importar_pacientes(ruta), (3, 2))
+        self.assertEqual([p.obtener_dni() for p in self.clinica.obtener_pacientes()],
+                         ["12345678", "11223344", "22334455"])
+        rechazos = self.leer_rechazos()
+        self.assertEqual([r["linea"] for r in rechazos], [3, 5])
+        self.assertIn("dni", rechazos[0]["error"])
+        self.assertEqual(rechazos[1]["registro"]["nombre"], "Juan Otro")
+        # Un aviso de progreso por lote: (procesados, rechazados, segundos)
+        self.assertEqual([avance[:2] for avance in self.avances], [(2, 1), (4, 2), (5, 2)])
+    
+    def test_importar_medicos_y_turnos_jsonl(self):
+        """Test: Los médicos suman especialidades por fila y los turnos se validan como en agendar_turnos"""
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        medicos = self.escribir("medicos.jsonl", "\n".join([
+            json.dumps({"nombre": "Dra. Martínez", "matricula": "MED001", "especialidad": "Pediatría",
+                        "dias": ["lunes", "martes"]}),
+            json.dumps({"nombre": "Dra. Martínez", "matricula": "MED001", "especialidad": "Cardiología",
+                        "dias": "miércoles, jueves"}),
+            json.dumps({"nombre": "Dr. Gómez", "matricula": "MED002", "especialidad": "Clínica",
+                        "dias": ["feriado"]}),
+            "{no es json",
+            json.dumps({"nombre": "Dr. Ruiz", "matricula": "MED003"}),
+        ]) + "\n")
+        self.assertEqual(self.importador.importar_medicos(medicos), (3, 2))
+        medico = self.clinica.obtener_medico_por_matricula("MED001")
+        self.assertEqual([e.obtener_especialidad() for e in medico.obtener_especialidades()],
+                         ["Pediatría", "Cardiología"])
+        
+        turnos = self.escribir("turnos.csv",
+                               "dni,matricula,especialidad,fecha_hora\n"
+                               "12345678,MED001,Pediatría,2025-06-16T10:00\n"
+                               "12345678,MED001,Pediatría,2025-06-16T10:00\n"
+                               "12345678,MED001,Pediatría,16/06/2025 11:00\n"
+                               "99999999,MED001,Cardiología,2025-06-18T09:00\n")
+        self.assertEqual(self.importador.importar_turnos(turnos), (1, 3))
+        self.assertEqual(self.clinica.obtener_turnos()[0].obtener_fecha_hora(), datetime(2025, 6, 16, 10, 0))
+        self.assertEqual(len(self.leer_rechazos()), 5)
+    
+    def test_turno_con_segundos_va_a_rechazos(self):
+        """Test: Una fecha con segundos se rechaza sola, también con el repositorio columnar"""
+        clinica = Clinica(repositorio=RepositorioColumnar())
+        clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        medico = Medico("Dra. Martínez", "MED001")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        clinica.agregar_medico(medico)
+        turnos = self.escribir("turnos.jsonl", "\n".join(json.dumps(
+            {"dni": "12345678", "matricula": "MED001", "especialidad": "Pediatría", "fecha_hora": fecha})
+            for fecha in ("2025-06-16T08:00", "2025-06-16T09:00:30", "2025-06-16T10:00")) + "\n")
+        
+        self.assertEqual(Importador(clinica, self.rechazos, tamano_lote=10).importar_turnos(turnos), (2, 1))
+        self.assertEqual([r["linea"] for r in self.leer_rechazos()], [2])
+        self.assertEqual(len(clinica.obtener_turnos_medico("MED001")), 2)
+    
+    def test_formato_desconocido(self):
+        """Test: Solo se aceptan archivos CSV o JSONL"""
+        with self.assertRaises(ValueError):
+            self.importador.importar_pacientes(self.escribir("pacientes.xlsx", ""))
+
+
+if __name__ == '__main__':
+    unittest.main()
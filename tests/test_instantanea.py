@@ -0,0 +1,119 @@
+
+
+import unittest
+from datetime import datetime
+import sys
+import os
+import tempfile
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelobitacora import Bitacora
+from modeloinstantanea import Instantanea
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+from modeloexcepciones import TurnoOcupadoException
+
+
+class TestInstantanea(unittest.TestCase):
+    """Tests para las instantáneas binarias de la clínica"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.snap")
+        self.ruta_bitacora = os.path.join(self.directorio.name, "clinica.log")
+        self.clinica = Clinica()
+        self.clinica.agregar_paciente(Paciente("José Núñez", "12345678", "15/03/1990"))
+        self.clinica.agregar_paciente(Paciente("María García", "87654321", "22/07/1985"))
+        medico = Medico("Dra. Martínez", "MED001")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes", "miércoles"]))
+        self.clinica.agregar_medico(medico)
+        self.clinica.agregar_especialidad("MED001", Especialidad("Cardiología", ["martes"]))
+        self.clinica.agendar_turno("12345678", "MED001", "Pediatría", datetime(2025, 6, 16, 10, 0))
+        self.clinica.agendar_turno("87654321", "MED001", "Cardiología", datetime(2025, 6, 17, 9, 30))
+        self.clinica.emitir_receta("87654321", "MED001", ["Paracetamol", "Ibuprofeno"])
+    
+    def tearDown(self):
+        self.directorio.cleanup()
+    
+    def assertMismoEstado(self, clinica, original):
+        self.assertEqual([str(p) for p in clinica.obtener_pacientes()],
+                         [str(p) for p in original.obtener_pacientes()])
+        self.assertEqual([str(m) for m in clinica.obtener_medicos()],
+                         [str(m) for m in original.obtener_medicos()])
+        self.assertEqual([str(t) for t in clinica.obtener_turnos()],
+                         [str(t) for t in original.obtener_turnos()])
+        for paciente in original.obtener_pacientes():
+            dni = paciente.obtener_dni()
+            self.assertEqual(str(clinica.obtener_historia_clinica(dni)),
+                             str(original.obtener_historia_clinica(dni)))
+    
+    def test_guardar_y_recuperar(self):
+        """Test: Una clínica recuperada desde la instantánea tiene el mismo estado"""
+        self.clinica.guardar_instantanea(self.ruta)
+        
+        clinica = Clinica.recuperar(self.ruta)
+        
+        self.assertMismoEstado(clinica, self.clinica)
+        with self.assertRaises(TurnoOcupadoException):
+            clinica.agendar_turno("87654321", "MED001", "Pediatría", datetime(2025, 6, 16, 10, 0))
+    
+    def test_lectura_perezosa(self):
+        """Test: La instantánea permite leer entidades sueltas sin cargar todo"""
+        self.clinica.guardar_instantanea(self.ruta)
+        
+        with Instantanea(self.ruta) as instantanea:
+            self.assertEqual(instantanea.cantidad_pacientes(), 2)
+            self.assertEqual(instantanea.cantidad_turnos(), 2)
+            self.assertEqual(instantanea.cantidad_recetas(), 1)
+            self.assertEqual(instantanea.obtener_paciente(0).obtener_nombre(), "José Núñez")
+            self.assertIs(instantanea.obtener_paciente(0), instantanea.obtener_paciente(0))
+            turno = instantanea.obtener_turno(1)
+            self.assertEqual(turno.obtener_fecha_hora(), datetime(2025, 6, 17, 9, 30))
+            self.assertEqual(turno.obtener_especialidad(), "Cardiología")
+            receta = instantanea.obtener_receta(0)
+            self.assertEqual(receta.obtener_medicamentos(), ["Paracetamol", "Ibuprofeno"])
+            self.assertEqual(receta.obtener_medico().obtener_especialidad_para_dia("martes"), "Cardiología")
+    
+    def test_instantanea_mas_cola_de_bitacora(self):
+        """Test: Al recuperar se aplica solo la parte de la bitácora posterior a la instantánea"""
+        clinica = Clinica(Bitacora(self.ruta_bitacora))
+        clinica.agregar_paciente(Paciente("Ana López", "11223344", "25/12/1992"))
+        medico = Medico("Dr. Pérez", "MED002")
+        medico.agregar_especialidad(Especialidad("Clínica", ["lunes"]))
+        clinica.agregar_medico(medico)
+        clinica.guardar_instantanea(self.ruta)
+        clinica.agendar_turno("11223344", "MED002", "Clínica", datetime(2025, 6, 16, 8, 0))
+        clinica.cerrar()
+        
+        recuperada = Clinica.recuperar(self.ruta, self.ruta_bitacora)
+        recuperada.cerrar()
+        
+        self.assertMismoEstado(recuperada, clinica)
+    
+    def test_recuperar_sin_instantanea_usa_toda_la_bitacora(self):
+        """Test: Sin instantánea se reproduce la bitácora completa"""
+        clinica = Clinica(Bitacora(self.ruta_bitacora))
+        clinica.agregar_paciente(Paciente("Ana López", "11223344", "25/12/1992"))
+        clinica.cerrar()
+        
+        recuperada = Clinica.recuperar(self.ruta, self.ruta_bitacora)
+        recuperada.cerrar()
+        
+        self.assertEqual(len(recuperada.obtener_pacientes()), 1)
+    
+    def test_archivo_invalido(self):
+        """Test: Abrir un archivo que no es una instantánea lanza ValueError"""
+        with open(self.ruta, "wb") as archivo:
+            archivo.write(b"no es una instantanea" * 4)
+        
+        with self.assertRaises(ValueError):
+            Instantanea(self.ruta)
+
+
+if __name__ == '__main__':
+    unittest.main()
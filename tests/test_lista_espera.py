@@ -0,0 +1,176 @@
+import unittest
+from datetime import date, datetime, timedelta
+import sys
+import os
+import tempfile
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelolistaespera import ListaEspera, SolicitudEspera
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+from modeloexcepciones import PacienteNoEncontradoException, MedicoNoEncontradoException
+
+
+class TestListaEspera(unittest.TestCase):
+    """Tests para la lista de espera por sí sola"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.lista = ListaEspera()
+        self.lunes = date(2025, 6, 16)
+    
+    def test_orden_por_prioridad_y_llegada(self):
+        """Test: Sale primero la menor prioridad y, a igual prioridad, la que llegó antes"""
+        primera = SolicitudEspera("1", "Pediatría", self.lunes, self.lunes, prioridad=2)
+        urgente = SolicitudEspera("2", "Pediatría", self.lunes, self.lunes, prioridad=0)
+        segunda = SolicitudEspera("3", "pediatría", self.lunes, self.lunes, prioridad=2)
+        for solicitud in (primera, urgente, segunda):
+            self.lista.agregar(solicitud)
+        
+        self.assertEqual(self.lista.obtener_pendientes(), [urgente, primera, segunda])
+        extraidas = [self.lista.extraer("PEDIATRÍA", "MED001", self.lunes) for _ in range(4)]
+        self.assertEqual(extraidas, [urgente, primera, segunda, None])
+        self.assertEqual(len(self.lista), 0)
+    
+    def test_medico_y_dia(self):
+        """Test: Una solicitud solo sirve para su médico (si lo indicó) y los días de su rango"""
+        con_medico = SolicitudEspera("1", "Pediatría", self.lunes, self.lunes + timedelta(days=2), "MED002")
+        cualquiera = SolicitudEspera("2", "Pediatría", self.lunes + timedelta(days=1), self.lunes + timedelta(days=1))
+        self.lista.agregar(con_medico)
+        self.lista.agregar(cualquiera)
+        
+        self.assertIsNone(self.lista.extraer("Pediatría", "MED001", self.lunes))
+        self.assertIsNone(self.lista.extraer("Cardiología", "MED002", self.lunes))
+        self.assertIs(self.lista.extraer("Pediatría", "MED001", self.lunes + timedelta(days=1)), cualquiera)
+        self.assertEqual(self.lista.obtener_dias("Pediatría", "MED002"),
+                         [self.lunes + timedelta(days=i) for i in range(3)])
+        # Ya atendida, no vuelve a salir en los otros días de su rango
+        self.assertIs(self.lista.extraer("Pediatría", "MED002", self.lunes + timedelta(days=2)), con_medico)
+        self.assertIsNone(self.lista.extraer("Pediatría", "MED002", self.lunes))
+    
+    def test_quitar_y_devolver(self):
+        """Test: Una solicitud quitada no sale más y una devuelta conserva su lugar"""
+        primera = SolicitudEspera("1", "Pediatría", self.lunes, self.lunes + timedelta(days=1))
+        segunda = SolicitudEspera("2", "Pediatría", self.lunes, self.lunes + timedelta(days=1))
+        tercera = SolicitudEspera("3", "Pediatría", self.lunes, self.lunes)
+        for solicitud in (primera, segunda, tercera):
+            self.lista.agregar(solicitud)
+        
+        self.assertTrue(self.lista.quitar(segunda))
+        self.assertFalse(self.lista.quitar(segunda))
+        self.assertIs(self.lista.extraer("Pediatría", "MED001", self.lunes), primera)
+        self.lista.devolver(primera)
+        self.assertIs(self.lista.extraer("Pediatría", "MED001", self.lunes + timedelta(days=1)), primera)
+        self.assertIs(self.lista.extraer("Pediatría", "MED001", self.lunes), tercera)
+        self.assertIsNone(self.lista.extraer("Pediatría", "MED001", self.lunes + timedelta(days=1)))
+    
+    def test_rango_invalido(self):
+        """Test: El rango de días no puede terminar antes de empezar"""
+        with self.assertRaises(ValueError):
+            SolicitudEspera("1", "Pediatría", self.lunes, self.lunes - timedelta(days=1))
+
+
+class TestClinicaListaEspera(unittest.TestCase):
+    """Tests para la lista de espera integrada a la clínica"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.clinica = Clinica()
+        for i in range(4):
+            self.clinica.agregar_paciente(Paciente(f"Paciente {i}", str(1000 + i), "01/01/1990"))
+        for matricula in ("MED001", "MED002"):
+            medico = Medico(f"Médico {matricula}", matricula)
+            medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+            self.clinica.agregar_medico(medico)
+        self.lunes = datetime(2025, 6, 16, 8, 0)
+        # Ambas agendas del lunes completas (8 a 18, cada 30 minutos)
+        lote = [("1000", matricula, "Pediatría", self.lunes + timedelta(minutes=30 * i))
+                for matricula in ("MED001", "MED002") for i in range(20)]
+        self.assertTrue(all(r is None for r in self.clinica.agendar_turnos(lote)))
+    
+    def esperar(self, dni, matricula=None, prioridad=0, dias=0):
+        return self.clinica.agregar_a_lista_espera(dni, "Pediatría", self.lunes.date(),
+                                                   self.lunes.date() + timedelta(days=dias), matricula, prioridad)
+    
+    def test_cancelacion_asigna_al_mejor(self):
+        """Test: El horario cancelado se agenda al paciente con mejor prioridad que lo acepta"""
+        normal = self.esperar("1001")
+        otro_medico = self.esperar("1002", "MED002", prioridad=-1)
+        urgente = self.esperar("1003", "MED001", prioridad=-1)
+        self.assertEqual(len(self.clinica.obtener_lista_espera()), 3)
+        
+        horario = self.lunes + timedelta(hours=2)
+        self.clinica.cancelar_turno("MED001", horario)
+        turno = urgente.obtener_turno()
+        self.assertEqual((turno.obtener_paciente().obtener_dni(), turno.obtener_fecha_hora()), ("1003", horario))
+        self.assertEqual(self.clinica.obtener_turnos_medico("MED001", horario, horario + timedelta(minutes=1)), [turno])
+        
+        self.clinica.cancelar_turno("MED001", horario + timedelta(minutes=30))
+        self.assertEqual(normal.obtener_turno().obtener_fecha_hora(), horario + timedelta(minutes=30))
+        self.assertIsNone(otro_medico.obtener_turno())
+        self.assertEqual(self.clinica.obtener_lista_espera().obtener_pendientes(), [otro_medico])
+        self.assertEqual(self.clinica.contar_turnos(), 40)
+    
+    def test_reprogramacion_libera_el_horario(self):
+        """Test: El horario que deja un turno reprogramado también se ofrece"""
+        solicitud = self.esperar("1001")
+        self.clinica.reprogramar_turno("MED002", self.lunes, self.lunes + timedelta(weeks=1))
+        self.assertEqual(solicitud.obtener_turno().obtener_fecha_hora(), self.lunes)
+        self.assertEqual(solicitud.obtener_turno().obtener_medico().obtener_matricula(), "MED002")
+    
+    def test_horario_libre_al_anotarse(self):
+        """Test: Si ya hay un horario libre en el rango, se agenda al anotarse"""
+        solicitud = self.esperar("1001", "MED001", dias=7)
+        self.assertEqual(solicitud.obtener_turno().obtener_fecha_hora(), self.lunes + timedelta(weeks=1))
+        self.assertEqual(len(self.clinica.obtener_lista_espera()), 0)
+    
+    def test_medico_suma_dias(self):
+        """Test: Cuando un médico suma días de una especialidad se atiende a quienes la esperan"""
+        primera = self.clinica.agregar_a_lista_espera("1001", "Dermatología", date(2025, 6, 16), date(2025, 6, 20))
+        segunda = self.clinica.agregar_a_lista_espera("1002", "dermatología", date(2025, 6, 16), date(2025, 6, 16))
+        self.assertIsNone(primera.obtener_turno())
+        
+        self.clinica.agregar_especialidad("MED001", Especialidad("Dermatología", ["martes", "jueves"]))
+        self.assertEqual(primera.obtener_turno().obtener_fecha_hora(), datetime(2025, 6, 17, 8, 0))
+        self.assertIsNone(segunda.obtener_turno())
+        self.assertEqual(len(self.clinica.obtener_lista_espera()), 1)
+    
+    def test_validaciones(self):
+        """Test: El paciente y el médico deben existir"""
+        with self.assertRaises(PacienteNoEncontradoException):
+            self.esperar("9999")
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.esperar("1001", "MED999")
+        self.assertEqual(len(self.clinica.obtener_lista_espera()), 0)
+    
+    def test_bitacora(self):
+        """Test: El turno asignado desde la lista de espera queda en la bitácora"""
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "clinica.log")
+            clinica = Clinica.desde_bitacora(ruta, fsync_cada=0)
+            clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+            clinica.agregar_paciente(Paciente("Ana López", "11223344", "25/12/1992"))
+            medico = Medico("Dra. Martínez", "MED001")
+            medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+            clinica.agregar_medico(medico)
+            clinica.agendar_turnos([("12345678", "MED001", "Pediatría", self.lunes + timedelta(minutes=30 * i))
+                                    for i in range(20)])
+            solicitud = clinica.agregar_a_lista_espera("11223344", "Pediatría", self.lunes.date(),
+                                                       self.lunes.date(), "MED001")
+            self.assertIsNone(solicitud.obtener_turno())
+            clinica.cancelar_turno("MED001", self.lunes)
+            clinica.cerrar()
+            
+            recuperada = Clinica.desde_bitacora(ruta)
+            turno = recuperada.obtener_turnos_medico("MED001", self.lunes, self.lunes + timedelta(minutes=1))[0]
+            self.assertEqual(turno.obtener_paciente().obtener_dni(), "11223344")
+            self.assertEqual(recuperada.contar_turnos(), 20)
+            recuperada.cerrar()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 
 
 import unittest
+from datetime import datetime
 import sys
 import os
 
@@ -88,6 +89,24 @@ class TestMedico(unittest.TestCase):
         self.assertIn("MAT006", str_medico)
         self.assertIn("Neurología", str_medico)
         self.assertIn("Especialidades:", str_medico)
+    
+    def test_dia_compartido_usa_primera_especialidad(self):
+        """Test: Si dos especialidades comparten día, se atiende la primera agregada"""
+        medico = Medico("Dr. Mario Díaz", "MAT007")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes", "martes"]))
+        
+        self.assertEqual(medico.obtener_especialidad_para_dia("lunes"), "Pediatría")
+        self.assertEqual(medico.obtener_especialidad_para_dia("martes"), "Cardiología")
+    
+    def test_obtener_especialidad_para_fecha(self):
+        """Test: La especialidad se obtiene a partir del día de la semana de la fecha"""
+        medico = Medico("Dr. Mario Díaz", "MAT008")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["miércoles"]))
+        
+        self.assertEqual(medico.obtener_especialidad_para_fecha(datetime(2025, 6, 18, 10, 0)), "Pediatría")
+        self.assertIsNone(medico.obtener_especialidad_para_fecha(datetime(2025, 6, 19, 10, 0)))
+        self.assertIsNone(medico.obtener_especialidad_para_dia("día_inventado"))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,109 @@
+import unittest
+from datetime import datetime, timedelta
+import io
+import json
+import sys
+import os
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelometricas import Metricas, HistogramaLatencia
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+from modeloexcepciones import PacienteNoEncontradoException, PacienteDuplicadoException, TurnoOcupadoException
+
+
+class TestHistogramaLatencia(unittest.TestCase):
+    """Tests para el histograma de duraciones"""
+    
+    def test_intervalos_y_percentiles(self):
+        """Test: Cada duración cae en el intervalo de su potencia de dos y los percentiles la acotan"""
+        histograma = HistogramaLatencia()
+        for nanosegundos in [500] + [3_000] * 98 + [1_000_000]:
+            histograma.registrar(nanosegundos)
+        
+        self.assertEqual(histograma.obtener_cantidad(), 100)
+        self.assertEqual(histograma.obtener_intervalos(), [[1024, 1], [4096, 98], [1 << 20, 1]])
+        self.assertEqual(histograma.obtener_percentil(50), 4096)
+        self.assertEqual(histograma.obtener_percentil(100), 1_000_000)
+        self.assertEqual(histograma.obtener_maximo(), 1_000_000)
+        self.assertAlmostEqual(histograma.obtener_media(), (500 + 3_000 * 98 + 1_000_000) / 100)
+        with self.assertRaises(ValueError):
+            histograma.obtener_percentil(101)
+    
+    def test_duraciones_extremas(self):
+        """Test: Las duraciones enormes van al último intervalo y un histograma vacío da 0"""
+        histograma = HistogramaLatencia()
+        self.assertEqual(histograma.obtener_percentil(99), 0)
+        histograma.registrar(10 ** 15)
+        self.assertEqual(len(histograma.obtener_intervalos()), 1)
+
+
+class TestMetricasClinica(unittest.TestCase):
+    """Tests para las métricas de las operaciones de la clínica"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.metricas = Metricas()
+        self.clinica = Clinica(metricas=self.metricas)
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        medico = Medico("Dra. Martínez", "MED001")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        self.lunes = datetime(2025, 6, 16, 10, 0)
+    
+    def test_llamadas_y_rechazos(self):
+        """Test: Se cuentan las llamadas y las excepciones por tipo, que se siguen lanzando"""
+        self.clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes)
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes)
+        with self.assertRaises(PacienteNoEncontradoException):
+            self.clinica.agendar_turno("99999999", "MED001", "Pediatría", self.lunes)
+        self.clinica.obtener_historia_clinica("12345678")
+        
+        turnos = self.metricas.obtener_operacion("agendar_turno")
+        self.assertEqual(turnos.obtener_llamadas(), 3)
+        self.assertEqual(turnos.obtener_rechazos(),
+                         {"TurnoOcupadoException": 1, "PacienteNoEncontradoException": 1})
+        self.assertEqual(turnos.obtener_latencias().obtener_cantidad(), 3)
+        self.assertEqual(self.metricas.obtener_operacion("obtener_historia_clinica").obtener_llamadas(), 1)
+    
+    def test_rechazos_en_lote(self):
+        """Test: En las operaciones en lote se cuentan las excepciones devueltas por elemento"""
+        resultados = self.clinica.agregar_pacientes([Paciente("Juan Pérez", "12345678", "15/03/1990"),
+                                                     Paciente("Ana López", "11223344", "25/12/1992")])
+        self.assertIsInstance(resultados[0], PacienteDuplicadoException)
+        lote = [("11223344", "MED001", "Pediatría", self.lunes + timedelta(minutes=30 * i)) for i in range(3)]
+        self.clinica.agendar_turnos(lote + lote[:1])
+        
+        pacientes = self.metricas.obtener_operacion("agregar_pacientes")
+        self.assertEqual(pacientes.obtener_llamadas(), 1)
+        self.assertEqual(pacientes.obtener_rechazos(), {"PacienteDuplicadoException": 1})
+        self.assertEqual(self.metricas.obtener_operacion("agendar_turnos").obtener_rechazos(),
+                         {"TurnoOcupadoException": 1})
+    
+    def test_resumen_json(self):
+        """Test: El resumen solo incluye las operaciones llamadas y se puede volcar como JSON"""
+        salida = io.StringIO()
+        self.metricas.escribir_json(salida)
+        datos = json.loads(salida.getvalue())
+        
+        self.assertEqual(set(datos), {"agregar_paciente", "agregar_medico"})
+        latencia = datos["agregar_paciente"]["latencia_us"]
+        self.assertEqual(datos["agregar_paciente"]["llamadas"], 1)
+        self.assertLessEqual(latencia["p50"], latencia["max"])
+        self.assertEqual(sum(cantidad for _, cantidad in latencia["histograma"]), 1)
+    
+    def test_sin_metricas_no_envuelve(self):
+        """Test: Sin métricas las operaciones son los métodos de la clase, sin envolturas"""
+        clinica = Clinica()
+        self.assertIsNone(clinica.obtener_metricas())
+        self.assertNotIn("agendar_turno", vars(clinica))
+        self.assertIn("agendar_turno", vars(self.clinica))
+
+
+if __name__ == '__main__':
+    unittest.main()
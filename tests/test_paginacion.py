@@ -0,0 +1,133 @@
+import unittest
+from datetime import datetime, timedelta
+import sys
+import os
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from tests.repositorios import casos_por_repositorio
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+from modeloexcepciones import MedicoNoEncontradoException
+
+
+class PaginacionBase:
+    """Tests de los listados paginados, comunes a todos los repositorios"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.clinica = Clinica(repositorio=self.crear_repositorio())
+        for nombre, dni in (("Juan Pérez", "30111222"), ("ana lópez", "30999888"), ("Ana Díaz", "25123456"),
+                            ("Bruno Gómez", "30111333"), ("Andrés Ruiz", "41000000")):
+            self.clinica.agregar_paciente(Paciente(nombre, dni, "01/01/1990"))
+        pediatra = Medico("Dra. Martínez", "MED001")
+        pediatra.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        clinico = Medico("Dr. García", "MED002")
+        clinico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        clinico.agregar_especialidad(Especialidad("Cardiología", ["martes"]))
+        self.clinica.agregar_medico(pediatra)
+        self.clinica.agregar_medico(clinico)
+        
+        self.lunes = datetime(2025, 6, 16, 9, 0)
+        lote = []
+        for semana in range(3):
+            lunes = self.lunes + timedelta(weeks=semana)
+            for i in range(4):
+                lote.append(("30111222", "MED001", "Pediatría", lunes + timedelta(minutes=30 * i)))
+                lote.append(("30999888", "MED002", "Pediatría", lunes + timedelta(minutes=15 + 30 * i)))
+            lote.append(("25123456", "MED002", "Cardiología", lunes + timedelta(days=1)))
+        self.assertTrue(all(r is None for r in self.clinica.agendar_turnos(lote)))
+    
+    def tearDown(self):
+        self.clinica.cerrar()
+    
+    def test_paginar_pacientes(self):
+        """Test: Sin filtro se pagina en orden de alta, con prefijo numérico por DNI y con otro texto por palabras del nombre"""
+        pagina, total = self.clinica.paginar_pacientes(1, 2)
+        self.assertEqual(total, 5)
+        self.assertEqual([p.obtener_dni() for p in pagina], ["30999888", "25123456"])
+        
+        pagina, total = self.clinica.paginar_pacientes(0, 10, "30")
+        self.assertEqual(total, 3)
+        self.assertEqual([p.obtener_dni() for p in pagina], ["30111222", "30111333", "30999888"])
+        pagina, total = self.clinica.paginar_pacientes(1, 1, "3011")
+        self.assertEqual((total, [p.obtener_dni() for p in pagina]), (2, ["30111333"]))
+        
+        pagina, total = self.clinica.paginar_pacientes(0, 10, "AN")
+        self.assertEqual(total, 3)
+        self.assertEqual([p.obtener_nombre() for p in pagina], ["ana lópez", "Ana Díaz", "Andrés Ruiz"])
+        self.assertEqual(self.clinica.paginar_pacientes(0, 10, "zz"), ([], 0))
+    
+    def test_paginar_pacientes_por_nombre_sin_tildes(self):
+        """Test: El prefijo de nombre no distingue tildes ni mayúsculas y vale para cualquier palabra, en todos los repositorios"""
+        pagina, total = self.clinica.paginar_pacientes(0, 10, "LOPEZ")
+        self.assertEqual((total, [p.obtener_dni() for p in pagina]), (1, ["30999888"]))
+        pagina, total = self.clinica.paginar_pacientes(1, 1, "an")
+        self.assertEqual((total, [p.obtener_nombre() for p in pagina]), (3, ["Ana Díaz"]))
+        pagina, total = self.clinica.paginar_pacientes(0, 10, "and rú")
+        self.assertEqual((total, [p.obtener_nombre() for p in pagina]), (1, ["Andrés Ruiz"]))
+    
+    def test_pacientes_nuevos_en_el_indice(self):
+        """Test: Los pacientes agregados después de una búsqueda aparecen en la siguiente"""
+        self.assertEqual(self.clinica.paginar_pacientes(0, 10, "ana")[1], 2)
+        self.clinica.agregar_paciente(Paciente("Anabel Sosa", "50000000", "01/01/2000"))
+        pagina, total = self.clinica.paginar_pacientes(0, 10, "ana")
+        self.assertEqual(total, 3)
+        self.assertEqual(pagina[-1].obtener_nombre(), "Anabel Sosa")
+    
+    def test_paginar_medicos(self):
+        """Test: Los médicos se paginan en orden de alta"""
+        pagina, total = self.clinica.paginar_medicos(1, 5)
+        self.assertEqual(total, 2)
+        self.assertEqual([m.obtener_matricula() for m in pagina], ["MED002"])
+    
+    def test_paginar_turnos(self):
+        """Test: Los turnos se paginan ordenados por fecha, mezclando las agendas de los médicos"""
+        pagina, total = self.clinica.paginar_turnos(0, 5)
+        self.assertEqual(total, 27)
+        self.assertEqual([t.obtener_fecha_hora() for t in pagina],
+                         [self.lunes + timedelta(minutes=15 * i) for i in range(5)])
+        
+        todos = []
+        for inicio in range(0, 27, 10):
+            todos += self.clinica.paginar_turnos(inicio, 10)[0]
+        fechas = [t.obtener_fecha_hora() for t in todos]
+        self.assertEqual(len(todos), 27)
+        self.assertEqual(fechas, sorted(fechas))
+    
+    def test_filtros_de_turnos(self):
+        """Test: Los turnos se filtran por médico, especialidad y rango de fechas"""
+        self.assertEqual(self.clinica.paginar_turnos(matricula="MED002")[1], 15)
+        
+        pagina, total = self.clinica.paginar_turnos(0, 20, especialidad="cardiología")
+        self.assertEqual(total, 3)
+        self.assertTrue(all(t.obtener_especialidad() == "Cardiología" for t in pagina))
+        self.assertEqual(self.clinica.paginar_turnos(especialidad="Pediatría")[1], 24)
+        
+        semana = self.lunes + timedelta(weeks=1)
+        pagina, total = self.clinica.paginar_turnos(2, 3, especialidad="Pediatría", desde=semana,
+                                                    hasta=semana + timedelta(days=1))
+        self.assertEqual(total, 8)
+        self.assertEqual([t.obtener_fecha_hora() for t in pagina],
+                         [semana + timedelta(minutes=15 * i) for i in range(2, 5)])
+        
+        self.assertEqual(self.clinica.paginar_turnos(30, 10), ([], 27))
+    
+    def test_pagina_invalida(self):
+        """Test: Una página con inicio negativo o sin elementos se rechaza"""
+        with self.assertRaises(ValueError):
+            self.clinica.paginar_turnos(-1, 10)
+        with self.assertRaises(ValueError):
+            self.clinica.paginar_pacientes(0, 0)
+        with self.assertRaises(MedicoNoEncontradoException):
+            self.clinica.paginar_turnos(matricula="MED999")
+
+
+globals().update(casos_por_repositorio(PaginacionBase))
+
+
+if __name__ == '__main__':
+    unittest.main()
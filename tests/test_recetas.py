@@ -0,0 +1,189 @@
+import unittest
+from datetime import datetime, timedelta
+import sys
+import os
+import tempfile
+import sqlite3
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modeloindicerecetas import IndiceRecetas, normalizar_medicamento
+from modelorepositoriosqlite import RepositorioSQLite
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloreceta import Receta
+from modeloexcepciones import MedicoNoEncontradoException
+
+
+class TestIndiceRecetas(unittest.TestCase):
+    """Tests para el índice invertido de recetas por medicamento"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.juan = Paciente("Juan Pérez", "12345678", "15/03/1990")
+        self.ana = Paciente("Ana López", "11223344", "25/12/1992")
+        self.martinez = Medico("Dra. Martínez", "MED001")
+        self.garcia = Medico("Dr. García", "MED002")
+        self.junio = datetime(2025, 6, 1)
+        self.indice = IndiceRecetas()
+    
+    def receta(self, paciente, medico, medicamentos, dias):
+        receta = Receta(paciente, medico, medicamentos, self.junio + timedelta(days=dias))
+        self.indice.agregar_receta(receta)
+        return receta
+    
+    def test_normalizar_medicamento(self):
+        """Test: La clave ignora mayúsculas y espacios de más"""
+        self.assertEqual(normalizar_medicamento("  IBUPROFENO   600 "), "ibuprofeno 600")
+    
+    def test_buscar_por_medicamento_y_periodo(self):
+        """Test: Devuelve las recetas del medicamento por fecha de emisión, aunque se indexen desordenadas"""
+        tercera = self.receta(self.juan, self.martinez, ["Ibuprofeno"], 20)
+        primera = self.receta(self.ana, self.garcia, ["ibuprofeno ", "Amoxicilina"], 2)
+        self.receta(self.ana, self.martinez, ["Paracetamol"], 5)
+        segunda = self.receta(self.juan, self.garcia, ["IBUPROFENO"], 10)
+        
+        self.assertEqual(self.indice.buscar("Ibuprofeno"), [primera, segunda, tercera])
+        self.assertEqual(self.indice.buscar("ibuprofeno", self.junio + timedelta(days=10),
+                                            self.junio + timedelta(days=20)), [segunda])
+        self.assertEqual(self.indice.buscar("Diclofenac"), [])
+    
+    def test_medicamento_repetido_en_la_receta(self):
+        """Test: Un medicamento repetido en una receta se indexa y se cuenta una sola vez"""
+        receta = self.receta(self.juan, self.martinez, ["Ibuprofeno", "ibuprofeno", "Amoxicilina"], 0)
+        
+        self.assertEqual(self.indice.buscar("Ibuprofeno"), [receta])
+        self.assertEqual(self.indice.mas_recetados(5), [("Amoxicilina", 1), ("Ibuprofeno", 1)])
+    
+    def test_mas_recetados(self):
+        """Test: El ranking se filtra por médico y período, de mayor a menor y con empates por nombre"""
+        self.receta(self.juan, self.martinez, ["Ibuprofeno", "Amoxicilina"], 0)
+        self.receta(self.ana, self.martinez, ["ibuprofeno"], 3)
+        self.receta(self.ana, self.garcia, ["Paracetamol"], 3)
+        self.receta(self.juan, self.garcia, ["Paracetamol"], 12)
+        self.receta(self.juan, self.garcia, ["Paracetamol", "Amoxicilina"], 15)
+        
+        self.assertEqual(self.indice.mas_recetados(2), [("Paracetamol", 3), ("Amoxicilina", 2)])
+        self.assertEqual(self.indice.mas_recetados(5, "MED001"), [("Ibuprofeno", 2), ("Amoxicilina", 1)])
+        self.assertEqual(self.indice.mas_recetados(5, desde=self.junio + timedelta(days=3),
+                                                   hasta=self.junio + timedelta(days=15)),
+                         [("Paracetamol", 2), ("Ibuprofeno", 1)])
+        self.assertEqual(self.indice.mas_recetados(5, "MED002", hasta=self.junio + timedelta(days=10)),
+                         [("Paracetamol", 1)])
+        self.assertEqual(self.indice.mas_recetados(5, "MED999"), [])
+
+
+class TestRecetasClinica(unittest.TestCase):
+    """Tests de las consultas de recetas por medicamento de la clínica"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.bitacora = os.path.join(self.directorio.name, "clinica.log")
+    
+    def tearDown(self):
+        self.directorio.cleanup()
+    
+    def cargar(self, clinica):
+        clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        clinica.agregar_paciente(Paciente("Ana López", "11223344", "25/12/1992"))
+        clinica.agregar_medico(Medico("Dra. Martínez", "MED001"))
+        clinica.agregar_medico(Medico("Dr. García", "MED002"))
+        clinica.emitir_receta("12345678", "MED001", ["Ibuprofeno", "Amoxicilina"])
+        clinica.emitir_receta("11223344", "MED002", ["ibuprofeno"])
+        clinica.emitir_receta("12345678", "MED002", ["Ibuprofeno"])
+    
+    def resumen(self, clinica):
+        return ([str(receta) for receta in clinica.buscar_recetas_por_medicamento("IBUPROFENO")],
+                clinica.medicamentos_mas_recetados(), clinica.medicamentos_mas_recetados(1, "MED001"))
+    
+    def test_consultas(self):
+        """Test: emitir_receta actualiza el índice y los pacientes se devuelven sin repetir"""
+        clinica = Clinica()
+        antes = datetime.now()
+        self.cargar(clinica)
+        
+        self.assertEqual(len(clinica.buscar_recetas_por_medicamento("ibuprofeno", antes)), 3)
+        self.assertEqual(clinica.buscar_recetas_por_medicamento("ibuprofeno", hasta=antes), [])
+        self.assertEqual([p.obtener_dni() for p in clinica.obtener_pacientes_por_medicamento("Ibuprofeno")],
+                         ["12345678", "11223344"])
+        self.assertEqual(clinica.medicamentos_mas_recetados(), [("Ibuprofeno", 3), ("Amoxicilina", 1)])
+        self.assertEqual(clinica.medicamentos_mas_recetados(5, "MED002"), [("Ibuprofeno", 2)])
+    
+    def test_validaciones(self):
+        """Test: El ranking exige una cantidad positiva y un médico existente"""
+        clinica = Clinica()
+        self.cargar(clinica)
+        
+        with self.assertRaises(ValueError):
+            clinica.medicamentos_mas_recetados(0)
+        with self.assertRaises(MedicoNoEncontradoException):
+            clinica.medicamentos_mas_recetados(5, "MED999")
+    
+    def test_bitacora_e_instantanea(self):
+        """Test: El índice se reconstruye al reproducir la bitácora y al cargar una instantánea"""
+        clinica = Clinica.desde_bitacora(self.bitacora, fsync_cada=0)
+        self.cargar(clinica)
+        esperado = self.resumen(clinica)
+        instantanea = os.path.join(self.directorio.name, "clinica.snap")
+        clinica.guardar_instantanea(instantanea)
+        clinica.cerrar()
+        
+        recuperada = Clinica.desde_bitacora(self.bitacora)
+        self.assertEqual(self.resumen(recuperada), esperado)
+        recuperada.cerrar()
+        recuperada = Clinica.recuperar(instantanea)
+        self.assertEqual(self.resumen(recuperada), esperado)
+        recuperada.cerrar()
+    
+    def test_base_sqlite(self):
+        """Test: Al abrir una base SQLite existente se indexan sus recetas"""
+        ruta = os.path.join(self.directorio.name, "clinica.db")
+        clinica = Clinica(repositorio=RepositorioSQLite(ruta))
+        self.cargar(clinica)
+        esperado = self.resumen(clinica)
+        clinica.cerrar()
+        
+        reabierta = Clinica(repositorio=RepositorioSQLite(ruta))
+        self.assertEqual(self.resumen(reabierta), esperado)
+        reabierta.cerrar()
+    
+    def test_sqlite_responde_como_la_memoria(self):
+        """Test: SQLite responde con SQL lo mismo que el índice en memoria, también por período y médico"""
+        memoria = Clinica()
+        sqlite = Clinica(repositorio=RepositorioSQLite(os.path.join(self.directorio.name, "clinica.db")))
+        for clinica in (memoria, sqlite):
+            self.cargar(clinica)
+            clinica.emitir_receta("11223344", "MED001", ["  amoxicilina ", "Paracetamol", "AMOXICILINA"])
+        ahora = datetime.now()
+        
+        for medicamento, desde, hasta in (("amoxicilina", None, None), ("ibuprofeno", ahora, None),
+                                          ("Ibuprofeno", None, ahora - timedelta(days=1)), ("Aspirina", None, None)):
+            self.assertEqual([str(r) for r in sqlite.buscar_recetas_por_medicamento(medicamento, desde, hasta)],
+                             [str(r) for r in memoria.buscar_recetas_por_medicamento(medicamento, desde, hasta)])
+        for cantidad, matricula in ((10, None), (2, None), (10, "MED001"), (1, "MED002")):
+            self.assertEqual(sqlite.medicamentos_mas_recetados(cantidad, matricula),
+                             memoria.medicamentos_mas_recetados(cantidad, matricula))
+        self.assertEqual(sqlite.medicamentos_mas_recetados(), [("Ibuprofeno", 3), ("Amoxicilina", 2), ("Paracetamol", 1)])
+        sqlite.cerrar()
+    
+    def test_base_sin_tabla_de_medicamentos(self):
+        """Test: Una base creada antes de la tabla de medicamentos la llena al abrirse"""
+        ruta = os.path.join(self.directorio.name, "clinica.db")
+        clinica = Clinica(repositorio=RepositorioSQLite(ruta))
+        self.cargar(clinica)
+        esperado = self.resumen(clinica)
+        clinica.cerrar()
+        conexion = sqlite3.connect(ruta)
+        conexion.executescript("DROP TABLE recetas_medicamentos; DROP TABLE medicamentos;")
+        conexion.close()
+        
+        reabierta = Clinica(repositorio=RepositorioSQLite(ruta))
+        self.assertEqual(self.resumen(reabierta), esperado)
+        reabierta.cerrar()
+
+
+if __name__ == '__main__':
+    unittest.main()
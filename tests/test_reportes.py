@@ -0,0 +1,124 @@
+import unittest
+import math
+from datetime import date, datetime, timedelta, time
+import sys
+import os
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelorepositoriocolumnar import RepositorioColumnar
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+from modeloexcepciones import MedicoNoEncontradoException
+from modeloreportes import ReporteOcupacion, np
+
+
+@unittest.skipIf(np is None, "numpy no está instalado")
+class TestReporteOcupacion(unittest.TestCase):
+    """Tests para los reportes de ocupación"""
+    
+    def armar_clinica(self, repositorio=None):
+        """Clínica con dos médicos: uno atiende lunes y martes, el otro solo miércoles"""
+        clinica = Clinica(repositorio=repositorio)
+        clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        pediatra = Medico("Dra. Martínez", "MED001")
+        pediatra.agregar_especialidad(Especialidad("Pediatría", ["lunes", "martes"]))
+        clinico = Medico("Dr. Gómez", "MED002")
+        clinico.agregar_especialidad(Especialidad("Clínica", ["miércoles"]))
+        clinica.agregar_medico(pediatra)
+        clinica.agregar_medico(clinico)
+        
+        lunes = datetime(2025, 6, 16, 8, 0)
+        lote = [("12345678", "MED001", "Pediatría", lunes + timedelta(minutes=30 * i)) for i in range(4)]
+        lote.append(("12345678", "MED001", "Pediatría", lunes + timedelta(days=1, hours=2)))
+        lote.append(("12345678", "MED002", "Clínica", lunes + timedelta(days=2, hours=1)))
+        self.assertEqual(clinica.agendar_turnos(lote), [None] * len(lote))
+        return clinica
+    
+    def test_conteos_y_mapa_de_calor(self):
+        """Test: Los conteos por médico, especialidad, día y hora coinciden con los turnos"""
+        for repositorio in (None, RepositorioColumnar()):
+            reporte = ReporteOcupacion(self.armar_clinica(repositorio))
+            
+            self.assertEqual(reporte.turnos_por_medico(), {"MED001": 5, "MED002": 1})
+            self.assertEqual(reporte.turnos_por_especialidad(), {"Pediatría": 5, "Clínica": 1})
+            self.assertEqual(reporte.turnos_por_medico(desde=datetime(2025, 6, 16, 9, 0)),
+                             {"MED001": 3, "MED002": 1})
+            
+            mapa = reporte.mapa_calor()
+            self.assertEqual(mapa.shape, (7, 24))
+            self.assertEqual(mapa[0, 8], 2)
+            self.assertEqual(mapa[0, 9], 2)
+            self.assertEqual(mapa[1, 10], 1)
+            self.assertEqual(mapa[2, 9], 1)
+            self.assertEqual(mapa.sum(), 6)
+            self.assertEqual(reporte.mapa_calor(matricula="MED002").sum(), 1)
+            self.assertEqual(reporte.mapa_calor(especialidad="Pediatría").sum(), 5)
+            self.assertEqual(reporte.mapa_calor(especialidad="Cardiología").sum(), 0)
+            with self.assertRaises(MedicoNoEncontradoException):
+                reporte.mapa_calor(matricula="MED999")
+    
+    def test_utilizacion_y_dias_sin_capacidad(self):
+        """Test: La utilización compara los turnos con los días que atiende cada médico"""
+        reporte = ReporteOcupacion(self.armar_clinica(), duracion=timedelta(hours=1),
+                                   hora_inicio=time(8, 0), hora_fin=time(10, 0))
+        self.assertEqual(reporte.obtener_horarios_por_dia().tolist(),
+                         [[2, 2, 0, 0, 0, 0, 0], [0, 0, 2, 0, 0, 0, 0]])
+        
+        # Dos semanas: cada día de la semana que atiende aporta 2 horarios por semana
+        matriz = reporte.matriz_utilizacion(date(2025, 6, 16), date(2025, 6, 30))
+        self.assertEqual(matriz.shape, (2, 7))
+        self.assertEqual(matriz[0, 0], 4 / 4)
+        self.assertEqual(matriz[0, 1], 1 / 4)
+        self.assertEqual(matriz[1, 2], 1 / 4)
+        self.assertTrue(math.isnan(matriz[0, 2]))
+        self.assertTrue(math.isnan(matriz[1, 0]))
+        
+        utilizacion = reporte.utilizacion_por_medico(date(2025, 6, 16), date(2025, 6, 23))
+        self.assertEqual(utilizacion, {"MED001": 5 / 4, "MED002": 1 / 2})
+        
+        self.assertEqual(reporte.dias_sin_capacidad(date(2025, 6, 1), date(2025, 7, 1)),
+                         [("MED001", date(2025, 6, 16))])
+        self.assertEqual(reporte.dias_sin_capacidad(date(2025, 7, 1), date(2025, 6, 1)), [])
+    
+    def test_capacidad_con_la_duracion_de_cada_especialidad(self):
+        """Test: Sin duración fija, cada día ofrece los horarios de la especialidad que se atiende ese día"""
+        clinica = Clinica()
+        clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        medico = Medico("Dra. Martínez", "MED001")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"], timedelta(minutes=15)))
+        medico.agregar_especialidad(Especialidad("Cardiología", ["lunes", "martes"], timedelta(hours=1)))
+        clinica.agregar_medico(medico)
+        martes = datetime(2025, 6, 17, 8, 0)
+        lote = [("12345678", "MED001", "Cardiología", martes + timedelta(hours=i)) for i in range(2)]
+        self.assertEqual(clinica.agendar_turnos(lote), [None, None])
+        reporte = ReporteOcupacion(clinica, hora_inicio=time(8, 0), hora_fin=time(10, 0))
+        
+        # El lunes es de Pediatría (la primera agregada): 8 horarios de 15 minutos
+        self.assertEqual(reporte.obtener_horarios_por_dia()[0, :3].tolist(), [8, 2, 0])
+        matriz = reporte.matriz_utilizacion(date(2025, 6, 16), date(2025, 6, 23))
+        self.assertEqual(matriz[0, 0], 0)
+        self.assertEqual(matriz[0, 1], 1)
+        self.assertEqual(reporte.dias_sin_capacidad(date(2025, 6, 16), date(2025, 6, 23)),
+                         [("MED001", date(2025, 6, 17))])
+    
+    def test_clinica_sin_turnos(self):
+        """Test: Sin turnos los reportes devuelven ceros y la franja debe admitir algún turno"""
+        clinica = Clinica()
+        medico = Medico("Dr. Gómez", "MED002")
+        medico.agregar_especialidad(Especialidad("Clínica", ["miércoles"]))
+        clinica.agregar_medico(medico)
+        reporte = ReporteOcupacion(clinica)
+        
+        self.assertEqual(reporte.turnos_por_medico(), {"MED002": 0})
+        self.assertEqual(reporte.mapa_calor().sum(), 0)
+        self.assertEqual(reporte.utilizacion_por_medico(date(2025, 6, 16), date(2025, 6, 23)), {"MED002": 0.0})
+        with self.assertRaises(ValueError):
+            ReporteOcupacion(clinica, duracion=timedelta(hours=12))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+import unittest
+from datetime import datetime, timedelta
+import sys
+import os
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelorepositoriocolumnar import RepositorioColumnar
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+from modeloexcepciones import TurnoOcupadoException
+
+
+class TestRepositorioColumnar(unittest.TestCase):
+    """Tests para la clínica con los turnos en columnas"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.clinica = Clinica(repositorio=RepositorioColumnar())
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        self.clinica.agregar_paciente(Paciente("Ana López", "11223344", "25/12/1992"))
+        for matricula in ("MED001", "MED002"):
+            medico = Medico("Dra. Martínez", matricula)
+            medico.agregar_especialidad(Especialidad("Pediatría", ["lunes", "martes"]))
+            self.clinica.agregar_medico(medico)
+        self.lunes = datetime(2025, 6, 16, 9, 0)
+    
+    def test_agendar_y_consultar(self):
+        """Test: Los turnos se validan, listan, filtran y cuentan desde las columnas"""
+        self.clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes + timedelta(hours=2))
+        lote = [("11223344", "MED001", "Pediatría", self.lunes + timedelta(minutes=30 * i)) for i in range(40)]
+        resultados = self.clinica.agendar_turnos(lote + [("12345678", "MED002", "Pediatría", self.lunes)])
+        
+        self.assertEqual(sum(r is not None for r in resultados), 1)
+        self.assertIsInstance(resultados[4], TurnoOcupadoException)
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes)
+        
+        turnos = self.clinica.obtener_turnos()
+        self.assertEqual(len(turnos), 41)
+        self.assertEqual(turnos[0].obtener_fecha_hora(), self.lunes + timedelta(hours=2))
+        self.assertEqual(turnos[-1].obtener_medico().obtener_matricula(), "MED002")
+        self.assertEqual(len(turnos[1:11]), 10)
+        
+        medico = self.clinica.obtener_turnos_medico("MED001", self.lunes + timedelta(hours=1),
+                                                    self.lunes + timedelta(hours=3))
+        self.assertEqual([t.obtener_fecha_hora().hour for t in medico], [10, 10, 11, 11])
+        self.assertEqual(self.clinica.contar_turnos("MED001"), 40)
+        self.assertEqual(self.clinica.contar_turnos(desde=self.lunes, hasta=self.lunes + timedelta(minutes=1)), 2)
+        
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_turnos()), 2)
+    
+    def test_solo_minutos_exactos(self):
+        """Test: Un turno con segundos se rechaza porque las columnas guardan minutos"""
+        with self.assertRaises(ValueError):
+            self.clinica.agendar_turno("12345678", "MED001", "Pediatría", self.lunes.replace(second=30))
+    
+    def test_lote_con_segundos(self):
+        """Test: En un lote, la fila con segundos se rechaza sola y no deja turnos a medias"""
+        resultados = self.clinica.agendar_turnos([
+            ("12345678", "MED001", "Pediatría", self.lunes - timedelta(hours=1)),
+            ("11223344", "MED001", "Pediatría", self.lunes.replace(second=30)),
+            ("11223344", "MED002", "Pediatría", self.lunes),
+        ])
+        
+        self.assertIsNone(resultados[0])
+        self.assertIsInstance(resultados[1], ValueError)
+        self.assertIsNone(resultados[2])
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+        self.assertEqual([t.obtener_fecha_hora() for t in self.clinica.obtener_turnos_medico("MED001")],
+                         [self.lunes - timedelta(hours=1)])
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("11223344", "MED001", "Pediatría", self.lunes - timedelta(hours=1))
+        
+        libres = self.clinica.buscar_turnos_disponibles("Pediatría", self.lunes, timedelta(minutes=30))
+        self.assertEqual(libres[0][0], self.lunes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from datetime import datetime, timedelta
+import sys
+import os
+import tempfile
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from modelorepositoriosqlite import RepositorioSQLite
+from modelopaciente import Paciente
+from modelomedico import Medico
+from modeloespecialidad import Especialidad
+from modeloexcepciones import TurnoOcupadoException, PacienteDuplicadoException, MedicoNoDisponibleException
+
+
+class TestRepositorioSQLite(unittest.TestCase):
+    """Tests para la clínica guardada en SQLite"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "clinica.db")
+        self.clinica = Clinica(repositorio=RepositorioSQLite(self.ruta))
+        self.clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        medico = Medico("Dra. Martínez", "MED001")
+        medico.agregar_especialidad(Especialidad("Pediatría", ["lunes"]))
+        self.clinica.agregar_medico(medico)
+        self.clinica.agregar_especialidad("MED001", Especialidad("Cardiología", ["martes"]))
+    
+    def tearDown(self):
+        self.clinica.cerrar()
+        self.directorio.cleanup()
+    
+    def test_validaciones_contra_la_base(self):
+        """Test: Las validaciones de la clínica consultan la base"""
+        self.clinica.agendar_turno("12345678", "MED001", "Pediatría", datetime(2025, 6, 16, 10, 0))
+        
+        with self.assertRaises(TurnoOcupadoException):
+            self.clinica.agendar_turno("12345678", "MED001", "Pediatría", datetime(2025, 6, 16, 10, 0))
+        with self.assertRaises(PacienteDuplicadoException):
+            self.clinica.agregar_paciente(Paciente("Otro", "12345678", "01/01/2000"))
+        with self.assertRaises(MedicoNoDisponibleException):
+            self.clinica.agendar_turno("12345678", "MED001", "Pediatría", datetime(2025, 6, 18, 10, 0))
+    
+    def test_datos_persisten_al_reabrir(self):
+        """Test: Pacientes, médicos, turnos y recetas se conservan al reabrir la base"""
+        lunes = datetime(2025, 6, 16, 10, 0)
+        self.clinica.agendar_turno("12345678", "MED001", "Pediatría", lunes)
+        self.clinica.agendar_turnos([("12345678", "MED001", "Cardiología", datetime(2025, 6, 17, 9, 0))])
+        self.clinica.emitir_receta("12345678", "MED001", ["Paracetamol"])
+        self.clinica.cerrar()
+        
+        self.clinica = Clinica(repositorio=RepositorioSQLite(self.ruta))
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 1)
+        medico = self.clinica.obtener_medico_por_matricula("MED001")
+        self.assertEqual(medico.obtener_especialidad_para_dia("martes"), "Cardiología")
+        self.assertEqual(len(self.clinica.obtener_turnos()), 2)
+        
+        historia = self.clinica.obtener_historia_clinica("12345678")
+        self.assertEqual(len(historia.obtener_turnos()), 2)
+        self.assertEqual(historia.obtener_recetas()[0].obtener_medicamentos(), ["Paracetamol"])
+        
+        # El índice por especialidad se reconstruye desde la base
+        libres = self.clinica.buscar_turnos_disponibles("Pediatría", lunes, timedelta(minutes=30))
+        self.assertEqual(libres[0][0], lunes + timedelta(minutes=30))
+    
+    def test_turnos_medico_por_rango(self):
+        """Test: Los turnos de un médico se devuelven ordenados dentro del rango"""
+        fechas = [datetime(2025, 6, 16 + 7 * i, 9, 0) for i in range(3)]
+        self.clinica.agendar_turnos([("12345678", "MED001", "Pediatría", f) for f in reversed(fechas)])
+        
+        turnos = self.clinica.obtener_turnos_medico("MED001", fechas[0], fechas[2])
+        self.assertEqual([t.obtener_fecha_hora() for t in turnos], fechas[:2])
+        self.assertEqual(len(self.clinica.obtener_turnos_medico("MED001")), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+import unittest
+import asyncio
+import json
+import sys
+import os
+import threading
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modeloclinica import Clinica
+from servidor import ServidorClinica
+
+
+class TestServidor(unittest.TestCase):
+    """Tests para el servidor JSON sobre TCP"""
+    
+    def setUp(self):
+        """Configuración inicial para los tests"""
+        self.clinica = Clinica()
+        self.servidor = ServidorClinica(self.clinica)
+    
+    def solicitar(self, operacion, **parametros):
+        """Procesa una solicitud sin pasar por la red"""
+        linea = json.dumps({"id": 1, "operacion": operacion, "parametros": parametros}).encode()
+        return json.loads(self.servidor.responder(linea))
+    
+    def cargar_datos(self):
+        """Registra un paciente y un médico de ejemplo"""
+        self.solicitar("agregar_paciente", nombre="Juan Pérez", dni="12345678", fecha_nacimiento="15/03/1990")
+        self.solicitar("agregar_medico", nombre="Dra. Martínez", matricula="MED001",
+                       especialidades=[{"tipo": "Pediatría", "dias": ["lunes"]}])
+    
+    def test_operaciones_y_historia(self):
+        """Test: Las operaciones se aplican a la clínica y la historia se devuelve serializada"""
+        self.cargar_datos()
+        respuesta = self.solicitar("agendar_turno", dni="12345678", matricula="MED001",
+                                   especialidad="Pediatría", fecha_hora="2025-06-16T10:00:00")
+        self.assertEqual(respuesta, {"id": 1, "ok": True, "resultado": None})
+        self.solicitar("emitir_receta", dni="12345678", matricula="MED001", medicamentos=["Paracetamol"])
+        
+        historia = self.solicitar("obtener_historia_clinica", dni="12345678")["resultado"]
+        self.assertEqual(historia["paciente"]["nombre"], "Juan Pérez")
+        self.assertEqual(historia["turnos"][0]["fecha_hora"], "2025-06-16T10:00:00")
+        self.assertEqual(historia["recetas"][0]["medicamentos"], ["Paracetamol"])
+        self.assertEqual(len(self.clinica.obtener_turnos()), 1)
+    
+    def test_recetas_por_medicamento(self):
+        """Test: Se consultan las recetas de un medicamento y el ranking de más recetados"""
+        self.cargar_datos()
+        self.solicitar("emitir_receta", dni="12345678", matricula="MED001", medicamentos=["Ibuprofeno", "Paracetamol"])
+        self.solicitar("emitir_receta", dni="12345678", matricula="MED001", medicamentos=["ibuprofeno"])
+        
+        recetas = self.solicitar("buscar_recetas_por_medicamento", medicamento="IBUPROFENO")["resultado"]
+        self.assertEqual([r["medicamentos"] for r in recetas], [["Ibuprofeno", "Paracetamol"], ["ibuprofeno"]])
+        self.assertEqual(self.solicitar("buscar_recetas_por_medicamento", medicamento="Ibuprofeno",
+                                        hasta="2000-01-01T00:00:00")["resultado"], [])
+        ranking = self.solicitar("medicamentos_mas_recetados", matricula="MED001", cantidad=1)["resultado"]
+        self.assertEqual(ranking, [{"medicamento": "Ibuprofeno", "recetas": 2}])
+        self.assertEqual(self.solicitar("medicamentos_mas_recetados", matricula="MED999")["error"],
+                         "MedicoNoEncontradoException")
+    
+    def test_buscar_pacientes(self):
+        """Test: La búsqueda por nombre devuelve los pacientes parecidos, como mucho `limite`"""
+        self.cargar_datos()
+        self.solicitar("agregar_paciente", nombre="Juana Pérez", dni="87654321", fecha_nacimiento="01/01/1980")
+        
+        pacientes = self.solicitar("buscar_pacientes", texto="peres")["resultado"]
+        self.assertEqual([p["dni"] for p in pacientes], ["12345678", "87654321"])
+        self.assertEqual(len(self.solicitar("buscar_pacientes", texto="perez", limite=1)["resultado"]), 1)
+        self.assertEqual(self.solicitar("buscar_pacientes", texto="perez", limite=0)["error"], "SolicitudInvalida")
+    
+    def test_errores(self):
+        """Test: Los errores del dominio y las solicitudes inválidas se informan sin cortar la conexión"""
+        self.cargar_datos()
+        turno = dict(dni="12345678", matricula="MED001", especialidad="Pediatría", fecha_hora="2025-06-16T10:00:00")
+        self.solicitar("agendar_turno", **turno)
+        
+        self.assertEqual(self.solicitar("agendar_turno", **turno)["error"], "TurnoOcupadoException")
+        self.assertEqual(self.solicitar("obtener_historia_clinica")["error"], "SolicitudInvalida")
+        self.assertEqual(self.solicitar("borrar_todo")["error"], "OperacionDesconocida")
+        self.assertEqual(json.loads(self.servidor.responder(b"{no es json\n"))["error"], "SolicitudInvalida")
+    
+    def test_duracion_invalida(self):
+        """Test: Una duración booleana, decimal o fuera de rango se rechaza como solicitud inválida"""
+        self.cargar_datos()
+        turno = dict(dni="12345678", matricula="MED001", especialidad="Pediatría", fecha_hora="2025-06-16T10:00:00")
+        for duracion in (True, 30.0, 1e300, 10 ** 20, "30"):
+            self.assertEqual(self.solicitar("agendar_turno", duracion=duracion, **turno)["error"], "SolicitudInvalida")
+        self.assertEqual(self.solicitar("agregar_especialidad", matricula="MED001", tipo="Clínica", dias=["martes"],
+                                        duracion=10 ** 20)["error"], "SolicitudInvalida")
+        self.assertTrue(self.solicitar("agendar_turno", duracion=45, **turno)["ok"])
+    
+    def test_solicitudes_encadenadas_por_tcp(self):
+        """Test: Varias solicitudes enviadas juntas se responden en orden"""
+        
+        async def probar():
+            await self.servidor.iniciar()
+            lector, escritor = await asyncio.open_connection("127.0.0.1", self.servidor.obtener_puerto())
+            solicitudes = [{"id": i, "operacion": "agregar_paciente",
+                            "parametros": {"nombre": "Paciente", "dni": str(i % 3), "fecha_nacimiento": "01/01/2000"}}
+                           for i in range(6)]
+            escritor.write("".join(json.dumps(s) + "\n" for s in solicitudes).encode())
+            await escritor.drain()
+            respuestas = [json.loads(await lector.readline()) for _ in solicitudes]
+            escritor.close()
+            await self.servidor.cerrar()
+            return respuestas
+        
+        respuestas = asyncio.run(probar())
+        self.assertEqual([r["id"] for r in respuestas], list(range(6)))
+        self.assertEqual([r["ok"] for r in respuestas], [True] * 3 + [False] * 3)
+        self.assertEqual(len(self.clinica.obtener_pacientes()), 3)
+    
+    def test_solicitud_que_desborda_no_corta_la_conexion(self):
+        """Test: Las solicitudes encadenadas detrás de una duración enorme también se responden"""
+        self.cargar_datos()
+        
+        async def probar():
+            await self.servidor.iniciar()
+            lector, escritor = await asyncio.open_connection("127.0.0.1", self.servidor.obtener_puerto())
+            turno = {"dni": "12345678", "matricula": "MED001", "especialidad": "Pediatría",
+                     "fecha_hora": "2025-06-16T10:00:00"}
+            solicitudes = [{"id": 1, "operacion": "agendar_turno", "parametros": dict(turno, duracion=10 ** 20)},
+                           {"id": 2, "operacion": "agendar_turno", "parametros": turno}]
+            escritor.write("".join(json.dumps(s) + "\n" for s in solicitudes).encode())
+            respuestas = [json.loads(await lector.readline()) for _ in solicitudes]
+            escritor.close()
+            await self.servidor.cerrar()
+            return respuestas
+        
+        respuestas = asyncio.run(probar())
+        self.assertEqual([(r["id"], r["ok"]) for r in respuestas], [(1, False), (2, True)])
+    
+    def test_operacion_lenta_no_frena_a_otros_clientes(self):
+        """Test: Mientras una operación espera en su hilo, otro cliente recibe su respuesta"""
+        clinica = Clinica(concurrente=True)
+        servidor = ServidorClinica(clinica, hilos=2)
+        liberar = threading.Event()
+        listar = clinica.obtener_pacientes
+        
+        def listar_lento():
+            liberar.wait(5)
+            return listar()
+        clinica.obtener_pacientes = listar_lento
+        
+        async def probar():
+            await servidor.iniciar()
+            puerto = servidor.obtener_puerto()
+            lento_lector, lento_escritor = await asyncio.open_connection("127.0.0.1", puerto)
+            lento_escritor.write(b'{"id": 1, "operacion": "obtener_pacientes"}\n')
+            await lento_escritor.drain()
+            lector, escritor = await asyncio.open_connection("127.0.0.1", puerto)
+            escritor.write(json.dumps({"id": 2, "operacion": "agregar_paciente", "parametros": {
+                "nombre": "Juan Pérez", "dni": "12345678", "fecha_nacimiento": "15/03/1990"}}).encode() + b"\n")
+            rapida = json.loads(await asyncio.wait_for(lector.readline(), 2))
+            terminada_antes = liberar.is_set()
+            liberar.set()
+            lenta = json.loads(await lento_lector.readline())
+            for escritor_conexion in (escritor, lento_escritor):
+                escritor_conexion.close()
+            await servidor.cerrar()
+            return rapida, lenta, terminada_antes
+        
+        rapida, lenta, terminada_antes = asyncio.run(probar())
+        self.assertTrue(rapida["ok"])
+        self.assertFalse(terminada_antes)
+        self.assertEqual([p["dni"] for p in lenta["resultado"]], ["12345678"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import sys
+import os
+
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modelo'))
+
+from modelovista import Vista
+from modeloclinica import Clinica
+from modelopaciente import Paciente
+
+
+class TestVista(unittest.TestCase):
+    """Tests para las vistas de solo lectura"""
+    
+    def test_secuencia_de_solo_lectura(self):
+        """Test: La vista se mide, recorre, indexa y corta, pero no se puede modificar"""
+        datos = [10, 20, 30, 40, 50]
+        vista = Vista(datos)
+        
+        self.assertEqual(len(vista), 5)
+        self.assertEqual(vista[-1], 50)
+        self.assertEqual(list(vista[1:4]), [20, 30, 40])
+        self.assertEqual(list(vista[::-2]), [50, 30, 10])
+        self.assertEqual(vista[1:4][-1], 40)
+        self.assertIn(30, vista)
+        self.assertEqual(vista, datos)
+        with self.assertRaises(TypeError):
+            vista[0] = 99
+        self.assertFalse(hasattr(vista, "append"))
+    
+    def test_refleja_cambios_sin_copiar(self):
+        """Test: La vista de la clínica muestra los pacientes agregados después"""
+        clinica = Clinica()
+        pacientes = clinica.obtener_pacientes()
+        self.assertEqual(len(pacientes), 0)
+        
+        clinica.agregar_paciente(Paciente("Juan Pérez", "12345678", "15/03/1990"))
+        
+        self.assertEqual(len(pacientes), 1)
+        self.assertEqual(pacientes[0].obtener_dni(), "12345678")
+        self.assertIsInstance(clinica.obtener_historia_clinica("12345678").obtener_turnos(), Vista)
+    
+    def test_saltea_huecos(self):
+        """Test: La vista saltea las posiciones marcadas como huecos, también las agregadas después"""
+        datos = [10, 20, 30, 40, 50, 60]
+        huecos = [1, 4]
+        vista = Vista(datos, huecos=huecos)
+        
+        self.assertEqual(len(vista), 4)
+        self.assertEqual(list(vista), [10, 30, 40, 60])
+        self.assertEqual(list(reversed(vista)), [60, 40, 30, 10])
+        self.assertEqual(vista[1], 30)
+        self.assertEqual(vista[-1], 60)
+        self.assertEqual(list(vista[1:]), [30, 40, 60])
+        with self.assertRaises(IndexError):
+            vista[4]
+        
+        huecos.insert(0, 0)
+        self.assertEqual(list(vista), [30, 40, 60])
+        self.assertEqual(vista[0], 30)
+
+
+if __name__ == '__main__':
+    unittest.main()